@@ -0,0 +1 @@
+"""Performance benchmarks for pipeline and model hot paths."""
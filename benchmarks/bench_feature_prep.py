@@ -0,0 +1,90 @@
+"""
+Per-row cost of GameOutcomeModel feature preparation.
+
+Compares the original prepare_features (frame copy, per-column
+pd.to_numeric, fill strategy chosen per call, batch medians) with the fitted
+FeaturePipeline on DataFrames, on records and with a reused output buffer.
+
+Usage:
+    python -m benchmarks.bench_feature_prep --sizes 1 16 10000
+"""
+
+import argparse
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from ml.models.game_outcomes import FEATURE_COLUMNS
+from nfl_analytics.ml.feature_pipeline import FeaturePipeline
+
+
+def legacy_prepare_features(df: pd.DataFrame) -> pd.DataFrame:
+    """prepare_features as it was before the fitted pipeline."""
+    features = df[FEATURE_COLUMNS].copy()
+    for col in features.columns:
+        features[col] = pd.to_numeric(features[col], errors="coerce")
+    for col in features.columns:
+        if "rate" in col.lower():
+            features[col] = features[col].fillna(0.5)
+        elif "turnovers" in col.lower():
+            features[col] = features[col].fillna(1.0)
+        elif "epa" in col.lower():
+            features[col] = features[col].fillna(0)
+        else:
+            features[col] = features[col].astype("float64")
+            features[col] = features[col].fillna(features[col].median())
+    return features
+
+
+def make_games(n: int, seed: int = 0) -> pd.DataFrame:
+    """game_training_dataset-shaped rows with about 5% of features missing."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(rng.normal(size=(n, len(FEATURE_COLUMNS))), columns=FEATURE_COLUMNS)
+    return df.mask(rng.random(df.shape) < 0.05)
+
+
+def _per_row_us(fn: Callable[[], object], rows: int, min_seconds: float = 0.5) -> float:
+    fn()
+    calls, start = 0, time.perf_counter()
+    while True:
+        fn()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return elapsed / calls / rows * 1e6
+
+
+def run(sizes: List[int]) -> List[Dict[str, float]]:
+    pipeline = FeaturePipeline(FEATURE_COLUMNS).fit(make_games(5000, seed=1))
+    results = []
+    for size in sizes:
+        df = make_games(size)
+        records = df.astype(object).where(df.notna(), None).to_dict("records")
+        out = np.empty((size, len(FEATURE_COLUMNS)), dtype=np.float32)
+        results.append({
+            "batch": size,
+            "legacy_frame": _per_row_us(lambda: legacy_prepare_features(df), size),
+            "pipeline_frame": _per_row_us(lambda: pipeline.transform(df), size),
+            "pipeline_frame_out": _per_row_us(lambda: pipeline.transform(df, out=out), size),
+            "pipeline_records": _per_row_us(lambda: pipeline.transform(records), size),
+        })
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 16, 10_000])
+    args = parser.parse_args()
+
+    results = run(args.sizes)
+    columns = list(results[0])
+    print("microseconds per row")
+    print("".join(f"{c:>20}" for c in columns))
+    for row in results:
+        print(f"{row['batch']:>20}" + "".join(f"{row[c]:>20.2f}" for c in columns[1:]))
+
+
+if __name__ == "__main__":
+    main()
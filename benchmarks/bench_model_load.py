@@ -0,0 +1,90 @@
+"""
+Cold-load time of pickled models vs memory-mapped artifacts.
+
+Every models/*.pkl is exported to a temporary .model directory. Each format is
+then loaded in a fresh interpreter several times, timing the imports the
+format needs, the load itself and the first single-game prediction.
+
+Usage:
+    python -m benchmarks.bench_model_load --model-dir models --repeats 5
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+# Run in a fresh interpreter; prints one JSON line of timings in ms
+CHILD = """
+import json, sys, time, warnings
+warnings.simplefilter("ignore")
+fmt, path = sys.argv[1], sys.argv[2]
+t0 = time.perf_counter()
+import numpy as np
+if fmt == "pkl":
+    import joblib
+    import sklearn.ensemble, sklearn.linear_model, sklearn.preprocessing
+else:
+    from nfl_analytics.ml.artifact import read_artifact
+t1 = time.perf_counter()
+if fmt == "pkl":
+    data = joblib.load(path)
+    model, scaler, n = data["model"], data["scaler"], len(data["feature_columns"])
+else:
+    artifact = read_artifact(path)
+    model, scaler, n = artifact.estimator, artifact.scaler, len(artifact.feature_columns)
+t2 = time.perf_counter()
+model.predict_proba(scaler.transform(np.zeros((1, n), dtype=np.float32)))
+t3 = time.perf_counter()
+print(json.dumps({"import_ms": (t1 - t0) * 1e3, "load_ms": (t2 - t1) * 1e3, "first_predict_ms": (t3 - t2) * 1e3}))
+"""
+
+
+def cold_load(fmt: str, path: str, repeats: int) -> Dict[str, float]:
+    """Median timings over `repeats` fresh interpreters."""
+    runs = []
+    for _ in range(repeats):
+        out = subprocess.run([sys.executable, "-c", CHILD, fmt, path], capture_output=True, text=True, check=True)
+        runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    timings = {key: float(np.median([run[key] for run in runs])) for key in runs[0]}
+    timings["total_ms"] = sum(timings.values())
+    return timings
+
+
+def _size_mb(path: Path) -> float:
+    files = [path] if path.is_file() else list(path.iterdir())
+    return sum(f.stat().st_size for f in files) / 1024**2
+
+
+def run(model_dir: str, repeats: int) -> List[Dict]:
+    from ml.training.export_artifacts import export_artifacts
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for artifact in export_artifacts(model_dir, tmp):
+            pickle = Path(model_dir) / f"{artifact.stem}.pkl"
+            for fmt, path in (("pkl", pickle), ("model", artifact)):
+                rows.append({"model": artifact.stem, "format": fmt, "mb": _size_mb(path), **cold_load(fmt, str(path), repeats)})
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model-dir", default="models")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = run(args.model_dir, args.repeats)
+    columns = ["mb", "import_ms", "load_ms", "first_predict_ms", "total_ms"]
+    print(f"{'model':<20}{'format':>8}" + "".join(f"{c:>18}" for c in columns))
+    for row in rows:
+        print(f"{row['model']:<20}{row['format']:>8}" + "".join(f"{row[c]:>18.1f}" for c in columns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Peak memory benchmark for play-by-play loading.
+
+Compares the original path (every column for every season concatenated into
+one frame, then a whole-frame null count) with the lean path (projected
+columns, compact dtypes, one season at a time). Each path runs in its own
+process so peak RSS is measured in isolation.
+
+Usage:
+    python -m benchmarks.bench_pbp_memory --seasons 6 --plays 48000
+"""
+
+import argparse
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.fixtures import make_pbp_season
+from pipeline.utils.pbp import PBP_COLUMNS, compact_pbp, frame_memory_mb
+
+REQUIRED_COLUMNS = ["game_id", "posteam", "play_type", "season"]
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux and bytes on macOS
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+def full_path(paths: List[Path]) -> Dict[str, float]:
+    """Original behaviour: all columns, all seasons, one concatenated frame."""
+    frames = [pd.read_parquet(path) for path in paths]
+    pbp = pd.concat(frames, ignore_index=True)
+    del frames
+    float_cols = pbp.select_dtypes(include=[np.float64]).columns
+    pbp[float_cols] = pbp[float_cols].astype(np.float32)
+    pbp.isnull().sum().sum()
+    return {"rows": len(pbp), "frame_mb": frame_memory_mb(pbp)}
+
+
+def lean_path(paths: List[Path]) -> Dict[str, float]:
+    """Lean behaviour: projected columns, compact dtypes, streamed per season."""
+    rows, largest_frame = 0, 0.0
+    for path in paths:
+        season = compact_pbp(pd.read_parquet(path, columns=PBP_COLUMNS))
+        season[REQUIRED_COLUMNS].isnull().sum()
+        rows += len(season)
+        largest_frame = max(largest_frame, frame_memory_mb(season))
+        del season
+    return {"rows": rows, "frame_mb": largest_frame}
+
+
+def _child(fn: Callable[[List[Path]], Dict[str, float]], paths: List[Path], queue: multiprocessing.Queue) -> None:
+    baseline = _peak_rss_mb()
+    start = time.perf_counter()
+    stats = fn(paths)
+    stats["seconds"] = time.perf_counter() - start
+    stats["peak_rss_mb"] = _peak_rss_mb()
+    stats["baseline_rss_mb"] = baseline
+    queue.put(stats)
+
+
+def measure(fn: Callable[[List[Path]], Dict[str, float]], paths: List[Path]) -> Dict[str, float]:
+    """Run fn in a fresh process and return its stats including peak RSS."""
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    process = ctx.Process(target=_child, args=(fn, paths, queue))
+    process.start()
+    stats = queue.get()
+    process.join()
+    return stats
+
+
+def write_fixtures(directory: Path, seasons: int, plays: int, extra_columns: int) -> List[Path]:
+    """Write one synthetic season per Parquet file, like the nflverse release files."""
+    paths = []
+    for season in range(2020, 2020 + seasons):
+        path = directory / f"play_by_play_{season}.parquet"
+        make_pbp_season(season, plays=plays, extra_columns=extra_columns).to_parquet(path, index=False)
+        paths.append(path)
+    return paths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seasons", type=int, default=6)
+    parser.add_argument("--plays", type=int, default=48_000, help="plays per season")
+    parser.add_argument("--extra-columns", type=int, default=300)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_fixtures(Path(tmp), args.seasons, args.plays, args.extra_columns)
+        results = {"full": measure(full_path, paths), "lean": measure(lean_path, paths)}
+
+    print(f"{'path':<6} {'rows':>9} {'frame MB':>9} {'peak RSS MB':>12} {'over baseline':>14} {'seconds':>8}")
+    for name, stats in results.items():
+        print(
+            f"{name:<6} {stats['rows']:>9.0f} {stats['frame_mb']:>9.1f} {stats['peak_rss_mb']:>12.1f} "
+            f"{stats['peak_rss_mb'] - stats['baseline_rss_mb']:>14.1f} {stats['seconds']:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
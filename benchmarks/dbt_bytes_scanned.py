@@ -0,0 +1,84 @@
+"""
+Bytes scanned per dbt run, from BigQuery's adapter response.
+
+dbt-bigquery records bytes_processed / bytes_billed for every model in
+target/run_results.json. Copy that file aside after a run to keep it as a
+baseline, then compare a later run against it.
+
+Usage:
+    cd dbt && dbt run --full-refresh && cp target/run_results.json /tmp/before.json
+    dbt run && cd ..
+    python -m benchmarks.dbt_bytes_scanned dbt/target/run_results.json --baseline /tmp/before.json
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, Optional
+
+MB = 1024**2
+
+
+def read_run_results(path: str) -> Dict[str, Dict[str, float]]:
+    """
+    Model name -> bytes processed, bytes billed and seconds for one dbt run.
+    """
+    with Path(path).open() as f:
+        run_results = json.load(f)
+
+    models = {}
+    for result in run_results["results"]:
+        if not result["unique_id"].startswith("model."):
+            continue
+        response = result.get("adapter_response") or {}
+        models[result["unique_id"].rsplit(".", 1)[1]] = {
+            "bytes_processed": float(response.get("bytes_processed") or 0),
+            "bytes_billed": float(response.get("bytes_billed") or 0),
+            "seconds": float(result.get("execution_time") or 0),
+        }
+    return models
+
+
+def format_report(run: Dict[str, Dict[str, float]], baseline: Optional[Dict[str, Dict[str, float]]] = None) -> str:
+    """
+    Table of MB processed/billed per model with totals, and the change against baseline.
+    """
+    header = f"{'model':<32} {'MB processed':>13} {'MB billed':>10} {'seconds':>8}"
+    if baseline is not None:
+        header += f" {'baseline MB billed':>19} {'change':>8}"
+    lines = [header]
+
+    totals = {"bytes_processed": 0.0, "bytes_billed": 0.0, "seconds": 0.0}
+    baseline_total = 0.0
+    for model in sorted(set(run) | set(baseline or {})):
+        stats = run.get(model, {"bytes_processed": 0.0, "bytes_billed": 0.0, "seconds": 0.0})
+        for key in totals:
+            totals[key] += stats[key]
+        line = f"{model:<32} {stats['bytes_processed'] / MB:>13.1f} {stats['bytes_billed'] / MB:>10.1f} {stats['seconds']:>8.1f}"
+        if baseline is not None:
+            before = baseline.get(model, {}).get("bytes_billed", 0.0)
+            baseline_total += before
+            change = f"{(stats['bytes_billed'] - before) / before:>+8.0%}" if before else f"{'n/a':>8}"
+            line += f" {before / MB:>19.1f} {change}"
+        lines.append(line)
+
+    total_line = f"{'TOTAL':<32} {totals['bytes_processed'] / MB:>13.1f} {totals['bytes_billed'] / MB:>10.1f} {totals['seconds']:>8.1f}"
+    if baseline is not None:
+        change = (totals["bytes_billed"] - baseline_total) / baseline_total if baseline_total else 0.0
+        total_line += f" {baseline_total / MB:>19.1f} {change:>+8.0%}"
+    lines.append(total_line)
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("run_results", help="target/run_results.json of the run to report")
+    parser.add_argument("--baseline", help="run_results.json of an earlier run to compare against")
+    args = parser.parse_args()
+
+    baseline = read_run_results(args.baseline) if args.baseline else None
+    print(format_report(read_run_results(args.run_results), baseline))
+
+
+if __name__ == "__main__":
+    main()
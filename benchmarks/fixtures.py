@@ -0,0 +1,192 @@
+"""
+Synthetic nflverse-shaped fixtures so benchmarks run without network access
+"""
+
+import numpy as np
+import pandas as pd
+
+TEAMS = [
+    "ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE", "DAL", "DEN", "DET",
+    "GB", "HOU", "IND", "JAX", "KC", "LV", "LAC", "LA", "MIA", "MIN", "NE", "NO",
+    "NYG", "NYJ", "PHI", "PIT", "SF", "SEA", "TB", "TEN", "WAS",
+]
+PLAY_TYPES = ["pass", "run", "punt", "field_goal", "kickoff", "extra_point", "no_play", None]
+
+
+def make_pbp_season(
+    season: int,
+    plays: int = 48_000,
+    extra_columns: int = 300,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    Build one season of play-by-play data with nflverse column names and dtypes.
+
+    Args:
+        season: Season value to stamp on every play
+        plays: Number of plays (a real season has roughly 48-50k)
+        extra_columns: Filler columns standing in for the 300+ nflverse
+            columns that downstream models never read
+        seed: Random seed
+
+    Returns:
+        Play-by-play frame
+    """
+    rng = np.random.default_rng(seed + season)
+    plays_per_game = 170
+    n_games = max(1, plays // plays_per_game)
+    game_idx = np.repeat(np.arange(n_games), plays_per_game)[:plays]
+    game_idx = np.pad(game_idx, (0, plays - len(game_idx)), mode="edge")
+    week = (game_idx // 16 + 1).clip(max=22)
+    home = rng.integers(0, len(TEAMS), n_games)
+    away = (home + rng.integers(1, len(TEAMS), n_games)) % len(TEAMS)
+    offense_home = rng.random(plays) < 0.5
+    posteam = np.where(offense_home, np.array(TEAMS)[home[game_idx]], np.array(TEAMS)[away[game_idx]])
+    defteam = np.where(offense_home, np.array(TEAMS)[away[game_idx]], np.array(TEAMS)[home[game_idx]])
+    down = rng.integers(1, 5, plays).astype("float64")
+    down[rng.random(plays) < 0.15] = np.nan
+    player_pool = np.array([f"00-00{n:05d}" for n in range(2000)], dtype=object)
+
+    def maybe_player(p: float) -> np.ndarray:
+        ids = player_pool[rng.integers(0, len(player_pool), plays)]
+        return np.where(rng.random(plays) < p, ids, None)
+
+    df = pd.DataFrame(
+        {
+            "play_id": np.arange(plays, dtype="float64"),
+            "game_id": [f"{season}_{w:02d}_{TEAMS[a]}_{TEAMS[h]}" for w, a, h in zip(week, away[game_idx], home[game_idx])],
+            "home_team": np.array(TEAMS)[home[game_idx]],
+            "away_team": np.array(TEAMS)[away[game_idx]],
+            "season_type": np.where(week <= 18, "REG", "POST"),
+            "week": week.astype("int32"),
+            "posteam": posteam,
+            "defteam": defteam,
+            "game_date": [f"{season}-09-{(w % 28) + 1:02d}" for w in week],
+            "yardline_100": rng.integers(1, 100, plays).astype("float64"),
+            "qtr": rng.integers(1, 5, plays).astype("float64"),
+            "down": down,
+            "time": [f"{m:02d}:{s:02d}" for m, s in zip(rng.integers(0, 15, plays), rng.integers(0, 60, plays))],
+            "ydstogo": rng.integers(1, 20, plays).astype("float64"),
+            "play_type": np.array(PLAY_TYPES, dtype=object)[rng.integers(0, len(PLAY_TYPES), plays)],
+            "yards_gained": rng.integers(-10, 60, plays).astype("float64"),
+            "touchdown": (rng.random(plays) < 0.03).astype("float64"),
+            "first_down": (rng.random(plays) < 0.25).astype("float64"),
+            "interception": (rng.random(plays) < 0.01).astype("float64"),
+            "fumble": (rng.random(plays) < 0.01).astype("float64"),
+            "fumble_lost": (rng.random(plays) < 0.005).astype("float64"),
+            "penalty": (rng.random(plays) < 0.08).astype("float64"),
+            "epa": rng.normal(0, 1.4, plays),
+            "wpa": rng.normal(0, 0.04, plays),
+            "success": (rng.random(plays) < 0.45).astype("float64"),
+            "passer_player_id": maybe_player(0.45),
+            "rusher_player_id": maybe_player(0.4),
+            "receiver_player_id": maybe_player(0.35),
+        }
+    )
+
+    filler = {}
+    for i in range(extra_columns):
+        if i % 4 == 0:
+            filler[f"extra_str_{i}"] = np.where(rng.random(plays) < 0.5, f"value_{i}", None)
+        else:
+            values = rng.normal(size=plays)
+            values[rng.random(plays) < 0.3] = np.nan
+            filler[f"extra_num_{i}"] = values
+    df = pd.concat([df, pd.DataFrame(filler)], axis=1)
+    df["season"] = season
+    return df
+
+
+def make_training_games(games: int, seed: int = 0) -> pd.DataFrame:
+    """
+    game_training_dataset-shaped rows: every model feature (about 5% missing)
+    and a home_win label driven by the EPA features.
+    """
+    from ml.models.game_outcomes import FEATURE_COLUMNS
+
+    rng = np.random.default_rng(seed)
+    home = rng.integers(0, len(TEAMS), games)
+    away = (home + rng.integers(1, len(TEAMS), games)) % len(TEAMS)
+    season = 2018 + np.arange(games) // 272
+    week = (np.arange(games) % 272) // 16 + 1
+    df = pd.DataFrame({
+        "game_id": [f"{s}_{w:02d}_{TEAMS[a]}_{TEAMS[h]}" for s, w, a, h in zip(season, week, away, home)],
+        "season": season,
+        "week": week,
+        "home_team": np.array(TEAMS)[home],
+        "away_team": np.array(TEAMS)[away],
+    })
+    features = pd.DataFrame(rng.normal(size=(games, len(FEATURE_COLUMNS))), columns=FEATURE_COLUMNS)
+    df = pd.concat([df, features.mask(rng.random(features.shape) < 0.05)], axis=1)
+    signal = df["home_avg_epa_l3"].fillna(0) - df["away_avg_epa_l3"].fillna(0)
+    df["home_win"] = (signal + rng.normal(scale=1.0, size=games) > 0).astype(float)
+    return df
+
+
+def make_players(players: int = 20_000, seed: int = 0) -> pd.DataFrame:
+    """
+    Players reference shaped like nfl_data_py.import_players(), with the
+    alternate ids the resolver indexes and some ids missing.
+    """
+    rng = np.random.default_rng(seed)
+    n = np.arange(players)
+
+    def sometimes(values: np.ndarray, p: float = 0.8) -> np.ndarray:
+        return np.where(rng.random(players) < p, values, None)
+
+    return pd.DataFrame({
+        "gsis_id": [f"00-00{i:05d}" for i in n],
+        "display_name": [f"Player {i - i % 10 // 9} Jr." for i in n],  # one name in ten is shared
+        "esb_id": sometimes(np.array([f"ESB{i:06d}" for i in n], dtype=object)),
+        "espn_id": np.where(rng.random(players) < 0.8, 3_000_000.0 + n, np.nan),
+        "pfr_id": sometimes(np.array([f"Play{i:05d}" for i in n], dtype=object)),
+    })
+
+
+def make_ngs(players: pd.DataFrame, rows: int, seed: int = 0) -> pd.DataFrame:
+    """
+    NGS-shaped rows whose player is identified by a GSIS id, an ESB id or only
+    by name, roughly as import_ngs_data returns them.
+    """
+    rng = np.random.default_rng(seed)
+    picked = players.iloc[rng.integers(0, len(players), rows)].reset_index(drop=True)
+    id_kind = rng.integers(0, 3, rows)
+    return pd.DataFrame({
+        "season": 2024,
+        "week": rng.integers(1, 19, rows),
+        "player_gsis_id": np.where(id_kind == 0, picked["gsis_id"], None),
+        "esb_id": np.where(id_kind == 1, picked["esb_id"], None),
+        "player_display_name": picked["display_name"].str.upper(),
+        "avg_time_to_throw": rng.normal(2.8, 0.3, rows),
+        "avg_intended_air_yards": rng.normal(8, 2, rows),
+    })
+
+
+def make_player_stats(seasons: int = 6, players_per_week: int = 550, seed: int = 0) -> pd.DataFrame:
+    """
+    stg_player_stats-shaped rows: about as many player-weeks per season as
+    nflverse weekly stats, each player missing some weeks.
+    """
+    from nfl_analytics.analytics.player_features import stg_player_stats
+
+    rng = np.random.default_rng(seed)
+    player_pool = np.array([f"00-00{n:05d}" for n in range(int(players_per_week * 1.3))], dtype=object)
+    frames = []
+    for season in range(2024 - seasons + 1, 2025):
+        for week in range(1, 19):
+            frames.append(pd.DataFrame({
+                "player_id": rng.choice(player_pool, players_per_week, replace=False),
+                "season": season,
+                "week": week,
+            }))
+    weekly = pd.concat(frames, ignore_index=True)
+    n = len(weekly)
+    weekly["recent_team"] = np.array(TEAMS)[rng.integers(0, len(TEAMS), n)]
+    weekly["position"] = rng.choice(["QB", "RB", "WR", "TE"], n)
+    for stat, high in [("attempts", 45), ("completions", 30), ("passing_yards", 350), ("passing_tds", 4), ("interceptions", 3),
+                       ("carries", 25), ("rushing_yards", 150), ("rushing_tds", 3), ("targets", 14), ("receptions", 11),
+                       ("receiving_yards", 160), ("receiving_tds", 3), ("rushing_fumbles_lost", 2)]:
+        weekly[stat] = rng.integers(0, high, n).astype("float64")
+    weekly["fantasy_points"] = rng.gamma(2.0, 5.0, n)
+    weekly["fantasy_points_ppr"] = weekly["fantasy_points"] + weekly["receptions"]
+    return stg_player_stats(weekly)
@@ -0,0 +1,242 @@
+"""
+Minimal asv-style benchmark harness with a per-commit result history.
+
+A benchmark is a setup function registered with @benchmark: it takes a data
+size, builds its fixture and returns the zero-argument callable to time.
+
+    @benchmark("predict", sizes=(1, 100, 10_000), unit="games")
+    def predict(size):
+        model, games = ...
+        return lambda: model.predict(games)
+
+Each (benchmark, size) is timed timeit-style (calls batched until a repeat
+lasts min_time, best and median of several repeats) and then run once more
+under tracemalloc for peak memory. Results are appended as JSON lines tagged
+with the git commit and machine, so runs on the same machine compare commit
+to commit.
+"""
+
+import json
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+MB = 1024**2
+REGRESSION_THRESHOLD = 1.2  # head / base ratio that counts as a regression
+
+Setup = Callable[[int], Callable[[], object]]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    setup: Setup
+    sizes: Tuple[int, ...]
+    unit: str
+
+
+REGISTRY: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, sizes: Sequence[int], unit: str = "rows") -> Callable[[Setup], Setup]:
+    """
+    Register a setup function as a benchmark.
+
+    Args:
+        name: Unique benchmark name
+        sizes: Data sizes to run at by default
+        unit: What a size counts; throughput is reported per unit
+    """
+    def register(setup: Setup) -> Setup:
+        if name in REGISTRY:
+            raise ValueError(f"Benchmark already registered: {name}")
+        REGISTRY[name] = Benchmark(name, setup, tuple(sizes), unit)
+        return setup
+
+    return register
+
+
+def _timings(fn: Callable[[], object], repeat: int, min_time: float) -> Tuple[List[float], int]:
+    """Per-call seconds for each repeat, calling fn enough times per repeat to last min_time."""
+    start = time.perf_counter()
+    fn()  # warm-up, also sizes the batch
+    first = time.perf_counter() - start
+    loops = max(1, int(min_time / first)) if first > 0 else 1000
+
+    per_call = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        per_call.append((time.perf_counter() - start) / loops)
+    return per_call, loops
+
+
+def _peak_memory_mb(fn: Callable[[], object]) -> Tuple[float, object]:
+    """Peak traced allocation (Python objects and NumPy buffers) during one call."""
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        result = fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return (peak - baseline) / MB, result
+
+
+def measure(case: Benchmark, size: int, repeat: int = 5, min_time: float = 0.2) -> Dict:
+    """
+    Time one benchmark at one size.
+
+    If the timed callable returns a dict of numbers, the last one is recorded
+    as the result's metrics (e.g. the size of a frame it built).
+
+    Returns:
+        Result record without commit/machine tags
+    """
+    fn = case.setup(size)
+    per_call, loops = _timings(fn, repeat, min_time)
+    peak_mb, result = _peak_memory_mb(fn)
+    median = statistics.median(per_call)
+    return {
+        "benchmark": case.name,
+        "size": size,
+        "unit": case.unit,
+        "median_s": median,
+        "min_s": min(per_call),
+        "throughput": size / median if median > 0 else float("inf"),
+        "peak_mb": peak_mb,
+        "loops": loops,
+        "repeat": repeat,
+        "metrics": {key: float(value) for key, value in result.items()} if isinstance(result, dict) else {},
+    }
+
+
+def _git(*args: str) -> str:
+    try:
+        return subprocess.run(["git", *args], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def run_context() -> Dict:
+    """Commit and machine tags stored with every result."""
+    return {
+        "commit": _git("rev-parse", "--short", "HEAD") or "unknown",
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "machine": platform.node(),
+        "python": platform.python_version(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def run_suite(
+    names: Optional[Iterable[str]] = None,
+    sizes: Optional[Sequence[int]] = None,
+    repeat: int = 5,
+    min_time: float = 0.2,
+    context: Optional[Dict] = None,
+) -> List[Dict]:
+    """
+    Run registered benchmarks.
+
+    Args:
+        names: Benchmarks to run (default all)
+        sizes: Override every benchmark's default sizes
+        repeat: Timing repeats per size
+        min_time: Minimum seconds per repeat
+        context: Tags added to every record (default run_context())
+
+    Returns:
+        One record per (benchmark, size)
+    """
+    names = list(REGISTRY) if names is None else list(names)
+    unknown = [name for name in names if name not in REGISTRY]
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {unknown}; available: {sorted(REGISTRY)}")
+
+    context = run_context() if context is None else context
+    records = []
+    for name in names:
+        case = REGISTRY[name]
+        for size in sizes or case.sizes:
+            records.append({**context, **measure(case, size, repeat=repeat, min_time=min_time)})
+    return records
+
+
+def append_history(records: Iterable[Dict], path: str) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+def load_history(path: str) -> pd.DataFrame:
+    """Every stored result, oldest first."""
+    path = Path(path)
+    if not path.exists():
+        return pd.DataFrame()
+    with path.open() as f:
+        return pd.DataFrame([json.loads(line) for line in f if line.strip()])
+
+
+def compare(
+    history: pd.DataFrame,
+    base: Optional[str] = None,
+    head: Optional[str] = None,
+    machine: Optional[str] = None,
+    threshold: float = REGRESSION_THRESHOLD,
+) -> pd.DataFrame:
+    """
+    Compare two commits' results on one machine.
+
+    Args:
+        history: load_history() output
+        base: Baseline commit (default: the commit run before head)
+        head: Commit to check (default: the latest run)
+        machine: Machine to compare on (default: head's machine)
+        threshold: head/base ratio of median time or peak memory flagged as a regression
+
+    Returns:
+        One row per (benchmark, size) both commits ran, with time and memory ratios
+    """
+    if history.empty:
+        raise ValueError("No benchmark history to compare")
+    head = head or history["commit"].iloc[-1]
+    machine = machine or history.loc[history["commit"] == head, "machine"].iloc[-1]
+    runs = history[history["machine"] == machine]
+
+    commits = list(dict.fromkeys(runs["commit"]))  # run order
+    if head not in commits:
+        raise ValueError(f"No results for commit {head} on {machine}")
+    if base is None:
+        earlier = commits[: commits.index(head)]
+        if not earlier:
+            raise ValueError(f"No earlier commit than {head} on {machine} to compare against")
+        base = earlier[-1]
+
+    keys = ["benchmark", "size"]
+    latest = runs.drop_duplicates(["commit"] + keys, keep="last").set_index(keys)
+    base_runs = latest[latest["commit"] == base]
+    head_runs = latest[latest["commit"] == head]
+    if base_runs.empty:
+        raise ValueError(f"No results for commit {base} on {machine}")
+
+    joined = base_runs[["median_s", "peak_mb"]].join(
+        head_runs[["median_s", "peak_mb"]], lsuffix="_base", rsuffix="_head", how="inner"
+    )
+    joined["time_ratio"] = joined["median_s_head"] / joined["median_s_base"]
+    # Sub-megabyte peaks are noise; don't let them trip the memory check
+    joined["memory_ratio"] = joined["peak_mb_head"].clip(lower=1) / joined["peak_mb_base"].clip(lower=1)
+    joined["regression"] = (joined["time_ratio"] > threshold) | (joined["memory_ratio"] > threshold)
+    joined.attrs.update(base=base, head=head, machine=machine)
+    return joined.reset_index()
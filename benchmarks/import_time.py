@@ -0,0 +1,140 @@
+"""
+Cold-start import time of the Dagster code location.
+
+Loads pipeline.definitions in fresh interpreters under `python -X importtime`,
+the way the webserver, a code-location reload or a run worker does, and
+attributes the import time to top-level packages. Exits non-zero when the
+median cold start exceeds the budget, or when a dependency that should only
+be imported inside asset bodies is imported while loading.
+
+Usage:
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --repeats 5 --budget-ms 2000 --top 15
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+# The code location loads in about 1.7s under -X importtime, over 90% of it
+# Dagster, pandas and numpy; the budget leaves room for slower CI runners
+IMPORT_BUDGET_MS = 2500.0
+
+# Only needed once an asset runs, a model trains or a file is downloaded
+DEFERRED_MODULES = (
+    "dbt",
+    "duckdb",
+    "google.cloud.bigquery",
+    "httpx",
+    "joblib",
+    "nfl_data_py",
+    "nfl_analytics.api",
+    "sklearn",
+    "xgboost",
+)
+
+# Imports logged before the marker belong to interpreter startup (site, encodings)
+MARKER = "-- loading pipeline.definitions"
+
+CHILD = f"""
+import json, sys, time
+sys.stderr.write("{MARKER}\\n")
+sys.stderr.flush()
+start = time.perf_counter()
+from pipeline.definitions import defs
+definitions = defs()
+print(json.dumps({{"load_ms": (time.perf_counter() - start) * 1e3, "assets": len(list(definitions.assets))}}))
+"""
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def parse_importtime(stderr: str) -> List[Dict]:
+    """
+    One record per module from `-X importtime` output: self and cumulative
+    microseconds and the nesting depth (0 for imports made by the script itself).
+    """
+    modules = []
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules.append({"module": name, "self_us": int(self_us), "cumulative_us": int(cumulative_us), "depth": (len(indent) - 1) // 2})
+    return modules
+
+
+def package_times(modules: Sequence[Dict]) -> Dict[str, float]:
+    """
+    Milliseconds spent importing each top-level package, from the self time of its modules.
+    """
+    totals: Dict[str, float] = {}
+    for module in modules:
+        package = module["module"].split(".", 1)[0]
+        totals[package] = totals.get(package, 0.0) + module["self_us"] / 1e3
+    return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+
+def deferred_imports(modules: Sequence[Dict], deferred: Sequence[str] = DEFERRED_MODULES) -> List[str]:
+    """
+    The deferred modules (or their submodules) that were imported.
+    """
+    names = {module["module"] for module in modules}
+    return [prefix for prefix in deferred if any(name == prefix or name.startswith(prefix + ".") for name in names)]
+
+
+def cold_start() -> Dict:
+    """
+    Load the code location once in a fresh interpreter.
+
+    Returns:
+        import_ms (sum of top-level cumulative import times), load_ms (wall
+        time of the import and defs()), per-package milliseconds and the
+        deferred modules that were imported
+    """
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", CHILD], capture_output=True, text=True, check=True)
+    modules = parse_importtime(out.stderr.split(MARKER, 1)[1])
+    child = json.loads(out.stdout.strip().splitlines()[-1])
+    return {
+        "import_ms": sum(module["cumulative_us"] for module in modules if module["depth"] == 0) / 1e3,
+        "load_ms": child["load_ms"],
+        "assets": child["assets"],
+        "packages": package_times(modules),
+        "deferred": deferred_imports(modules),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeats", type=int, default=3, help="Fresh interpreters to take the median over")
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS, help="Fail above this median import time")
+    parser.add_argument("--top", type=int, default=10, help="Packages to list")
+    args = parser.parse_args()
+
+    runs = [cold_start() for _ in range(args.repeats)]
+    import_ms = float(np.median([run["import_ms"] for run in runs]))
+    load_ms = float(np.median([run["load_ms"] for run in runs]))
+    print(f"pipeline.definitions: {runs[0]['assets']} assets, import {import_ms:.0f} ms, import + defs() {load_ms:.0f} ms (median of {args.repeats})")
+    print(f"\n{'package':<24} {'ms':>8}")
+    packages = runs[-1]["packages"]
+    for package, ms in list(packages.items())[: args.top]:
+        print(f"{package:<24} {ms:>8.1f}")
+
+    failures = []
+    if import_ms > args.budget_ms:
+        failures.append(f"cold start import time {import_ms:.0f} ms is over the {args.budget_ms:.0f} ms budget")
+    deferred = sorted({module for run in runs for module in run["deferred"]})
+    if deferred:
+        failures.append(f"imported while loading the code location: {', '.join(deferred)}")
+    for failure in failures:
+        print(f"\nFAIL: {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Load test for the prediction service.
+
+Starts uvicorn on a free local port (or targets --url), fires requests from
+concurrent clients and reports latency percentiles and throughput as seen
+by the client. Requires the uvicorn[standard] extras for representative
+numbers.
+
+Usage:
+    python -m benchmarks.load_test_api --model rf --requests 5000 --concurrency 32
+    python -m benchmarks.load_test_api --url http://127.0.0.1:8000 --batch-size 16
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import socket
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import httpx
+import numpy as np
+
+from benchmarks.fixtures import TEAMS
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(model_dir: str, port: int, timeout: float = 30.0) -> subprocess.Popen:
+    """Run the app under uvicorn in a subprocess and wait for /health."""
+    env = dict(os.environ, NFL_MODEL_DIR=model_dir)
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "nfl_analytics.api.app:app",
+         "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning", "--no-access-log"],
+        env=env,
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with code {server.returncode}")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health").status_code == 200:
+                return server
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    server.terminate()
+    raise RuntimeError("uvicorn did not become healthy")
+
+
+def make_games(feature_columns: List[str], n: int, seed: int = 0) -> List[Dict]:
+    """Random games, with about 5% of features left missing."""
+    rng = np.random.default_rng(seed)
+    values = rng.normal(size=(n, len(feature_columns)))
+    games = []
+    for i in range(n):
+        home, away = rng.choice(TEAMS, size=2, replace=False)
+        features = {c: float(v) for c, v in zip(feature_columns, values[i]) if rng.random() > 0.05}
+        games.append({"game_id": f"load_{i}", "home_team": str(home), "away_team": str(away), "features": features})
+    return games
+
+
+async def _post(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, request: bytes) -> None:
+    """One keep-alive HTTP/1.1 round trip; raises unless the response is 200."""
+    writer.write(request)
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = head.split(b" ", 2)[1]
+    length = int(re.search(rb"(?i)content-length:\s*(\d+)", head).group(1))
+    body = await reader.readexactly(length)
+    if status != b"200":
+        raise RuntimeError(f"HTTP {status.decode()}: {body[:200]!r}")
+
+
+def _encode(host: str, path: str, body: Dict) -> bytes:
+    payload = json.dumps(body).encode()
+    head = (
+        f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(payload)}\r\n\r\n"
+    )
+    return head.encode() + payload
+
+
+async def run_load(
+    url: str,
+    model: str,
+    requests: int,
+    concurrency: int,
+    batch_size: int,
+    warmup: int = 200,
+) -> Dict[str, float]:
+    """
+    Send requests from `concurrency` keep-alive connections and time each one.
+
+    Requests are pre-encoded and sent over raw asyncio streams, so the client
+    spends far less CPU per request than an HTTP library would and the
+    numbers mostly reflect the server.
+
+    Returns:
+        Latency percentiles in ms, requests/s and games/s
+    """
+    info = {m["name"]: m for m in httpx.get(f"{url}/models").json()}
+    if model not in info:
+        raise SystemExit(f"Model '{model}' not served; available: {sorted(info)}")
+    games = make_games(info[model]["feature_columns"], 1024)
+
+    parsed = urlsplit(url)
+    if batch_size == 1:
+        requests_bytes = [_encode(parsed.netloc, f"/predict?model={model}", game) for game in games]
+    else:
+        requests_bytes = [
+            _encode(parsed.netloc, f"/predict/batch?model={model}", {"games": games[i : i + batch_size]})
+            for i in range(0, len(games) - batch_size + 1, batch_size)
+        ]
+
+    latencies: List[float] = []
+    counter = iter(range(warmup + requests))
+
+    async def worker() -> None:
+        reader, writer = await asyncio.open_connection(parsed.hostname, parsed.port)
+        try:
+            for i in counter:
+                start = time.perf_counter()
+                await _post(reader, writer, requests_bytes[i % len(requests_bytes)])
+                if i >= warmup:
+                    latencies.append(time.perf_counter() - start)
+        finally:
+            writer.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    ms = np.array(latencies) * 1000
+    return {
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p90_ms": float(np.percentile(ms, 90)),
+        "p99_ms": float(np.percentile(ms, 99)),
+        "max_ms": float(ms.max()),
+        "requests_per_s": (warmup + requests) / elapsed,
+        "games_per_s": (warmup + requests) * batch_size / elapsed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="Running service to test; default starts one locally")
+    parser.add_argument("--model-dir", default="models")
+    parser.add_argument("--model", default="rf")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--batch-size", type=int, default=1, help="Games per request; >1 uses /predict/batch")
+    args = parser.parse_args()
+
+    server: Optional[subprocess.Popen] = None
+    url = args.url
+    if url is None:
+        port = _free_port()
+        server = start_server(args.model_dir, port)
+        url = f"http://127.0.0.1:{port}"
+    try:
+        stats = asyncio.run(run_load(url, args.model, args.requests, args.concurrency, args.batch_size))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print(f"{args.model} model, {args.requests} requests x {args.batch_size} games, {args.concurrency} clients")
+    for key, value in stats.items():
+        print(f"  {key:<15} {value:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
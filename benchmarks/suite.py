@@ -0,0 +1,250 @@
+"""
+Benchmark suite for ingestion, feature prep, training and inference hot paths.
+
+Runs on the synthetic fixtures in benchmarks/fixtures.py (no network) and
+records median/best latency, throughput and peak traced memory per data
+size. Every run is appended to a JSON-lines history tagged with the git
+commit, so a later commit can be compared against an earlier one.
+
+Usage:
+    python -m benchmarks.suite run                          # everything, default sizes
+    python -m benchmarks.suite run --bench predict prepare_features --sizes 1 1000
+    python -m benchmarks.suite compare                      # latest run vs the run before it
+    python -m benchmarks.suite compare --base 4fab30d --fail-on-regression
+    python -m benchmarks.suite list
+"""
+
+import argparse
+import atexit
+import io
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.fixtures import make_ngs, make_pbp_season, make_player_stats, make_players, make_training_games
+from benchmarks.harness import (
+    REGISTRY,
+    REGRESSION_THRESHOLD,
+    append_history,
+    benchmark,
+    compare,
+    load_history,
+    run_suite,
+)
+
+HISTORY_PATH = ".benchmarks/history.jsonl"
+
+
+def _scratch_dir() -> str:
+    """Temporary directory removed when the process exits."""
+    path = tempfile.mkdtemp(prefix="nfl_bench_")
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return path
+
+
+def _trained_model(model_type: str = "random_forest", games: int = 2000):
+    from ml.models.game_outcomes import GameOutcomeModel
+
+    model = GameOutcomeModel(model_type)
+    model.train(make_training_games(games, seed=1))
+    return model
+
+
+@benchmark("ngs_id_mapping", sizes=(1_000, 10_000, 100_000))
+def ngs_id_mapping(size: int) -> Callable[[], object]:
+    """PlayerIdResolver.resolve_frame over NGS rows identified by GSIS id, ESB id or name."""
+    from pipeline.utils.player_ids import PlayerIdResolver
+
+    players = make_players()
+    resolver = PlayerIdResolver.from_players(players)
+    ngs = make_ngs(players, size)
+    return lambda: resolver.resolve_frame(ngs)
+
+
+@benchmark("pbp_load", sizes=(10_000, 50_000), unit="plays")
+def pbp_load(size: int) -> Callable[[], object]:
+    """Lean season load from Parquet: projected columns, compact dtypes."""
+    from pipeline.utils.pbp import PBP_COLUMNS, compact_pbp, frame_memory_mb
+
+    buffer = io.BytesIO()
+    make_pbp_season(2024, plays=size, extra_columns=100).to_parquet(buffer, index=False)
+    data = buffer.getvalue()
+
+    def load():
+        pbp = compact_pbp(pd.read_parquet(io.BytesIO(data), columns=PBP_COLUMNS))
+        return {"frame_mb": frame_memory_mb(pbp)}
+
+    return load
+
+
+@benchmark("pbp_load_full", sizes=(10_000, 50_000), unit="plays")
+def pbp_load_full(size: int) -> Callable[[], object]:
+    """Every column as read, for comparison with pbp_load."""
+    from pipeline.utils.pbp import frame_memory_mb
+
+    buffer = io.BytesIO()
+    make_pbp_season(2024, plays=size, extra_columns=100).to_parquet(buffer, index=False)
+    data = buffer.getvalue()
+    return lambda: {"frame_mb": frame_memory_mb(pd.read_parquet(io.BytesIO(data)))}
+
+
+@benchmark("prepare_features", sizes=(1, 100, 10_000), unit="games")
+def prepare_features(size: int) -> Callable[[], object]:
+    """GameOutcomeModel.prepare_features on a DataFrame."""
+    model = _trained_model("logistic_regression")
+    games = make_training_games(size, seed=2)
+    return lambda: model.prepare_features(games)
+
+
+@benchmark("train_random_forest", sizes=(500, 2_000), unit="games")
+def train_random_forest(size: int) -> Callable[[], object]:
+    """GameOutcomeModel.train, random forest with the default parameters."""
+    from ml.models.game_outcomes import GameOutcomeModel
+
+    games = make_training_games(size)
+
+    def train():
+        GameOutcomeModel("random_forest").train(games)
+
+    return train
+
+
+@benchmark("train_logistic_regression", sizes=(500, 2_000, 10_000), unit="games")
+def train_logistic_regression(size: int) -> Callable[[], object]:
+    """GameOutcomeModel.train, logistic regression."""
+    from ml.models.game_outcomes import GameOutcomeModel
+
+    games = make_training_games(size)
+
+    def train():
+        GameOutcomeModel("logistic_regression").train(games)
+
+    return train
+
+
+@benchmark("predict", sizes=(1, 100, 10_000), unit="games")
+def predict(size: int) -> Callable[[], object]:
+    """GameOutcomeModel.predict with the random forest."""
+    model = _trained_model()
+    games = make_training_games(size, seed=2)
+    return lambda: model.predict(games)
+
+
+@benchmark("model_load_joblib", sizes=(1,), unit="models")
+def model_load_joblib(size: int) -> Callable[[], object]:
+    """GameOutcomeModel.load_model of a pickled random forest."""
+    from ml.models.game_outcomes import GameOutcomeModel
+
+    path = str(Path(_scratch_dir()) / "model.pkl")
+    _trained_model().save_model(path)
+    return lambda: GameOutcomeModel().load_model(path)
+
+
+@benchmark("model_load_artifact", sizes=(1,), unit="models")
+def model_load_artifact(size: int) -> Callable[[], object]:
+    """GameOutcomeModel.load_artifact of the same random forest, memory-mapped."""
+    from ml.models.game_outcomes import GameOutcomeModel
+
+    path = str(Path(_scratch_dir()) / "model.model")
+    _trained_model().save_artifact(path)
+    return lambda: GameOutcomeModel().load_artifact(path)
+
+
+@benchmark("season_simulation", sizes=(10_000, 100_000), unit="seasons")
+def season_simulation(size: int) -> Callable[[], object]:
+    """SeasonSimulator.run over half a season of remaining games."""
+    from nfl_analytics.analytics.season_sim import NFL_DIVISIONS, SeasonSimulator
+
+    games = make_training_games(272, seed=3)
+    games = games.assign(
+        home_team=[list(NFL_DIVISIONS)[i % 32] for i in range(272)],
+        away_team=[list(NFL_DIVISIONS)[(i * 7 + 1) % 32] for i in range(272)],
+        home_score=games["home_win"].where(games["week"] <= 9) * 7,
+        away_score=(1 - games["home_win"]).where(games["week"] <= 9) * 7,
+    )
+    simulator = SeasonSimulator(games)
+    probabilities = simulator.remaining.assign(home_win_probability=0.55)
+    return lambda: simulator.run(probabilities, n_simulations=size)
+
+
+@benchmark("situational_split", sizes=(1, 6), unit="seasons")
+def situational_split(size: int) -> Callable[[], object]:
+    """Third-and-short EPA for one team over the last 5 weeks, from a memory-mapped PlayStore."""
+    from nfl_analytics.data.play_store import PlayStore
+
+    pbp = pd.concat([make_pbp_season(2024 - i, extra_columns=0) for i in range(size)], ignore_index=True)
+    path = str(Path(_scratch_dir()) / "plays")
+    PlayStore.from_pbp(pbp).save(path)
+    store = PlayStore.open(path)
+    return lambda: store.filter(posteam="KC", down_situation="short_third_down", last_weeks=5).agg().to_dict()
+
+
+@benchmark("player_rescoring", sizes=(1, 100, 1_000), unit="configs")
+def player_rescoring(size: int) -> Callable[[], object]:
+    """PlayerProjectionEngine.project for every player-week of six seasons under size scoring configs."""
+    from nfl_analytics.analytics.player_features import SCORING_STATS, PlayerProjectionEngine
+
+    engine = PlayerProjectionEngine(make_player_stats(seasons=6))
+    configs = np.random.default_rng(0).normal(size=(size, len(SCORING_STATS)))
+    return lambda: engine.project(configs)
+
+
+def _print_results(records) -> None:
+    frame = pd.DataFrame(records)
+    frame["median_ms"] = frame["median_s"] * 1e3
+    frame["metrics"] = frame["metrics"].map(lambda metrics: ", ".join(f"{k}={v:.1f}" for k, v in metrics.items()))
+    columns = ["benchmark", "size", "unit", "median_ms", "throughput", "peak_mb", "metrics"]
+    print(frame[columns].to_string(index=False, float_format=lambda value: f"{value:,.2f}"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--history", default=HISTORY_PATH)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run benchmarks and append the results to the history")
+    run.add_argument("--bench", nargs="+", help="Benchmarks to run (default all)")
+    run.add_argument("--sizes", type=int, nargs="+", help="Override the default sizes")
+    run.add_argument("--repeat", type=int, default=5)
+    run.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds per repeat")
+    run.add_argument("--no-save", action="store_true")
+
+    check = commands.add_parser("compare", help="Compare two commits from the history")
+    check.add_argument("--base", help="Baseline commit (default: the run before --head)")
+    check.add_argument("--head", help="Commit to check (default: the latest run)")
+    check.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    check.add_argument("--fail-on-regression", action="store_true")
+
+    commands.add_parser("list", help="List the benchmarks")
+    args = parser.parse_args()
+
+    if args.command == "list":
+        for case in REGISTRY.values():
+            print(f"{case.name:<28} {case.unit:<8} sizes={list(case.sizes)}")
+        return
+
+    if args.command == "run":
+        records = run_suite(args.bench, args.sizes, repeat=args.repeat, min_time=args.min_time)
+        _print_results(records)
+        if not args.no_save:
+            append_history(records, args.history)
+            print(f"\nAppended {len(records)} results for {records[0]['commit']} to {args.history}")
+        return
+
+    report = compare(load_history(args.history), base=args.base, head=args.head, threshold=args.threshold)
+    print(f"{report.attrs['head']} vs {report.attrs['base']} on {report.attrs['machine']}")
+    print(report.to_string(index=False, float_format=lambda value: f"{value:,.3f}"))
+    regressions = report[report["regression"]]
+    if len(regressions):
+        print(f"\n{len(regressions)} regressions over {args.threshold:.2f}x")
+        if args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+{#
+  SQL dialect helpers so the same models compile for BigQuery (target dev)
+  and DuckDB (target duckdb).
+
+  Each macro dispatches on the adapter: bigquery__ keeps the original
+  BigQuery spelling, default__ is standard SQL that DuckDB accepts. Arguments
+  are SQL expressions passed as strings, e.g.
+
+    {{ safe_divide('total_yards', 'total_plays') }}
+
+  Timestamps use dbt's built-in {{ dbt.current_timestamp() }}.
+#}
+
+{% macro safe_divide(numerator, denominator) -%}
+  {{ return(adapter.dispatch('safe_divide', 'nfl_analytics')(numerator, denominator)) }}
+{%- endmacro %}
+
+{% macro bigquery__safe_divide(numerator, denominator) -%}
+  safe_divide({{ numerator }}, {{ denominator }})
+{%- endmacro %}
+
+{% macro default__safe_divide(numerator, denominator) -%}
+  case when ({{ denominator }}) = 0 then null else ({{ numerator }}) / ({{ denominator }}) end
+{%- endmacro %}
+
+
+{% macro type_float64() -%}
+  {{ return(adapter.dispatch('type_float64', 'nfl_analytics')()) }}
+{%- endmacro %}
+
+{% macro bigquery__type_float64() -%}
+  float64
+{%- endmacro %}
+
+{% macro default__type_float64() -%}
+  double
+{%- endmacro %}
+
+
+{% macro parse_iso_date(expression) -%}
+  {#- 'YYYY-MM-DD' string (nflverse gameday) to a date -#}
+  {{ return(adapter.dispatch('parse_iso_date', 'nfl_analytics')(expression)) }}
+{%- endmacro %}
+
+{% macro bigquery__parse_iso_date(expression) -%}
+  parse_date('%Y-%m-%d', {{ expression }})
+{%- endmacro %}
+
+{% macro default__parse_iso_date(expression) -%}
+  cast({{ expression }} as date)
+{%- endmacro %}
+
+
+{% macro day_of_week(expression) -%}
+  {#- BigQuery numbering: 1 = Sunday ... 7 = Saturday -#}
+  {{ return(adapter.dispatch('day_of_week', 'nfl_analytics')(expression)) }}
+{%- endmacro %}
+
+{% macro bigquery__day_of_week(expression) -%}
+  extract(dayofweek from {{ expression }})
+{%- endmacro %}
+
+{% macro default__day_of_week(expression) -%}
+  (extract(dow from {{ expression }}) + 1)
+{%- endmacro %}
+
+
+{% macro add_days(expression, days) -%}
+  {{ return(adapter.dispatch('add_days', 'nfl_analytics')(expression, days)) }}
+{%- endmacro %}
+
+{% macro bigquery__add_days(expression, days) -%}
+  date_add({{ expression }}, interval {{ days }} day)
+{%- endmacro %}
+
+{% macro default__add_days(expression, days) -%}
+  cast({{ expression }} + interval {{ days }} day as date)
+{%- endmacro %}
+
+
+{% macro date_difference(end_date, start_date, date_part) -%}
+  {#- Whole date_part boundaries between start_date and end_date -#}
+  {{ return(adapter.dispatch('date_difference', 'nfl_analytics')(end_date, start_date, date_part)) }}
+{%- endmacro %}
+
+{% macro bigquery__date_difference(end_date, start_date, date_part) -%}
+  date_diff({{ end_date }}, {{ start_date }}, {{ date_part }})
+{%- endmacro %}
+
+{% macro default__date_difference(end_date, start_date, date_part) -%}
+  date_diff('{{ date_part }}', {{ start_date }}, {{ end_date }})
+{%- endmacro %}
+
+
+{% macro star_except(relation_alias, columns) -%}
+  {#- relation_alias.* without the listed columns -#}
+  {{ return(adapter.dispatch('star_except', 'nfl_analytics')(relation_alias, columns)) }}
+{%- endmacro %}
+
+{% macro bigquery__star_except(relation_alias, columns) -%}
+  {{ relation_alias }}.* except({{ columns | join(', ') }})
+{%- endmacro %}
+
+{% macro default__star_except(relation_alias, columns) -%}
+  {{ relation_alias }}.* exclude ({{ columns | join(', ') }})
+{%- endmacro %}
+
+
+{% macro clock_seconds(expression) -%}
+  {#- 'MM:SS' game clock (nflverse time) to seconds -#}
+  {{ return(adapter.dispatch('clock_seconds', 'nfl_analytics')(expression)) }}
+{%- endmacro %}
+
+{% macro bigquery__clock_seconds(expression) -%}
+  (60 * safe_cast(split({{ expression }}, ':')[safe_offset(0)] as int64) + safe_cast(split({{ expression }}, ':')[safe_offset(1)] as int64))
+{%- endmacro %}
+
+{% macro default__clock_seconds(expression) -%}
+  (60 * try_cast(split_part({{ expression }}, ':', 1) as integer) + try_cast(split_part({{ expression }}, ':', 2) as integer))
+{%- endmacro %}
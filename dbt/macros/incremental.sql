@@ -0,0 +1,50 @@
+{#
+  Incremental helpers for the season-partitioned models.
+
+  Every window function in the staging tables and marts is partitioned by
+  season (team and player rolling averages, season-to-date totals, season
+  rankings), so a whole season is the smallest unit that can be rebuilt
+  without touching its neighbours, and rebuilding it keeps the l8 windows and
+  season rankings exact. Incremental runs therefore overwrite whole season
+  partitions.
+
+  By default only var('current_season') is rebuilt. Backfill stat corrections
+  for older seasons with:
+
+    dbt run --select +team_game_performance --vars '{refresh_seasons: [2023, 2024]}'
+
+  and rebuild everything with --full-refresh.
+#}
+
+{% macro season_partition() -%}
+  {{ return({
+    "field": "season",
+    "data_type": "int64",
+    "range": {"start": 1999, "end": 2100, "interval": 1}
+  }) }}
+{%- endmacro %}
+
+
+{% macro season_incremental_strategy() -%}
+  {#- Use with unique_key='season'; BigQuery's insert_overwrite ignores it -#}
+  {{ return(adapter.dispatch('season_incremental_strategy', 'nfl_analytics')()) }}
+{%- endmacro %}
+
+{% macro bigquery__season_incremental_strategy() -%}
+  {{ return('insert_overwrite') }}
+{%- endmacro %}
+
+{% macro default__season_incremental_strategy() -%}
+  {{ return('delete+insert') }}
+{%- endmacro %}
+
+
+{% macro refresh_seasons() -%}
+  {{ return(var('refresh_seasons', [var('current_season')])) }}
+{%- endmacro %}
+
+
+{% macro incremental_season_predicate(column='season') -%}
+  {#- Literal season list so BigQuery prunes partitions of the upstream table -#}
+  {{ column }} in ({{ refresh_seasons() | join(', ') }})
+{%- endmacro %}
@@ -0,0 +1,43 @@
+{#
+  Sources for the duckdb target: one view per nfl_data table over the
+  pipeline's raw Parquet cache (pipeline/utils/cache.py):
+
+    <NFL_RAW_CACHE_DIR>/<dataset>/season=<season>/fetch_date=<YYYY-MM-DD>/data.parquet
+
+  var('raw_cache_sources') maps each source table to its dataset. A view
+  reads the newest fetch date of every season and is resolved at query time,
+  so a fresh pipeline pull is picked up without re-registering. Run the
+  pipeline (or any nfl_data_py pull through the cache) once to populate it.
+
+  Runs as an on-run-start hook and does nothing on other targets.
+#}
+
+{% macro register_raw_cache_sources() %}
+  {%- if target.type != 'duckdb' or not execute -%}
+    {{ return('') }}
+  {%- endif -%}
+
+  {%- set root = env_var('NFL_RAW_CACHE_DIR', '../.pipeline_state/raw_cache') -%}
+  {%- set schema = 'nfl_data' -%}
+  {% do run_query('create schema if not exists ' ~ schema) %}
+
+  {% for table, source in var('raw_cache_sources').items() %}
+    {%- set pattern = root ~ '/' ~ source.dataset ~ '/season=' ~ source.get('season', '*') ~ '/fetch_date=*/data.parquet' -%}
+    {%- set files = run_query("select count(*) from glob('" ~ pattern ~ "')").columns[0].values()[0] -%}
+    {% if files == 0 %}
+      {% do log('raw cache has no ' ~ source.dataset ~ ' pulls under ' ~ root ~ '; source ' ~ table ~ ' not registered', info=True) %}
+    {% else %}
+      {% do run_query(raw_cache_view_sql(schema ~ '.' ~ table, pattern)) %}
+    {% endif %}
+  {% endfor %}
+{% endmacro %}
+
+
+{% macro raw_cache_view_sql(relation, pattern) -%}
+  create or replace view {{ relation }} as
+  select * exclude (filename)
+  from read_parquet('{{ pattern }}', filename = true, union_by_name = true, hive_partitioning = false)
+  qualify regexp_extract(filename, 'fetch_date=([0-9-]+)', 1) = max(regexp_extract(filename, 'fetch_date=([0-9-]+)', 1)) over (
+    partition by regexp_extract(filename, 'season=([^/\\]+)', 1)
+  )
+{%- endmacro %}
@@ -0,0 +1,148 @@
+{{
+  config(
+    materialized='ephemeral',
+    description='GameOutcomeModel inputs for every game, from each team''s games strictly before it'
+  )
+}}
+
+{#
+  The one definition of the model's inputs: game_training_dataset takes the
+  played games from here and game_model_inputs the unplayed ones, so a game
+  is scored with exactly the features it is later trained on.
+
+  Model input -> per-team game column it is computed from. The names are
+  FEATURE_COLUMNS in ml/models/game_outcomes.py without the home_/away_
+  prefix.
+#}
+{#- _l3: mean over the team's last three games -#}
+{%- set rolling_inputs = {
+    'avg_yards_l3': 'total_yards',
+    'avg_epa_l3': 'total_epa',
+    'third_down_rate_l3': 'third_down_conversion_rate',
+    'turnovers_l3': 'turnovers',
+    'top_secs_l3': 'time_of_possession_secs'
+} -%}
+{#- _wm1: the team's previous game -#}
+{%- set last_game_inputs = {
+    'total_yards_wm1': 'total_yards',
+    'total_epa_wm1': 'total_epa',
+    'third_down_rate_wm1': 'third_down_conversion_rate',
+    'turnovers_wm1': 'turnovers',
+    'top_secs_wm1': 'time_of_possession_secs',
+    'rz_first_downs_wm1': 'red_zone_first_downs'
+} -%}
+{%- set model_inputs = (rolling_inputs.keys() | list) + (last_game_inputs.keys() | list) -%}
+
+with games as (
+  select
+    game_id,
+    season,
+    week,
+    game_date,
+    home_team,
+    away_team,
+    game_status,
+    upcoming_week as betting_relevant
+  from {{ ref('stg_games') }}
+),
+
+play_clock as (
+  select
+    game_id,
+    play_id,
+    posteam as team,
+    yardline_100,
+    first_down,
+    -- Seconds since kickoff; overtime counts on from 60:00
+    case when quarter <= 4 then quarter * 900 else 4200 end - {{ clock_seconds('time_remaining') }} as elapsed_secs
+  from {{ ref('stg_pbp') }}
+),
+
+plays as (
+  select
+    *,
+    -- A play's offense keeps the ball until the next snap
+    greatest(coalesce(lead(elapsed_secs) over (partition by game_id order by play_id) - elapsed_secs, 0), 0) as play_secs
+  from play_clock
+),
+
+possession as (
+  select
+    game_id,
+    team,
+    sum(play_secs) as time_of_possession_secs,
+    sum(case when yardline_100 <= 20 and first_down = 1 then 1 else 0 end) as red_zone_first_downs
+  from plays
+  group by 1, 2
+),
+
+team_games as (
+  select
+    s.game_id,
+    s.season,
+    s.week,
+    s.team,
+    s.total_yards,
+    s.total_epa,
+    s.third_down_conversion_rate,
+    s.turnovers,
+    p.time_of_possession_secs,
+    p.red_zone_first_downs
+  from {{ ref('stg_team_stats') }} s
+  left join possession p
+    on p.game_id = s.game_id
+    and p.team = s.team
+),
+
+team_form as (
+  -- Each team's inputs as of the end of each game it played
+  select
+    game_id,
+    season,
+    week,
+    team,
+
+    {% for input, column in rolling_inputs.items() %}
+    avg({{ column }}) over (
+      partition by season, team
+      order by week
+      rows between 2 preceding and current row
+    ) as {{ input }},
+    {%- endfor %}
+
+    {% for input, column in last_game_inputs.items() %}
+    {{ column }} as {{ input }}{{ ',' if not loop.last }}
+    {%- endfor %}
+
+  from team_games
+),
+
+{% for side in ['home', 'away'] %}
+{{ side }}_inputs as (
+  select
+    g.game_id,
+    {% for input in model_inputs %}
+    f.{{ input }} as {{ side }}_{{ input }}{{ ',' if not loop.last }}
+    {%- endfor %}
+
+  from games g
+  -- Latest game strictly before this one, as in team_feature_store
+  left join team_form f
+    on f.team = g.{{ side }}_team
+    and f.season = g.season
+    and f.week < g.week
+  qualify row_number() over (
+    partition by g.game_id
+    order by f.week desc
+  ) = 1
+){{ ',' if not loop.last }}
+{% endfor %}
+
+select
+  g.*,
+  {{ star_except('h', ['game_id']) }},
+  {{ star_except('a', ['game_id']) }}
+
+from games g
+left join home_inputs h on g.game_id = h.game_id
+left join away_inputs a on g.game_id = a.game_id
@@ -0,0 +1,14 @@
+{{
+  config(
+    materialized='table',
+    description='GameOutcomeModel inputs for every unplayed game, from each team''s games strictly before it'
+  )
+}}
+
+select
+  {{ star_except('f', ['game_status']) }},
+  {{ dbt.current_timestamp() }} as updated_at
+
+from {{ ref('game_model_features') }} f
+where f.game_status = 'scheduled'
+order by season, week, game_id
@@ -1,7 +1,7 @@
 {{
   config(
-    materialized='view',
-    description='ML-ready dataset with home/away team features and game outcomes'
+    materialized='table',
+    description='ML-ready dataset with home/away team features and game outcomes, read from team_feature_store'
   )
 }}
 
@@ -48,21 +48,20 @@ home_team_features as (
 
     {# Generate home team features with 'home_' prefix #}
     {% for feature in team_features %}
-    t.{{ feature }} as home_{{ feature }},
+    f.{{ feature }} as home_{{ feature }},
     {%- endfor %}
 
     -- Additional home team context
-    t.recent_form as home_recent_form,
-    t.season_strength_tier as home_strength_tier,
-    t.momentum_direction as home_momentum,
-    t.games_played_to_date as home_games_played,
-    t.epa_rank_season as home_season_rank
+    f.recent_form as home_recent_form,
+    f.season_strength_tier as home_strength_tier,
+    f.momentum_direction as home_momentum,
+    f.games_played_to_date as home_games_played,
+    f.epa_rank_season as home_season_rank
 
   from game_base g
-  left join {{ ref('team_game_performance') }} t
-    on g.home_team = t.team
-    and g.season = t.season
-    and g.week = t.week + 1  -- Use previous week's performance for prediction
+  left join {{ ref('team_feature_store') }} f
+    on f.as_of_game_id = g.game_id
+    and f.team = g.home_team  -- Latest features strictly before this game
 ),
 
 away_team_features as (
@@ -71,28 +70,27 @@ away_team_features as (
 
     {# Generate away team features with 'away_' prefix #}
     {% for feature in team_features %}
-    t.{{ feature }} as away_{{ feature }},
+    f.{{ feature }} as away_{{ feature }},
     {%- endfor %}
 
     -- Additional away team context
-    t.recent_form as away_recent_form,
-    t.season_strength_tier as away_strength_tier,
-    t.momentum_direction as away_momentum,
-    t.games_played_to_date as away_games_played,
-    t.epa_rank_season as away_season_rank
+    f.recent_form as away_recent_form,
+    f.season_strength_tier as away_strength_tier,
+    f.momentum_direction as away_momentum,
+    f.games_played_to_date as away_games_played,
+    f.epa_rank_season as away_season_rank
 
   from game_base g
-  left join {{ ref('team_game_performance') }} t
-    on g.away_team = t.team
-    and g.season = t.season
-    and g.week = t.week + 1  -- Use previous week's performance for prediction
+  left join {{ ref('team_feature_store') }} f
+    on f.as_of_game_id = g.game_id
+    and f.team = g.away_team  -- Latest features strictly before this game
 ),
 
 feature_differentials as (
   select
     g.*,
-    h.* except(game_id),
-    a.* except(game_id),
+    {{ star_except('h', ['game_id']) }},
+    {{ star_except('a', ['game_id']) }},
 
     {# Calculate differential features (key for ML performance) #}
     {% for feature in team_features %}
@@ -145,7 +143,7 @@ final_features as (
     case when season >= 2023 then true else false end as recent_season,
 
     -- Record metadata
-    current_timestamp() as updated_at
+    {{ dbt.current_timestamp() }} as updated_at
 
   from feature_differentials
 )
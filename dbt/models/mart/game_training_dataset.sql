@@ -0,0 +1,18 @@
+{{
+  config(
+    materialized='table',
+    description='GameOutcomeModel training rows: every played game, its result and the inputs game_model_inputs served for it'
+  )
+}}
+
+select
+  {{ star_except('f', ['game_status', 'betting_relevant']) }},
+  g.home_score,
+  g.away_score,
+  g.home_win,
+  {{ dbt.current_timestamp() }} as updated_at
+
+from {{ ref('game_model_features') }} f
+join {{ ref('stg_games') }} g on g.game_id = f.game_id
+where f.game_status = 'completed'
+order by season, week, game_id
@@ -1,6 +1,10 @@
 {{
   config(
-    materialized='table',
+    materialized='incremental',
+    incremental_strategy=season_incremental_strategy(),
+    unique_key='season',
+    partition_by=season_partition(),
+    cluster_by=['team', 'week'],
     description='Player weekly performance with usage trends and team context'
   )
 }}
@@ -56,6 +60,10 @@ with player_base as (
     on ps.player_id = r.player_id
     and ps.season = r.season
   where ps.player_id is not null
+  {% if is_incremental() %}
+    -- Whole seasons only: every window below is partitioned by player and season
+    and {{ incremental_season_predicate('ps.season') }}
+  {% endif %}
 ),
 
 team_context as (
@@ -70,14 +78,17 @@ team_context as (
     t.total_plays as team_plays,
 
     -- Usage opportunity context
-    safe_divide(pb.targets, nullif(t.total_plays, 0)) as target_share_of_plays,
-    safe_divide(pb.rushing_attempts, nullif(t.total_plays, 0)) as rush_share_of_plays
+    {{ safe_divide('pb.targets', 'nullif(t.total_plays, 0)') }} as target_share_of_plays,
+    {{ safe_divide('pb.rushing_attempts', 'nullif(t.total_plays, 0)') }} as rush_share_of_plays
 
   from player_base pb
   left join {{ ref('team_game_performance') }} t
     on pb.team = t.team
     and pb.season = t.season
     and pb.week = t.week
+    {% if is_incremental() %}
+    and {{ incremental_season_predicate('t.season') }}
+    {% endif %}
 ),
 
 rolling_performance as (
@@ -161,7 +172,7 @@ trend_analysis as (
     end as usage_trend,
 
     -- Opportunity vs production efficiency
-    safe_divide(fantasy_points, nullif(targets + rushing_attempts, 0)) as points_per_opportunity,
+    {{ safe_divide('fantasy_points', 'nullif(targets + rushing_attempts, 0)') }} as points_per_opportunity,
 
     -- Consistency metrics
     case
@@ -214,11 +225,10 @@ final_metrics as (
     )) as fantasy_relevance_score,
 
     -- Record metadata
-    current_timestamp() as updated_at
+    {{ dbt.current_timestamp() }} as updated_at
 
   from trend_analysis
 )
 
 select * from final_metrics
-where games_played_season >= 1  -- Filter out players who haven't played
-order by season desc, week desc, fantasy_relevance_score desc
\ No newline at end of file
+where games_played_season >= 1  -- Filter out players who haven't played
\ No newline at end of file
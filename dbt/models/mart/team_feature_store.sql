@@ -0,0 +1,85 @@
+{{
+  config(
+    materialized='incremental',
+    incremental_strategy=season_incremental_strategy(),
+    unique_key='season',
+    partition_by=season_partition(),
+    cluster_by=['team', 'as_of_game_id'],
+    description='Point-in-time team features: the latest team_game_performance row strictly before each game a team plays'
+  )
+}}
+
+{# Features served per team; game_prediction_features and the Python reader select from these #}
+{%- set store_features = [
+    'total_epa_l3',
+    'total_yards_l3',
+    'points_scored_l3',
+    'third_down_conversion_rate_l3',
+    'red_zone_efficiency_l3',
+    'turnovers_l3',
+    'success_rate_l3',
+    'total_epa_l5',
+    'epa_trend_3v8',
+    'epa_volatility_l5',
+    'yards_per_play',
+    'epa_per_play',
+    'recent_form',
+    'season_strength_tier',
+    'momentum_direction',
+    'games_played_to_date',
+    'epa_rank_season'
+] -%}
+
+with team_games as (
+  -- Every scheduled or played game, once per participating team
+  select game_id as as_of_game_id, season, week, game_date, home_team as team, 'home' as home_away
+  from {{ ref('stg_games') }}
+  {% if is_incremental() %}
+  where {{ incremental_season_predicate() }}
+  {% endif %}
+
+  union all
+
+  select game_id as as_of_game_id, season, week, game_date, away_team as team, 'away' as home_away
+  from {{ ref('stg_games') }}
+  {% if is_incremental() %}
+  where {{ incremental_season_predicate() }}
+  {% endif %}
+),
+
+point_in_time as (
+  select
+    tg.team,
+    tg.as_of_game_id,
+    tg.season,
+    tg.week as as_of_week,
+    tg.game_date as as_of_date,
+    tg.home_away,
+
+    t.game_id as source_game_id,
+    t.week as source_week,
+    tg.week - t.week as weeks_since_source,
+
+    {% for feature in store_features %}
+    t.{{ feature }},
+    {%- endfor %}
+
+    {{ dbt.current_timestamp() }} as updated_at
+
+  from team_games tg
+  -- Latest game strictly before this one; unlike week = week + 1 this still
+  -- finds the previous game after a bye
+  left join {{ ref('team_game_performance') }} t
+    on t.team = tg.team
+    and t.season = tg.season
+    and t.week < tg.week
+    {% if is_incremental() %}
+    and {{ incremental_season_predicate('t.season') }}
+    {% endif %}
+  qualify row_number() over (
+    partition by tg.team, tg.as_of_game_id
+    order by t.week desc
+  ) = 1
+)
+
+select * from point_in_time
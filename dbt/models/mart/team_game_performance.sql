@@ -1,6 +1,10 @@
 {{
   config(
-    materialized='table',
+    materialized='incremental',
+    incremental_strategy=season_incremental_strategy(),
+    unique_key='season',
+    partition_by=season_partition(),
+    cluster_by=['team', 'week'],
     description='Team performance by game with rolling averages and advanced metrics'
   )
 }}
@@ -37,6 +41,10 @@ with base_team_stats as (
 
   from {{ ref('stg_team_stats') }}
   where team is not null
+  {% if is_incremental() %}
+    -- Whole seasons only: every window below is partitioned by season
+    and {{ incremental_season_predicate() }}
+  {% endif %}
 ),
 
 rolling_averages as (
@@ -87,9 +95,9 @@ trend_analysis as (
     ) as epa_volatility_l5,
 
     -- Efficiency ratios
-    safe_divide(total_yards, nullif(total_plays, 0)) as yards_per_play,
-    safe_divide(total_epa, nullif(total_plays, 0)) as epa_per_play,
-    safe_divide(points_scored, nullif(total_yards, 0)) * 100 as points_per_100_yards
+    {{ safe_divide('total_yards', 'nullif(total_plays, 0)') }} as yards_per_play,
+    {{ safe_divide('total_epa', 'nullif(total_plays, 0)') }} as epa_per_play,
+    {{ safe_divide('points_scored', 'nullif(total_yards, 0)') }} * 100 as points_per_100_yards
 
   from rolling_averages
 ),
@@ -153,10 +161,9 @@ final_rankings as (
     ) as epa_percentile_weekly,
 
     -- Record updated timestamp for tracking
-    current_timestamp() as updated_at
+    {{ dbt.current_timestamp() }} as updated_at
 
   from form_indicators
 )
 
-select * from final_rankings
-order by season desc, week desc, epa_rank_weekly
\ No newline at end of file
+select * from final_rankings
\ No newline at end of file
@@ -189,10 +189,10 @@ final_analysis as (
     end as research_priority,
 
     -- Days until game for urgency
-    date_diff(game_date, current_date(), day) as days_until_game,
+    {{ date_difference('game_date', 'current_date()', 'day') }} as days_until_game,
 
     -- Record timestamp
-    current_timestamp() as analysis_timestamp
+    {{ dbt.current_timestamp() }} as analysis_timestamp
 
   from confidence_scoring
 )
@@ -10,7 +10,7 @@ select
     , away_team
 
     -- updoming week y/n
-    , case when gameday between current_date() and date_add(current_date(), interval 7 day) then true else false end as upcoming_week
+    , case when gameday between current_date() and {{ add_days('current_date()', 7) }} then true else false end as upcoming_week
 
 from {{ source('nfl_data', 'schedule_2025') }}
 
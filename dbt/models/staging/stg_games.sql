@@ -5,7 +5,7 @@ select
   season,
   week,
   game_type as season_type,
-  parse_date('%Y-%m-%d', gameday) as game_date,
+  {{ parse_iso_date('gameday') }} as game_date,
   gametime as game_time,
   home_team,
   away_team,
@@ -28,18 +28,18 @@ select
 
   -- Additional derived fields
   case when week <= 18 then 'regular' else 'playoff' end as season_phase,
-  extract(dayofweek from parse_date('%Y-%m-%d', gameday)) as game_day_of_week,
+  {{ day_of_week(parse_iso_date('gameday')) }} as game_day_of_week,
   case
-    when extract(dayofweek from parse_date('%Y-%m-%d', gameday)) = 1 then 'Sunday'
-    when extract(dayofweek from parse_date('%Y-%m-%d', gameday)) = 2 then 'Monday'
-    when extract(dayofweek from parse_date('%Y-%m-%d', gameday)) = 5 then 'Thursday'
-    when extract(dayofweek from parse_date('%Y-%m-%d', gameday)) = 7 then 'Saturday'
+    when {{ day_of_week(parse_iso_date('gameday')) }} = 1 then 'Sunday'
+    when {{ day_of_week(parse_iso_date('gameday')) }} = 2 then 'Monday'
+    when {{ day_of_week(parse_iso_date('gameday')) }} = 5 then 'Thursday'
+    when {{ day_of_week(parse_iso_date('gameday')) }} = 7 then 'Saturday'
     else 'Other'
   end as game_day_name,
 
   -- Betting relevance
   case
-    when parse_date('%Y-%m-%d', gameday) between current_date() and date_add(current_date(), interval 7 day)
+    when {{ parse_iso_date('gameday') }} between current_date() and {{ add_days('current_date()', 7) }}
     then true else false
   end as upcoming_week
 
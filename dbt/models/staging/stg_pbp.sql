@@ -1,4 +1,13 @@
-{{ config(materialized='view') }}
+{{
+  config(
+    materialized='incremental',
+    incremental_strategy=season_incremental_strategy(),
+    unique_key='season',
+    partition_by=season_partition(),
+    cluster_by=['posteam', 'week'],
+    description='Play-by-play, scanned from pbp_data once per run and stored by season'
+  )
+}}
 
 select
   play_id,
@@ -57,4 +66,6 @@ select
 
 from {{ source('nfl_data', 'pbp_data') }}
 where posteam is not null  -- Filter out plays without a possessing team
-order by game_id, play_id
\ No newline at end of file
+{% if is_incremental() %}
+  and {{ incremental_season_predicate() }}
+{% endif %}
\ No newline at end of file
@@ -32,31 +32,31 @@ select
   -- Derived stats
   case
     when attempts > 0 then
-      round(cast(completions as float64) / cast(attempts as float64), 3)
+      round(cast(completions as {{ type_float64() }}) / cast(attempts as {{ type_float64() }}), 3)
     else null
   end as completion_percentage,
 
   case
     when attempts > 0 then
-      round(cast(passing_yards as float64) / cast(attempts as float64), 1)
+      round(cast(passing_yards as {{ type_float64() }}) / cast(attempts as {{ type_float64() }}), 1)
     else null
   end as yards_per_attempt,
 
   case
     when carries > 0 then
-      round(cast(rushing_yards as float64) / cast(carries as float64), 1)
+      round(cast(rushing_yards as {{ type_float64() }}) / cast(carries as {{ type_float64() }}), 1)
     else null
   end as yards_per_carry,
 
   case
     when targets > 0 then
-      round(cast(receptions as float64) / cast(targets as float64), 3)
+      round(cast(receptions as {{ type_float64() }}) / cast(targets as {{ type_float64() }}), 3)
     else null
   end as catch_rate,
 
   case
     when receptions > 0 then
-      round(cast(receiving_yards as float64) / cast(receptions as float64), 1)
+      round(cast(receiving_yards as {{ type_float64() }}) / cast(receptions as {{ type_float64() }}), 1)
     else null
   end as yards_per_reception
 
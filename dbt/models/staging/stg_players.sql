@@ -50,7 +50,7 @@ select
 
   -- Derived fields
   case
-    when birth_date is not null then date_diff(current_date(), date(birth_date), year)
+    when birth_date is not null then {{ date_difference('current_date()', 'date(birth_date)', 'year') }}
     else null
   end as age,
 
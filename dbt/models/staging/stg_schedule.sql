@@ -6,7 +6,7 @@ select
   season,
   week,
   game_type as season_type,
-  parse_date('%Y-%m-%d', gameday) as game_date,
+  {{ parse_iso_date('gameday') }} as game_date,
   gametime as game_time,
   home_team,
   away_team,
@@ -14,7 +14,7 @@ select
   null as network,  -- Can be enhanced when network data available
 
   case
-    when extract(dayofweek from parse_date('%Y-%m-%d', gameday)) in (2, 5) then true  -- Monday/Thursday
+    when {{ day_of_week(parse_iso_date('gameday')) }} in (2, 5) then true  -- Monday/Thursday
     else false
   end as primetime,
 
@@ -31,16 +31,16 @@ select
 
   -- Days until game (for scheduled games)
   case
-    when parse_date('%Y-%m-%d', gameday) >= current_date() then date_diff(parse_date('%Y-%m-%d', gameday), current_date(), day)
+    when {{ parse_iso_date('gameday') }} >= current_date() then {{ date_difference(parse_iso_date('gameday'), 'current_date()', 'day') }}
     else null
   end as days_until_game,
 
   -- Betting relevance
   case
-    when parse_date('%Y-%m-%d', gameday) between current_date() and date_add(current_date(), interval 7 day)
+    when {{ parse_iso_date('gameday') }} between current_date() and {{ add_days('current_date()', 7) }}
     then true else false
   end as upcoming_week
 
 from {{ source('nfl_data', 'games') }}
 where home_score is null  -- Focus on scheduled games
-order by season, week, parse_date('%Y-%m-%d', gameday)
\ No newline at end of file
+order by season, week, {{ parse_iso_date('gameday') }}
\ No newline at end of file
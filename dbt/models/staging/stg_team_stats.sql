@@ -1,4 +1,12 @@
-{{ config(materialized='view') }}
+{{
+  config(
+    materialized='incremental',
+    incremental_strategy=season_incremental_strategy(),
+    unique_key='season',
+    partition_by=season_partition(),
+    cluster_by=['team', 'week']
+  )
+}}
 
 -- Team game-level statistics aggregated from play-by-play data
 with base_pbp as (
@@ -20,6 +28,9 @@ with base_pbp as (
     yardline_100
   from {{ ref('stg_pbp') }}
   where posteam is not null
+  {% if is_incremental() %}
+    and {{ incremental_season_predicate() }}
+  {% endif %}
 ),
 
 game_context as (
@@ -99,21 +110,20 @@ select
   -- Derived efficiency metrics
   case
     when third_down_attempts > 0 then
-      round(cast(third_down_conversions as float64) / cast(third_down_attempts as float64), 3)
+      round(cast(third_down_conversions as {{ type_float64() }}) / cast(third_down_attempts as {{ type_float64() }}), 3)
     else null
   end as third_down_conversion_rate,
 
   case
     when red_zone_attempts > 0 then
-      round(cast(red_zone_scores as float64) / cast(red_zone_attempts as float64), 3)
+      round(cast(red_zone_scores as {{ type_float64() }}) / cast(red_zone_attempts as {{ type_float64() }}), 3)
     else null
   end as red_zone_efficiency,
 
   case
     when total_plays > 0 then
-      round(cast(successful_plays as float64) / cast(total_plays as float64), 3)
+      round(cast(successful_plays as {{ type_float64() }}) / cast(total_plays as {{ type_float64() }}), 3)
     else null
   end as success_rate
 
-from team_stats_by_game
-order by season desc, week desc, team
\ No newline at end of file
+from team_stats_by_game
\ No newline at end of file
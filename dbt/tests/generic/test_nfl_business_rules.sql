@@ -17,7 +17,7 @@ select *
 from {{ model }}
 where {{ column_name }} not in (
   'ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN',
-  'DET', 'GB', 'HOU', 'IND', 'JAX', 'KC', 'LV', 'LAC', 'LAR', 'MIA',
+  'DET', 'GB', 'HOU', 'IND', 'JAX', 'KC', 'LV', 'LA', 'LAC', 'LAR', 'MIA',
   'MIN', 'NE', 'NO', 'NYG', 'NYJ', 'PHI', 'PIT', 'SEA', 'SF', 'TB', 'TEN', 'WAS'
 )
 
@@ -0,0 +1,184 @@
+"""
+Walk-forward backtesting for GameOutcomeModel.
+
+Every week of the test seasons is one fold: the model is refit on every
+labeled game played before that week (an expanding window) and scored on the
+week's games, so no fold ever trains on its own future. Games are sorted by
+(season, week) once and the raw feature matrix is prepared once; each fold's
+training set is then a leading slice of that matrix and its test set the
+slice right after it, both views rather than copies. Folds run in parallel
+with joblib.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.metrics import accuracy_score, brier_score_loss, log_loss, roc_auc_score
+
+from ml.models.game_outcomes import GAME_KEYS, GameOutcomeModel
+
+MODEL_TYPES = ('random_forest', 'logistic_regression')
+
+
+@dataclass(frozen=True)
+class Fold:
+    """One walk-forward step: train on rows [0, train_end), test on [train_end, test_end)."""
+
+    season: int
+    week: int
+    train_end: int
+    test_end: int
+
+
+def fit_fold(model_type: str, X: np.ndarray, y: np.ndarray, fold: Fold) -> np.ndarray:
+    """
+    Refit a fresh model on a fold's training slice and score its test slice.
+
+    Fill values and scaling are fitted on the training slice only, as
+    GameOutcomeModel.train does.
+
+    Returns:
+        Home win probability per test game
+    """
+    model = GameOutcomeModel(model_type)
+    features = model.features.fit_matrix(X[:fold.train_end])
+    X_train = model.scaler.fit_transform(features.impute(X[:fold.train_end]))
+    model.model.fit(X_train, y[:fold.train_end])
+
+    X_test = model.scaler.transform(features.impute(X[fold.train_end:fold.test_end]))
+    return model.model.predict_proba(X_test)[:, 1]
+
+
+class WalkForwardBacktest:
+    """
+    Expanding-window, week-by-week backtest over game_training_dataset rows.
+    """
+
+    def __init__(self, df: pd.DataFrame, test_seasons: Sequence[int], min_train_games: int = 200):
+        """
+        Args:
+            df: game_training_dataset rows (GAME_KEYS, home_win and FEATURE_COLUMNS)
+            test_seasons: Seasons to walk forward through; earlier seasons
+                are only ever used for training
+            min_train_games: Skip weeks with fewer labeled games before them
+        """
+        labeled = df[df['home_win'].notna()]
+        if len(labeled) < len(df):
+            logging.info(f"Dropping {len(df) - len(labeled)} games without a result (ties or unplayed)")
+
+        self.games = labeled.sort_values(['season', 'week', 'game_id'], kind='stable').reset_index(drop=True)
+        self.X = GameOutcomeModel().features.raw_matrix(self.games)
+        self.y = self.games['home_win'].to_numpy(dtype='int8')
+        self.test_seasons = sorted(test_seasons)
+        self.min_train_games = min_train_games
+
+    def folds(self) -> List[Fold]:
+        """Fold per (season, week) of the test seasons, in time order."""
+        keys = self.games[['season', 'week']].to_numpy()
+        # Row where each (season, week) block starts, and where it ends
+        starts = np.flatnonzero(np.r_[True, (keys[1:] != keys[:-1]).any(axis=1)])
+        ends = np.r_[starts[1:], len(keys)]
+
+        folds = []
+        for start, end in zip(starts, ends):
+            season, week = (int(v) for v in keys[start])
+            if season in self.test_seasons and start >= self.min_train_games:
+                folds.append(Fold(season, week, int(start), int(end)))
+        return folds
+
+    def run(self, model_types: Sequence[str] = MODEL_TYPES, n_jobs: int = -1) -> pd.DataFrame:
+        """
+        Run every fold for every model type.
+
+        Args:
+            model_types: GameOutcomeModel model types to backtest
+            n_jobs: joblib workers (-1 = all cores, 1 = serial)
+
+        Returns:
+            One row per (model_type, test game) with GAME_KEYS, home_win and
+            home_win_probability
+        """
+        folds = self.folds()
+        # Largest training sets first so the slowest fits don't finish last
+        tasks = sorted(
+            ((model_type, fold) for model_type in model_types for fold in folds),
+            key=lambda task: -task[1].train_end,
+        )
+        logging.info(f"Backtesting {len(folds)} weeks x {len(model_types)} models on {n_jobs} jobs")
+
+        started = time.perf_counter()
+        probabilities = Parallel(n_jobs=n_jobs)(
+            delayed(fit_fold)(model_type, self.X, self.y, fold) for model_type, fold in tasks
+        )
+        logging.info(f"Backtest finished in {time.perf_counter() - started:.1f}s")
+
+        frames = []
+        for (model_type, fold), proba in zip(tasks, probabilities):
+            games = self.games.iloc[fold.train_end:fold.test_end]
+            frame = games[GAME_KEYS + ['home_win']].assign(model_type=model_type, home_win_probability=proba)
+            frames.append(frame)
+        predictions = pd.concat(frames, ignore_index=True)
+        predictions['home_win'] = predictions['home_win'].astype(int)
+        return predictions.sort_values(['model_type', 'season', 'week', 'game_id'], ignore_index=True)
+
+
+def expected_calibration_error(y: np.ndarray, p: np.ndarray, bins: int = 10) -> float:
+    """Game-weighted gap between predicted and observed win rate over equal-width bins."""
+    bin_ids = np.minimum((p * bins).astype(int), bins - 1)
+    games = np.bincount(bin_ids, minlength=bins)
+    predicted = np.bincount(bin_ids, weights=p, minlength=bins)
+    observed = np.bincount(bin_ids, weights=y, minlength=bins)
+    filled = games > 0
+    return float(np.abs(predicted[filled] - observed[filled]).sum() / len(y))
+
+
+def score(y: np.ndarray, p: np.ndarray) -> Dict[str, float]:
+    """Accuracy, ROC-AUC, log loss, Brier score and calibration error for one group."""
+    return {
+        'games': len(y),
+        'accuracy': accuracy_score(y, p > 0.5),
+        # AUC is undefined when every game in the group went the same way
+        'roc_auc': roc_auc_score(y, p) if len(np.unique(y)) == 2 else np.nan,
+        'log_loss': log_loss(y, p, labels=[0, 1]),
+        'brier': brier_score_loss(y, p),
+        'calibration_error': expected_calibration_error(y, p),
+    }
+
+
+def summarize(predictions: pd.DataFrame, by: Sequence[str] = ('model_type', 'season')) -> pd.DataFrame:
+    """
+    Metrics per group of backtest predictions, e.g. per season or per (season, week).
+    """
+    by = list(by)
+    rows = []
+    for keys, group in predictions.groupby(by if len(by) > 1 else by[0], sort=True):
+        keys = keys if len(by) > 1 else (keys,)
+        metrics = score(group['home_win'].to_numpy(), group['home_win_probability'].to_numpy())
+        rows.append({**dict(zip(by, keys)), **metrics})
+    return pd.DataFrame(rows)
+
+
+def calibration_table(
+    predictions: pd.DataFrame, bins: int = 10, by: Optional[Sequence[str]] = ('model_type',)
+) -> pd.DataFrame:
+    """
+    Predicted vs observed home win rate per probability bin.
+    """
+    edges = np.linspace(0, 1, bins + 1)
+    binned = predictions.assign(
+        bin=pd.cut(predictions['home_win_probability'], edges, include_lowest=True)
+    )
+    return (
+        binned.groupby(list(by or []) + ['bin'], observed=True)
+        .agg(
+            games=('home_win', 'size'),
+            mean_predicted=('home_win_probability', 'mean'),
+            observed_rate=('home_win', 'mean'),
+        )
+        .reset_index()
+    )
@@ -0,0 +1,142 @@
+"""
+Training data access for the Game Outcome Models.
+
+Reads only the columns GameOutcomeModel and the backtests use from
+game_training_dataset, downloads them as Arrow (through the BigQuery Storage
+Read API when google-cloud-bigquery-storage is installed) and keeps each
+result in a local Arrow file. The cache key is the query's hash plus the
+table's last-modified time, so a rebuilt table is downloaded again while
+repeated training runs, backtests and notebook sessions read the local copy
+and skip the warehouse.
+"""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import pandas as pd
+import pyarrow as pa
+from pyarrow import feather
+
+from ml.models.game_outcomes import FEATURE_COLUMNS, GAME_KEYS
+
+logger = logging.getLogger(__name__)
+
+TRAINING_TABLE = "nfl-analytics-472221.nfl_data.game_training_dataset"
+TRAINING_COLUMNS = GAME_KEYS + ['home_win'] + FEATURE_COLUMNS
+TRAINING_CACHE_DIR = os.getenv("NFL_TRAINING_CACHE_DIR", ".training_cache")
+
+
+class TrainingData:
+    """
+    Projected, locally cached reads of game_training_dataset.
+    """
+
+    def __init__(
+        self,
+        client=None,
+        table: str = TRAINING_TABLE,
+        columns: Sequence[str] = TRAINING_COLUMNS,
+        cache_dir: str = TRAINING_CACHE_DIR,
+    ):
+        """
+        Args:
+            client: google.cloud.bigquery.Client; created on first use if omitted
+            table: Fully qualified table id
+            columns: Columns to select
+            cache_dir: Directory holding the cached results
+        """
+        self._client = client
+        self.table = table
+        self.columns = list(columns)
+        self.cache_dir = Path(cache_dir)
+
+    @property
+    def client(self):
+        if self._client is None:
+            from google.cloud import bigquery
+
+            self._client = bigquery.Client()
+        return self._client
+
+    def query(self, first_season: Optional[int] = None, last_season: Optional[int] = None) -> str:
+        """
+        SQL selecting the projected columns for a range of seasons.
+        """
+        conditions = []
+        if first_season is not None:
+            conditions.append(f"season >= {int(first_season)}")
+        if last_season is not None:
+            conditions.append(f"season <= {int(last_season)}")
+        where = f"\nWHERE {' AND '.join(conditions)}" if conditions else ""
+        return f"SELECT {', '.join(self.columns)}\nFROM `{self.table}`{where}"
+
+    def table_version(self) -> str:
+        """
+        The table's last-modified time, read from its metadata without running a query.
+        """
+        modified = self.client.get_table(self.table).modified
+        return modified.strftime("%Y%m%dT%H%M%S%f")
+
+    def cache_path(self, sql: str, version: str) -> Path:
+        query_hash = hashlib.sha256(f"{self.table}\n{sql}".encode()).hexdigest()[:16]
+        return self.cache_dir / f"{query_hash}-{version}.arrow"
+
+    def load(
+        self, first_season: Optional[int] = None, last_season: Optional[int] = None, refresh: bool = False
+    ) -> pd.DataFrame:
+        """
+        Load game_training_dataset rows, from the local cache when the table is unchanged.
+
+        Args:
+            first_season: First season to include (default: all)
+            last_season: Last season to include (default: all)
+            refresh: Download even if a cached copy exists
+
+        Returns:
+            One row per game with GAME_KEYS, home_win and FEATURE_COLUMNS
+        """
+        sql = self.query(first_season, last_season)
+        path = self.cache_path(sql, self.table_version())
+
+        if path.exists() and not refresh:
+            table = feather.read_table(path)
+            logger.info(f"Loaded {table.num_rows} training rows from local cache {path}")
+            return table.to_pandas()
+
+        logger.info(f"Loading training data from BigQuery ({len(self.columns)} columns)...")
+        table = self._download(sql)
+        self._write(path, table)
+        logger.info(f"Loaded {table.num_rows} training rows, {table.nbytes / 1024**2:.1f} MB, cached at {path}")
+        return table.to_pandas()
+
+    def _download(self, sql: str) -> pa.Table:
+        # Uses the Storage Read API for large results when it's installed,
+        # the REST API otherwise; either way rows arrive as Arrow batches
+        return self.client.query(sql).to_arrow(create_bqstorage_client=True)
+
+    def _write(self, path: Path, table: pa.Table) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        feather.write_feather(table, tmp)
+        os.replace(tmp, path)
+        # Copies of the same query from older versions of the table are dead
+        query_hash = path.name.split("-", 1)[0]
+        for stale in self.cache_dir.glob(f"{query_hash}-*.arrow"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+
+    def clear(self) -> List[Path]:
+        """
+        Delete every cached result.
+
+        Returns:
+            The removed files
+        """
+        removed = sorted(self.cache_dir.glob("*.arrow"))
+        for path in removed:
+            path.unlink()
+        return removed
+
@@ -1,99 +1,111 @@
 import pandas as pd
 import numpy as np
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.linear_model import LogisticRegression
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import accuracy_score, classification_report, roc_auc_score
-from sklearn.preprocessing import StandardScaler
-import joblib
 from typing import Optional, Tuple, Dict
 import logging
 
+from nfl_analytics.ml.artifact import read_artifact, write_artifact
+from nfl_analytics.ml.feature_pipeline import FeatureInput, FeaturePipeline
+
+FEATURE_COLUMNS = [
+    'home_avg_yards_l3', 'home_avg_epa_l3', 'home_third_down_rate_l3', 
+    'home_turnovers_l3', 'home_top_secs_l3',
+
+    'away_avg_yards_l3', 'away_avg_epa_l3', 'away_third_down_rate_l3', 
+    'away_turnovers_l3', 'away_top_secs_l3',
+
+    'home_total_yards_wm1', 'home_total_epa_wm1', 'home_third_down_rate_wm1', 
+    'home_turnovers_wm1', 'home_top_secs_wm1', 'home_rz_first_downs_wm1',
+
+    'away_total_yards_wm1', 'away_total_epa_wm1', 'away_third_down_rate_wm1', 
+    'away_turnovers_wm1', 'away_top_secs_wm1', 'away_rz_first_downs_wm1'
+]
+
+# Identify a game in training data and predictions
+GAME_KEYS = ['game_id', 'season', 'week', 'home_team', 'away_team']
+
+# Estimator settings per model type; GameOutcomeModel(params=...) overrides them
+DEFAULT_PARAMS = {
+    'random_forest': {
+        'n_estimators': 100,
+        'max_depth': 10,
+        'random_state': 42,
+        'class_weight': 'balanced'
+    },
+    'logistic_regression': {
+        'max_iter': 1000,
+        'random_state': 42,
+        'class_weight': 'balanced'
+    },
+    'xgboost': {
+        'n_estimators': 200,
+        'max_depth': 4,
+        'learning_rate': 0.05,
+        'subsample': 0.8,
+        'colsample_bytree': 0.8,
+        'random_state': 42,
+        'eval_metric': 'logloss'
+    },
+}
+
 class GameOutcomeModel:
     """ 
     Predicts game outcomes
     """
 
-    def __init__(self, model_type: str = 'random_forest'):
+    def __init__(self, model_type: str = 'random_forest', params: Optional[Dict] = None):
         """ 
         initialize the model
         Args: 
-            model_type: 'random_forest' or 'logistic_regression'
+            model_type: 'random_forest', 'logistic_regression' or 'xgboost'
+            params: Estimator hyperparameters overriding DEFAULT_PARAMS
         """
 
+        if model_type not in DEFAULT_PARAMS:
+            raise ValueError(f"Invalid model type: {model_type}")
+
+        # sklearn is imported here rather than at module load, so importing
+        # FEATURE_COLUMNS or the training data loader stays cheap
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.linear_model import LogisticRegression
+        from sklearn.preprocessing import StandardScaler
+
         self.model_type = model_type
-        self.model = None
+        self.params = {**DEFAULT_PARAMS[model_type], **(params or {})}
         self.scaler = StandardScaler()
-        self.feature_columns = None
+        self.feature_columns = list(FEATURE_COLUMNS)
+        self.features = FeaturePipeline(self.feature_columns)
+        self.training_window: Dict = {}
+        self.metrics: Dict = {}
         self.is_trained = False
 
         # Initialize the model
         if model_type == 'random_forest':
-            self.model = RandomForestClassifier(
-                n_estimators=100,
-                max_depth=10,
-                random_state=42,
-                class_weight='balanced'
-            )
+            self.model = RandomForestClassifier(**self.params)
 
         elif model_type == 'logistic_regression':
-            self.model = LogisticRegression(
-                max_iter=1000,
-                random_state=42,
-                class_weight='balanced'
-            )
+            self.model = LogisticRegression(**self.params)
 
         else:
-            raise ValueError(f"Invalid model type: {model_type}")
+            from xgboost import XGBClassifier
+
+            self.model = XGBClassifier(**self.params)
     
-    def prepare_features(self, df: pd.DataFrame) -> pd.DataFrame:
+    def prepare_features(self, data: FeatureInput, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
-        prepare features for training
+        prepare features for training or prediction
 
         Args:
-            df: Dataframe from game_training_dataset
-        
-        Returns:
-            Feature matrix
-        """ 
-
-        feature_cols = [
-            'home_avg_yards_l3', 'home_avg_epa_l3', 'home_third_down_rate_l3', 
-            'home_turnovers_l3', 'home_top_secs_l3',
-
-            'away_avg_yards_l3', 'away_avg_epa_l3', 'away_third_down_rate_l3', 
-            'away_turnovers_l3', 'away_top_secs_l3',
-
-            'home_total_yards_wm1', 'home_total_epa_wm1', 'home_third_down_rate_wm1', 
-            'home_turnovers_wm1', 'home_top_secs_wm1', 'home_rz_first_downs_wm1',
+            data: DataFrame from game_training_dataset, one game as a dict,
+                or a list of such dicts
+            out: Optional preallocated float32 buffer to write into
 
-            'away_total_yards_wm1', 'away_total_epa_wm1', 'away_third_down_rate_wm1', 
-            'away_turnovers_wm1', 'away_top_secs_wm1', 'away_rz_first_downs_wm1'
-        ]
+        Returns:
+            Contiguous float32 feature matrix in feature_columns order
+        """
+        if not self.features.is_fitted:
+            raise ValueError("Feature pipeline must be fitted (train or load a model) before preparing features")
+        return self.features.transform(data, out=out)
 
-        if self.feature_columns is None:
-            self.feature_columns = feature_cols
-        
-        features = df[feature_cols].copy()
-        for col in features.columns:
-            features[col] = pd.to_numeric(features[col], errors='coerce')
-        
-        for col in features.columns:
-            if 'rate' in col.lower():
-                features[col] = features[col].fillna(0.5)
-            elif 'turnovers' in col.lower():
-                features[col] = features[col].fillna(1.0)
-            elif 'epa' in col.lower():
-                features[col] = features[col].fillna(0)
-            else:
-                # Convert to float first to handle median calculation properly
-                features[col] = features[col].astype('float64')
-                median_val = features[col].median()
-                features[col] = features[col].fillna(median_val)
-
-
-        return features 
-    
     def train(self, df: pd.DataFrame) -> Dict:
         """
         Train the model on game data.
@@ -104,20 +116,21 @@ class GameOutcomeModel:
         Returns:
             Dictionary with training metrics
         """
-        logging.info(f"Training {self.model_type} model...")
+        from sklearn.metrics import accuracy_score, roc_auc_score
+        from sklearn.model_selection import train_test_split
 
-        X = self.prepare_features(df)
-        y = df['home_win'].copy()
+        logging.info(f"Training {self.model_type} model...")
 
-        mask = y.notna()
-        X = X[mask]
-        y = y[mask]
+        labeled = df[df['home_win'].notna()]
+        logging.info(f"Training on {len(labeled)} games")
 
-        logging.info(f"Training on {len(X)} games")
+        train_df, val_df = train_test_split(labeled, test_size=0.2, random_state=42, stratify=labeled['home_win'])
+        # Fill values come from the training split only
+        self.features.fit(train_df)
 
-        X_train, X_val, y_train, y_val = train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
-        X_train_scaled = self.scaler.fit_transform(X_train)
-        X_val_scaled = self.scaler.transform(X_val)
+        X_train_scaled = self.scaler.fit_transform(self.prepare_features(train_df))
+        X_val_scaled = self.scaler.transform(self.prepare_features(val_df))
+        y_train, y_val = train_df['home_win'].astype(int), val_df['home_win'].astype(int)
 
         self.model.fit(X_train_scaled, y_train)
         self.is_trained = True
@@ -128,14 +141,35 @@ class GameOutcomeModel:
         metrics = {
             'accuracy': accuracy_score(y_val, y_pred),
             'roc_auc': roc_auc_score(y_val, y_pred_proba),
-            'training_samples': len(X_train),
-            'validation_samples': len(X_val)
+            'training_samples': len(train_df),
+            'validation_samples': len(val_df)
         }
         logging.info(f"Validation Accuracy: {metrics['accuracy']:.3f}")
         logging.info(f"Validation ROC-AUC: {metrics['roc_auc']:.3f}")
+
+        self.metrics = metrics
+        self.training_window = {'games': len(labeled)}
+        if 'season' in labeled.columns:
+            self.training_window.update(first_season=int(labeled['season'].min()), last_season=int(labeled['season'].max()))
         
         return metrics
-        
+
+    def predict_proba(self, data: FeatureInput) -> np.ndarray:
+        """
+        Home win probability per game.
+
+        Args:
+            data: DataFrame, one game as a dict, or a list of dicts
+
+        Returns:
+            Array with one probability per game
+        """
+        if not self.is_trained:
+            raise ValueError("Model must be trained before predictions can be made")
+
+        X_scaled = self.scaler.transform(self.prepare_features(data))
+        return self.model.predict_proba(X_scaled)[:, 1]
+
     def predict(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Make prediction on new games.
@@ -146,14 +180,7 @@ class GameOutcomeModel:
         Returns:
             dataframe with predictions
         """
-
-        if not self.is_trained:
-            raise ValueError("Model must be trained before predictions can be made")
-        
-        X = self.prepare_features(df)
-        X_scaled = self.scaler.transform(X)
-
-        predictions = self.model.predict_proba(X_scaled)[:, 1] # Home Win Probs
+        predictions = self.predict_proba(df) # Home Win Probs
 
         result_df = df.copy() 
         result_df['home_win_probability'] = predictions
@@ -165,7 +192,7 @@ class GameOutcomeModel:
     
     def get_feature_importance(self) -> pd.DataFrame:
         """ 
-        Get feature importance for the model (RandomForest Only)
+        Get feature importance for the model (RandomForest / XGBoost only)
 
         Returns:
             dataframe with feature importance scores
@@ -174,8 +201,8 @@ class GameOutcomeModel:
         if not self.is_trained:
             raise ValueError("Model must be trained before feature importance can be calculated")
 
-        if self.model_type != 'random_forest':
-            raise ValueError("Feature importance is only available for RandomForest models")
+        if self.model_type not in ('random_forest', 'xgboost'):
+            raise ValueError("Feature importance is only available for RandomForest and XGBoost models")
         
         importance_df = pd.DataFrame({
             'feature': self.feature_columns,
@@ -196,9 +223,13 @@ class GameOutcomeModel:
             'model': self.model,
             'scaler': self.scaler,
             'feature_columns': self.feature_columns,
-            'model_type': self.model_type
+            'model_type': self.model_type,
+            'params': self.params,
+            'feature_pipeline': self.features.to_dict()
         }
 
+        import joblib
+
         joblib.dump(model_data, path)
         logging.info(f"Model saved to {path}")
     
@@ -206,10 +237,58 @@ class GameOutcomeModel:
         """
         Load the model from a file
         """
+        import joblib
+
         model_data = joblib.load(path)
         self.model = model_data['model']
         self.scaler = model_data['scaler']
         self.feature_columns = model_data['feature_columns']
         self.model_type = model_data['model_type']
+        self.params = model_data.get('params', self.model.get_params())
+        if 'feature_pipeline' in model_data:
+            self.features = FeaturePipeline.from_dict(model_data['feature_pipeline'])
+        else:
+            logging.warning(f"{path} has no stored fill values; using training means for median-filled features")
+            self.features = FeaturePipeline.from_scaler(self.feature_columns, self.scaler)
+        self.is_trained = True
+        logging.info(f"Model loaded from {path}")
+
+    def save_artifact(self, path: str):
+        """
+        Save the model as a versioned, memory-mappable artifact directory
+        (see nfl_analytics.ml.artifact)
+        """
+        if not self.is_trained:
+            raise ValueError("Model must be trained before saving")
+
+        write_artifact(
+            path,
+            model_type=self.model_type,
+            estimator=self.model,
+            scaler=self.scaler,
+            feature_columns=self.feature_columns,
+            fill_values=self.features.fill_values,
+            params=self.params,
+            training_window=self.training_window,
+            metrics=self.metrics,
+        )
+
+    def load_artifact(self, path: str, verify: bool = False):
+        """
+        Load a model saved with save_artifact. Arrays are memory-mapped, not
+        read, and an artifact trained on other feature columns is refused.
+        """
+        artifact = read_artifact(path, feature_columns=FEATURE_COLUMNS, verify=verify)
+        manifest = artifact.manifest
+        self.model = artifact.estimator
+        self.scaler = artifact.scaler
+        self.feature_columns = artifact.feature_columns
+        self.model_type = artifact.model_type
+        self.params = manifest['params']
+        self.training_window = manifest['training_window']
+        self.metrics = manifest['metrics']
+        self.features = FeaturePipeline.from_dict(
+            {'columns': self.feature_columns, 'fill_values': artifact.array('fill_values')}
+        )
         self.is_trained = True
-        logging.info(f"Model loaded from {path}")
\ No newline at end of file
+        logging.info(f"Model artifact loaded from {path}")
@@ -0,0 +1,63 @@
+"""
+Walk-forward backtest for the Game Outcome Models
+
+This script:
+1. Loads game_training_dataset from BigQuery
+2. Refits each model type week by week over the test seasons, folds in parallel
+3. Writes per-game predictions, per-season and per-week metrics and a calibration table
+"""
+
+import argparse
+import logging
+from pathlib import Path
+
+import pandas as pd
+
+from ml.backtesting.walk_forward import MODEL_TYPES, WalkForwardBacktest, calibration_table, summarize
+from ml.data.training_data import TrainingData
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def load_games(last_season: int) -> pd.DataFrame:
+    """
+    Every game_training_dataset row up to last_season, from the local cache
+    until the table is rebuilt.
+    """
+    df = TrainingData().load(last_season=last_season)
+    logger.info(f"Loaded {len(df)} games")
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--first-season", type=int, default=2020)
+    parser.add_argument("--last-season", type=int, default=2025)
+    parser.add_argument("--models", nargs="+", default=list(MODEL_TYPES))
+    parser.add_argument("--n-jobs", type=int, default=-1)
+    parser.add_argument("--output", default="backtests")
+    args = parser.parse_args()
+
+    games = load_games(args.last_season)
+    backtest = WalkForwardBacktest(games, test_seasons=range(args.first_season, args.last_season + 1))
+    predictions = backtest.run(args.models, n_jobs=args.n_jobs)
+
+    by_season = summarize(predictions, by=["model_type", "season"])
+    by_week = summarize(predictions, by=["model_type", "season", "week"])
+    overall = summarize(predictions, by=["model_type"])
+
+    output = Path(args.output)
+    output.mkdir(parents=True, exist_ok=True)
+    predictions.to_csv(output / "predictions.csv", index=False)
+    by_season.to_csv(output / "metrics_by_season.csv", index=False)
+    by_week.to_csv(output / "metrics_by_week.csv", index=False)
+    calibration_table(predictions).to_csv(output / "calibration.csv", index=False)
+
+    logger.info("\n=== Backtest by season ===\n" + by_season.to_string(index=False, float_format="%.3f"))
+    logger.info("\n=== Overall ===\n" + overall.to_string(index=False, float_format="%.3f"))
+    logger.info(f"Results written to {output}/")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Convert pickled Game Outcome Models to memory-mapped artifacts
+
+Writes models/game_outcome_rf.model/ next to models/game_outcome_rf.pkl and
+so on. The prediction service prefers a .model directory over a .pkl of the
+same name.
+"""
+
+import argparse
+import logging
+from pathlib import Path
+from typing import List
+
+from ml.models.game_outcomes import GameOutcomeModel
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def export_artifacts(model_dir: str, output_dir: str = None) -> List[Path]:
+    """
+    Re-save every .pkl in model_dir as a .model artifact directory.
+    """
+    written = []
+    for path in sorted(Path(model_dir).glob("*.pkl")):
+        model = GameOutcomeModel()
+        model.load_model(str(path))
+        target = Path(output_dir or model_dir) / f"{path.stem}.model"
+        model.save_artifact(str(target))
+        written.append(target)
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model-dir", default="models")
+    parser.add_argument("--output-dir", help="Defaults to --model-dir")
+    args = parser.parse_args()
+
+    for target in export_artifacts(args.model_dir, args.output_dir):
+        logger.info(f"Exported {target}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Monte Carlo simulation of the rest of the season
+
+This script:
+1. Loads the current schedule and the unplayed games' features from BigQuery
+2. Scores those games with a saved Game Outcome Model
+3. Simulates the remaining season and writes playoff, division and seed odds
+"""
+
+import argparse
+import logging
+from pathlib import Path
+
+import pandas as pd
+from google.cloud import bigquery
+
+from ml.models.game_outcomes import GameOutcomeModel
+from nfl_analytics.analytics.season_sim import SeasonSimulator
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DATASET = "nfl-analytics-472221.nfl_data"
+
+
+def load_schedule() -> pd.DataFrame:
+    """
+    The current_schedule table written by nfl_current_schedule.
+    """
+    client = bigquery.Client()
+    return client.query(f"SELECT * FROM `{DATASET}.current_schedule`").to_dataframe()
+
+
+def load_features(game_ids: list) -> pd.DataFrame:
+    """
+    game_model_inputs rows for the given games.
+
+    game_model_inputs is the dbt mart with the model's inputs for every
+    unplayed game; game_training_dataset only has games with a result.
+    """
+    client = bigquery.Client()
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[bigquery.ArrayQueryParameter("game_ids", "STRING", game_ids)]
+    )
+    query = f"SELECT * FROM `{DATASET}.game_model_inputs` WHERE game_id IN UNNEST(@game_ids)"
+    return client.query(query, job_config=job_config).to_dataframe()
+
+
+def load_model(path: str) -> GameOutcomeModel:
+    model = GameOutcomeModel()
+    if Path(path).is_dir():
+        model.load_artifact(path)
+    else:
+        model.load_model(path)
+    return model
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="models/game_outcome_rf.model", help="A .model artifact or a .pkl")
+    parser.add_argument("--simulations", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--n-jobs", type=int, default=1)
+    parser.add_argument("--output", default="simulations/season_odds.csv")
+    args = parser.parse_args()
+
+    simulator = SeasonSimulator(load_schedule())
+    game_ids = simulator.remaining["game_id"].tolist()
+    logger.info(f"{len(game_ids)} regular season games left to simulate")
+
+    model = load_model(args.model)
+    features = load_features(game_ids)
+    missing = [column for column in model.feature_columns if column not in features.columns]
+    if missing:
+        raise ValueError(f"game_model_inputs is missing {len(missing)} model inputs: {', '.join(missing)}")
+    predictions = model.predict(features)
+    odds = simulator.run(predictions, n_simulations=args.simulations, seed=args.seed, n_jobs=args.n_jobs)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    odds.to_csv(output, index=False)
+    logger.info("\n" + odds.to_string(index=False, float_format="%.3f"))
+    logger.info(f"Odds written to {output}")
+
+
+if __name__ == "__main__":
+    main()
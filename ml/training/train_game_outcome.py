@@ -10,7 +10,7 @@
 
 import pandas as pd
 import logging
-from google.cloud import bigquery
+from ml.data.training_data import TrainingData
 from ml.models.game_outcomes import GameOutcomeModel
 
   # Set up logging
@@ -19,19 +19,12 @@ logger = logging.getLogger(__name__)
 
 def load_training_data() -> pd.DataFrame:
       """
-      Load training data from BigQuery using your dbt model.
-      """
-      client = bigquery.Client()
+      Load 2020-2023 training data from BigQuery using your dbt model.
 
-      # Query your training dataset
-      query = """
-      SELECT *
-      FROM `nfl-analytics-472221.nfl_data.game_training_dataset`
-      WHERE season BETWEEN 2020 AND 2023
+      Only the model's columns are read, and the result is cached locally
+      until game_training_dataset is rebuilt.
       """
-
-      logger.info("Loading training data from BigQuery...")
-      df = client.query(query).to_dataframe()
+      df = TrainingData().load(first_season=2020, last_season=2023)
       logger.info(f"Loaded {len(df)} training samples")
 
       return df
@@ -0,0 +1,53 @@
+"""
+Hyperparameter search for the Game Outcome Model
+
+This script:
+1. Loads game_training_dataset from BigQuery
+2. Races RandomForest, LogisticRegression and XGBoost configurations with
+   successive halving over season folds, trials in a process pool
+3. Writes the leaderboard and saves the winning model to models/
+"""
+
+import argparse
+import logging
+from pathlib import Path
+
+from ml.training.backtest_game_outcome import load_games
+from ml.tuning.search import SEARCH_SPACES, tune
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--last-season", type=int, default=2025)
+    parser.add_argument("--models", nargs="+", default=list(SEARCH_SPACES), choices=list(SEARCH_SPACES))
+    parser.add_argument("--configs-per-model", type=int, default=20)
+    parser.add_argument("--folds", type=int, default=4, help="Most recent seasons used for validation")
+    parser.add_argument("--eta", type=int, default=3)
+    parser.add_argument("--n-jobs", type=int, default=-1)
+    parser.add_argument("--model-path", default="models/game_outcome_tuned.pkl")
+    parser.add_argument("--leaderboard", default="models/leaderboard.csv")
+    args = parser.parse_args()
+
+    games = load_games(args.last_season)
+    leaderboard, model = tune(
+        games,
+        model_types=args.models,
+        n_per_type=args.configs_per_model,
+        n_folds=args.folds,
+        eta=args.eta,
+        n_jobs=args.n_jobs,
+    )
+
+    Path(args.leaderboard).parent.mkdir(parents=True, exist_ok=True)
+    leaderboard.to_csv(args.leaderboard, index=False)
+    model.save_model(args.model_path)
+
+    logger.info("\n=== Leaderboard ===\n" + leaderboard.drop(columns="params").head(15).to_string(index=False, float_format="%.4f"))
+    logger.info(f"Leaderboard written to {args.leaderboard}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""
+Hyperparameter search for GameOutcomeModel.
+
+Configurations are sampled for each model type and raced with successive
+halving. Every configuration is first scored on the most recent validation
+season; the best 1/eta go on to the next rung, which adds more seasons, until
+the survivors have been scored on every fold. Folds are time-aware: each one
+trains on all seasons before its validation season.
+
+The imputed, scaled feature matrices only depend on the fold, not on the
+configuration, so they are built once and written to .npy files. Trials run
+in a joblib process pool and memory-map those files, so every worker shares
+the same pages instead of rebuilding or unpickling the data per trial.
+"""
+
+import json
+import logging
+import math
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from scipy.stats import loguniform, randint, uniform
+from sklearn.metrics import accuracy_score, log_loss, roc_auc_score
+from sklearn.model_selection import ParameterSampler
+
+from ml.models.game_outcomes import DEFAULT_PARAMS, GameOutcomeModel
+
+SEARCH_SPACES = {
+    'random_forest': {
+        'n_estimators': [100, 200, 400],
+        'max_depth': [4, 6, 8, 10, None],
+        'min_samples_leaf': [1, 5, 10, 20],
+        'max_features': ['sqrt', 0.5, 1.0],
+    },
+    'logistic_regression': {
+        'C': loguniform(1e-3, 1e2),
+        'class_weight': ['balanced', None],
+    },
+    'xgboost': {
+        'n_estimators': randint(100, 600),
+        'max_depth': [2, 3, 4, 6],
+        'learning_rate': loguniform(0.01, 0.3),
+        'subsample': uniform(0.6, 0.4),
+        'colsample_bytree': uniform(0.5, 0.5),
+        'min_child_weight': [1, 5, 10],
+    },
+}
+
+# Trials already run in parallel processes; keep each estimator single-threaded
+TRIAL_PARAMS = {
+    'random_forest': {'n_jobs': 1},
+    'logistic_regression': {},
+    'xgboost': {'n_jobs': 1},
+}
+
+
+@dataclass(frozen=True)
+class CVFold:
+    """Train on every season before `season`, validate on `season`."""
+
+    season: int
+    train_end: int
+    val_end: int
+
+
+@dataclass
+class Config:
+    config_id: int
+    model_type: str
+    params: Dict
+
+
+def sample_configs(model_types: Sequence[str], n_per_type: int, seed: int = 42) -> List[Config]:
+    """
+    Random configurations from SEARCH_SPACES, always including each type's defaults.
+    """
+    configs = []
+    for model_type in model_types:
+        candidates = [{}] + list(ParameterSampler(SEARCH_SPACES[model_type], n_iter=n_per_type - 1, random_state=seed))
+        for params in candidates:
+            params = {k: v.item() if isinstance(v, np.generic) else v for k, v in params.items()}
+            configs.append(Config(len(configs), model_type, params))
+    return configs
+
+
+class FoldCache:
+    """
+    Imputed, scaled train/validation matrices per fold, saved as .npy files.
+    """
+
+    def __init__(self, games: pd.DataFrame, n_folds: int, cache_dir: str):
+        """
+        Args:
+            games: game_training_dataset rows with a result
+            n_folds: Number of most recent seasons to validate on
+            cache_dir: Where to write the fold matrices
+        """
+        self.games = games.sort_values(['season', 'week', 'game_id'], kind='stable').reset_index(drop=True)
+        self.y = self.games['home_win'].to_numpy(dtype='int8')
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        seasons = self.games['season'].to_numpy()
+        validation_seasons = np.unique(seasons)[1:][-n_folds:][::-1]  # most recent first
+        self.folds = [
+            CVFold(int(s), int(np.searchsorted(seasons, s, 'left')), int(np.searchsorted(seasons, s, 'right')))
+            for s in validation_seasons
+        ]
+
+        raw = GameOutcomeModel().features.raw_matrix(self.games)
+        for i, fold in enumerate(self.folds):
+            model = GameOutcomeModel()
+            features = model.features.fit_matrix(raw[:fold.train_end])
+            np.save(self._path(i, 'train'), model.scaler.fit_transform(features.impute(raw[:fold.train_end])))
+            np.save(self._path(i, 'val'), model.scaler.transform(features.impute(raw[fold.train_end:fold.val_end])))
+
+    def _path(self, fold: int, split: str) -> Path:
+        return self.cache_dir / f"fold{fold}_{split}.npy"
+
+    def paths(self, fold: int) -> Tuple[str, str]:
+        return str(self._path(fold, 'train')), str(self._path(fold, 'val'))
+
+    def labels(self, fold: int) -> Tuple[np.ndarray, np.ndarray]:
+        cv = self.folds[fold]
+        return self.y[:cv.train_end], self.y[cv.train_end:cv.val_end]
+
+
+def run_trial(
+    config: Config, fold: int, train_path: str, val_path: str, y_train: np.ndarray, y_val: np.ndarray
+) -> Dict:
+    """
+    Fit one configuration on one fold's cached matrices and score it.
+    """
+    X_train = np.load(train_path, mmap_mode='r')
+    X_val = np.load(val_path, mmap_mode='r')
+    params = {**config.params, **TRIAL_PARAMS[config.model_type]}
+    model = GameOutcomeModel(config.model_type, params).model
+
+    started = time.perf_counter()
+    model.fit(X_train, y_train)
+    p = model.predict_proba(X_val)[:, 1]
+    return {
+        'config_id': config.config_id,
+        'fold': fold,
+        'log_loss': log_loss(y_val, p, labels=[0, 1]),
+        'accuracy': accuracy_score(y_val, p > 0.5),
+        'roc_auc': roc_auc_score(y_val, p) if len(np.unique(y_val)) == 2 else np.nan,
+        'seconds': time.perf_counter() - started,
+    }
+
+
+def rung_folds(n_folds: int, eta: int, min_folds: int = 1) -> List[int]:
+    """Number of folds each rung is scored on, e.g. [1, 3, 4] for 4 folds and eta=3."""
+    rungs = []
+    folds = min_folds
+    while folds < n_folds:
+        rungs.append(folds)
+        folds *= eta
+    return rungs + [n_folds]
+
+
+def successive_halving(
+    configs: List[Config], cache: FoldCache, eta: int = 3, n_jobs: int = -1
+) -> pd.DataFrame:
+    """
+    Race configurations over growing numbers of folds.
+
+    Returns:
+        Leaderboard: one row per configuration with the rung it reached, the
+        folds it was scored on and its mean metrics over those folds, best first
+    """
+    trials: List[Dict] = []
+    survivors = list(configs)
+    rungs = rung_folds(len(cache.folds), eta)
+    by_id = {config.config_id: config for config in configs}
+
+    with Parallel(n_jobs=n_jobs) as parallel:
+        for rung, n_folds in enumerate(rungs):
+            done = {(t['config_id'], t['fold']) for t in trials}
+            todo = [(c, f) for c in survivors for f in range(n_folds) if (c.config_id, f) not in done]
+            started = time.perf_counter()
+            trials += parallel(
+                delayed(run_trial)(config, fold, *cache.paths(fold), *cache.labels(fold)) for config, fold in todo
+            )
+            logging.info(
+                f"Rung {rung}: {len(survivors)} configs x {n_folds} folds "
+                f"({len(todo)} trials) in {time.perf_counter() - started:.1f}s"
+            )
+
+            if rung == len(rungs) - 1:
+                break
+            scored = pd.DataFrame(trials)
+            scored = scored[scored['config_id'].isin([c.config_id for c in survivors]) & (scored['fold'] < n_folds)]
+            scores = scored.groupby('config_id')['log_loss'].mean().sort_values(kind='stable')
+            keep = max(1, math.ceil(len(survivors) / eta))
+            survivors = [by_id[config_id] for config_id in scores.index[:keep]]
+
+    results = pd.DataFrame(trials)
+    leaderboard = results.groupby('config_id').agg(
+        folds=('fold', 'nunique'),
+        log_loss=('log_loss', 'mean'),
+        accuracy=('accuracy', 'mean'),
+        roc_auc=('roc_auc', 'mean'),
+        fit_seconds=('seconds', 'mean'),
+    ).reset_index()
+    leaderboard['rung'] = leaderboard['folds'].map(lambda n: rungs.index(n) if n in rungs else 0)
+    leaderboard['model_type'] = leaderboard['config_id'].map(lambda i: by_id[i].model_type)
+    leaderboard['params'] = leaderboard['config_id'].map(
+        lambda i: json.dumps({**DEFAULT_PARAMS[by_id[i].model_type], **by_id[i].params}, sort_keys=True, default=str)
+    )
+    leaderboard = leaderboard.sort_values(['folds', 'log_loss'], ascending=[False, True], ignore_index=True)
+    return leaderboard[['config_id', 'model_type', 'rung', 'folds', 'log_loss', 'accuracy', 'roc_auc', 'fit_seconds', 'params']]
+
+
+def tune(
+    df: pd.DataFrame,
+    model_types: Sequence[str] = ('random_forest', 'logistic_regression', 'xgboost'),
+    n_per_type: int = 20,
+    n_folds: int = 4,
+    eta: int = 3,
+    n_jobs: int = -1,
+    cache_dir: Optional[str] = None,
+    seed: int = 42,
+) -> Tuple[pd.DataFrame, GameOutcomeModel]:
+    """
+    Search every model type, then train the winner on all labeled games.
+
+    Args:
+        df: game_training_dataset rows
+        model_types: Model types to search
+        n_per_type: Configurations sampled per model type (including defaults)
+        n_folds: Most recent seasons used as validation folds
+        eta: Keep the best 1/eta configurations at each rung
+        n_jobs: joblib worker processes (-1 = all cores)
+        cache_dir: Where to keep fold matrices; a temporary directory if None
+        seed: Sampling seed
+
+    Returns:
+        (leaderboard, trained best model)
+    """
+    labeled = df[df['home_win'].notna()]
+    configs = sample_configs(model_types, n_per_type, seed)
+    logging.info(f"Searching {len(configs)} configurations over {n_folds} season folds")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = FoldCache(labeled, n_folds, cache_dir or tmp)
+        leaderboard = successive_halving(configs, cache, eta=eta, n_jobs=n_jobs)
+
+    best = leaderboard.iloc[0]
+    logging.info(f"Best: {best['model_type']} log_loss={best['log_loss']:.4f} params={best['params']}")
+    config = configs[int(best['config_id'])]
+    model = GameOutcomeModel(config.model_type, config.params)
+    model.train(labeled)
+    return leaderboard, model
@@ -1,33 +1,68 @@
-from dagster import asset, AssetExecutionContext
-import nfl_data_py
-import pandas as pd
-from ..config.settings import SEASONS
-from ..utils.bigquery_client import store_dataframe_in_bigquery
+from dagster import asset, AssetExecutionContext, MaterializeResult
+from ..resources import WarehouseResource
+from ..utils.cache import get_raw_data_cache
+from ..utils.fanout import fan_out
+from ..utils.nflverse import RELEASES
+from ..utils.pbp import fetch_pbp_season, to_warehouse_frame
+from ..utils.telemetry import instrumented, record_fetch
 
 @asset
-def current_season_stats(context: AssetExecutionContext) -> pd.DataFrame:
+@instrumented
+def current_season_stats(context: AssetExecutionContext, warehouse: WarehouseResource) -> MaterializeResult:
     """
     Load current NFL stats by week
+
+    Nightly reconciliation of the whole season; completed_games_sensor loads
+    individual games as they go final. Reports pbp_games, stats_week and
+    roster_players as materialization metadata.
     """
     context.log.info("checking for current season stats...")
 
     results = {} 
+    cache = get_raw_data_cache()
+    # table name -> (frame, pull); loaded together once every pull has finished
+    pending_loads = {}
+
+    # The three 2025 pulls are independent; download them concurrently. Threads,
+    # since the cache and the lambdas below can't cross a process boundary
+    fetched = {
+        result.key: result
+        for result in fan_out(
+            {
+                "pbp": (fetch_pbp_season, (cache, 2025)),
+                "weekly": (cache.fetch, ("weekly", 2025, RELEASES["weekly"])),
+                "rosters": (cache.fetch, ("seasonal_rosters", 2025, RELEASES["seasonal_rosters"])),
+            },
+            executor="thread",
+        )
+    }
+
+    for dataset, result in fetched.items():
+        record_fetch(result, season=2025, dataset=dataset)
 
     try: 
-        pbp_2025 = nfl_data_py.import_pbp_data([2025], cache=False)
+        if not fetched["pbp"].ok:
+            raise fetched["pbp"].error
+        pbp_pull = fetched["pbp"].value
+        pbp_2025 = pbp_pull.frame
         if len(pbp_2025) > 0: 
             context.log.info(f"Loaded {len(pbp_2025)} plays in 2025")
-            store_dataframe_in_bigquery(context, pbp_2025, "pbp_2025")
+            if cache.needs_load("pbp_2025", [pbp_pull]):
+                pending_loads["pbp_2025"] = (to_warehouse_frame(pbp_2025), pbp_pull)
             results['pbp_games'] = len(pbp_2025['game_id'].unique())
         else:
             context.log.info("No 2025 PBP data found")
             results['pbp_games'] = 0
         
         try:
-            stats_2025 = nfl_data_py.import_weekly_data([2025])
+            if not fetched["weekly"].ok:
+                raise fetched["weekly"].error
+            stats_pull = fetched["weekly"].value
+            stats_2025 = stats_pull.frame
             if len(stats_2025) > 0: 
                 context.log.info(f"Loaded {len(stats_2025)} stats for 2025")
-                store_dataframe_in_bigquery(context, stats_2025, "player_stats_2025")
+                if cache.needs_load("player_stats_2025", [stats_pull]):
+                    pending_loads["player_stats_2025"] = (stats_2025, stats_pull)
                 results['stats_week'] = len(stats_2025['week'].unique())
             else:
                 results['stats_week'] = 0
@@ -38,10 +73,14 @@ def current_season_stats(context: AssetExecutionContext) -> pd.DataFrame:
         
         # Check for roster changes
         try: 
-            rosters_2025 = nfl_data_py.import_seasonal_rosters([2025])
+            if not fetched["rosters"].ok:
+                raise fetched["rosters"].error
+            rosters_pull = fetched["rosters"].value
+            rosters_2025 = rosters_pull.frame.dropna(subset=["player_id"])
             if len(rosters_2025) > 0: 
                 context.log.info(f"Loaded {len(rosters_2025)} rosters in 2025")
-                store_dataframe_in_bigquery(context, rosters_2025, "rosters_2025")
+                if cache.needs_load("rosters_2025", [rosters_pull]):
+                    pending_loads["rosters_2025"] = (rosters_2025, rosters_pull)
                 results['roster_players'] = len(rosters_2025['player_id'].unique())
             else: 
                 results['roster_players'] = 0
@@ -50,9 +89,19 @@ def current_season_stats(context: AssetExecutionContext) -> pd.DataFrame:
             context.log.info("No 2025 roster data")
             results['roster_players'] = 0
         
+        # Load changed tables concurrently instead of one blocking job at a time
+        if pending_loads:
+            warehouse.store_many(
+                context, {table: frame for table, (frame, _) in pending_loads.items()}
+            )
+            for table, (_, pull) in pending_loads.items():
+                cache.mark_loaded(table, [pull])
+        else:
+            context.log.info("No 2025 tables changed since last load, skipping BigQuery writes")
+
         context.log.info(f"2025 Season Stats Summary: {results}")
-        return results
+        return MaterializeResult(metadata=results)
 
     except Exception as e:
         context.log.error(f"Error loading 2025 season stats: {str(e)}")
-        return {'error': str(e)}
\ No newline at end of file
+        raise
@@ -1,17 +1,22 @@
 from dagster import asset, AssetExecutionContext
-import nfl_data_py
 import pandas as pd
 from ..config.settings import SEASONS
-from ..utils.bigquery_client import store_dataframe_in_bigquery
+from ..resources import WarehouseResource
+from ..utils.cache import get_raw_data_cache
+from ..utils.ingest import stream_seasons
+from ..utils.nflverse import RELEASES
+from ..utils.telemetry import instrumented
 
 @asset
-def nfl_games(context: AssetExecutionContext) -> pd.DataFrame:
+@instrumented
+def nfl_games(context: AssetExecutionContext, warehouse: WarehouseResource) -> pd.DataFrame:
     """Load NFL games data from API and store in BigQuery"""
     context.log.info(f"Loading NFL games data for seasons: {SEASONS}")
 
-    games = nfl_data_py.import_schedules(SEASONS)
+    # Seasons download concurrently and each is merged as soon as it lands
+    games = stream_seasons(
+        context, warehouse, get_raw_data_cache(), "schedules", "games", RELEASES["schedules"]
+    )
     context.log.info(f"Loaded {len(games)} games")
 
-    store_dataframe_in_bigquery(context, games, "games")
-
-    return games
\ No newline at end of file
+    return games
@@ -0,0 +1,114 @@
+from typing import List
+
+from dagster import AssetExecutionContext, Config, MultiPartitionKey, RetryRequested, asset
+import pandas as pd
+from ..config.settings import LIVE_DBT_SELECT, LIVE_PBP_MAX_RETRIES, LIVE_PBP_RETRY_SECONDS, PREDICTION_MODEL
+from ..resources import WarehouseResource
+from ..utils.cache import get_raw_data_cache
+from ..utils.dbt_runner import refresh_seasons_args, run_dbt
+from ..utils.live import check_model_inputs, load_serving_model, score_games, seasons_of, upcoming_games
+from ..utils.nflverse import RELEASES
+from ..utils.pbp import fetch_pbp_season, to_warehouse_frame
+from ..utils.telemetry import frame_bytes, instrumented, phase, tagged
+from ..utils.watermarks import WatermarkStore, changed_keys, frame_fingerprints
+
+
+class LiveGamesConfig(Config):
+    """Games the completed_games_sensor saw go final"""
+
+    game_ids: List[str]
+
+
+@asset
+@instrumented
+def live_pbp(context: AssetExecutionContext, config: LiveGamesConfig, warehouse: WarehouseResource) -> pd.DataFrame:
+    """Merge the plays of newly completed games into pbp_data"""
+    context.log.info(f"Loading plays for {len(config.game_ids)} completed games: {config.game_ids}")
+
+    cache = get_raw_data_cache()
+    # Shared with nfl_pbp, so the nightly run skips games already loaded here
+    watermarks = WatermarkStore("nfl_pbp")
+    loaded = []
+
+    for season in seasons_of(config.game_ids):
+        # nflverse publishes one file per season; re-pull it (a game just went
+        # final) but write only the requested games
+        with phase("fetch", season=season, dataset="pbp") as stats:
+            season_pbp = fetch_pbp_season(cache, season, force_refresh=True).frame
+            stats.record(rows=len(season_pbp), bytes=frame_bytes(season_pbp))
+        plays = season_pbp[season_pbp['game_id'].astype(str).isin(config.game_ids)].reset_index(drop=True)
+        del season_pbp
+
+        for week in sorted(plays['week'].dropna().unique()):
+            week_plays = plays[plays['week'] == week].reset_index(drop=True)
+            partition_key = MultiPartitionKey({"season": str(season), "week": str(int(week))})
+            previous = watermarks.get(partition_key)
+            fingerprints = frame_fingerprints(week_plays, key_column="game_id")
+            changed_games = changed_keys(fingerprints, previous)
+
+            if changed_games:
+                with tagged(season=season, week=int(week)):
+                    with phase("transform", dataset="pbp") as stats:
+                        changed_plays = to_warehouse_frame(week_plays[week_plays['game_id'].astype(str).isin(changed_games)])
+                        stats.record(rows=len(changed_plays), bytes=frame_bytes(changed_plays))
+                    warehouse.merge(context, changed_plays, "pbp_data", key_column="game_id")
+                watermarks.set(partition_key, {**previous, **fingerprints})
+            else:
+                context.log.info(f"Season {season} week {int(week)}: games already loaded, skipping BigQuery write")
+
+            loaded.append(
+                week_plays.groupby(week_plays['game_id'].astype(str)).size().rename("plays").reset_index()
+                .assign(season=season, week=int(week))
+            )
+
+    summary = pd.concat(loaded, ignore_index=True) if loaded else pd.DataFrame(columns=["game_id", "plays", "season", "week"])
+    missing = sorted(set(config.game_ids) - set(summary['game_id']))
+    if missing:
+        # The final is in the schedule before nflverse publishes the plays
+        context.log.info(f"No plays published yet for {missing}, retrying in {LIVE_PBP_RETRY_SECONDS}s")
+        raise RetryRequested(max_retries=LIVE_PBP_MAX_RETRIES, seconds_to_wait=LIVE_PBP_RETRY_SECONDS)
+
+    context.log.info(f"Loaded {int(summary['plays'].sum())} plays from {len(summary)} games")
+    return summary
+
+
+@asset
+@instrumented
+def live_marts(context: AssetExecutionContext, live_pbp: pd.DataFrame) -> List[int]:
+    """Rebuild the mart season partitions touched by newly completed games"""
+    seasons = sorted(int(season) for season in live_pbp['season'].unique())
+    context.log.info(f"Rebuilding {LIVE_DBT_SELECT} for seasons {seasons}")
+
+    with phase("transform", select=LIVE_DBT_SELECT) as stats:
+        nodes = run_dbt(refresh_seasons_args(LIVE_DBT_SELECT, seasons))
+        stats.record(models=len(nodes))
+    context.log.info(f"dbt rebuilt {len(nodes)} models: {nodes}")
+    return seasons
+
+
+@asset
+@instrumented
+def live_predictions(context: AssetExecutionContext, live_marts: List[int], warehouse: WarehouseResource) -> pd.DataFrame:
+    """Re-score the upcoming games of the rebuilt seasons"""
+    cache = get_raw_data_cache()
+    game_ids = []
+    for season in live_marts:
+        schedule = cache.fetch("schedules", season, RELEASES["schedules"]).frame
+        game_ids += upcoming_games(schedule)['game_id'].astype(str).tolist()
+
+    # game_model_inputs is downstream of stg_pbp, so live_marts rebuilds it with the default select
+    with phase("fetch", table="game_model_inputs") as stats:
+        features = warehouse.read_keys("game_model_inputs", "game_id", game_ids) if game_ids else pd.DataFrame()
+        stats.record(rows=len(features))
+    if features.empty:
+        context.log.info("No upcoming games with features to score")
+        return features
+
+    model = load_serving_model()
+    check_model_inputs(features, model, "game_model_inputs")
+    with phase("transform", model=PREDICTION_MODEL) as stats:
+        predictions = score_games(features, model, PREDICTION_MODEL)
+        stats.record(rows=len(predictions))
+    warehouse.merge(context, predictions, "game_predictions", key_column="game_id")
+    context.log.info(f"Re-scored {len(predictions)} upcoming games with '{PREDICTION_MODEL}'")
+    return predictions
@@ -1,38 +1,79 @@
-from dagster import asset, AssetExecutionContext
-import nfl_data_py
+from dagster import (
+    asset,
+    AssetExecutionContext,
+    MultiPartitionsDefinition,
+    StaticPartitionsDefinition,
+)
 import pandas as pd
-from ..config.settings import SEASONS
-from ..utils.bigquery_client import store_dataframe_in_bigquery
+from ..config.settings import SEASONS, PBP_WEEKS
+from ..resources import WarehouseResource
+from ..utils.cache import get_raw_data_cache
+from ..utils.pbp import fetch_pbp_season, frame_memory_mb, to_warehouse_frame
+from ..utils.telemetry import frame_bytes, instrumented, phase
+from ..utils.watermarks import WatermarkStore, changed_keys, frame_fingerprints
 
-@asset
-def nfl_pbp(context: AssetExecutionContext) -> pd.DataFrame:
-    """Load NFL PBP data from API and store in BigQuery"""
-    context.log.info(f"Loading NFL PBP data for seasons: {SEASONS}")
+pbp_partitions = MultiPartitionsDefinition(
+    {
+        "season": StaticPartitionsDefinition([str(season) for season in SEASONS]),
+        "week": StaticPartitionsDefinition([str(week) for week in PBP_WEEKS]),
+    }
+)
 
-    try:    
-        pbp_data = nfl_data_py.import_pbp_data(SEASONS, cache=False)
+@asset(partitions_def=pbp_partitions)
+@instrumented
+def nfl_pbp(context: AssetExecutionContext, warehouse: WarehouseResource) -> pd.DataFrame:
+    """Load one season/week of NFL PBP data and merge new or changed games into BigQuery"""
+    partition = context.partition_key.keys_by_dimension
+    season, week = int(partition["season"]), int(partition["week"])
+    context.log.info(f"Loading NFL PBP data for season {season}, week {week}")
+
+    try:
+        # nflverse publishes one file per season; the raw cache shares that pull
+        # across every week partition of the season fetched on the same day
+        with phase("fetch", dataset="pbp") as stats:
+            pull = fetch_pbp_season(get_raw_data_cache(), season)
+            stats.record(rows=len(pull.frame), bytes=frame_bytes(pull.frame), from_cache=pull.from_cache)
+        season_pbp = pull.frame
+        context.log.info(f"Season {season} PBP: {len(season_pbp)} plays, {frame_memory_mb(season_pbp):.0f} MB in memory")
+        pbp_data = season_pbp[season_pbp['week'] == week].reset_index(drop=True)
+        del season_pbp
         context.log.info(f"Loaded {len(pbp_data)} plays with {len(pbp_data.columns)} columns")
 
         # Data Qual Checks
-        if len(pbp_data) == 0: 
-            raise ValueError("No PBP data loaded")
-        
+        if len(pbp_data) == 0:
+            context.log.info(f"No plays found for season {season}, week {week} yet")
+            return pbp_data
+
         required_columns = ['game_id', 'posteam', 'play_type', 'season']
         missing_columns = [col for col in required_columns if col not in pbp_data.columns]
-        if missing_columns: 
+        if missing_columns:
             raise ValueError(f"Missing required columns: {missing_columns}")
-        
+
         # Log Qual Metrics
         context.log.info(f"Data quality metrics:")
-        context.log.info(f" - Date range: {pbp_data['game_date'].min()} to {pbp_data['game_date'].max()}")
-        context.log.info(f" - Seasons: {sorted(pbp_data['season'].unique())}")
-        context.log.info(f" - Missing values: {pbp_data.isnull().sum().sum()}")
+        game_dates = pbp_data['game_date'].astype(str)
+        context.log.info(f" - Date range: {game_dates.min()} to {game_dates.max()}")
+        context.log.info(f" - Games: {pbp_data['game_id'].nunique()}")
+        context.log.info(f" - Missing values (required columns): {pbp_data[required_columns].isnull().sum().to_dict()}")
+
+        # High-water mark: only games whose plays changed since the last run are written
+        watermarks = WatermarkStore("nfl_pbp")
+        fingerprints = frame_fingerprints(pbp_data, key_column="game_id")
+        changed_games = changed_keys(fingerprints, watermarks.get(context.partition_key))
+
+        if not changed_games:
+            context.log.info("No new or changed games since last load, skipping BigQuery write")
+            return pbp_data
+
+        with phase("transform", dataset="pbp") as stats:
+            changed_plays = to_warehouse_frame(pbp_data[pbp_data['game_id'].astype(str).isin(changed_games)])
+            stats.record(rows=len(changed_plays), bytes=frame_bytes(changed_plays))
+        warehouse.merge(context, changed_plays, "pbp_data", key_column="game_id")
+        watermarks.set(context.partition_key, fingerprints)
+        context.log.info(f"Stored {len(changed_plays)} plays from {len(changed_games)} games in BigQuery")
 
-        store_dataframe_in_bigquery(context, pbp_data, "pbp_data")
-        context.log.info(f"Stored {len(pbp_data)} plays in BigQuery")
-        
         return pbp_data
 
-    except Exception as e: 
+    except Exception as e:
         context.log.error(f"Failed to load pbp data: {str(e)}")
         raise
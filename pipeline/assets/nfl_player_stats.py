@@ -1,17 +1,36 @@
 from dagster import asset, AssetExecutionContext
-import nfl_data_py
 import pandas as pd
 from ..config.settings import SEASONS
-from ..utils.bigquery_client import store_dataframe_in_bigquery
+from ..resources import WarehouseResource
+from ..utils.cache import get_raw_data_cache
+from ..utils.ingest import stream_seasons
+from ..utils.nflverse import RELEASES
+from ..utils.player_ids import format_coverage, load_player_id_resolver
+from ..utils.telemetry import instrumented, phase
 
 @asset
-def nfl_player_stats(context: AssetExecutionContext) -> pd.DataFrame:
+@instrumented
+def nfl_player_stats(context: AssetExecutionContext, warehouse: WarehouseResource) -> pd.DataFrame:
     """Load NFL player stats data from API and store in BigQuery"""
     context.log.info(f"Loading NFL player stats for seasons: {SEASONS}")
 
-    player_stats = nfl_data_py.import_weekly_data(SEASONS)
-    context.log.info(f"Loaded {len(player_stats)} player stat records")
+    cache = get_raw_data_cache()
+    players_pull = cache.fetch("players", None, RELEASES["players"])
+    resolver = load_player_id_resolver(players_pull)
+
+    def resolve_ids(season_stats: pd.DataFrame) -> pd.DataFrame:
+        # Fill any missing GSIS ids from the shared player id index
+        season_stats = season_stats.copy()
+        with phase("map") as stats:
+            season_stats["player_id"], coverage = resolver.resolve_frame(season_stats)
+            stats.record(rows=len(season_stats))
+        context.log.info(f"Player stats id coverage: {format_coverage(coverage, len(season_stats))}")
+        return season_stats
 
-    store_dataframe_in_bigquery(context, player_stats, "player_stats")
+    player_stats = stream_seasons(
+        context, warehouse, cache, "weekly", "player_stats", RELEASES["weekly"],
+        transform=resolve_ids, depends_on=[players_pull],
+    )
+    context.log.info(f"Loaded {len(player_stats)} player stat records")
     
-    return player_stats
\ No newline at end of file
+    return player_stats
@@ -0,0 +1,60 @@
+from dagster import AssetExecutionContext, Config, asset
+import pandas as pd
+from ..config.settings import PREDICTION_MODEL
+from ..resources import WarehouseResource
+from ..utils.live import check_model_inputs, feature_hashes, load_serving_model, score_games
+from ..utils.telemetry import frame_bytes, instrumented, phase
+from ..utils.watermarks import WatermarkStore, changed_keys
+
+
+class GamePredictionsConfig(Config):
+    """Re-score every game even if its inputs and the model are unchanged"""
+
+    force_rescore: bool = False
+
+
+@asset
+@instrumented
+def game_predictions(
+    context: AssetExecutionContext, config: GamePredictionsConfig, warehouse: WarehouseResource
+) -> pd.DataFrame:
+    """Score the betting-relevant games of game_model_inputs whose inputs or model changed"""
+    with phase("fetch", table="game_model_inputs") as stats:
+        # CAST(betting_relevant AS STRING) is 'true' on BigQuery and DuckDB alike
+        features = warehouse.read_keys("game_model_inputs", "betting_relevant", ["true"])
+        stats.record(rows=len(features), bytes=frame_bytes(features))
+    if features.empty:
+        context.log.info("No betting-relevant games to score")
+        return features
+
+    model = load_serving_model()
+    check_model_inputs(features, model, "game_model_inputs")
+    features = features.reset_index(drop=True)
+    # A new model version changes every fingerprint, so a retrain re-scores everything
+    hashes = feature_hashes(features, list(model.feature_columns))
+    fingerprints = model.version + ":" + hashes
+    game_ids = features["game_id"].astype(str)
+
+    watermarks = WatermarkStore("game_predictions")
+    changed = pd.Series(False, index=features.index)
+    current = {}
+    for season, rows in features.groupby("season").groups.items():
+        current[season] = dict(zip(game_ids[rows], fingerprints[rows]))
+        previous = {} if config.force_rescore else watermarks.get(str(season))
+        changed[rows] = game_ids[rows].isin(changed_keys(current[season], previous))
+
+    context.log.info(f"{int(changed.sum())} of {len(features)} betting-relevant games changed since they were last scored")
+    if not changed.any():
+        return features.iloc[:0][["game_id", "season", "week", "home_team", "away_team"]]
+
+    with phase("transform", model=PREDICTION_MODEL, model_version=model.version) as stats:
+        predictions = score_games(features[changed], model, PREDICTION_MODEL)
+        predictions["feature_hash"] = hashes[changed].to_numpy()
+        stats.record(rows=len(predictions), skipped=int((~changed).sum()))
+    warehouse.merge(context, predictions, "game_predictions", key_column="game_id")
+
+    # Marked only once the predictions are written, so a failed load is retried next run
+    for season, fingerprints_by_game in current.items():
+        watermarks.set(str(season), fingerprints_by_game)
+    context.log.info(f"Scored {len(predictions)} games with '{PREDICTION_MODEL}' version {model.version}")
+    return predictions
@@ -1,37 +1,57 @@
 from dagster import asset, AssetExecutionContext
-import nfl_data_py
 import pandas as pd
 from ..config.settings import SEASONS
-from ..utils.bigquery_client import store_dataframe_in_bigquery
+from ..resources import WarehouseResource
+from ..utils.cache import get_raw_data_cache
+from ..utils.ingest import stream_seasons
+from ..utils.nflverse import RELEASES
+from ..utils.player_ids import format_coverage, load_player_id_resolver
+from ..utils.telemetry import instrumented, phase
 
 @asset
-def nfl_rosters(context: AssetExecutionContext) -> pd.DataFrame:
+@instrumented
+def nfl_rosters(context: AssetExecutionContext, warehouse: WarehouseResource) -> pd.DataFrame:
     """Load NFL rosters data from API and store in BigQuery"""
     context.log.info(f"Loading NFL rosters data for seasons: {SEASONS}")
 
     try: 
-        rosters = nfl_data_py.import_seasonal_rosters(SEASONS)
+        cache = get_raw_data_cache()
+        players_pull = cache.fetch("players", None, RELEASES["players"])
+        resolver = load_player_id_resolver(players_pull)
+
+        def prepare_season(season_rosters: pd.DataFrame) -> pd.DataFrame:
+            # Recover missing GSIS ids from the alternate ids rosters carry (espn, sportradar, pfr...)
+            # and drop only the rows none of them identify
+            season_rosters, total_rows = season_rosters.copy(), len(season_rosters)
+            with phase("map") as stats:
+                season_rosters["player_id"], coverage = resolver.resolve_frame(season_rosters)
+                season_rosters = season_rosters.dropna(subset=["player_id"]).reset_index(drop=True)
+                stats.record(rows=len(season_rosters))
+            context.log.info(f"Roster player id coverage: {format_coverage(coverage, total_rows)}")
+
+            required_columns = ['player_id', 'team', 'season', 'position']
+            missing_columns = [col for col in required_columns if col not in season_rosters.columns]
+            if missing_columns:
+                raise ValueError(f"Missing required columns: {missing_columns}")
+            return season_rosters
+
+        rosters = stream_seasons(
+            context, warehouse, cache, "seasonal_rosters", "rosters", RELEASES["seasonal_rosters"],
+            transform=prepare_season, depends_on=[players_pull],
+        )
         context.log.info(f"Loaded {len(rosters)} rosters")
 
         if len(rosters) == 0: 
             raise ValueError("No roster data loaded")
         
-        required_columns = ['player_id', 'team', 'season', 'position']
-        missing_columns = [col for col in required_columns if col not in rosters.columns]
-        if missing_columns:
-            raise ValueError(f"Missing required columns: {missing_columns}")
-        
         context.log.info(f"Data quality metrics:")
         context.log.info(f" - Seasons: {sorted(rosters['season'].unique())}")
         context.log.info(f" - Teams: {len(rosters['team'].unique())} unique teams")
         context.log.info(f" - Players: {len(rosters['player_id'].unique())} unique players")
         context.log.info(f" - Missing values: {rosters.isnull().sum().sum()}")
 
-        store_dataframe_in_bigquery(context, rosters, "rosters")
-        context.log.info(f"Stored {len(rosters)} rosters in BigQuery")
-
         return rosters
         
     except Exception as e: 
         context.log.error(f"Failed to load rosters data: {str(e)}")
-        raise
\ No newline at end of file
+        raise
@@ -1,16 +1,28 @@
 from dagster import asset, AssetExecutionContext
-import nfl_data_py
 import pandas as pd
-from ..config.settings import SEASONS
-from ..utils.bigquery_client import store_dataframe_in_bigquery
+from ..config.settings import CURRENT_SEASON
+from ..resources import WarehouseResource
+from ..utils.cache import get_raw_data_cache
+from ..utils.nflverse import RELEASES
+from ..utils.telemetry import frame_bytes, instrumented, phase
 
 @asset
-def nfl_current_schedule(context: AssetExecutionContext) -> pd.DataFrame:
+@instrumented
+def nfl_current_schedule(context: AssetExecutionContext, warehouse: WarehouseResource) -> pd.DataFrame:
     """Load NFL current schedule data from API and store in BigQuery"""
     context.log.info(f"Loading NFL current schedule data for current season")
 
-    current_schedule = nfl_data_py.import_schedules([2025])
+    cache = get_raw_data_cache()
+    with phase("fetch", season=CURRENT_SEASON, dataset="schedules") as stats:
+        pull = cache.fetch("schedules", CURRENT_SEASON, RELEASES["schedules"])
+        stats.record(rows=len(pull.frame), bytes=frame_bytes(pull.frame), from_cache=pull.from_cache)
+    current_schedule = pull.frame
     context.log.info(f"Loaded {len(current_schedule)} schedule records")
 
-    store_dataframe_in_bigquery(context, current_schedule, "current_schedule")
+    if cache.needs_load("current_schedule", [pull]):
+        warehouse.store(context, current_schedule, "current_schedule")
+        cache.mark_loaded("current_schedule", [pull])
+    else:
+        context.log.info("Current schedule unchanged since last load, skipping BigQuery write")
 
+    return current_schedule
@@ -2,18 +2,68 @@
 Config settings for analytics pipeline
 """
 
+import os
+
 # Data Settings
 SEASONS = [2020, 2021, 2022, 2023, 2024, 2025]
+CURRENT_SEASON = 2025
+PBP_WEEKS = list(range(1, 23))  # regular season (17/18 weeks) + postseason
+# "lean" projects PBP to the columns dbt uses with compact dtypes; "full" keeps all 300+ columns
+PBP_LOAD_MODE = os.getenv("NFL_PBP_LOAD_MODE", "lean")
 
 # BigQuery Settings
 BIGQUERY_PROJECT = "nfl-analytics-472221"
 BIGQUERY_DATASET = "nfl_data"
 BIGQUERY_LOCATION = "US"
 WRITE_DISPOSITION = "WRITE_TRUNCATE"
+GOOGLE_CREDENTIALS_PATH = os.getenv("GOOGLE_APPLICATION_CREDENTIALS", "credentials.json")
 
 # API Settings
-NFL_API_TIMEOUT = 30
+NFL_API_TIMEOUT = int(os.getenv("NFL_API_TIMEOUT", "30"))  # seconds; per connect/read of an nflverse download
 BATCH_SIZE = 1000
+NFLVERSE_BASE_URL = os.getenv("NFL_NFLVERSE_BASE_URL", "https://github.com/nflverse/nflverse-data/releases/download")
+NFLDATA_BASE_URL = os.getenv("NFL_NFLDATA_BASE_URL", "https://raw.githubusercontent.com/nflverse/nfldata/master/data")
+HTTP_MAX_CONNECTIONS = int(os.getenv("NFL_HTTP_MAX_CONNECTIONS", "8"))
+HTTP_MAX_RETRIES = int(os.getenv("NFL_HTTP_MAX_RETRIES", "3"))
+HTTP_BACKOFF_SECONDS = float(os.getenv("NFL_HTTP_BACKOFF_SECONDS", "1.0"))  # doubled on every retry
+
+# Pipeline State Settings
+PIPELINE_STATE_DIR = os.getenv("NFL_PIPELINE_STATE_DIR", ".pipeline_state")
+
+# Warehouse Loader Settings
+WAREHOUSE_BACKEND = os.getenv("NFL_WAREHOUSE_BACKEND", "bigquery")  # "bigquery" or "duckdb"
+LOADER_MAX_WORKERS = int(os.getenv("NFL_LOADER_MAX_WORKERS", "4"))
+LOCAL_WAREHOUSE_PATH = os.getenv("NFL_LOCAL_WAREHOUSE_PATH", os.path.join(PIPELINE_STATE_DIR, "warehouse.duckdb"))
+# Tables created range-partitioned by season, with their clustering columns.
+# Only applied when a load creates the table; see docs/incremental_marts.md to migrate.
+SEASON_PARTITIONED_TABLES = {"pbp_data": ["week", "game_id"], "game_predictions": ["week", "game_id"]}
+
+# Fan-out Settings (per-season / per-stat-type pulls)
+FANOUT_MAX_WORKERS = int(os.getenv("NFL_FANOUT_MAX_WORKERS", str(os.cpu_count() or 4)))
+FANOUT_EXECUTOR = os.getenv("NFL_FANOUT_EXECUTOR", "thread")  # "thread" or "process"
+
+# Raw Data Cache Settings
+RAW_CACHE_DIR = os.getenv("NFL_RAW_CACHE_DIR", os.path.join(PIPELINE_STATE_DIR, "raw_cache"))
+RAW_CACHE_MAX_BYTES = int(os.getenv("NFL_RAW_CACHE_MAX_BYTES", str(5 * 1024**3)))
+RAW_CACHE_FORCE_REFRESH = os.getenv("NFL_RAW_CACHE_FORCE_REFRESH", "0") == "1"
+
+# Live (in-season) Settings
+LIVE_SENSOR_INTERVAL_SECONDS = int(os.getenv("NFL_LIVE_SENSOR_INTERVAL_SECONDS", "120"))
+# nflverse publishes a game's plays some time after the final; the load retries until they appear
+LIVE_PBP_MAX_RETRIES = int(os.getenv("NFL_LIVE_PBP_MAX_RETRIES", "12"))
+LIVE_PBP_RETRY_SECONDS = int(os.getenv("NFL_LIVE_PBP_RETRY_SECONDS", "300"))
+LIVE_DBT_SELECT = os.getenv("NFL_LIVE_DBT_SELECT", "stg_pbp+")
+PREDICTION_MODEL_DIR = os.getenv("NFL_MODEL_DIR", "models")
+PREDICTION_MODEL = os.getenv("NFL_DEFAULT_MODEL", "rf")
+# Hourly, September through February; runs where no game's inputs changed score nothing
+PREDICTION_SCHEDULE_CRON = os.getenv("NFL_PREDICTION_SCHEDULE_CRON", "0 * * 1,2,9-12 *")
 
+# dbt Settings
+DBT_PROJECT_DIR = os.getenv("NFL_DBT_PROJECT_DIR", "dbt")
+DBT_PROFILES_DIR = os.getenv("NFL_DBT_PROFILES_DIR", DBT_PROJECT_DIR)
+DBT_TARGET = os.getenv("NFL_DBT_TARGET")  # None uses the profile's default target
 
-# API Settings
\ No newline at end of file
+# Telemetry Settings
+# Export asset/phase spans over OTLP (OTEL_EXPORTER_OTLP_ENDPOINT, default localhost:4318)
+OTEL_ENABLED = os.getenv("NFL_OTEL_ENABLED", "0") == "1"
+OTEL_SERVICE_NAME = os.getenv("OTEL_SERVICE_NAME", "nfl-analytics-pipeline")
@@ -0,0 +1,32 @@
+"""
+Dagster code location
+
+Definitions are built on first load rather than at import, so the webserver,
+code-location reloads and run workers only pay for the modules they use.
+"""
+
+from dagster import Definitions, definitions
+
+
+@definitions
+def defs() -> Definitions:
+    from .assets.nfl_current_stats import current_season_stats
+    from .assets.nfl_games import nfl_games
+    from .assets.nfl_live import live_marts, live_pbp, live_predictions
+    from .assets.nfl_ngs import nfl_ngs
+    from .assets.nfl_pbp import nfl_pbp
+    from .assets.nfl_player_stats import nfl_player_stats
+    from .assets.nfl_predictions import game_predictions
+    from .assets.nfl_rosters import nfl_rosters
+    from .assets.nfl_schedule import nfl_current_schedule
+    from .resources import WarehouseResource
+    from .schedules import game_predictions_job, game_predictions_schedule
+    from .sensors import completed_games_sensor, live_update_job
+
+    return Definitions(
+        assets=[nfl_games, nfl_player_stats, nfl_pbp, nfl_rosters, nfl_ngs, nfl_current_schedule,
+        current_season_stats, live_pbp, live_marts, live_predictions, game_predictions],
+        jobs=[live_update_job, game_predictions_job],
+        schedules=[game_predictions_schedule],
+        sensors=[completed_games_sensor],
+        resources={"warehouse": WarehouseResource()})
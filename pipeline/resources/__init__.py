@@ -0,0 +1,3 @@
+"""Dagster resources shared by pipeline assets"""
+
+from .warehouse import WarehouseResource
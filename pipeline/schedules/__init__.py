@@ -0,0 +1,3 @@
+"""Dagster schedules and the jobs they run"""
+
+from .game_predictions import game_predictions_job, game_predictions_schedule
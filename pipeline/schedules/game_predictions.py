@@ -0,0 +1,21 @@
+"""
+Hourly in-season scoring of upcoming games
+"""
+
+from dagster import AssetSelection, DefaultScheduleStatus, ScheduleDefinition, define_asset_job
+
+from ..assets.nfl_predictions import game_predictions
+from ..config.settings import PREDICTION_SCHEDULE_CRON
+
+game_predictions_job = define_asset_job(
+    "game_predictions_job",
+    selection=AssetSelection.assets(game_predictions),
+    description="Score betting-relevant games whose features or model changed since the last run",
+)
+
+game_predictions_schedule = ScheduleDefinition(
+    job=game_predictions_job,
+    cron_schedule=PREDICTION_SCHEDULE_CRON,
+    execution_timezone="America/New_York",
+    default_status=DefaultScheduleStatus.STOPPED,
+)
@@ -0,0 +1,3 @@
+"""Dagster sensors and the jobs they trigger"""
+
+from .completed_games import completed_games_sensor, live_update_job
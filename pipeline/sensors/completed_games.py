@@ -0,0 +1,112 @@
+"""
+Sensor that triggers the live update when games go final
+"""
+
+import hashlib
+import json
+from typing import Optional
+
+from dagster import (
+    AssetSelection,
+    DagsterRunStatus,
+    DefaultSensorStatus,
+    RunRequest,
+    RunsFilter,
+    SensorEvaluationContext,
+    SkipReason,
+    define_asset_job,
+    sensor,
+)
+import pandas as pd
+
+from ..assets.nfl_live import live_marts, live_pbp, live_predictions
+from ..config.settings import CURRENT_SEASON, LIVE_SENSOR_INTERVAL_SECONDS
+from ..utils.cache import get_raw_data_cache
+from ..utils.live import final_fingerprints
+from ..utils.nflverse import RELEASES
+from ..utils.watermarks import changed_keys
+
+live_update_job = define_asset_job(
+    "live_update_job",
+    selection=AssetSelection.assets(live_pbp, live_marts, live_predictions),
+    description="Load newly completed games, rebuild their season partitions and re-score upcoming games",
+)
+
+
+# Tag Dagster puts the sensor's run_key under on the launched run
+RUN_KEY_TAG = "dagster/run_key"
+
+# A run that ends like this loaded nothing for sure, so its games are requested again
+FAILED_STATUSES = (DagsterRunStatus.FAILURE, DagsterRunStatus.CANCELED)
+
+
+def load_current_schedule() -> pd.DataFrame:
+    """
+    Download the current season's schedule, refreshing the raw cache entry.
+    """
+    pull = get_raw_data_cache().fetch("schedules", CURRENT_SEASON, RELEASES["schedules"], force_refresh=True)
+    return pull.frame
+
+
+def _run_status(context: SensorEvaluationContext, run_key: str) -> Optional[DagsterRunStatus]:
+    """
+    Status of the run launched for run_key, None until it has been launched.
+    """
+    runs = context.instance.get_runs(RunsFilter(tags={RUN_KEY_TAG: run_key}), limit=1)
+    return runs[0].status if runs else None
+
+
+@sensor(
+    job=live_update_job,
+    minimum_interval_seconds=LIVE_SENSOR_INTERVAL_SECONDS,
+    default_status=DefaultSensorStatus.STOPPED,
+)
+def completed_games_sensor(context: SensorEvaluationContext):
+    """
+    Request a live update for games that went final and are not loaded yet.
+
+    The cursor holds the fingerprint of every final a run has loaded, and the
+    finals of each requested run still in flight. A final counts as loaded
+    only once its run succeeds; if the run fails or is canceled, the next
+    tick requests its games again. A corrected score triggers the game again.
+    The first tick only records the finals already in the schedule; the
+    nightly assets cover those.
+    """
+    fingerprints = final_fingerprints(load_current_schedule())
+
+    if context.cursor is None:
+        context.update_cursor(json.dumps({"loaded": fingerprints, "requested": {}, "requests": 0}, sort_keys=True))
+        return SkipReason(f"Recorded {len(fingerprints)} existing finals as the baseline")
+
+    state = json.loads(context.cursor)
+    if "loaded" not in state:
+        # Cursors written before runs were tracked hold only the finals
+        state = {"loaded": state, "requested": {}, "requests": 0}
+    loaded, requested = state["loaded"], state["requested"]
+    for run_key, finals in list(requested.items()):
+        status = _run_status(context, run_key)
+        if status == DagsterRunStatus.SUCCESS:
+            loaded.update(finals)
+            del requested[run_key]
+        elif status in FAILED_STATUSES:
+            context.log.warning(f"Live update for {sorted(finals)} ended {status.value}; requesting them again")
+            del requested[run_key]
+
+    in_flight = {game_id: fingerprint for finals in requested.values() for game_id, fingerprint in finals.items()}
+    game_ids = [game_id for game_id in changed_keys(fingerprints, loaded) if in_flight.get(game_id) != fingerprints[game_id]]
+    if not game_ids:
+        context.update_cursor(json.dumps(state, sort_keys=True))
+        return SkipReason(f"No new finals; {len(in_flight)} still loading")
+
+    # Numbered, so re-requesting the same finals after a failure is a new run
+    state["requests"] += 1
+    finals = {game_id: fingerprints[game_id] for game_id in game_ids}
+    run_key = f"{state['requests']}-{hashlib.sha1(json.dumps(finals, sort_keys=True).encode()).hexdigest()}"
+    requested[run_key] = finals
+    context.update_cursor(json.dumps(state, sort_keys=True))
+    context.log.info(f"{len(game_ids)} new finals: {game_ids}")
+    return RunRequest(
+        run_key=run_key,
+        run_config={"ops": {"live_pbp": {"config": {"game_ids": game_ids}}}},
+        tags={"nfl/new_finals": str(len(game_ids))},
+    )
@@ -1,11 +1,29 @@
+import os
+from functools import lru_cache
 from google.cloud import bigquery
 from dagster import AssetExecutionContext
-from ..config.settings import BIGQUERY_PROJECT, BIGQUERY_DATASET, WRITE_DISPOSITION
+from ..config.settings import (
+    BIGQUERY_PROJECT,
+    BIGQUERY_DATASET,
+    BIGQUERY_LOCATION,
+    GOOGLE_CREDENTIALS_PATH,
+    WRITE_DISPOSITION,
+)
+from .loader import BigQueryBackend, BulkLoader, LoadResult
+from .telemetry import phase
 
-def get_bigquery_client() -> bigquery.Client:
-    import os 
-    os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = "credentials.json"
-    return bigquery.Client()
+@lru_cache(maxsize=None)
+def get_bigquery_client(project: str = BIGQUERY_PROJECT) -> bigquery.Client:
+    """
+    Shared BigQuery client, built once per process.
+
+    Uses the service account file when present, otherwise application default credentials.
+    """
+    if os.path.exists(GOOGLE_CREDENTIALS_PATH):
+        return bigquery.Client.from_service_account_json(
+            GOOGLE_CREDENTIALS_PATH, project=project, location=BIGQUERY_LOCATION
+        )
+    return bigquery.Client(project=project, location=BIGQUERY_LOCATION)
 
 def store_dataframe_in_bigquery(
     context: AssetExecutionContext,
@@ -13,15 +31,34 @@ def store_dataframe_in_bigquery(
     table_name: str,
     project: str = BIGQUERY_PROJECT,
     dataset: str = BIGQUERY_DATASET
-) -> None:
-    client = get_bigquery_client()
-    table_id = f"{project}.{dataset}.{table_name}"
+) -> LoadResult:
+    loader = BulkLoader(BigQueryBackend(get_bigquery_client(project), project, dataset))
+    with phase("load", table=table_name) as stats:
+        result = loader.load(table_name, df, write_disposition=WRITE_DISPOSITION)
+        stats.record(rows=result.rows, bytes=result.bytes, **result.job_stats)
+
+    context.log.info(f"Stored {result.rows} records in {project}.{dataset}.{table_name} (job stats: {result.job_stats})")
+    return result
 
-    job_config = bigquery.LoadJobConfig(
-        write_disposition=WRITE_DISPOSITION,
-    )
+def merge_dataframe_into_bigquery(
+    context: AssetExecutionContext,
+    df,
+    table_name: str,
+    key_column: str,
+    project: str = BIGQUERY_PROJECT,
+    dataset: str = BIGQUERY_DATASET
+) -> LoadResult:
+    """
+    Replace the rows for every key present in df, leaving the rest of the table intact.
 
-    job = client.load_table_from_dataframe(df, table_id, job_config=job_config)
-    job.result()
+    df is staged in a scratch table and swapped in with one DELETE + INSERT
+    transaction, so reloading one week of games only touches those games
+    instead of truncating the table, and a failed load deletes nothing.
+    """
+    loader = BulkLoader(BigQueryBackend(get_bigquery_client(project), project, dataset))
+    with phase("load", table=table_name) as stats:
+        result = loader.merge(table_name, df, key_column=key_column)
+        stats.record(rows=result.rows, bytes=result.bytes, **result.job_stats)
 
-    context.log.info(f"Stored {len(df)} records in {table_id}")
\ No newline at end of file
+    context.log.info(f"Merged {result.rows} records into {project}.{dataset}.{table_name} (job stats: {result.job_stats})")
+    return result
@@ -0,0 +1,515 @@
+"""
+Local columnar cache for raw nfl_data_py pulls
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+import pandas as pd
+
+from nfl_analytics.analytics.features import raw_cache_entries
+
+from ..config.settings import (
+    CURRENT_SEASON,
+    FANOUT_EXECUTOR,
+    FANOUT_MAX_WORKERS,
+    RAW_CACHE_DIR,
+    RAW_CACHE_FORCE_REFRESH,
+    RAW_CACHE_MAX_BYTES,
+)
+from .fanout import UnitResult, fan_out
+from .nflverse import ReleaseFile, iter_release_files
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedPull:
+    """One dataset/season pull, either read from the cache or freshly downloaded"""
+
+    dataset: str
+    season: Optional[int]
+    frame: pd.DataFrame
+    content_hash: str
+    fetch_date: str
+    from_cache: bool
+    validators: Dict[str, str] = field(default_factory=dict)  # HTTP ETag/Last-Modified of the source file
+
+    @property
+    def key(self) -> str:
+        return f"{self.dataset}/{_season_label(self.season)}"
+
+
+def _season_label(season: Optional[int]) -> str:
+    return "all" if season is None else str(season)
+
+
+def content_hash(df: pd.DataFrame) -> str:
+    """
+    Stable hash of a frame's columns and values.
+    """
+    digest = hashlib.sha256()
+    digest.update("|".join(map(str, df.columns)).encode())
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    except TypeError:
+        # Unhashable cells (lists, dicts) fall back to their string form
+        row_hashes = pd.util.hash_pandas_object(df.astype(str), index=False).to_numpy()
+    digest.update(row_hashes.tobytes())
+    return digest.hexdigest()
+
+
+def concat_pulls(pulls: Iterable[CachedPull]) -> pd.DataFrame:
+    """
+    Combine per-season pulls into a single frame.
+    """
+    frames = [pull.frame for pull in pulls if len(pull.frame) > 0]
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def replace_dir(staging: Path, target: Path) -> None:
+    """
+    Rename a fully written staging directory onto target, replacing its contents.
+
+    Safe between processes: an existing target is moved aside first, and if a
+    concurrent writer swaps in its own copy in the meantime, that copy is kept
+    and staging is discarded.
+    """
+    try:
+        os.replace(staging, target)
+        return
+    except OSError:
+        pass  # target exists and is not empty
+
+    retired = Path(tempfile.mkdtemp(dir=target.parent, prefix=".retired-"))
+    try:
+        os.replace(target, retired / target.name)
+    except FileNotFoundError:
+        pass  # another writer moved it first
+    try:
+        os.replace(staging, target)
+    except OSError:
+        shutil.rmtree(staging, ignore_errors=True)
+    shutil.rmtree(retired, ignore_errors=True)
+
+
+class RawDataCache:
+    """
+    On-disk Parquet cache of raw pulls, partitioned by dataset, season and fetch date.
+
+    Layout::
+
+        <root>/<dataset>/season=<season>/fetch_date=<YYYY-MM-DD>/data.parquet
+        <root>/<dataset>/season=<season>/fetch_date=<YYYY-MM-DD>/manifest.json
+        <root>/_loads/<table>.json
+
+    A pull is reused without downloading when it was fetched today, or at any
+    time for seasons before CURRENT_SEASON (those files no longer change).
+    Pulls of nflverse ReleaseFiles keep the file's HTTP validators, so a
+    refresh of an unchanged file is a 304 with no body.
+    Content hashes of what was last written to each warehouse table are kept
+    under ``_loads`` so unchanged data skips the load as well.
+    """
+
+    def __init__(
+        self,
+        root: str = RAW_CACHE_DIR,
+        max_bytes: int = RAW_CACHE_MAX_BYTES,
+        force_refresh: bool = RAW_CACHE_FORCE_REFRESH,
+    ):
+        """
+        Args:
+            root: Cache directory
+            max_bytes: Size budget enforced by evict()
+            force_refresh: Always re-download, ignoring cached entries
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.force_refresh = force_refresh
+
+    def _season_dir(self, dataset: str, season: Optional[int]) -> Path:
+        return self.root / dataset / f"season={_season_label(season)}"
+
+    def _entries(self, dataset: str, season: Optional[int]) -> List[Path]:
+        return raw_cache_entries(self._season_dir(dataset, season))
+
+    def _is_fresh(self, entry: Path, season: Optional[int]) -> bool:
+        fetch_date = entry.name.split("=", 1)[1]
+        if fetch_date == date.today().isoformat():
+            return True
+        return season is not None and season < CURRENT_SEASON
+
+    def _read_manifest(self, entry: Path) -> Dict:
+        with (entry / "manifest.json").open() as f:
+            return json.load(f)
+
+    def _read_entry(self, dataset: str, season: Optional[int], entry: Path) -> CachedPull:
+        manifest = self._read_manifest(entry)
+        os.utime(entry)  # mark as recently used for eviction
+        return CachedPull(
+            dataset=dataset,
+            season=season,
+            frame=pd.read_parquet(entry / "data.parquet"),
+            content_hash=manifest["content_hash"],
+            fetch_date=manifest["fetch_date"],
+            from_cache=True,
+            validators=manifest.get("validators", {}),
+        )
+
+    def lookup(
+        self, dataset: str, season: Optional[int], force_refresh: Optional[bool] = None
+    ) -> Optional[CachedPull]:
+        """
+        Return the fresh cached pull for a dataset/season, or None if it must be downloaded.
+        """
+        force = self.force_refresh if force_refresh is None else force_refresh
+        entries = self._entries(dataset, season)
+        if entries and not force and self._is_fresh(entries[-1], season):
+            return self._read_entry(dataset, season, entries[-1])
+        return None
+
+    def latest(self, dataset: str, season: Optional[int]) -> Optional[CachedPull]:
+        """
+        Return the newest cached pull regardless of age, or None.
+        """
+        entries = self._entries(dataset, season)
+        return self._read_entry(dataset, season, entries[-1]) if entries else None
+
+    def store(
+        self, dataset: str, season: Optional[int], frame: pd.DataFrame, validators: Optional[Dict[str, str]] = None
+    ) -> CachedPull:
+        """
+        Cache a freshly downloaded frame under today's fetch date.
+        """
+        pull = CachedPull(
+            dataset=dataset,
+            season=season,
+            frame=frame,
+            content_hash=content_hash(frame),
+            fetch_date=date.today().isoformat(),
+            from_cache=False,
+            validators=dict(validators or {}),
+        )
+        self._write(pull)
+        self.evict()
+        return pull
+
+    def renew(self, pull: CachedPull) -> CachedPull:
+        """
+        Re-date a cached pull to today without rewriting it, for a source that
+        answered 304 Not Modified.
+        """
+        today = date.today().isoformat()
+        season_dir = self._season_dir(pull.dataset, pull.season)
+        entry, renewed = season_dir / f"fetch_date={pull.fetch_date}", season_dir / f"fetch_date={today}"
+        if entry != renewed:
+            shutil.rmtree(renewed, ignore_errors=True)
+            os.replace(entry, renewed)
+        manifest = self._read_manifest(renewed)
+        manifest.update(fetch_date=today, fetched_at=datetime.now(timezone.utc).isoformat())
+        with (renewed / "manifest.json").open("w") as f:
+            json.dump(manifest, f, indent=2)
+        return replace(pull, fetch_date=today, from_cache=True)
+
+    def _validators(self, dataset: str, season: Optional[int]) -> Dict[str, str]:
+        entries = self._entries(dataset, season)
+        return self._read_manifest(entries[-1]).get("validators", {}) if entries else {}
+
+    def fetch(
+        self,
+        dataset: str,
+        season: Optional[int],
+        loader: Union[Callable[[], pd.DataFrame], ReleaseFile],
+        force_refresh: Optional[bool] = None,
+    ) -> CachedPull:
+        """
+        Return a dataset/season pull, downloading only when no fresh entry exists.
+
+        Args:
+            dataset: Dataset name, e.g. 'schedules' or 'ngs_passing'
+            season: Season the pull covers, None for season-less datasets
+            loader: Zero-argument callable performing the download, or the
+                ReleaseFile to fetch (conditionally, if a copy is cached)
+            force_refresh: Override the cache-wide force_refresh setting
+
+        Returns:
+            CachedPull with the frame and its content hash
+        """
+        if isinstance(loader, ReleaseFile):
+            result = next(self.iter_pulls({(dataset, season): loader}, force_refresh))
+            if not result.ok:
+                raise result.error
+            return result.value
+
+        pull = self.lookup(dataset, season, force_refresh)
+        if pull is not None:
+            return pull
+        return self.store(dataset, season, loader())
+
+    def iter_pulls(
+        self,
+        loaders: Mapping[Tuple[str, int], Callable[[List[int]], pd.DataFrame]],
+        force_refresh: Optional[bool] = None,
+        max_workers: int = FANOUT_MAX_WORKERS,
+        executor: str = FANOUT_EXECUTOR,
+    ) -> Iterator[UnitResult]:
+        """
+        Yield one pull per (dataset, season) as soon as it is available.
+
+        Cached pulls are yielded first; the rest are downloaded concurrently.
+        ReleaseFile loaders share one async HTTP client and send conditional
+        requests, so an unchanged file re-dates its cached copy instead of
+        downloading; other loaders run through fan_out. A pull that fails to
+        download falls back to its newest cached copy (value set, error set)
+        or, without one, is yielded with value None.
+
+        Args:
+            loaders: (dataset, season) -> ReleaseFile or nfl_data_py style function
+                taking a list of seasons; must be picklable when executor is 'process'
+            force_refresh: Override the cache-wide force_refresh setting
+            max_workers: Concurrent downloads
+            executor: 'thread' or 'process'
+
+        Yields:
+            UnitResult keyed by (dataset, season) with a CachedPull value
+        """
+        misses, release_misses = {}, {}
+        for (dataset, season), loader in loaders.items():
+            pull = self.lookup(dataset, season, force_refresh)
+            if pull is not None:
+                yield UnitResult(key=(dataset, season), value=pull)
+            elif isinstance(loader, ReleaseFile):
+                release_misses[(dataset, season)] = (loader, season, self._validators(dataset, season))
+            else:
+                misses[(dataset, season)] = (loader, ([season],))
+
+        for result in iter_release_files(release_misses):
+            dataset, season = result.key
+            if result.ok and result.value.not_modified:
+                pull = self.renew(self.latest(dataset, season))
+                logger.info(f"{pull.key} unchanged at the source (304), reusing cached copy")
+                yield UnitResult(key=result.key, value=pull, seconds=result.seconds)
+            elif result.ok:
+                pull = self.store(dataset, season, result.value.frame, result.value.validators)
+                yield UnitResult(key=result.key, value=pull, seconds=result.seconds)
+            else:
+                yield self._fall_back(result)
+
+        for result in fan_out(misses, max_workers=max_workers, executor=executor):
+            dataset, season = result.key
+            if result.ok:
+                pull = self.store(dataset, season, result.value)
+                yield UnitResult(key=result.key, value=pull, seconds=result.seconds, cpu_seconds=result.cpu_seconds)
+            else:
+                yield self._fall_back(result)
+
+    def _fall_back(self, result: UnitResult) -> UnitResult:
+        """The newest cached copy of a failed download, or value None without one."""
+        stale = self.latest(*result.key)
+        if stale is not None:
+            logger.warning(f"Using cached {stale.fetch_date} copy of {stale.key}: {result.error}")
+        return UnitResult(
+            key=result.key, value=stale, error=result.error, seconds=result.seconds, cpu_seconds=result.cpu_seconds
+        )
+
+    def iter_seasons(
+        self,
+        dataset: str,
+        seasons: Iterable[int],
+        loader: Callable[[List[int]], pd.DataFrame],
+        force_refresh: Optional[bool] = None,
+        max_workers: int = FANOUT_MAX_WORKERS,
+        executor: str = FANOUT_EXECUTOR,
+    ) -> Iterator[UnitResult]:
+        """
+        iter_pulls for a single dataset, with results keyed by season.
+        """
+        loaders = {(dataset, season): loader for season in seasons}
+        for result in self.iter_pulls(loaders, force_refresh, max_workers, executor):
+            result.key = result.key[1]
+            yield result
+
+    def fetch_seasons(
+        self,
+        dataset: str,
+        seasons: Iterable[int],
+        loader: Callable[[List[int]], pd.DataFrame],
+        force_refresh: Optional[bool] = None,
+    ) -> List[CachedPull]:
+        """
+        Fetch a season-based dataset one season at a time through the cache.
+
+        Downloads run concurrently; any season without data raises.
+
+        Args:
+            dataset: Dataset name
+            seasons: Seasons to pull
+            loader: nfl_data_py style function taking a list of seasons
+            force_refresh: Override the cache-wide force_refresh setting
+        """
+        seasons = list(seasons)
+        pulls = {}
+        for result in self.iter_seasons(dataset, seasons, loader, force_refresh):
+            if result.value is None:
+                raise result.error
+            pulls[result.key] = result.value
+        return [pulls[season] for season in seasons]
+
+    def _write(self, pull: CachedPull) -> None:
+        season_dir = self._season_dir(pull.dataset, pull.season)
+        season_dir.mkdir(parents=True, exist_ok=True)
+        # Private staging directory: concurrent writers of the same pull never
+        # share files, and the name is not a fetch_date=* entry until swapped in
+        staging = Path(tempfile.mkdtemp(dir=season_dir, prefix=".staging-"))
+        try:
+            pull.frame.to_parquet(staging / "data.parquet", index=False)
+        except (ValueError, TypeError, ImportError) as e:
+            # Caching is best-effort; the pull itself is still usable
+            logger.warning(f"Could not cache {pull.key}: {e}")
+            shutil.rmtree(staging, ignore_errors=True)
+            return
+
+        manifest = {
+            "dataset": pull.dataset,
+            "season": pull.season,
+            "fetch_date": pull.fetch_date,
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+            "content_hash": pull.content_hash,
+            "validators": pull.validators,
+            "rows": len(pull.frame),
+            "bytes": (staging / "data.parquet").stat().st_size,
+        }
+        with (staging / "manifest.json").open("w") as f:
+            json.dump(manifest, f, indent=2)
+
+        replace_dir(staging, season_dir / f"fetch_date={pull.fetch_date}")
+
+    def _load_state_path(self, table_name: str) -> Path:
+        return self.root / "_loads" / f"{table_name}.json"
+
+    def _load_state(self, table_name: str) -> Dict[str, str]:
+        path = self._load_state_path(table_name)
+        if not path.exists():
+            return {}
+        with path.open() as f:
+            return json.load(f)
+
+    @staticmethod
+    def _load_hash(pull: CachedPull, depends_on: Iterable[CachedPull]) -> str:
+        depends_on = list(depends_on)
+        if not depends_on:
+            return pull.content_hash
+        # Fold in reference pulls (e.g. the players table used to map ids) so a
+        # change there reloads every season that was transformed with it
+        digest = hashlib.sha256(pull.content_hash.encode())
+        for dependency in sorted(depends_on, key=lambda dep: dep.key):
+            digest.update(f"{dependency.key}={dependency.content_hash}".encode())
+        return digest.hexdigest()
+
+    def needs_load(
+        self,
+        table_name: str,
+        pulls: Iterable[CachedPull],
+        depends_on: Iterable[CachedPull] = (),
+    ) -> bool:
+        """
+        True when any pull differs from what was last loaded into table_name.
+
+        Args:
+            table_name: Warehouse table
+            pulls: Pulls about to be written
+            depends_on: Reference pulls the written data was derived with
+        """
+        if self.force_refresh:
+            return True
+        loaded = self._load_state(table_name)
+        depends_on = list(depends_on)
+        return any(loaded.get(pull.key) != self._load_hash(pull, depends_on) for pull in pulls)
+
+    def mark_loaded(
+        self,
+        table_name: str,
+        pulls: Iterable[CachedPull],
+        depends_on: Iterable[CachedPull] = (),
+        replace: bool = True,
+    ) -> None:
+        """
+        Record the content hashes that were just written to table_name.
+
+        Args:
+            table_name: Warehouse table
+            pulls: Pulls that were written
+            depends_on: Reference pulls the written data was derived with
+            replace: True for truncate loads; False merges with the recorded
+                state, for tables loaded one season at a time
+        """
+        path = self._load_state_path(table_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        depends_on = list(depends_on)
+        state = {} if replace else self._load_state(table_name)
+        state.update({pull.key: self._load_hash(pull, depends_on) for pull in pulls})
+        tmp_path = path.with_suffix(".json.tmp")
+        with tmp_path.open("w") as f:
+            json.dump(state, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def _all_entries(self) -> Iterator[List[Path]]:
+        """Complete entries of every dataset/season, oldest first."""
+        for season_dir in self.root.glob("*/season=*"):
+            yield raw_cache_entries(season_dir)
+
+    @staticmethod
+    def _entry_stat(entry: Path) -> Optional[Tuple[float, int]]:
+        """Last use and size of an entry, None once another process replaced or evicted it."""
+        try:
+            return entry.stat().st_mtime, sum(path.stat().st_size for path in entry.iterdir())
+        except FileNotFoundError:
+            return None
+
+    def size_bytes(self) -> int:
+        """
+        Total bytes of cached entries.
+        """
+        stats = (self._entry_stat(entry) for entries in self._all_entries() for entry in entries)
+        return sum(stat[1] for stat in stats if stat is not None)
+
+    def evict(self) -> int:
+        """
+        Drop least recently used entries until the cache fits in max_bytes.
+
+        The newest entry of every dataset/season is never evicted.
+
+        Returns:
+            Number of bytes freed
+        """
+        total = self.size_bytes()
+        if total <= self.max_bytes:
+            return 0
+
+        candidates = []
+        for entries in self._all_entries():
+            candidates.extend((stat, entry) for entry in entries[:-1] if (stat := self._entry_stat(entry)))
+        candidates.sort()
+
+        freed = 0
+        for (_, entry_bytes), entry in candidates:
+            if total - freed <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            freed += entry_bytes
+            logger.info(f"Evicted {entry} ({entry_bytes} bytes)")
+        return freed
+
+
+def get_raw_data_cache() -> RawDataCache:
+    return RawDataCache()
@@ -0,0 +1,46 @@
+"""
+Programmatic dbt invocations for assets that rebuild marts
+"""
+
+import json
+from typing import Iterable, List, Optional
+
+from ..config.settings import DBT_PROFILES_DIR, DBT_PROJECT_DIR, DBT_TARGET
+
+
+def refresh_seasons_args(select: str, seasons: Iterable[int]) -> List[str]:
+    """
+    dbt CLI arguments rebuilding only the given season partitions of select.
+
+    The season-partitioned models overwrite whole seasons (see
+    dbt/macros/incremental.sql), so this is the smallest rebuild that keeps
+    their windows exact.
+    """
+    seasons = sorted({int(season) for season in seasons})
+    if not seasons:
+        raise ValueError("At least one season is required")
+    return ["run", "--select", select, "--vars", json.dumps({"refresh_seasons": seasons})]
+
+
+def run_dbt(
+    args: List[str],
+    project_dir: str = DBT_PROJECT_DIR,
+    profiles_dir: str = DBT_PROFILES_DIR,
+    target: Optional[str] = DBT_TARGET,
+) -> List[str]:
+    """
+    Run a dbt command in-process and return the names of the nodes it ran.
+
+    Raises:
+        RuntimeError: If dbt fails or any node errors
+    """
+    from dbt.cli.main import dbtRunner
+
+    cli_args = [*args, "--project-dir", project_dir, "--profiles-dir", profiles_dir]
+    if target:
+        cli_args += ["--target", target]
+
+    result = dbtRunner().invoke(cli_args)
+    if not result.success:
+        raise RuntimeError(f"dbt {' '.join(args)} failed: {result.exception or 'see dbt logs'}")
+    return [node.node.name for node in (result.result or [])]
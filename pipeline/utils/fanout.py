@@ -0,0 +1,99 @@
+"""
+Fan-out of independent ingestion units (seasons, stat types) over a worker pool
+"""
+
+import time
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, Hashable, Iterator, Mapping, Optional, Tuple, TypeVar
+
+from ..config.settings import FANOUT_EXECUTOR, FANOUT_MAX_WORKERS
+
+T = TypeVar("T")
+
+# A unit of work: a picklable callable and its positional arguments
+Unit = Tuple[Callable[..., Any], Tuple[Any, ...]]
+
+
+@dataclass
+class UnitResult(Generic[T]):
+    """
+    Outcome of one unit.
+
+    value is None when the unit failed outright; error is set whenever the
+    unit raised, even if a fallback value was supplied.
+    """
+
+    key: Hashable
+    value: Optional[T] = None
+    error: Optional[BaseException] = None
+    seconds: float = 0.0
+    cpu_seconds: Optional[float] = None  # of the worker thread that ran the unit
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _timed_call(fn: Callable[..., T], args: Tuple[Any, ...]) -> Tuple[T, float, float]:
+    start, cpu = time.perf_counter(), time.thread_time()
+    value = fn(*args)
+    return value, time.perf_counter() - start, time.thread_time() - cpu
+
+
+def _make_executor(executor: str, max_workers: int) -> Executor:
+    if executor == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers)
+    if executor == "process":
+        return ProcessPoolExecutor(max_workers=max_workers)
+    raise ValueError(f"Invalid fan-out executor: {executor}")
+
+
+def fan_out(
+    units: Mapping[Hashable, Unit],
+    max_workers: int = FANOUT_MAX_WORKERS,
+    executor: str = FANOUT_EXECUTOR,
+) -> Iterator[UnitResult]:
+    """
+    Run units concurrently and yield each result as soon as it finishes.
+
+    Exceptions are captured per unit instead of propagating, so one bad
+    season doesn't abort the others.
+
+    Args:
+        units: key -> (callable, args). Callables must be picklable
+            (module-level functions or functools.partial) for 'process'.
+        max_workers: Pool size; 1 runs the units inline, in order
+        executor: 'thread' for network-bound pulls, 'process' for CPU-bound parsing
+
+    Yields:
+        UnitResult per unit, in completion order
+    """
+    if max_workers <= 1 or len(units) <= 1:
+        for key, (fn, args) in units.items():
+            try:
+                value, seconds, cpu_seconds = _timed_call(fn, args)
+            except Exception as e:
+                yield UnitResult(key=key, error=e)
+            else:
+                yield UnitResult(key=key, value=value, seconds=seconds, cpu_seconds=cpu_seconds)
+        return
+
+    with _make_executor(executor, min(max_workers, len(units))) as pool:
+        futures: Dict[Future, Hashable] = {
+            pool.submit(_timed_call, fn, args): key for key, (fn, args) in units.items()
+        }
+        for future in as_completed(futures):
+            key = futures[future]
+            error = future.exception()
+            if error is not None:
+                yield UnitResult(key=key, error=error)
+            else:
+                value, seconds, cpu_seconds = future.result()
+                yield UnitResult(key=key, value=value, seconds=seconds, cpu_seconds=cpu_seconds)
@@ -0,0 +1,91 @@
+"""
+Season-by-season ingestion: pull, transform and merge each season as it arrives
+"""
+
+from typing import Callable, Iterable, List, Optional
+
+import pandas as pd
+from dagster import AssetExecutionContext
+
+from ..config.settings import SEASONS
+from ..resources import WarehouseResource
+from .cache import CachedPull, RawDataCache
+from .telemetry import frame_bytes, phase, record_fetch, tagged
+
+
+def stream_seasons(
+    context: AssetExecutionContext,
+    warehouse: WarehouseResource,
+    cache: RawDataCache,
+    dataset: str,
+    table_name: str,
+    loader: Callable[[List[int]], pd.DataFrame],
+    seasons: Iterable[int] = SEASONS,
+    transform: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+    depends_on: Iterable[CachedPull] = (),
+) -> pd.DataFrame:
+    """
+    Pull seasons concurrently and merge each one into table_name as soon as it lands.
+
+    Seasons whose content (and reference pulls) are unchanged since the last
+    load skip the warehouse write, as do empty seasons, which are logged as a
+    warning since they usually mean the upstream release is missing. A season that fails to download does not
+    hold up the others; the asset fails afterwards with every failed season listed.
+
+    Args:
+        context: Dagster execution context
+        warehouse: Warehouse resource to merge into
+        cache: Raw data cache
+        dataset: Cache dataset name, e.g. 'schedules'
+        table_name: Warehouse table, merged on its season column
+        loader: nfl_data_py style function taking a list of seasons
+        seasons: Seasons to pull
+        transform: Per-season transform applied before loading
+        depends_on: Reference pulls the transform uses (e.g. players)
+
+    Returns:
+        All seasons combined, in season order
+    """
+    depends_on = list(depends_on)
+    frames = {}
+    failed = {}
+
+    for result in cache.iter_seasons(dataset, seasons, loader):
+        season, pull = result.key, result.value
+        if pull is None:
+            context.log.error(f"Failed to pull {dataset} for {season}: {result.error}")
+            failed[season] = result.error
+            continue
+        if not result.ok:
+            context.log.warning(f"Pull of {dataset} for {season} failed, using cached copy from {pull.fetch_date}")
+
+        # Downloads run on pool workers, so the fetch is recorded from their timings
+        record_fetch(result, season=season, dataset=dataset)
+
+        with tagged(season=season):
+            if transform is not None:
+                with phase("transform", dataset=dataset) as stats:
+                    frame = transform(pull.frame)
+                    stats.record(rows=len(frame), bytes=frame_bytes(frame))
+            else:
+                frame = pull.frame
+            source = "cache" if pull.from_cache else f"download in {result.seconds:.1f}s"
+            context.log.info(f"Loaded {len(frame)} {dataset} rows for {season} ({source})")
+
+            if len(frame) == 0:
+                # Usually a season nflverse hasn't published yet: nothing to load, but not a no-op
+                context.log.warning(f"{dataset} for {season} is empty upstream, nothing written to {table_name}")
+            elif cache.needs_load(table_name, [pull], depends_on):
+                warehouse.merge(context, frame, table_name, key_column="season")
+                cache.mark_loaded(table_name, [pull], depends_on, replace=False)
+            else:
+                context.log.info(f"{table_name} {season} unchanged since last load, skipping write")
+        frames[season] = frame
+
+    if failed:
+        raise RuntimeError(f"Failed to pull {dataset} for seasons {sorted(failed)}")
+
+    ordered = [frames[season] for season in sorted(frames) if len(frames[season]) > 0]
+    if not ordered:
+        return pd.DataFrame()
+    return pd.concat(ordered, ignore_index=True)
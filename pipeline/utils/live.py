@@ -0,0 +1,119 @@
+"""
+In-season helpers: spotting newly completed games and re-scoring upcoming ones
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+import pandas as pd
+
+from ..config.settings import PREDICTION_MODEL, PREDICTION_MODEL_DIR
+from .watermarks import frame_fingerprints
+
+# Schedule columns whose change means a game went final or its final was corrected
+FINAL_COLUMNS = ["game_id", "season", "week", "home_score", "away_score"]
+
+
+def game_season(game_id: str) -> int:
+    """
+    Season of an nflverse game id ('2025_01_DAL_PHI' -> 2025).
+    """
+    try:
+        return int(str(game_id)[:4])
+    except ValueError:
+        raise ValueError(f"Not an nflverse game id: {game_id}") from None
+
+
+def completed_games(schedule: pd.DataFrame) -> pd.DataFrame:
+    """
+    Schedule rows that have a final score.
+    """
+    return schedule[schedule["home_score"].notna() & schedule["away_score"].notna()]
+
+
+def upcoming_games(schedule: pd.DataFrame) -> pd.DataFrame:
+    """
+    Schedule rows that have not been played yet.
+    """
+    return schedule[schedule["home_score"].isna() | schedule["away_score"].isna()]
+
+
+def final_fingerprints(schedule: pd.DataFrame) -> Dict[str, str]:
+    """
+    Fingerprint of each completed game's final, keyed by game id.
+    """
+    finals = completed_games(schedule)[FINAL_COLUMNS].reset_index(drop=True)
+    if finals.empty:
+        return {}
+    # Scores arrive as float when the season is in progress and int once it's over
+    finals = finals.astype({"game_id": str, "season": "int64", "week": "int64", "home_score": "float64", "away_score": "float64"})
+    return frame_fingerprints(finals, key_column="game_id")
+
+
+def load_serving_model(model_dir: str = PREDICTION_MODEL_DIR, name: str = PREDICTION_MODEL):
+    """
+    The LoadedModel predictions are made with (NFL_DEFAULT_MODEL in NFL_MODEL_DIR).
+
+    Only that model is loaded: its .model artifact directory, or else its .pkl,
+    the same precedence load_models applies.
+    """
+    from nfl_analytics.api.predictor import ARTIFACT_PREFIX, load_model, load_model_artifact
+
+    loaders = {".model": load_model_artifact, ".pkl": load_model}
+    candidates = [Path(model_dir) / f"{stem}{suffix}" for suffix in loaders for stem in (f"{ARTIFACT_PREFIX}{name}", name)]
+    for path in candidates:
+        if path.exists():
+            return loaders[path.suffix](str(path), name)
+    raise ValueError(f"Model '{name}' not found in {model_dir}; looked for {', '.join(path.name for path in candidates)}")
+
+
+def check_model_inputs(features: pd.DataFrame, model, table: str) -> None:
+    """
+    Raise if features lacks any column the model was trained on, naming them.
+    """
+    missing = [column for column in model.feature_columns if column not in features.columns]
+    if missing:
+        raise ValueError(
+            f"{table} is missing {len(missing)} of the {len(model.feature_columns)} inputs of model "
+            f"'{model.name}': {', '.join(missing)}"
+        )
+
+
+def score_games(features: pd.DataFrame, model, model_name: str) -> pd.DataFrame:
+    """
+    Home win probabilities for one row of game features per game, scored as one batch.
+
+    Args:
+        features: game_model_inputs rows for the games to score
+        model: A LoadedModel from nfl_analytics.api.predictor
+        model_name: Recorded with each prediction
+
+    Returns:
+        One row per game, ready to merge into the predictions table on game_id
+    """
+    columns = ["game_id", "season", "week", "home_team", "away_team"]
+    predictions = features[columns].reset_index(drop=True).copy()
+    predictions["home_win_probability"] = model.home_win_probability(model.vectorize_frame(features))
+    predictions["model"] = model_name
+    predictions["model_version"] = model.version
+    predictions["scored_at"] = datetime.now(timezone.utc)
+    return predictions
+
+
+def feature_hashes(features: pd.DataFrame, feature_columns: List[str]) -> pd.Series:
+    """
+    Hash of each game's model inputs, indexed like features.
+
+    Only the feature columns are hashed: game_model_inputs stamps
+    updated_at on every dbt run, which must not count as a change.
+    """
+    inputs = features[feature_columns].astype("float64")
+    return pd.util.hash_pandas_object(inputs, index=False).map("{:016x}".format)
+
+
+def seasons_of(game_ids: Iterable[str]) -> List[int]:
+    """
+    Sorted distinct seasons of a set of game ids.
+    """
+    return sorted({game_season(game_id) for game_id in game_ids})
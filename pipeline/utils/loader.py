@@ -0,0 +1,404 @@
+"""
+Parallel bulk loader for warehouse tables
+"""
+
+import io
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Protocol, Sequence
+
+import pandas as pd
+
+from ..config.settings import (
+    BIGQUERY_DATASET,
+    BIGQUERY_PROJECT,
+    LOADER_MAX_WORKERS,
+    SEASON_PARTITIONED_TABLES,
+    WRITE_DISPOSITION,
+)
+
+
+@dataclass
+class LoadResult:
+    """Outcome of one table load"""
+
+    table: str
+    rows: int
+    bytes: int
+    wall_seconds: float
+    job_id: Optional[str] = None
+    job_stats: Dict[str, Any] = field(default_factory=dict)
+
+
+def job_statistics(job: Any) -> Dict[str, Any]:
+    """
+    Statistics of a finished BigQuery load job: rows and bytes written, input
+    size and how long the job ran server-side.
+    """
+    stats: Dict[str, Any] = {"job_id": job.job_id}
+    for attribute in ("output_rows", "output_bytes", "input_file_bytes"):
+        value = getattr(job, attribute, None)
+        if value is not None:
+            stats[attribute] = int(value)
+    started, ended = getattr(job, "started", None), getattr(job, "ended", None)
+    if started is not None and ended is not None:
+        stats["job_seconds"] = (ended - started).total_seconds()
+    return stats
+
+
+def serialize_to_parquet(df: pd.DataFrame) -> bytes:
+    """
+    Serialize a frame to Parquet bytes once so it can be shipped as-is.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer, compression="snappy")
+    return buffer.getvalue()
+
+
+class WarehouseBackend(Protocol):
+    """Minimal interface a warehouse needs for the bulk loader"""
+
+    def load_parquet(self, table_name: str, payload: bytes, write_disposition: str) -> Dict[str, Any]:
+        """Load Parquet bytes into a table, blocking until done. Returns the job's statistics, if any."""
+        ...
+
+    def merge_parquet(self, table_name: str, payload: bytes, key_column: str) -> Dict[str, Any]:
+        """
+        Atomically replace the rows whose key_column appears in the payload with the
+        payload's rows. Returns the job's statistics, including deleted_rows.
+        """
+        ...
+
+    def delete_keys(self, table_name: str, key_column: str, keys: Sequence[str]) -> int:
+        """Delete rows whose key_column is in keys. Returns rows deleted."""
+        ...
+
+    def read_keys(self, table_name: str, key_column: str, keys: Sequence[str]) -> pd.DataFrame:
+        """Read rows whose key_column is in keys. Empty if the table doesn't exist."""
+        ...
+
+
+class BigQueryBackend:
+    """Loads Parquet payloads into BigQuery with one shared client"""
+
+    def __init__(
+        self,
+        client,
+        project: str = BIGQUERY_PROJECT,
+        dataset: str = BIGQUERY_DATASET,
+        partitioned_tables: Dict[str, List[str]] = SEASON_PARTITIONED_TABLES,
+    ):
+        self.client = client
+        self.project = project
+        self.dataset = dataset
+        self.partitioned_tables = partitioned_tables
+
+    def _table_id(self, table_name: str) -> str:
+        return f"{self.project}.{self.dataset}.{table_name}"
+
+    def _table_exists(self, table_name: str) -> bool:
+        from google.api_core.exceptions import NotFound
+
+        try:
+            self.client.get_table(self._table_id(table_name))
+        except NotFound:
+            return False
+        return True
+
+    def load_parquet(self, table_name: str, payload: bytes, write_disposition: str) -> Dict[str, Any]:
+        from google.cloud import bigquery
+
+        job_config = bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.PARQUET,
+            write_disposition=write_disposition,
+        )
+        if write_disposition == "WRITE_APPEND":
+            job_config.schema_update_options = [bigquery.SchemaUpdateOption.ALLOW_FIELD_ADDITION]
+        if table_name in self.partitioned_tables and not self._table_exists(table_name):
+            # Season partitions let dbt's incremental models scan one season, not all of them
+            job_config.range_partitioning = bigquery.RangePartitioning(
+                field="season", range_=bigquery.PartitionRange(start=1999, end=2100, interval=1)
+            )
+            job_config.clustering_fields = self.partitioned_tables[table_name]
+
+        job = self.client.load_table_from_file(
+            io.BytesIO(payload), self._table_id(table_name), job_config=job_config
+        )
+        job.result()
+        return job_statistics(job)
+
+    def _add_missing_fields(self, table_name: str, staging_name: str) -> None:
+        # Mirrors ALLOW_FIELD_ADDITION: the INSERT below can't add columns itself
+        table = self.client.get_table(self._table_id(table_name))
+        existing = {schema_field.name for schema_field in table.schema}
+        added = [f for f in self.client.get_table(self._table_id(staging_name)).schema if f.name not in existing]
+        if added:
+            table.schema = [*table.schema, *added]
+            self.client.update_table(table, ["schema"])
+
+    def merge_parquet(self, table_name: str, payload: bytes, key_column: str) -> Dict[str, Any]:
+        if not self._table_exists(table_name):
+            return {**self.load_parquet(table_name, payload, "WRITE_APPEND"), "deleted_rows": 0}
+
+        # Land the rows in a staging table, then swap them in with one transaction,
+        # so a failed load never leaves the target with the old rows deleted
+        staging_name = f"{table_name}__merge_{uuid.uuid4().hex[:12]}"
+        stats = self.load_parquet(staging_name, payload, "WRITE_TRUNCATE")
+        try:
+            self._add_missing_fields(table_name, staging_name)
+            columns = ", ".join(f"`{f.name}`" for f in self.client.get_table(self._table_id(staging_name)).schema)
+            table_id, staging_id = self._table_id(table_name), self._table_id(staging_name)
+            job = self.client.query(
+                f"""
+                BEGIN
+                  BEGIN TRANSACTION;
+                  DELETE FROM `{table_id}`
+                  WHERE CAST({key_column} AS STRING) IN (SELECT DISTINCT CAST({key_column} AS STRING) FROM `{staging_id}`);
+                  INSERT INTO `{table_id}` ({columns}) SELECT {columns} FROM `{staging_id}`;
+                  COMMIT TRANSACTION;
+                EXCEPTION WHEN ERROR THEN
+                  ROLLBACK TRANSACTION;
+                  RAISE USING MESSAGE = @@error.message;
+                END;
+                """
+            )
+            job.result()
+            deleted = sum(
+                child.num_dml_affected_rows or 0
+                for child in self.client.list_jobs(parent_job=job.job_id)
+                if getattr(child, "statement_type", None) == "DELETE"
+            )
+        finally:
+            self.client.delete_table(self._table_id(staging_name), not_found_ok=True)
+        return {**stats, "deleted_rows": deleted}
+
+    def delete_keys(self, table_name: str, key_column: str, keys: Sequence[str]) -> int:
+        from google.cloud import bigquery
+
+        table_id = self._table_id(table_name)
+        if not self._table_exists(table_name):
+            return 0
+
+        delete_job = self.client.query(
+            f"DELETE FROM `{table_id}` WHERE CAST({key_column} AS STRING) IN UNNEST(@keys)",
+            job_config=bigquery.QueryJobConfig(
+                query_parameters=[bigquery.ArrayQueryParameter("keys", "STRING", list(keys))]
+            ),
+        )
+        delete_job.result()
+        return delete_job.num_dml_affected_rows or 0
+
+    def read_keys(self, table_name: str, key_column: str, keys: Sequence[str]) -> pd.DataFrame:
+        from google.cloud import bigquery
+
+        if not self._table_exists(table_name):
+            return pd.DataFrame()
+
+        return self.client.query(
+            f"SELECT * FROM `{self._table_id(table_name)}` WHERE CAST({key_column} AS STRING) IN UNNEST(@keys)",
+            job_config=bigquery.QueryJobConfig(
+                query_parameters=[bigquery.ArrayQueryParameter("keys", "STRING", list(keys))]
+            ),
+        ).to_dataframe()
+
+
+class DuckDBBackend:
+    """
+    Local stand-in warehouse backed by a DuckDB file.
+
+    Tables land in a schema named after the BigQuery dataset so the same
+    table names work offline.
+    """
+
+    def __init__(self, path: str, dataset: str = BIGQUERY_DATASET):
+        import duckdb
+
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.dataset = dataset
+        self.connection = duckdb.connect(path)
+        self.connection.execute(f"CREATE SCHEMA IF NOT EXISTS {dataset}")
+        # A DuckDB connection is not safe to share across threads without a lock
+        self._lock = threading.Lock()
+
+    def _table_exists(self, table_name: str) -> bool:
+        result = self.connection.execute(
+            "SELECT count(*) FROM information_schema.tables WHERE table_schema = ? AND table_name = ?",
+            [self.dataset, table_name],
+        ).fetchone()
+        return result[0] > 0
+
+    def _add_missing_columns(self, table_ref: str) -> None:
+        # Mirrors BigQuery's ALLOW_FIELD_ADDITION on appends
+        existing = {row[0] for row in self.connection.execute(f"DESCRIBE {table_ref}").fetchall()}
+        for name, column_type, *_ in self.connection.execute("DESCRIBE SELECT * FROM incoming").fetchall():
+            if name not in existing:
+                self.connection.execute(f'ALTER TABLE {table_ref} ADD COLUMN "{name}" {column_type}')
+
+    def load_parquet(self, table_name: str, payload: bytes, write_disposition: str) -> Dict[str, Any]:
+        import pyarrow.parquet as pq
+
+        incoming = pq.read_table(io.BytesIO(payload))
+        table_ref = f"{self.dataset}.{table_name}"
+        with self._lock:
+            self.connection.register("incoming", incoming)
+            try:
+                if write_disposition == "WRITE_APPEND" and self._table_exists(table_name):
+                    self._add_missing_columns(table_ref)
+                    self.connection.execute(f"INSERT INTO {table_ref} BY NAME SELECT * FROM incoming")
+                else:
+                    self.connection.execute(f"CREATE OR REPLACE TABLE {table_ref} AS SELECT * FROM incoming")
+            finally:
+                self.connection.unregister("incoming")
+        return {}
+
+    def merge_parquet(self, table_name: str, payload: bytes, key_column: str) -> Dict[str, Any]:
+        import pyarrow.parquet as pq
+
+        incoming = pq.read_table(io.BytesIO(payload))
+        table_ref = f"{self.dataset}.{table_name}"
+        with self._lock:
+            self.connection.register("incoming", incoming)
+            try:
+                if not self._table_exists(table_name):
+                    self.connection.execute(f"CREATE TABLE {table_ref} AS SELECT * FROM incoming")
+                    return {"deleted_rows": 0}
+                self.connection.execute("BEGIN TRANSACTION")
+                try:
+                    self._add_missing_columns(table_ref)
+                    deleted = self.connection.execute(
+                        f"DELETE FROM {table_ref} WHERE CAST({key_column} AS VARCHAR) IN "
+                        f"(SELECT DISTINCT CAST({key_column} AS VARCHAR) FROM incoming)"
+                    ).fetchone()
+                    self.connection.execute(f"INSERT INTO {table_ref} BY NAME SELECT * FROM incoming")
+                    self.connection.execute("COMMIT")
+                except Exception:
+                    self.connection.execute("ROLLBACK")
+                    raise
+            finally:
+                self.connection.unregister("incoming")
+        return {"deleted_rows": int(deleted[0]) if deleted else 0}
+
+    def delete_keys(self, table_name: str, key_column: str, keys: Sequence[str]) -> int:
+        with self._lock:
+            if not self._table_exists(table_name):
+                return 0
+            result = self.connection.execute(
+                f"DELETE FROM {self.dataset}.{table_name} WHERE CAST({key_column} AS VARCHAR) IN (SELECT unnest(?))",
+                [list(keys)],
+            ).fetchone()
+        return int(result[0]) if result else 0
+
+    def read_keys(self, table_name: str, key_column: str, keys: Sequence[str]) -> pd.DataFrame:
+        with self._lock:
+            if not self._table_exists(table_name):
+                return pd.DataFrame()
+            return self.connection.execute(
+                f"SELECT * FROM {self.dataset}.{table_name} WHERE CAST({key_column} AS VARCHAR) IN (SELECT unnest(?))",
+                [list(keys)],
+            ).df()
+
+    def read_table(self, table_name: str) -> pd.DataFrame:
+        """
+        Read a loaded table back, mostly for tests and notebooks.
+        """
+        with self._lock:
+            return self.connection.execute(f"SELECT * FROM {self.dataset}.{table_name}").df()
+
+
+class BulkLoader:
+    """
+    Loads several DataFrames concurrently from a bounded thread pool.
+
+    Each frame is serialized to Parquet once and handed to the backend; the
+    loader waits for every job and reports rows, bytes and wall time per table.
+    """
+
+    def __init__(self, backend: WarehouseBackend, max_workers: int = LOADER_MAX_WORKERS):
+        """
+        Args:
+            backend: Warehouse implementation (BigQuery or DuckDB)
+            max_workers: Maximum number of loads in flight at once
+        """
+        self.backend = backend
+        self.max_workers = max_workers
+
+    def load(self, table_name: str, df: pd.DataFrame, write_disposition: str = WRITE_DISPOSITION) -> LoadResult:
+        """
+        Load a single frame and wait for it to finish.
+        """
+        start = time.perf_counter()
+        payload = serialize_to_parquet(df)
+        job_stats = self.backend.load_parquet(table_name, payload, write_disposition) or {}
+        return LoadResult(
+            table=table_name,
+            rows=len(df),
+            bytes=len(payload),
+            wall_seconds=time.perf_counter() - start,
+            job_id=job_stats.get("job_id"),
+            job_stats=job_stats,
+        )
+
+    def load_many(
+        self, frames: Dict[str, pd.DataFrame], write_disposition: str = WRITE_DISPOSITION
+    ) -> List[LoadResult]:
+        """
+        Load every frame concurrently and wait for all of them.
+
+        Args:
+            frames: Mapping of table name -> DataFrame
+            write_disposition: Applied to every table
+
+        Returns:
+            One LoadResult per table, in the order of frames
+        """
+        if not frames:
+            return []
+
+        results: Dict[str, LoadResult] = {}
+        errors: Dict[str, Exception] = {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(frames))) as pool:
+            futures = {
+                pool.submit(self.load, table_name, df, write_disposition): table_name
+                for table_name, df in frames.items()
+            }
+            for future in as_completed(futures):
+                table_name = futures[future]
+                try:
+                    results[table_name] = future.result()
+                except Exception as e:
+                    errors[table_name] = e
+
+        if errors:
+            failed = ", ".join(f"{table}: {error}" for table, error in errors.items())
+            raise RuntimeError(f"Failed to load {len(errors)} of {len(frames)} tables ({failed})")
+
+        return [results[table_name] for table_name in frames]
+
+    def merge(self, table_name: str, df: pd.DataFrame, key_column: str) -> LoadResult:
+        """
+        Replace rows for every key present in df with df's rows.
+
+        The delete and the insert commit together, so a failed merge leaves the
+        table as it was rather than missing the deleted keys.
+        """
+        start = time.perf_counter()
+        payload = serialize_to_parquet(df)
+        job_stats = self.backend.merge_parquet(table_name, payload, key_column) or {}
+        return LoadResult(
+            table=table_name,
+            rows=len(df),
+            bytes=len(payload),
+            wall_seconds=time.perf_counter() - start,
+            job_id=job_stats.get("job_id"),
+            job_stats=job_stats,
+        )
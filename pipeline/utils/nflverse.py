@@ -0,0 +1,311 @@
+"""
+Concurrent nflverse downloads over a pooled async HTTP client, with
+conditional requests and retries
+"""
+
+import asyncio
+import io
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, Iterator, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..config.settings import (
+    HTTP_BACKOFF_SECONDS,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_RETRIES,
+    NFL_API_TIMEOUT,
+    NFLDATA_BASE_URL,
+    NFLVERSE_BASE_URL,
+)
+from .fanout import UnitResult
+
+if TYPE_CHECKING:
+    # Imported where used: httpx is only needed once something is downloaded
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+# Worth retrying: timeouts, rate limiting and transient server errors
+RETRY_STATUSES = {408, 429, 500, 502, 503, 504}
+
+NGS_STAT_TYPES = ("passing", "rushing", "receiving")
+
+
+@dataclass(frozen=True)
+class ReleaseFile:
+    """
+    An nflverse file (one per season, or one covering every season) and how to read it.
+
+    Instances are nfl_data_py style loaders: called with a list of seasons they
+    download and read those seasons. RawDataCache recognises them and fetches
+    all of its misses concurrently with conditional requests instead.
+    """
+
+    dataset: str
+    path: str  # relative to the base URL; {season} is filled in
+    base: str = "releases"  # 'releases' (nflverse-data) or 'nfldata'
+    format: str = "parquet"  # 'parquet' or 'csv'
+    columns: Optional[Tuple[str, ...]] = None  # read only these, where the file has them
+    prepare: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None
+
+    @property
+    def all_seasons(self) -> bool:
+        return "{season}" not in self.path
+
+    def url(self, season: Optional[int]) -> str:
+        base = {"releases": NFLVERSE_BASE_URL, "nfldata": NFLDATA_BASE_URL}[self.base]
+        return f"{base.rstrip('/')}/{self.path.format(season=season)}"
+
+    def read(self, content: bytes, season: Optional[int]) -> pd.DataFrame:
+        """
+        Parse a downloaded file into the frame the nfl_data_py function returned.
+        """
+        if self.format == "csv":
+            frame = pd.read_csv(io.BytesIO(content), low_memory=False)
+        else:
+            import pyarrow.parquet as pq
+
+            columns = None
+            if self.columns is not None:
+                available = set(pq.read_schema(io.BytesIO(content)).names)
+                columns = [column for column in self.columns if column in available]
+            frame = pd.read_parquet(io.BytesIO(content), columns=columns)
+
+        if self.all_seasons and season is not None:
+            frame = frame[frame["season"] == season].reset_index(drop=True)
+        return self.prepare(frame) if self.prepare is not None else frame
+
+    def __call__(self, seasons: List[Optional[int]]) -> pd.DataFrame:
+        """
+        Download and read seasons unconditionally.
+        """
+        frames = {}
+        for result in iter_release_files({season: (self, season, {}) for season in seasons}):
+            if not result.ok:
+                raise result.error
+            frames[result.key] = result.value.frame
+        return pd.concat([frames[season] for season in seasons], ignore_index=True)
+
+
+@dataclass
+class Download:
+    """
+    A fetched release file. frame is None when the server answered 304 Not
+    Modified to the validators that were sent.
+    """
+
+    frame: Optional[pd.DataFrame]
+    validators: Dict[str, str] = field(default_factory=dict)
+    bytes: int = 0
+
+    @property
+    def not_modified(self) -> bool:
+        return self.frame is None
+
+
+def downcast_floats(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    float64 to float32, as nfl_data_py does for weekly and play-by-play data.
+    """
+    columns = frame.select_dtypes(include=[np.float64]).columns
+    frame[columns] = frame[columns].astype(np.float32)
+    return frame
+
+
+def prepare_seasonal_rosters(rosters: pd.DataFrame) -> pd.DataFrame:
+    """
+    Match nfl_data_py.import_seasonal_rosters: player_id/player_name names and
+    age at the start of the season. Rows without a player_id are kept so the
+    rosters asset can recover it from their alternate ids.
+    """
+    rosters["birth_date"] = pd.to_datetime(rosters["birth_date"])
+    rosters = rosters.rename(columns={"gsis_id": "player_id", "full_name": "player_name"})
+    season_start = pd.to_datetime(rosters["season"].astype(int).astype(str) + "-09-01")
+    rosters["age"] = (
+        season_start.dt.year - rosters["birth_date"].dt.year
+        + np.where(season_start.dt.month > rosters["birth_date"].dt.month, 0, -1)
+    )
+    return rosters
+
+
+# Datasets the assets pull, by the raw cache's dataset name
+RELEASES: Dict[str, ReleaseFile] = {
+    "schedules": ReleaseFile("schedules", "games.csv", base="nfldata", format="csv"),
+    "weekly": ReleaseFile("weekly", "player_stats/player_stats_{season}.parquet", prepare=downcast_floats),
+    "seasonal_rosters": ReleaseFile(
+        "seasonal_rosters", "rosters/roster_{season}.parquet", prepare=prepare_seasonal_rosters
+    ),
+    "players": ReleaseFile("players", "players/players.parquet"),
+    **{
+        f"ngs_{stat_type}": ReleaseFile(f"ngs_{stat_type}", f"nextgen_stats/ngs_{stat_type}.parquet")
+        for stat_type in NGS_STAT_TYPES
+    },
+}
+
+
+def response_validators(response: "httpx.Response") -> Dict[str, str]:
+    """
+    ETag and Last-Modified of a response, for the next conditional request.
+    """
+    validators = {"etag": response.headers.get("etag"), "last_modified": response.headers.get("last-modified")}
+    return {name: value for name, value in validators.items() if value}
+
+
+def _retry_delay(response: Optional["httpx.Response"], attempt: int, backoff: float) -> float:
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    return backoff * 2**attempt
+
+
+def http_client() -> "httpx.AsyncClient":
+    """
+    Pooled client: connections are reused across every file of a batch.
+    """
+    import httpx
+
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(NFL_API_TIMEOUT),
+        limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS, max_keepalive_connections=HTTP_MAX_CONNECTIONS),
+        follow_redirects=True,
+        headers={"User-Agent": "nfl-analytics"},
+    )
+
+
+async def fetch_file(
+    client: "httpx.AsyncClient",
+    url: str,
+    validators: Optional[Mapping[str, str]] = None,
+    max_retries: Optional[int] = None,
+    backoff: Optional[float] = None,
+) -> "httpx.Response":
+    """
+    GET a file, conditionally when validators from an earlier download are given.
+
+    Connection errors, timeouts and RETRY_STATUSES are retried with
+    exponential backoff (or the server's Retry-After).
+
+    Args:
+        client: Client from http_client()
+        url: File URL
+        validators: 'etag' and/or 'last_modified' of the copy already held
+        max_retries: Retries after the first attempt (default HTTP_MAX_RETRIES)
+        backoff: Seconds before the first retry, doubled after each (default HTTP_BACKOFF_SECONDS)
+
+    Returns:
+        A 200 response, or 304 if the file is unchanged
+
+    Raises:
+        httpx.HTTPStatusError: For any other status once retries run out
+        httpx.TransportError: If the last attempt failed to connect or timed out
+    """
+    import httpx
+
+    max_retries = HTTP_MAX_RETRIES if max_retries is None else max_retries
+    backoff = HTTP_BACKOFF_SECONDS if backoff is None else backoff
+    validators = validators or {}
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+
+    for attempt in range(max_retries + 1):
+        response = None
+        try:
+            response = await client.get(url, headers=headers)
+        except httpx.TransportError as e:
+            if attempt == max_retries:
+                raise
+            reason = f"{type(e).__name__}: {e}"
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt == max_retries:
+                if response.status_code != 304:
+                    response.raise_for_status()
+                return response
+            reason = f"HTTP {response.status_code}"
+
+        delay = _retry_delay(response, attempt, backoff)
+        logger.warning(f"Retrying {url} in {delay:.1f}s after {reason} (attempt {attempt + 1}/{max_retries})")
+        await asyncio.sleep(delay)
+
+
+FileRequest = Tuple[ReleaseFile, Optional[int], Mapping[str, str]]
+
+
+async def _fetch_all(files: Mapping[Hashable, FileRequest], emit: Callable[[UnitResult], None]) -> None:
+    # Files covering every season are shared by several keys; download each URL once
+    by_url: Dict[str, List[Hashable]] = {}
+    for key, (release, season, _) in files.items():
+        by_url.setdefault(release.url(season), []).append(key)
+
+    async def fetch_url(client: "httpx.AsyncClient", url: str, keys: List[Hashable]) -> None:
+        start = time.perf_counter()
+        # Conditional only if every key holds the same copy of the file
+        held = [dict(files[key][2]) for key in keys]
+        validators = held[0] if all(v == held[0] for v in held) else {}
+        pending = list(keys)
+        try:
+            response = await fetch_file(client, url, validators)
+            for key in keys:
+                release, season, _ = files[key]
+                if response.status_code == 304:
+                    download = Download(None, validators)
+                else:
+                    # Parse off the event loop so other downloads keep streaming
+                    frame = await asyncio.to_thread(release.read, response.content, season)
+                    download = Download(frame, response_validators(response), len(response.content))
+                pending.remove(key)
+                emit(UnitResult(key=key, value=download, seconds=time.perf_counter() - start))
+        except Exception as e:
+            for key in pending:
+                emit(UnitResult(key=key, error=e, seconds=time.perf_counter() - start))
+
+    async with http_client() as client:
+        await asyncio.gather(*(fetch_url(client, url, keys) for url, keys in by_url.items()))
+
+
+def iter_release_files(files: Mapping[Hashable, FileRequest]) -> Iterator[UnitResult]:
+    """
+    Download release files concurrently and yield each as soon as it is read.
+
+    The event loop runs on its own thread, so downloads continue while the
+    caller processes the files that already arrived.
+
+    Args:
+        files: key -> (release file, season, validators of the copy already held)
+
+    Yields:
+        UnitResult per key whose value is a Download, or whose error is set
+    """
+    if not files:
+        return
+    results: queue.Queue = queue.Queue()
+    done = object()
+
+    def run() -> None:
+        try:
+            asyncio.run(_fetch_all(files, results.put))
+        except BaseException as e:  # surfaced to the caller's thread
+            results.put(e)
+        finally:
+            results.put(done)
+
+    threading.Thread(target=run, name="nflverse-fetch", daemon=True).start()
+    while (item := results.get()) is not done:
+        if isinstance(item, BaseException):
+            raise item
+        yield item
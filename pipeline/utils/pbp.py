@@ -0,0 +1,192 @@
+"""
+Memory-lean play-by-play loading: column projection and compact dtypes
+"""
+
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..config.settings import PBP_LOAD_MODE
+from .cache import CachedPull, RawDataCache
+from .nflverse import ReleaseFile
+
+# Columns consumed downstream (dbt stg_pbp and the asset's own quality checks)
+PBP_COLUMNS = [
+    "play_id",
+    "game_id",
+    "season",
+    "season_type",
+    "week",
+    "game_date",
+    "home_team",
+    "away_team",
+    "posteam",
+    "defteam",
+    "play_type",
+    "down",
+    "ydstogo",
+    "yardline_100",
+    "qtr",
+    "time",
+    "yards_gained",
+    "touchdown",
+    "first_down",
+    "interception",
+    "fumble",
+    "fumble_lost",
+    "penalty",
+    "epa",
+    "wpa",
+    "success",
+    "passer_player_id",
+    "rusher_player_id",
+    "receiver_player_id",
+]
+
+# Low-cardinality strings and ids: dictionary encoded
+PBP_CATEGORICAL_COLUMNS = [
+    "game_id",
+    "season_type",
+    "game_date",
+    "home_team",
+    "away_team",
+    "posteam",
+    "defteam",
+    "play_type",
+    "time",
+    "passer_player_id",
+    "rusher_player_id",
+    "receiver_player_id",
+]
+
+# Small integers; nullable because nflverse leaves them NaN on non-plays
+PBP_INTEGER_DTYPES = {
+    "play_id": "Int32",
+    "season": "Int16",
+    "week": "Int8",
+    "down": "Int8",
+    "ydstogo": "Int8",
+    "yardline_100": "Int8",
+    "qtr": "Int8",
+    "yards_gained": "Int16",
+    "touchdown": "Int8",
+    "first_down": "Int8",
+    "interception": "Int8",
+    "fumble": "Int8",
+    "fumble_lost": "Int8",
+    "penalty": "Int8",
+    "success": "Int8",
+}
+
+PBP_FLOAT32_COLUMNS = ["epa", "wpa"]
+
+
+def compact_pbp(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast play-by-play columns to compact dtypes in place.
+
+    Columns that don't hold whole numbers are left as float32 rather than
+    failing the cast.
+    """
+    for col in PBP_CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    for col, dtype in PBP_INTEGER_DTYPES.items():
+        if col in df.columns:
+            try:
+                df[col] = df[col].astype(dtype)
+            except (TypeError, ValueError):
+                df[col] = df[col].astype(np.float32)
+    for col in PBP_FLOAT32_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype(np.float32)
+    return df
+
+
+# Lean season files: only PBP_COLUMNS are decoded from the downloaded Parquet
+LEAN_PBP_RELEASE = ReleaseFile(
+    "pbp_lean", "pbp/play_by_play_{season}.parquet", columns=tuple(PBP_COLUMNS), prepare=compact_pbp
+)
+
+
+def load_pbp_season(season: int, mode: str = PBP_LOAD_MODE) -> pd.DataFrame:
+    """
+    Download one season of play-by-play data.
+
+    Args:
+        season: Season to load
+        mode: 'lean' projects to PBP_COLUMNS with compact dtypes; 'full' keeps
+            every nflverse column (300+) and the participation join as
+            nfl_data_py returns them
+
+    Returns:
+        Play-by-play frame for the season
+    """
+    if mode == "full":
+        import nfl_data_py
+
+        return nfl_data_py.import_pbp_data([season], cache=False)
+    if mode != "lean":
+        raise ValueError(f"Invalid PBP load mode: {mode}")
+
+    return LEAN_PBP_RELEASE([season])
+
+
+def fetch_pbp_season(
+    cache: RawDataCache,
+    season: int,
+    mode: str = PBP_LOAD_MODE,
+    force_refresh: Optional[bool] = None,
+) -> CachedPull:
+    """
+    Load one season of play-by-play data through the raw cache.
+
+    Lean and full pulls are cached as separate datasets. force_refresh
+    re-checks a pull already cached today, e.g. after a game goes final; lean
+    pulls do so with a conditional request, so an unchanged file isn't downloaded.
+    """
+    if mode == "lean":
+        return cache.fetch("pbp_lean", season, LEAN_PBP_RELEASE, force_refresh)
+    dataset = "pbp" if mode == "full" else f"pbp_{mode}"
+    return cache.fetch(dataset, season, lambda: load_pbp_season(season, mode), force_refresh)
+
+
+def iter_pbp_seasons(
+    seasons: Iterable[int],
+    loader: Optional[Callable[[int], pd.DataFrame]] = None,
+) -> Iterator[Tuple[int, pd.DataFrame]]:
+    """
+    Stream play-by-play data one season at a time instead of concatenating.
+
+    Only one season is held in memory as long as callers don't keep
+    references to earlier frames.
+    """
+    loader = loader or load_pbp_season
+    for season in seasons:
+        yield season, loader(season)
+
+
+def to_warehouse_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert compact dtypes back to the types the existing warehouse table uses.
+
+    Categoricals become plain strings and nullable integers become floats,
+    matching the schema of the full nfl_data_py frame. Meant for the small
+    per-week slices that are written, not whole seasons.
+    """
+    out = df.copy()
+    for col in out.columns:
+        dtype = out[col].dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            out[col] = out[col].astype(object).where(out[col].notna(), None)
+        elif isinstance(dtype, pd.api.extensions.ExtensionDtype) and pd.api.types.is_integer_dtype(dtype):
+            out[col] = out[col].astype("float64")
+    return out
+
+
+def frame_memory_mb(df: pd.DataFrame) -> float:
+    """
+    Deep memory usage of a frame in MB.
+    """
+    return df.memory_usage(deep=True).sum() / 1024**2
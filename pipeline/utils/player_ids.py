@@ -0,0 +1,256 @@
+"""
+Player identity resolution from alternate IDs to the canonical GSIS id
+"""
+
+import json
+import logging
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..config.settings import PIPELINE_STATE_DIR
+from .cache import CachedPull, replace_dir
+
+logger = logging.getLogger(__name__)
+
+CANONICAL_SOURCE = "gsis_id"
+NAME_SOURCE = "name"
+ALTERNATE_ID_SOURCES = [
+    "nfl_id",
+    "esb_id",
+    "gsis_it_id",
+    "pfr_id",
+    "espn_id",
+    "sportradar_id",
+    "yahoo_id",
+]
+# Columns in nflverse frames that hold each kind of identifier, tried in order
+SOURCE_COLUMNS = {
+    CANONICAL_SOURCE: ["player_id", "gsis_id", "player_gsis_id"],
+    **{source: [source] for source in ALTERNATE_ID_SOURCES},
+    NAME_SOURCE: ["player_display_name", "display_name", "full_name"],
+}
+INDEX_VERSION = 1
+
+_NAME_SUFFIXES = r"\b(jr|sr|ii|iii|iv|v)\b"
+
+
+def normalize_ids(values: pd.Series) -> pd.Series:
+    """
+    Normalize identifier values to comparable strings (None when missing).
+
+    Float-typed numeric ids such as 3139477.0 become '3139477'.
+    """
+    normalized = values.astype("string").str.strip().str.replace(r"\.0$", "", regex=True)
+    return normalized.mask(normalized.isin(["", "nan", "None", "<NA>"]))
+
+
+def normalize_names(values: pd.Series) -> pd.Series:
+    """
+    Lowercase names and strip punctuation and generational suffixes.
+    """
+    normalized = (
+        values.astype("string")
+        .str.lower()
+        .str.replace(r"[.'\-,]", "", regex=True)
+        .str.replace(_NAME_SUFFIXES, "", regex=True)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+    )
+    return normalized.mask(normalized == "")
+
+
+def _normalize(values: pd.Series, source: str) -> pd.Series:
+    return normalize_names(values) if source == NAME_SOURCE else normalize_ids(values)
+
+
+class PlayerIdResolver:
+    """
+    Precomputed hash index from alternate player ids to the canonical GSIS id.
+
+    One pandas Index per id source maps normalized values to positions in an
+    array of GSIS ids, so a whole column resolves with a single get_indexer call.
+    """
+
+    def __init__(self, keys: Dict[str, np.ndarray], player_ids: Dict[str, np.ndarray], source_hash: str = ""):
+        """
+        Args:
+            keys: source -> normalized key values
+            player_ids: source -> GSIS id aligned with keys
+            source_hash: Content hash of the players reference the index was built from
+        """
+        self.source_hash = source_hash
+        self._player_ids = player_ids
+        self._indexes = {source: pd.Index(values) for source, values in keys.items()}
+
+    @property
+    def sources(self) -> List[str]:
+        return list(self._indexes)
+
+    @classmethod
+    def from_players(cls, players: pd.DataFrame, source_hash: str = "") -> "PlayerIdResolver":
+        """
+        Build the index from the nfl_data_py.import_players() reference.
+        """
+        canonical_col = next(
+            (col for col in SOURCE_COLUMNS[CANONICAL_SOURCE] if col in players.columns), None
+        )
+        if canonical_col is None:
+            raise ValueError(f"Players reference missing canonical player id column; available columns: {list(players.columns)}")
+
+        canonical = normalize_ids(players[canonical_col])
+        keys, player_ids = {}, {}
+        for source, columns in SOURCE_COLUMNS.items():
+            column = next((col for col in columns if col in players.columns), None)
+            if column is None:
+                continue
+            pairs = pd.DataFrame({"key": _normalize(players[column], source), "player_id": canonical}).dropna()
+            pairs = pairs.drop_duplicates()
+            # A key pointing at more than one player (common for names) is ambiguous; drop it
+            pairs = pairs[~pairs["key"].duplicated(keep=False)]
+            keys[source] = pairs["key"].to_numpy(dtype=object)
+            player_ids[source] = pairs["player_id"].to_numpy(dtype=object)
+
+        return cls(keys, player_ids, source_hash=source_hash)
+
+    def resolve(self, values: pd.Series, source: str) -> pd.Series:
+        """
+        Map one column of ids from a given source to GSIS ids in a single lookup.
+
+        Canonical GSIS ids pass through unchanged, so players missing from the
+        reference (e.g. recent signings) are kept.
+        """
+        normalized = _normalize(values, source)
+        if source == CANONICAL_SOURCE:
+            return pd.Series(normalized.to_numpy(dtype=object), index=values.index, dtype=object)
+
+        index = self._indexes.get(source)
+        # Empty when every key of the source was ambiguous
+        if index is None or index.empty:
+            return pd.Series(None, index=values.index, dtype=object)
+
+        positions = index.get_indexer(normalized.to_numpy(dtype=object))
+        resolved = np.where(positions >= 0, self._player_ids[source][positions], None)
+        return pd.Series(resolved, index=values.index, dtype=object)
+
+    def resolve_frame(
+        self,
+        df: pd.DataFrame,
+        sources: Optional[Sequence[Tuple[str, str]]] = None,
+    ) -> Tuple[pd.Series, Dict[str, int]]:
+        """
+        Resolve the canonical id for every row, trying id sources in priority order.
+
+        Args:
+            df: Frame holding one or more identifier columns
+            sources: (column, source) pairs to try; defaults to every known column present
+
+        Returns:
+            GSIS id per row (None when unresolved) and rows resolved per source
+        """
+        if sources is None:
+            sources = list(iter_source_columns(df))
+
+        resolved = pd.Series(None, index=df.index, dtype=object)
+        coverage = {}
+        for column, source in sources:
+            if column not in df.columns:
+                continue
+            missing = resolved.isna()
+            if not missing.any():
+                break
+            found = self.resolve(df.loc[missing, column], source)
+            resolved.loc[missing] = found
+            coverage[f"{column}->{source}"] = int(found.notna().sum())
+
+        coverage["unresolved"] = int(resolved.isna().sum())
+        return resolved, coverage
+
+    def save(self, path: Path) -> None:
+        """
+        Persist the index as Parquet plus a small manifest.
+        """
+        path.mkdir(parents=True, exist_ok=True)
+        frame = pd.concat(
+            [
+                pd.DataFrame({"source": source, "key": self._indexes[source].to_numpy(dtype=object), "player_id": ids})
+                for source, ids in self._player_ids.items()
+            ],
+            ignore_index=True,
+        )
+        frame.to_parquet(path / "index.parquet", index=False)
+        with (path / "manifest.json").open("w") as f:
+            json.dump({"version": INDEX_VERSION, "source_hash": self.source_hash}, f)
+
+    @classmethod
+    def load(cls, path: Path) -> "PlayerIdResolver":
+        """
+        Load a persisted index.
+        """
+        with (path / "manifest.json").open() as f:
+            manifest = json.load(f)
+        frame = pd.read_parquet(path / "index.parquet")
+        keys, player_ids = {}, {}
+        for source, group in frame.groupby("source", sort=False):
+            keys[source] = group["key"].to_numpy(dtype=object)
+            player_ids[source] = group["player_id"].to_numpy(dtype=object)
+        return cls(keys, player_ids, source_hash=manifest["source_hash"])
+
+
+_resolvers: Dict[str, PlayerIdResolver] = {}
+
+
+def load_player_id_resolver(
+    players_pull: CachedPull, state_dir: str = PIPELINE_STATE_DIR
+) -> PlayerIdResolver:
+    """
+    Return the resolver for a players reference pull.
+
+    The index is rebuilt only when the players reference content changes;
+    otherwise it is read from disk (or reused from memory within a process).
+    """
+    source_hash = players_pull.content_hash
+    if source_hash in _resolvers:
+        return _resolvers[source_hash]
+
+    path = Path(state_dir) / "player_ids"
+    resolver = None
+    try:
+        with (path / "manifest.json").open() as f:
+            manifest = json.load(f)
+        if manifest.get("version") == INDEX_VERSION and manifest.get("source_hash") == source_hash:
+            resolver = PlayerIdResolver.load(path)
+    except FileNotFoundError:
+        pass  # not built yet, or another process is swapping in a new index
+
+    if resolver is None:
+        logger.info("Building player id index from players reference")
+        resolver = PlayerIdResolver.from_players(players_pull.frame, source_hash=source_hash)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=path.parent, prefix=".player_ids-"))
+        resolver.save(staging)
+        replace_dir(staging, path)
+
+    _resolvers[source_hash] = resolver
+    return resolver
+
+
+def format_coverage(coverage: Dict[str, int], total_rows: int) -> str:
+    """
+    One-line summary of rows resolved per id source.
+    """
+    parts = [f"{source}={count}" for source, count in coverage.items()]
+    return f"{total_rows - coverage.get('unresolved', 0)}/{total_rows} mapped ({', '.join(parts)})"
+
+
+def iter_source_columns(df: pd.DataFrame) -> Iterable[Tuple[str, str]]:
+    """
+    (column, source) pairs present in df, in resolution priority order.
+    """
+    for source, columns in SOURCE_COLUMNS.items():
+        for column in columns:
+            if column in df.columns:
+                yield column, source
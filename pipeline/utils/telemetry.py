@@ -0,0 +1,346 @@
+"""
+Per-phase resource telemetry for assets: wall time, CPU time, peak RSS, rows
+and bytes, attached to the materialization and optionally exported as
+OpenTelemetry spans
+"""
+
+import functools
+import logging
+import resource
+import sys
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import pandas as pd
+from dagster import MaterializeResult, MetadataValue
+
+from ..config.settings import OTEL_ENABLED, OTEL_SERVICE_NAME
+
+logger = logging.getLogger(__name__)
+
+MB = 1024**2
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux and bytes on macOS
+    return peak / MB if sys.platform == "darwin" else peak / 1024
+
+
+def frame_bytes(df: pd.DataFrame) -> int:
+    """
+    In-memory size of a frame, without the slow deep count of object columns.
+    """
+    return int(df.memory_usage(index=False, deep=False).sum())
+
+
+@dataclass
+class PhaseStats:
+    """
+    Resources one phase of an asset used.
+
+    peak_rss_mb is the process high-water mark when the phase ended and
+    rss_growth_mb how much the phase raised it, so the phase that set a new
+    peak is the one that shows growth.
+    """
+
+    phase: str
+    tags: Dict[str, Any] = field(default_factory=dict)
+    wall_seconds: float = 0.0
+    cpu_seconds: Optional[float] = None
+    peak_rss_mb: Optional[float] = None
+    rss_growth_mb: Optional[float] = None
+    rows: Optional[int] = None
+    bytes: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def record(self, rows: Optional[int] = None, bytes: Optional[int] = None, **attributes: Any) -> None:
+        """
+        Add rows, bytes and any other numbers (e.g. warehouse job statistics) to the phase.
+        """
+        if rows is not None:
+            self.rows = (self.rows or 0) + int(rows)
+        if bytes is not None:
+            self.bytes = (self.bytes or 0) + int(bytes)
+        self.attributes.update(attributes)
+
+    @property
+    def tag_text(self) -> str:
+        return " ".join(f"{key}={value}" for key, value in self.tags.items())
+
+    @property
+    def label(self) -> str:
+        return f"{self.phase} {self.tag_text}".strip()
+
+
+def _tracer():
+    """OpenTelemetry tracer, or None when the API isn't installed."""
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        return None
+    return trace.get_tracer("nfl_analytics.pipeline")
+
+
+@functools.lru_cache(maxsize=None)
+def configure_tracing(enabled: bool = OTEL_ENABLED) -> bool:
+    """
+    Install an OTLP span exporter once per process when tracing is enabled.
+
+    The exporter reads the standard OTEL_EXPORTER_OTLP_* variables and defaults
+    to a collector on localhost:4318. Needs the 'telemetry' extras.
+
+    Returns:
+        Whether spans are being exported
+    """
+    if not enabled:
+        return False
+    try:
+        from opentelemetry import trace
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    except ImportError:
+        logger.warning("NFL_OTEL_ENABLED is set but opentelemetry-sdk is missing; pip install 'nfl-analytics[telemetry]'")
+        return False
+
+    provider = TracerProvider(resource=Resource.create({"service.name": OTEL_SERVICE_NAME}))
+    provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+    trace.set_tracer_provider(provider)
+    return True
+
+
+def _start_span(stack: ExitStack, name: str, attributes: Dict[str, Any]):
+    """Open a span for the rest of the stack's block; None without OpenTelemetry."""
+    tracer = _tracer()
+    if tracer is None:
+        return None
+    return stack.enter_context(tracer.start_as_current_span(name, attributes=_span_attributes(attributes)))
+
+
+def _span_attributes(values: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        key: value if isinstance(value, (bool, int, float, str)) else str(value)
+        for key, value in values.items()
+        if value is not None
+    }
+
+
+class Telemetry:
+    """
+    Collects PhaseStats for one asset execution.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.phases: List[PhaseStats] = []
+        self._lock = threading.Lock()
+
+    def add(self, stats: PhaseStats) -> PhaseStats:
+        """
+        Record a phase measured elsewhere, e.g. a download timed in a worker.
+        """
+        stats.tags = {**_tags.get(), **stats.tags}
+        with self._lock:
+            self.phases.append(stats)
+        return stats
+
+    @contextmanager
+    def phase(self, name: str, **tags: Any) -> Iterator[PhaseStats]:
+        """
+        Measure the enclosed block as one phase.
+
+        CPU time is the process's, so work running on other threads at the
+        same time counts towards it as well.
+
+        Args:
+            name: Phase name: fetch, transform, map or load by convention
+            tags: Labels such as season or table; tags set with tagged() are added
+
+        Yields:
+            The phase's PhaseStats, for recording rows, bytes and job statistics
+        """
+        stats = PhaseStats(phase=name, tags={**_tags.get(), **tags})
+        with ExitStack() as stack:
+            span = _start_span(stack, name, stats.tags)
+            rss_before = _peak_rss_mb()
+            wall, cpu = time.perf_counter(), time.process_time()
+            try:
+                yield stats
+            finally:
+                stats.wall_seconds = time.perf_counter() - wall
+                stats.cpu_seconds = time.process_time() - cpu
+                stats.peak_rss_mb = _peak_rss_mb()
+                stats.rss_growth_mb = stats.peak_rss_mb - rss_before
+                with self._lock:
+                    self.phases.append(stats)
+                if span is not None:
+                    span.set_attributes(_span_attributes(_summary(stats)))
+
+    def totals(self) -> pd.DataFrame:
+        """
+        Wall time, CPU time, rows and bytes summed per phase name.
+        """
+        frame = self.frame()
+        if frame.empty:
+            return frame
+        numeric = ["wall_seconds", "cpu_seconds", "rows", "bytes"]
+        # A column no phase recorded is all None (object dtype), which sum() would drop
+        frame[numeric] = frame[numeric].astype("float64")
+        return frame.groupby("phase", sort=False)[numeric].sum(min_count=1)
+
+    def frame(self) -> pd.DataFrame:
+        """
+        One row per recorded phase.
+        """
+        with self._lock:
+            phases = list(self.phases)
+        return pd.DataFrame([{"phase": stats.phase, "tags": stats.tag_text, **_summary(stats)} for stats in phases])
+
+    def metadata(self) -> Dict[str, Any]:
+        """
+        Dagster materialization metadata: per-phase totals, the slowest phase
+        and every phase as JSON.
+        """
+        if not self.phases:
+            return {}
+        metadata: Dict[str, Any] = {}
+        for phase, row in self.totals().iterrows():
+            metadata[f"{phase}_seconds"] = MetadataValue.float(round(float(row["wall_seconds"]), 3))
+            if pd.notna(row["cpu_seconds"]):
+                metadata[f"{phase}_cpu_seconds"] = MetadataValue.float(round(float(row["cpu_seconds"]), 3))
+            if pd.notna(row["rows"]):
+                metadata[f"{phase}_rows"] = MetadataValue.int(int(row["rows"]))
+            if pd.notna(row["bytes"]):
+                metadata[f"{phase}_mb"] = MetadataValue.float(round(float(row["bytes"]) / MB, 2))
+
+        slowest = max(self.phases, key=lambda stats: stats.wall_seconds)
+        metadata["slowest_phase"] = MetadataValue.text(f"{slowest.label} ({slowest.wall_seconds:.2f}s)")
+        metadata["peak_rss_mb"] = MetadataValue.float(round(_peak_rss_mb(), 1))
+        phases = self.frame().round(3)
+        metadata["phases"] = MetadataValue.json(phases.astype(object).where(phases.notna(), None).to_dict("records"))
+        return metadata
+
+
+def _summary(stats: PhaseStats) -> Dict[str, Any]:
+    summary = {
+        "wall_seconds": stats.wall_seconds,
+        "cpu_seconds": stats.cpu_seconds,
+        "peak_rss_mb": stats.peak_rss_mb,
+        "rss_growth_mb": stats.rss_growth_mb,
+        "rows": stats.rows,
+        "bytes": stats.bytes,
+    }
+    summary.update(stats.attributes)
+    return summary
+
+
+_current: ContextVar[Optional[Telemetry]] = ContextVar("nfl_telemetry", default=None)
+_tags: ContextVar[Dict[str, Any]] = ContextVar("nfl_telemetry_tags", default={})
+
+
+def current_telemetry() -> Telemetry:
+    """
+    The collector of the running instrumented asset.
+
+    Outside one, a fresh collector nobody reads, so helpers can record phases
+    unconditionally.
+    """
+    telemetry = _current.get()
+    return telemetry if telemetry is not None else Telemetry("detached")
+
+
+@contextmanager
+def phase(name: str, **tags: Any) -> Iterator[PhaseStats]:
+    """
+    Telemetry.phase on the running asset's collector.
+    """
+    with current_telemetry().phase(name, **tags) as stats:
+        yield stats
+
+
+def record_fetch(result: Any, **tags: Any) -> Optional[PhaseStats]:
+    """
+    Record a download that ran on a fan_out worker as a fetch phase.
+
+    Args:
+        result: UnitResult whose value is a CachedPull (or None if the pull failed)
+        tags: Labels such as season and dataset
+
+    Returns:
+        The recorded PhaseStats
+    """
+    stats = current_telemetry().add(
+        PhaseStats("fetch", tags=tags, wall_seconds=result.seconds, cpu_seconds=result.cpu_seconds)
+    )
+    pull = result.value
+    if pull is not None:
+        stats.record(rows=len(pull.frame), bytes=frame_bytes(pull.frame), from_cache=pull.from_cache)
+    return stats
+
+
+@contextmanager
+def tagged(**tags: Any) -> Iterator[None]:
+    """
+    Add tags (e.g. season=2024) to every phase recorded inside the block.
+    """
+    token = _tags.set({**_tags.get(), **tags})
+    try:
+        yield
+    finally:
+        _tags.reset(token)
+
+
+def _partition_tags(context) -> Dict[str, Any]:
+    if not context.has_partition_key:
+        return {}
+    key = context.partition_key
+    if hasattr(key, "keys_by_dimension"):
+        return dict(key.keys_by_dimension)
+    return {"partition": key}
+
+
+def instrumented(fn: Callable) -> Callable:
+    """
+    Collect phase telemetry for an asset and attach it to the materialization.
+
+    Apply under @asset. Phases recorded anywhere during the asset (warehouse
+    loads, season pulls, explicit phase() blocks) are tagged with the
+    partition, if any, and summarized into the output metadata; if the asset fails, the summary is logged instead. With
+    NFL_OTEL_ENABLED=1 the asset and each phase are also exported as spans.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(context, *args, **kwargs):
+        configure_tracing()
+        telemetry = Telemetry(context.asset_key.to_user_string())
+        token = _current.set(telemetry)
+        tags_token = _tags.set(_partition_tags(context))
+        with ExitStack() as stack:
+            _start_span(stack, telemetry.name, {"dagster.run_id": context.run.run_id})
+            try:
+                result = fn(context, *args, **kwargs)
+            except BaseException:
+                if telemetry.phases:
+                    context.log.info(f"Phase telemetry before failure:\n{telemetry.frame().to_string(index=False)}")
+                raise
+            finally:
+                _tags.reset(tags_token)
+                _current.reset(token)
+
+        metadata = telemetry.metadata()
+        if not metadata:
+            return result
+        slowest = metadata["slowest_phase"].value
+        context.log.info(f"Telemetry: {len(telemetry.phases)} phases, slowest {slowest}")
+        if isinstance(result, MaterializeResult):
+            return result._replace(metadata={**metadata, **(result.metadata or {})})
+        context.add_output_metadata(metadata)
+        return result
+
+    return wrapper
@@ -0,0 +1,94 @@
+"""
+High-water marks for incrementally loaded assets
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from ..config.settings import PIPELINE_STATE_DIR
+
+
+class WatermarkStore:
+    """
+    Per-partition high-water marks kept as small JSON files on local disk.
+
+    Each partition gets its own file so concurrent partition runs never
+    write to the same path.
+    """
+
+    def __init__(self, name: str, state_dir: str = PIPELINE_STATE_DIR):
+        """
+        Args:
+            name: Namespace for the marks, usually the asset name
+            state_dir: Root directory for pipeline state
+        """
+        self.root = Path(state_dir) / "watermarks" / name
+
+    def _path(self, partition_key: str) -> Path:
+        safe_key = partition_key.replace("|", "-").replace("/", "-")
+        return self.root / f"{safe_key}.json"
+
+    def get(self, partition_key: str) -> Dict[str, str]:
+        """
+        Return the fingerprints recorded for a partition (empty if none).
+        """
+        path = self._path(partition_key)
+        if not path.exists():
+            return {}
+        with path.open() as f:
+            return json.load(f)["fingerprints"]
+
+    def set(self, partition_key: str, fingerprints: Dict[str, str]) -> None:
+        """
+        Record fingerprints for a partition, replacing the previous mark.
+        """
+        path = self._path(partition_key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "partition_key": partition_key,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "fingerprints": fingerprints,
+        }
+        tmp_path = path.with_suffix(".json.tmp")
+        with tmp_path.open("w") as f:
+            json.dump(payload, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+
+
+def frame_fingerprints(df: pd.DataFrame, key_column: str = "game_id") -> Dict[str, str]:
+    """
+    Hash the rows belonging to each key so changed groups can be detected.
+
+    Args:
+        df: Rows to fingerprint
+        key_column: Column identifying a group (e.g. one game)
+
+    Returns:
+        Mapping of key -> content hash
+    """
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    keys = df[key_column].astype(str).to_numpy()
+
+    # One stable sort by key code puts each key's rows together in their
+    # original order, so every group hashes a slice instead of a full-length mask
+    codes, group_keys = pd.factorize(keys)
+    row_hashes = row_hashes[np.argsort(codes, kind="stable")]
+    bounds = np.concatenate([[0], np.cumsum(np.bincount(codes, minlength=len(group_keys)))])
+    return {
+        key: hashlib.sha1(row_hashes[bounds[i] : bounds[i + 1]].tobytes()).hexdigest()
+        for i, key in enumerate(group_keys)
+    }
+
+
+def changed_keys(current: Dict[str, str], previous: Dict[str, str]) -> List[str]:
+    """
+    Keys that are new or whose fingerprint differs from the previous mark.
+    """
+    return sorted(key for key, value in current.items() if previous.get(key) != value)
@@ -0,0 +1,234 @@
+"""
+Point-in-time team feature store.
+
+Mirrors ``dbt/models/mart/team_feature_store.sql``: one row per team per game
+it plays, holding that team's latest team_game_performance row strictly
+before the game. FeatureStore reads the materialized table once and turns a
+list of game_ids into the home/away/differential matrix that
+game_prediction_features exposes, with array lookups instead of SQL joins.
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Numeric features carried per team, in game_prediction_features order
+STORE_FEATURES = [
+    "total_epa_l3",
+    "total_yards_l3",
+    "points_scored_l3",
+    "third_down_conversion_rate_l3",
+    "red_zone_efficiency_l3",
+    "turnovers_l3",
+    "success_rate_l3",
+    "total_epa_l5",
+    "epa_trend_3v8",
+    "epa_volatility_l5",
+    "yards_per_play",
+    "epa_per_play",
+]
+
+# Store column -> suffix used for home_/away_ columns in game_prediction_features
+STORE_CONTEXT = {
+    "recent_form": "recent_form",
+    "season_strength_tier": "strength_tier",
+    "momentum_direction": "momentum",
+    "games_played_to_date": "games_played",
+    "epa_rank_season": "season_rank",
+}
+
+STORE_COLUMNS = [
+    "team",
+    "as_of_game_id",
+    "season",
+    "as_of_week",
+    "as_of_date",
+    "home_away",
+    "source_game_id",
+    "source_week",
+    "weeks_since_source",
+] + STORE_FEATURES + list(STORE_CONTEXT)
+
+
+def build_feature_store(team_game_performance: pd.DataFrame, games: pd.DataFrame) -> pd.DataFrame:
+    """
+    Local equivalent of the team_feature_store model.
+
+    Args:
+        team_game_performance: Output of features.build_team_game_performance
+            or the mart read back from the warehouse
+        games: Schedule with game_id, season, week, game_date, home_team, away_team
+
+    Returns:
+        One row per (team, as_of_game_id) with STORE_COLUMNS
+    """
+    team_games = pd.concat(
+        [
+            games.assign(team=games[f"{side}_team"], home_away=side)[
+                ["game_id", "season", "week", "game_date", "team", "home_away"]
+            ]
+            for side in ("home", "away")
+        ],
+        ignore_index=True,
+    ).rename(columns={"game_id": "as_of_game_id", "week": "as_of_week", "game_date": "as_of_date"})
+
+    source = team_game_performance[["team", "season", "week", "game_id"] + STORE_FEATURES + list(STORE_CONTEXT)]
+    source = source.rename(columns={"game_id": "source_game_id", "week": "source_week"})
+
+    # merge_asof needs both sides sorted on the "on" key
+    team_games["_week"] = team_games["as_of_week"].astype("float64")
+    source = source.assign(_week=source["source_week"].astype("float64")).sort_values("_week")
+    store = pd.merge_asof(
+        team_games.sort_values("_week"),
+        source,
+        on="_week",
+        by=["team", "season"],
+        direction="backward",
+        allow_exact_matches=False,  # strictly before
+    ).drop(columns="_week")
+    store["weeks_since_source"] = store["as_of_week"] - store["source_week"]
+    return store[STORE_COLUMNS].sort_values(["season", "as_of_week", "as_of_game_id", "home_away"], ignore_index=True)
+
+
+class FeatureStore:
+    """
+    In-memory reader over the materialized team_feature_store table.
+    """
+
+    def __init__(self, store: pd.DataFrame):
+        """
+        Args:
+            store: team_feature_store rows (see STORE_COLUMNS)
+        """
+        missing = [column for column in STORE_COLUMNS if column not in store.columns]
+        if missing:
+            raise ValueError(f"Feature store is missing columns: {missing}")
+
+        self.frame = store.reset_index(drop=True)
+        self._features = self.frame[STORE_FEATURES].to_numpy(dtype="float64", na_value=np.nan)
+        self._context = {column: self.frame[column].to_numpy() for column in STORE_CONTEXT}
+
+        side = self.frame["home_away"].to_numpy()
+        game_ids = self.frame["as_of_game_id"].astype(str)
+        self._rows: Dict[str, np.ndarray] = {}
+        self._index: Dict[str, pd.Index] = {}
+        for home_away in ("home", "away"):
+            rows = np.flatnonzero(side == home_away)
+            self._rows[home_away] = rows
+            self._index[home_away] = pd.Index(game_ids.to_numpy()[rows])
+        if not (self._index["home"].is_unique and self._index["away"].is_unique):
+            raise ValueError("Feature store has more than one row per (team, as_of_game_id)")
+
+    @classmethod
+    def read_parquet(cls, path: str) -> "FeatureStore":
+        return cls(pd.read_parquet(path))
+
+    @classmethod
+    def read_bigquery(
+        cls,
+        client,
+        table_id: str = "nfl-analytics-472221.nfl_data.team_feature_store",
+        seasons: Optional[Iterable[int]] = None,
+    ) -> "FeatureStore":
+        """
+        Read the store from BigQuery, optionally pruned to a few season partitions.
+        """
+        from google.cloud import bigquery
+
+        query = f"SELECT {', '.join(STORE_COLUMNS)} FROM `{table_id}`"
+        job_config = None
+        if seasons is not None:
+            query += " WHERE season IN UNNEST(@seasons)"
+            job_config = bigquery.QueryJobConfig(
+                query_parameters=[bigquery.ArrayQueryParameter("seasons", "INT64", list(seasons))]
+            )
+        return cls(client.query(query, job_config=job_config).to_dataframe())
+
+    def save(self, path: str) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.frame.to_parquet(path, index=False)
+
+    def _side_rows(self, home_away: str, game_ids: Sequence[str]) -> np.ndarray:
+        """Store row per game id for one side, -1 where the game is unknown."""
+        positions = self._index[home_away].get_indexer(game_ids)
+        return np.where(positions >= 0, self._rows[home_away][np.maximum(positions, 0)], -1)
+
+    def game_matrix(self, game_ids: Sequence[str]) -> pd.DataFrame:
+        """
+        Feature matrix for a list of games, in the order given.
+
+        Columns follow game_prediction_features: home_/away_ features and
+        context, diff_ features (nulls counted as 0, ranks as 32) and the
+        form/strength matchup labels. Unknown game ids come back as null rows.
+
+        Args:
+            game_ids: Games to look up
+
+        Returns:
+            DataFrame indexed by game_id
+        """
+        game_ids = [str(game_id) for game_id in game_ids]
+        columns: Dict[str, np.ndarray] = {}
+        numeric: Dict[str, np.ndarray] = {}
+        context: Dict[str, Dict[str, np.ndarray]] = {}
+
+        for home_away in ("home", "away"):
+            rows = self._side_rows(home_away, game_ids)
+            found = rows >= 0
+            values = np.full((len(rows), len(STORE_FEATURES)), np.nan)
+            values[found] = self._features[rows[found]]
+            numeric[home_away] = values
+            for i, feature in enumerate(STORE_FEATURES):
+                columns[f"{home_away}_{feature}"] = values[:, i]
+
+            context[home_away] = {}
+            for column, suffix in STORE_CONTEXT.items():
+                taken = np.full(len(rows), None, dtype=object)
+                taken[found] = self._context[column][rows[found]]
+                context[home_away][suffix] = taken
+                columns[f"{home_away}_{suffix}"] = taken
+
+        diffs = np.nan_to_num(numeric["home"]) - np.nan_to_num(numeric["away"])
+        for i, feature in enumerate(STORE_FEATURES):
+            columns[f"diff_{feature}"] = diffs[:, i]
+
+        def _filled(side: str, suffix: str, default: float) -> np.ndarray:
+            return pd.to_numeric(pd.Series(context[side][suffix]), errors="coerce").fillna(default).to_numpy()
+
+        columns["diff_season_rank"] = _filled("home", "season_rank", 32) - _filled("away", "season_rank", 32)
+        columns["diff_games_played"] = _filled("home", "games_played", 0) - _filled("away", "games_played", 0)
+        columns["form_matchup"] = _matchup(
+            context["home"]["recent_form"], context["away"]["recent_form"],
+            [("hot", "cold", "home_hot_away_cold"), ("cold", "hot", "home_cold_away_hot")],
+            "mixed_form",
+        )
+        columns["strength_matchup"] = _strength_matchup(
+            context["home"]["strength_tier"], context["away"]["strength_tier"]
+        )
+
+        return pd.DataFrame(columns, index=pd.Index(game_ids, name="game_id"))
+
+
+def _matchup(home: np.ndarray, away: np.ndarray, pairs: List[tuple], default: str) -> np.ndarray:
+    """
+    CASE over (home, away) label pairs, then 'both_<label>' when they agree.
+
+    As in SQL, a null on either side falls through to the default.
+    """
+    home, away = home.astype(object), away.astype(object)
+    conditions = [(home == h) & (away == a) for h, a, _ in pairs]
+    labels = [label for _, _, label in pairs]
+    same = (home == away) & pd.notna(home)
+    return np.select(conditions + [same], labels + [np.char.add("both_", home.astype(str))], default)
+
+
+def _strength_matchup(home: np.ndarray, away: np.ndarray) -> np.ndarray:
+    weak = ["below_average", "poor"]
+    return _matchup(
+        home,
+        away,
+        [("elite", tier, "elite_vs_weak") for tier in weak] + [(tier, "elite", "weak_vs_elite") for tier in weak],
+        "mixed_strength",
+    )
@@ -0,0 +1,396 @@
+"""
+Local feature engine for team game performance.
+
+Reproduces ``dbt/models/staging/stg_team_stats.sql`` and
+``dbt/models/mart/team_game_performance.sql`` in pandas/NumPy so rolling-window
+features can be built straight from a local play-by-play Parquet cache,
+without a dbt run on BigQuery.
+
+Rolling windows are computed with grouped prefix sums over one sorted array
+per metric, so every window for every team is a pair of vectorized lookups
+rather than a Python loop or a per-group ``rolling`` call.
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+ROLLING_WINDOWS = (3, 5, 8)
+BASE_METRICS = (
+    "total_yards",
+    "total_epa",
+    "points_scored",
+    "third_down_conversion_rate",
+    "red_zone_efficiency",
+    "turnovers",
+    "success_rate",
+)
+VOLATILITY_WINDOW = 5
+
+# Play-by-play columns the engine reads
+PBP_FEATURE_COLUMNS = [
+    "game_id",
+    "season",
+    "week",
+    "posteam",
+    "home_team",
+    "away_team",
+    "play_type",
+    "yards_gained",
+    "touchdown",
+    "first_down",
+    "interception",
+    "fumble_lost",
+    "penalty",
+    "epa",
+    "success",
+    "down",
+    "yardline_100",
+]
+
+TEAM_STATS_PLAY_TYPES = ("pass", "run", "punt", "field_goal")
+GAME_KEYS = ["game_id", "season", "week", "team", "opponent", "home_away"]
+
+
+def raw_cache_entries(season_dir: Path) -> List[Path]:
+    """
+    Complete fetches in a raw cache season directory, oldest first.
+
+    A fetch is complete once its manifest.json is written, so entries a
+    writer is still staging (or abandoned) are never read.
+
+    Args:
+        season_dir: ``<root>/<dataset>/season=<season>``
+
+    Returns:
+        ``fetch_date=<date>`` directories that have a manifest
+    """
+    return sorted(entry for entry in Path(season_dir).glob("fetch_date=*") if (entry / "manifest.json").exists())
+
+
+def raw_cache_files(
+    root: str,
+    seasons: Optional[Iterable[int]] = None,
+    dataset: str = "pbp_lean",
+) -> List[Path]:
+    """
+    Newest cached fetch of each season of a raw cache dataset, in season order.
+
+    Args:
+        root: Raw cache directory (NFL_RAW_CACHE_DIR)
+        seasons: Seasons to list, default every cached season
+        dataset: Cache dataset, e.g. 'pbp_lean', 'pbp' or 'weekly'
+
+    Returns:
+        ``<root>/<dataset>/season=<season>/fetch_date=<date>/data.parquet`` paths
+    """
+    dataset_dir = Path(root) / dataset
+    wanted = None if seasons is None else {str(season) for season in seasons}
+    files = []
+    for season_dir in sorted(dataset_dir.glob("season=*")):
+        if wanted is not None and season_dir.name.split("=", 1)[1] not in wanted:
+            continue
+        fetches = raw_cache_entries(season_dir)
+        if fetches:
+            files.append(fetches[-1] / "data.parquet")
+    if not files:
+        raise FileNotFoundError(f"No cached {dataset} data under {dataset_dir}")
+    return files
+
+
+def read_pbp_cache(
+    root: str,
+    seasons: Optional[Iterable[int]] = None,
+    dataset: str = "pbp_lean",
+) -> pd.DataFrame:
+    """
+    Read play-by-play from the pipeline's raw Parquet cache.
+
+    Takes the newest fetch of each season (see raw_cache_files), reading only
+    the columns the feature engine needs.
+
+    Args:
+        root: Raw cache directory (NFL_RAW_CACHE_DIR)
+        seasons: Seasons to read, default every cached season
+        dataset: 'pbp_lean' or 'pbp' for full-mode pulls
+
+    Returns:
+        Play-by-play for the requested seasons
+    """
+    files = raw_cache_files(root, seasons, dataset)
+    return pd.concat([pd.read_parquet(file, columns=PBP_FEATURE_COLUMNS) for file in files], ignore_index=True)
+
+
+def _flag(series: pd.Series) -> np.ndarray:
+    """SQL ``case when col = 1``: nulls count as false."""
+    return series.to_numpy(dtype="float64", na_value=np.nan) == 1
+
+
+def _round_half_away(values: np.ndarray, digits: int) -> np.ndarray:
+    """SQL ROUND semantics (half away from zero), unlike numpy's half-to-even."""
+    scale = 10.0**digits
+    return np.sign(values) * np.floor(np.abs(values) * scale + 0.5) / scale
+
+
+def team_game_stats(pbp: pd.DataFrame, games: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """
+    One row per team per game, matching stg_team_stats.
+
+    Args:
+        pbp: Play-by-play with at least PBP_FEATURE_COLUMNS
+            (home_team/away_team are only needed when games is None)
+        games: Optional schedule with game_id, home_team, away_team; like the
+            dbt join, plays of games missing from it are dropped. Defaults to
+            the home/away teams carried on the play-by-play.
+
+    Returns:
+        Team game stats with the stg_team_stats columns
+    """
+    plays = pbp[pbp["posteam"].notna() & pbp["play_type"].isin(TEAM_STATS_PLAY_TYPES)]
+    if games is None:
+        games = plays[["game_id", "home_team", "away_team"]].drop_duplicates("game_id")
+    plays = plays.drop(columns=["home_team", "away_team"], errors="ignore").merge(
+        games[["game_id", "home_team", "away_team"]], on="game_id", how="inner"
+    )
+
+    posteam = plays["posteam"].astype(str).to_numpy()
+    home_team = plays["home_team"].astype(str).to_numpy()
+    is_home = home_team == posteam
+    play_type = plays["play_type"].astype(str).to_numpy()
+    yards = plays["yards_gained"].to_numpy(dtype="float64", na_value=np.nan)
+    down = plays["down"].to_numpy(dtype="float64", na_value=np.nan)
+    yardline = plays["yardline_100"].to_numpy(dtype="float64", na_value=np.nan)
+    touchdown = _flag(plays["touchdown"])
+    scrimmage = np.isin(play_type, ["pass", "run"])
+    red_zone = yardline <= 20
+
+    frame = pd.DataFrame(
+        {
+            "game_id": plays["game_id"].astype(str).to_numpy(),
+            "season": plays["season"].to_numpy(dtype="int64"),
+            "week": plays["week"].to_numpy(dtype="int64"),
+            "team": posteam,
+            "opponent": np.where(is_home, plays["away_team"].astype(str).to_numpy(), home_team),
+            "home_away": np.where(is_home, "home", "away"),
+            "total_yards": yards,
+            "passing_yards": np.where(play_type == "pass", np.nan_to_num(yards), 0.0),
+            "rushing_yards": np.where(play_type == "run", np.nan_to_num(yards), 0.0),
+            "points_scored": touchdown * 6,
+            "turnovers": (_flag(plays["interception"]) | _flag(plays["fumble_lost"])).astype("int64"),
+            "penalties": _flag(plays["penalty"]).astype("int64"),
+            "third_down_conversions": (scrimmage & (down == 3) & _flag(plays["first_down"])).astype("int64"),
+            "third_down_attempts": (scrimmage & (down == 3)).astype("int64"),
+            "red_zone_scores": (red_zone & touchdown).astype("int64"),
+            "red_zone_attempts": red_zone.astype("int64"),
+            "total_epa": plays["epa"].to_numpy(dtype="float64", na_value=np.nan),
+            "successful_plays": _flag(plays["success"]).astype("int64"),
+        }
+    )
+    frame["avg_epa"] = frame["total_epa"]
+
+    grouped = frame.groupby(GAME_KEYS, sort=False)
+    # SQL SUM over all-null input is NULL, hence min_count=1 on nullable columns
+    stats = grouped.sum(min_count=1)
+    stats["avg_epa"] = grouped["avg_epa"].mean()
+    stats["total_plays"] = grouped.size()
+    stats = stats.reset_index()
+
+    for rate, numerator, denominator in [
+        ("third_down_conversion_rate", "third_down_conversions", "third_down_attempts"),
+        ("red_zone_efficiency", "red_zone_scores", "red_zone_attempts"),
+        ("success_rate", "successful_plays", "total_plays"),
+    ]:
+        num = stats[numerator].to_numpy(dtype="float64")
+        den = stats[denominator].to_numpy(dtype="float64")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stats[rate] = np.where(den > 0, _round_half_away(num / den, 3), np.nan)
+
+    return stats.sort_values(["season", "week", "team"], ascending=[False, False, True], ignore_index=True)
+
+
+def _group_starts(keys: np.ndarray) -> np.ndarray:
+    """Index of the first row of each row's group, for rows sorted by group."""
+    boundary = np.ones(len(keys), dtype=bool)
+    boundary[1:] = keys[1:] != keys[:-1]
+    return np.maximum.accumulate(np.where(boundary, np.arange(len(keys)), 0))
+
+
+def _prefix(values: np.ndarray) -> np.ndarray:
+    return np.concatenate([[0.0], np.cumsum(values)])
+
+
+def _window_bounds(starts: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Prefix-sum bounds for ``rows between <window> preceding and 1 preceding``."""
+    rows = np.arange(len(starts))
+    return np.maximum(rows - window, starts), rows
+
+
+def _window_mean(values: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """SQL AVG over [lo, hi): nulls are ignored, an empty window is NULL."""
+    present = ~np.isnan(values)
+    total = _prefix(np.where(present, values, 0.0))
+    count = _prefix(present.astype("float64"))
+    n = count[hi] - count[lo]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(n > 0, (total[hi] - total[lo]) / n, np.nan)
+
+
+def _window_stddev(values: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """SQL STDDEV (sample) over [lo, hi); NULL with fewer than two values."""
+    present = ~np.isnan(values)
+    # Center first so the running sum of squares doesn't lose precision
+    centered = np.where(present, values - np.nanmean(values) if present.any() else 0.0, 0.0)
+    total = _prefix(centered)
+    squares = _prefix(centered**2)
+    count = _prefix(present.astype("float64"))
+    n = count[hi] - count[lo]
+    s = total[hi] - total[lo]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variance = (squares[hi] - squares[lo] - s * s / n) / (n - 1)
+    return np.where(n > 1, np.sqrt(np.maximum(variance, 0.0)), np.nan)
+
+
+def _safe_divide(numerator: pd.Series, denominator: pd.Series) -> np.ndarray:
+    num = numerator.to_numpy(dtype="float64", na_value=np.nan)
+    den = denominator.to_numpy(dtype="float64", na_value=np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(den != 0, num / den, np.nan)
+
+
+def _row_number(df: pd.DataFrame, by: Sequence[str], column: str) -> np.ndarray:
+    """row_number() over (partition by <by> order by <column> desc), nulls last."""
+    ranks = df.groupby(list(by))[column].rank(method="first", ascending=False, na_option="bottom")
+    return ranks.to_numpy(dtype="int64")
+
+
+def team_game_performance(team_stats: pd.DataFrame) -> pd.DataFrame:
+    """
+    Rolling form features per team game, matching the team_game_performance mart.
+
+    Args:
+        team_stats: Output of team_game_stats (or the stg_team_stats view)
+
+    Returns:
+        team_game_performance rows and columns, in the mart's sort order
+    """
+    base_columns = GAME_KEYS + list(BASE_METRICS) + ["total_plays", "successful_plays"]
+    df = team_stats.loc[team_stats["team"].notna(), base_columns]
+    df = df.sort_values(["season", "team", "week", "game_id"], ignore_index=True)
+
+    group_keys = (df["season"].astype(str) + "|" + df["team"].astype(str)).to_numpy()
+    starts = _group_starts(group_keys)
+    rows = np.arange(len(df))
+
+    features: Dict[str, np.ndarray] = {}
+    metric_values = {metric: df[metric].to_numpy(dtype="float64", na_value=np.nan) for metric in BASE_METRICS}
+    for window in ROLLING_WINDOWS:
+        lo, hi = _window_bounds(starts, window)
+        for metric in BASE_METRICS:
+            features[f"{metric}_l{window}"] = _window_mean(metric_values[metric], lo, hi)
+
+    # rows unbounded preceding, current row included
+    features["total_epa_season_avg"] = _window_mean(metric_values["total_epa"], starts, rows + 1)
+    features["games_played_to_date"] = rows - starts + 1
+    df = pd.concat([df, pd.DataFrame(features)], axis=1)
+
+    df["epa_trend_3v8"] = df["total_epa_l3"].fillna(0) - df["total_epa_l8"].fillna(0)
+    df["yards_trend_3v8"] = df["total_yards_l3"].fillna(0) - df["total_yards_l8"].fillna(0)
+    df["scoring_trend_3v8"] = df["points_scored_l3"].fillna(0) - df["points_scored_l8"].fillna(0)
+    lo, hi = _window_bounds(starts, VOLATILITY_WINDOW)
+    df["epa_volatility_l5"] = _window_stddev(metric_values["total_epa"], lo, hi)
+    df["yards_per_play"] = _safe_divide(df["total_yards"], df["total_plays"])
+    df["epa_per_play"] = _safe_divide(df["total_epa"], df["total_plays"])
+    df["points_per_100_yards"] = _safe_divide(df["points_scored"], df["total_yards"]) * 100
+
+    # Comparisons against NULL are false in SQL and in numpy alike, so the
+    # else branches below line up with the CASE expressions
+    l3, season_avg = df["total_epa_l3"].to_numpy(), df["total_epa_season_avg"].to_numpy()
+    df["recent_form"] = np.select([l3 > season_avg * 1.15, l3 < season_avg * 0.85], ["hot", "cold"], "average")
+    df["season_strength_tier"] = np.select(
+        [season_avg > 0.10, season_avg > 0.00, season_avg > -0.10],
+        ["elite", "above_average", "below_average"],
+        "poor",
+    )
+    trend = df["epa_trend_3v8"].to_numpy()
+    df["momentum_direction"] = np.select([trend > 0.05, trend < -0.05], ["trending_up", "trending_down"], "stable")
+
+    df["epa_rank_weekly"] = _row_number(df, ["season", "week"], "total_epa")
+    df["yards_rank_weekly"] = _row_number(df, ["season", "week"], "total_yards")
+    df["epa_rank_season"] = _row_number(df, ["season"], "total_epa_season_avg")
+
+    # percent_rank() ascending, nulls first: (rank - 1) / (rows - 1)
+    weekly = df.groupby(["season", "week"])["total_epa"]
+    rank = weekly.rank(method="min", ascending=True, na_option="top").to_numpy()
+    size = weekly.transform("size").to_numpy(dtype="float64")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percent = np.where(size > 1, (rank - 1) / (size - 1), 0.0)
+    df["epa_percentile_weekly"] = _round_half_away(percent * 100, 1)
+
+    df["updated_at"] = pd.Timestamp.now(tz="UTC")
+
+    return df.sort_values(
+        ["season", "week", "epa_rank_weekly"], ascending=[False, False, True], ignore_index=True
+    )
+
+
+def build_team_game_performance(pbp: pd.DataFrame, games: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """
+    Play-by-play straight to team_game_performance.
+    """
+    return team_game_performance(team_game_stats(pbp, games))
+
+
+def compare_to_reference(
+    local: pd.DataFrame,
+    reference: pd.DataFrame,
+    keys: Sequence[str] = ("game_id", "team"),
+    rtol: float = 1e-6,
+    atol: float = 1e-9,
+) -> pd.DataFrame:
+    """
+    Column-by-column parity report between local features and a dbt output.
+
+    Args:
+        local: Output of this module
+        reference: The same model read back from the warehouse
+        keys: Columns identifying a row
+        rtol: Relative tolerance for numeric columns
+        atol: Absolute tolerance for numeric columns
+
+    Returns:
+        One row per shared column with rows compared, mismatches and, for
+        numeric columns, the largest absolute difference. Empty mismatches
+        everywhere means parity.
+    """
+    keys = list(keys)
+    joined = local.merge(reference, on=keys, how="outer", suffixes=("_local", "_reference"), indicator=True)
+    matched = joined[joined["_merge"] == "both"]
+
+    report = [
+        {
+            "column": "_rows",
+            "compared": len(joined),
+            "mismatches": int((joined["_merge"] != "both").sum()),
+            "max_abs_diff": np.nan,
+        }
+    ]
+    shared = [column for column in local.columns if column in reference.columns and column not in keys]
+    for column in shared:
+        if column == "updated_at":
+            continue
+        left, right = matched[f"{column}_local"], matched[f"{column}_reference"]
+        both_null = left.isna() & right.isna()
+        if pd.api.types.is_numeric_dtype(left) and pd.api.types.is_numeric_dtype(right):
+            left_values = left.to_numpy(dtype="float64", na_value=np.nan)
+            right_values = right.to_numpy(dtype="float64", na_value=np.nan)
+            close = np.isclose(left_values, right_values, rtol=rtol, atol=atol)
+            diff = np.abs(left_values - right_values)
+            max_diff = float(np.nanmax(diff)) if np.isfinite(diff).any() else 0.0
+        else:
+            close = (left.astype(str) == right.astype(str)).to_numpy()
+            max_diff = np.nan
+        mismatches = int((~(close | both_null.to_numpy())).sum())
+        report.append({"column": column, "compared": len(matched), "mismatches": mismatches, "max_abs_diff": max_diff})
+    return pd.DataFrame(report)
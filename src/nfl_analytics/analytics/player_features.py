@@ -0,0 +1,317 @@
+"""
+Local engine for player usage trends and fantasy projections.
+
+Reproduces the rolling columns of ``dbt/models/mart/player_weekly_performance.sql``
+over ``stg_player_stats`` in pandas/NumPy, straight from the raw weekly
+player-stats cache, and scores fantasy points under any number of scoring
+systems at once.
+
+Rows are sorted by (player_id, season, week) once, so every window for every
+player is a pair of prefix-sum lookups, as in the team feature engine.
+Fantasy points are linear in the box-score stats, and so are their rolling
+means. A scoring system is therefore one column of a (stat x config) matrix:
+points, rolling averages and projections for every player-week under every
+config are one matrix product each, over stat windows computed once.
+"""
+
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .features import (
+    _group_starts,
+    _prefix,
+    _round_half_away,
+    _safe_divide,
+    _window_bounds,
+    _window_mean,
+    _window_stddev,
+    raw_cache_files,
+)
+
+ROLLING_WEEKS = (3, 5)
+ROLLING_METRICS = (
+    "fantasy_points",
+    "fantasy_points_ppr",
+    "targets",
+    "rushing_attempts",
+    "yards_per_attempt",
+    "catch_rate",
+)
+VOLATILITY_ROWS = 5  # rows between 4 preceding and current row
+
+# Box-score stats a scoring system weights, in scoring matrix row order
+SCORING_STATS = (
+    "passing_yards",
+    "passing_tds",
+    "interceptions",
+    "rushing_yards",
+    "rushing_tds",
+    "receptions",
+    "receiving_yards",
+    "receiving_tds",
+    "fumbles_lost",
+    "two_point_conversions",
+)
+
+# nflverse standard scoring; the yardage and touchdown values are the vars in
+# dbt/dbt_project.yml, keep them in step
+DEFAULT_SCORING = {
+    "passing_yards": 0.04,
+    "passing_tds": 4.0,
+    "interceptions": -2.0,
+    "rushing_yards": 0.1,
+    "rushing_tds": 6.0,
+    "receptions": 0.0,
+    "receiving_yards": 0.1,
+    "receiving_tds": 6.0,
+    "fumbles_lost": -2.0,
+    "two_point_conversions": 2.0,
+}
+PPR_SCORING = {**DEFAULT_SCORING, "receptions": 1.0}
+
+# Projection for a week: weighted blend of the trailing windows before it
+PROJECTION_WEIGHTS = {3: 0.5, 5: 0.5}
+
+# Raw weekly column -> stg_player_stats name
+STG_RENAMES = {"recent_team": "team", "attempts": "passing_attempts", "completions": "passing_completions", "carries": "rushing_attempts"}
+STG_COUNT_COLUMNS = [
+    "passing_attempts",
+    "passing_completions",
+    "passing_yards",
+    "passing_tds",
+    "interceptions",
+    "rushing_attempts",
+    "rushing_yards",
+    "rushing_tds",
+    "targets",
+    "receptions",
+    "receiving_yards",
+    "receiving_tds",
+    "fantasy_points",
+    "fantasy_points_ppr",
+]
+# Scoring stats summed from the raw per-play-type columns, where present
+COMBINED_STATS = {
+    "fumbles_lost": ("sack_fumbles_lost", "rushing_fumbles_lost", "receiving_fumbles_lost"),
+    "two_point_conversions": ("passing_2pt_conversions", "rushing_2pt_conversions", "receiving_2pt_conversions"),
+}
+PLAYER_KEYS = ["player_id", "season", "week"]
+
+ScoringInput = Union[Mapping[str, float], Sequence[Mapping[str, float]], np.ndarray]
+
+
+def stg_player_stats(weekly: pd.DataFrame) -> pd.DataFrame:
+    """
+    stg_player_stats over raw nflverse weekly stats, plus the fumble and
+    two-point totals scoring needs.
+
+    Args:
+        weekly: Raw weekly player stats (the 'weekly' cache dataset)
+
+    Returns:
+        Rows with a player_id and the stg_player_stats columns
+    """
+    stats = weekly[weekly["player_id"].notna()].rename(columns=STG_RENAMES)
+    out = stats[["player_id", "season", "week", "team", "position"]].reset_index(drop=True)
+    for column in STG_COUNT_COLUMNS:
+        out[column] = stats[column].to_numpy(dtype="float64", na_value=np.nan)
+    for column, parts in COMBINED_STATS.items():
+        present = [part for part in parts if part in stats.columns]
+        out[column] = stats[present].fillna(0).sum(axis=1).to_numpy(dtype="float64") if present else 0.0
+
+    for rate, numerator, denominator, digits in [
+        ("completion_percentage", "passing_completions", "passing_attempts", 3),
+        ("yards_per_attempt", "passing_yards", "passing_attempts", 1),
+        ("yards_per_carry", "rushing_yards", "rushing_attempts", 1),
+        ("catch_rate", "receptions", "targets", 3),
+        ("yards_per_reception", "receiving_yards", "receptions", 1),
+    ]:
+        num, den = out[numerator].to_numpy(), out[denominator].to_numpy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out[rate] = np.where(den > 0, _round_half_away(num / den, digits), np.nan)
+    return out
+
+
+def read_player_stats_cache(root: str, seasons: Optional[Iterable[int]] = None) -> pd.DataFrame:
+    """
+    stg_player_stats from the newest cached fetch of each season's weekly stats.
+    """
+    files = raw_cache_files(root, seasons, dataset="weekly")
+    return stg_player_stats(pd.concat([pd.read_parquet(file) for file in files], ignore_index=True))
+
+
+def scoring_matrix(scoring: ScoringInput) -> np.ndarray:
+    """
+    Scoring systems as a (len(SCORING_STATS), n_configs) matrix.
+
+    Args:
+        scoring: One config or a list of configs as {stat: points} (stats
+            left out keep their DEFAULT_SCORING value), or an array of shape
+            (n_configs, len(SCORING_STATS)) or (len(SCORING_STATS),)
+
+    Returns:
+        float64 matrix, one column per config
+    """
+    if isinstance(scoring, np.ndarray):
+        matrix = np.atleast_2d(np.asarray(scoring, dtype="float64"))
+        if matrix.shape[1] != len(SCORING_STATS):
+            raise ValueError(f"Scoring arrays need {len(SCORING_STATS)} columns ({', '.join(SCORING_STATS)})")
+        return np.ascontiguousarray(matrix.T)
+
+    configs = [scoring] if isinstance(scoring, Mapping) else list(scoring)
+    unknown = sorted({stat for config in configs for stat in config} - set(SCORING_STATS))
+    if unknown:
+        raise ValueError(f"Unknown scoring stats: {unknown}")
+    return np.array([[{**DEFAULT_SCORING, **config}[stat] for config in configs] for stat in SCORING_STATS])
+
+
+class PlayerProjectionEngine:
+    """
+    Rolling player features and fantasy projections for every player-week.
+
+    Every array an engine returns is aligned with engine.frame, which holds
+    the input rows sorted by (player_id, season, week).
+    """
+
+    def __init__(self, player_stats: pd.DataFrame, projection_weights: Mapping[int, float] = PROJECTION_WEIGHTS):
+        """
+        Args:
+            player_stats: Output of stg_player_stats
+            projection_weights: Trailing window (games) -> weight in the projection
+        """
+        missing = [column for column in PLAYER_KEYS + list(SCORING_STATS) if column not in player_stats.columns]
+        if missing:
+            raise ValueError(f"Player stats are missing columns: {missing}")
+
+        self.frame = player_stats[player_stats["player_id"].notna()].sort_values(
+            PLAYER_KEYS, ignore_index=True, kind="stable"
+        )
+        keys = (self.frame["player_id"].astype(str) + "|" + self.frame["season"].astype(str)).to_numpy()
+        self._starts = _group_starts(keys)
+        self._rows = np.arange(len(self.frame))
+        last = np.ones(len(keys), dtype=bool)
+        last[:-1] = keys[1:] != keys[:-1]
+        self._last_rows = np.flatnonzero(last)
+
+        # Missing stats score nothing
+        self._stats = self.frame[list(SCORING_STATS)].to_numpy(dtype="float64", na_value=np.nan)
+        self._stats = np.nan_to_num(self._stats, nan=0.0)
+        self._stat_prefix = np.vstack([np.zeros(len(SCORING_STATS)), np.cumsum(self._stats, axis=0)])
+
+        weights = {window: float(weight) for window, weight in projection_weights.items()}
+        self._windows = {window: self._stat_means(*_window_bounds(self._starts, window)) for window in set(weights) | set(ROLLING_WEEKS)}
+        total = sum(weights.values())
+        self._projection = sum(self._windows[window] * (weight / total) for window, weight in weights.items())
+
+        next_lo = {window: np.maximum(self._last_rows + 1 - window, self._starts[self._last_rows]) for window in weights}
+        self._next_projection = sum(
+            self._stat_means(next_lo[window], self._last_rows + 1) * (weight / total) for window, weight in weights.items()
+        )
+
+    @classmethod
+    def from_cache(cls, root: str, seasons: Optional[Iterable[int]] = None, **kwargs) -> "PlayerProjectionEngine":
+        """
+        Engine over the pipeline's raw weekly player-stats cache.
+        """
+        return cls(read_player_stats_cache(root, seasons), **kwargs)
+
+    def _stat_means(self, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+        """Per-row mean of each scoring stat over rows [lo, hi); NaN for an empty window."""
+        games = (hi - lo).astype("float64")[:, None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(games > 0, (self._stat_prefix[hi] - self._stat_prefix[lo]) / games, np.nan)
+
+    def features(self) -> pd.DataFrame:
+        """
+        The rolling and trend columns of player_weekly_performance.
+
+        Columns from its joins (player profile, roster and team context) and
+        those derived from them are left out.
+
+        Returns:
+            engine.frame with the l3/l5 averages, season totals, trends,
+            points_per_opportunity, fantasy_volatility and weekly_performance_tier
+        """
+        df = self.frame
+        starts, rows = self._starts, self._rows
+        features: Dict[str, np.ndarray] = {}
+        values = {metric: df[metric].to_numpy(dtype="float64", na_value=np.nan) for metric in ROLLING_METRICS}
+        for window in ROLLING_WEEKS:
+            lo, hi = _window_bounds(starts, window)
+            for metric in ROLLING_METRICS:
+                features[f"{metric}_l{window}"] = _window_mean(values[metric], lo, hi)
+
+        points = values["fantasy_points"]
+        # SQL SUM: nulls ignored, NULL when every value is null
+        present = _prefix((~np.isnan(points)).astype("float64"))
+        total = _prefix(np.nan_to_num(points))
+        features["fantasy_points_season_total"] = np.where(
+            present[rows + 1] > present[starts], total[rows + 1] - total[starts], np.nan
+        )
+        features["games_played_season"] = rows - starts + 1
+        out = pd.concat([df, pd.DataFrame(features)], axis=1)
+
+        # Comparisons against NULL are false in SQL and in numpy alike
+        fp_l3 = np.nan_to_num(features["fantasy_points_l3"])
+        out["performance_trend"] = np.select(
+            [points > fp_l3 * 1.25, points < fp_l3 * 0.75], ["trending_up", "trending_down"], "stable"
+        )
+        targets, targets_l3 = values["targets"], np.nan_to_num(features["targets_l3"])
+        out["usage_trend"] = np.select(
+            [targets > targets_l3 * 1.2, targets < targets_l3 * 0.8], ["usage_increasing", "usage_decreasing"], "usage_stable"
+        )
+        out["points_per_opportunity"] = _safe_divide(out["fantasy_points"], out["targets"] + out["rushing_attempts"])
+        volatility = _window_stddev(points, np.maximum(rows - (VOLATILITY_ROWS - 1), starts), rows + 1)
+        out["fantasy_volatility"] = np.where(features["games_played_season"] >= 4, volatility, np.nan)
+        out["weekly_performance_tier"] = np.select(
+            [points >= 20, points >= 15, points >= 10, points >= 5],
+            ["elite_week", "wr1_week", "wr2_week", "flex_week"],
+            "bust_week",
+        )
+        return out
+
+    def score(self, scoring: ScoringInput) -> np.ndarray:
+        """
+        Fantasy points of every player-week under each scoring config.
+
+        Returns:
+            (len(frame), n_configs) array
+        """
+        return self._stats @ scoring_matrix(scoring)
+
+    def rolling(self, scoring: ScoringInput, window: int) -> np.ndarray:
+        """
+        Mean points over the previous window games of the season, per config
+        (``rows between <window> preceding and 1 preceding``).
+
+        Returns:
+            (len(frame), n_configs) array, NaN in a player's first game of a season
+        """
+        if window not in self._windows:
+            self._windows[window] = self._stat_means(*_window_bounds(self._starts, window))
+        return self._windows[window] @ scoring_matrix(scoring)
+
+    def project(self, scoring: ScoringInput) -> np.ndarray:
+        """
+        Projected points for each player-week from the games before it, per config.
+
+        Returns:
+            (len(frame), n_configs) array, NaN in a player's first game of a season
+        """
+        return self._projection @ scoring_matrix(scoring)
+
+    def next_game(self, scoring: ScoringInput) -> Tuple[pd.DataFrame, np.ndarray]:
+        """
+        Projection for each player's game after the last one in the data, per season.
+
+        Returns:
+            (player_id, season, team, position, last_week, games_played) rows and
+            the (rows, n_configs) projections aligned with them
+        """
+        last = self._last_rows
+        players = self.frame.loc[last, ["player_id", "season", "team", "position", "week"]]
+        players = players.rename(columns={"week": "last_week"}).reset_index(drop=True)
+        players["games_played"] = last - self._starts[last] + 1
+        return players, self._next_projection @ scoring_matrix(scoring)
@@ -0,0 +1,340 @@
+"""
+Monte Carlo season simulator.
+
+Plays out the rest of a regular season from per-game home win probabilities
+(``GameOutcomeModel.predict``) and reports division, playoff and seed
+probabilities per team.
+
+A chunk of seasons is one matrix: a (seasons x remaining games) block of
+uniform draws compared against the probabilities, times a (games x teams)
+home-minus-away incidence matrix, gives every simulated team's win total in
+one product. Division winners and seeds then come from argmax/argsort over
+those totals, again across all seasons at once.
+
+Each game draws from its own random stream per chunk, so the draws are fixed
+by (seed, chunk, game). ``SeasonSimulator.update`` uses that to re-score a few
+changed probabilities: it regenerates only those games' columns, flips the
+outcomes that change and re-ranks, without re-simulating the other games.
+
+Tiebreakers are approximated: teams level on record are ordered by a coin
+flip per season. Head-to-head, division and conference record are not
+modelled.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+
+# Team -> division, as in dbt/models/staging/stg_teams.sql
+NFL_DIVISIONS: Dict[str, str] = {
+    **dict.fromkeys(["BUF", "MIA", "NE", "NYJ"], "AFC East"),
+    **dict.fromkeys(["BAL", "CIN", "CLE", "PIT"], "AFC North"),
+    **dict.fromkeys(["HOU", "IND", "JAX", "TEN"], "AFC South"),
+    **dict.fromkeys(["DEN", "KC", "LV", "LAC"], "AFC West"),
+    **dict.fromkeys(["DAL", "NYG", "PHI", "WAS"], "NFC East"),
+    **dict.fromkeys(["CHI", "DET", "GB", "MIN"], "NFC North"),
+    **dict.fromkeys(["ATL", "CAR", "NO", "TB"], "NFC South"),
+    **dict.fromkeys(["ARI", "LA", "SF", "SEA"], "NFC West"),
+}
+PLAYOFF_TEAMS = 7  # per conference
+CHUNK_SIZE = 50_000
+
+Probabilities = Union[pd.DataFrame, pd.Series, Mapping[str, float]]
+
+
+@dataclass(frozen=True)
+class _Layout:
+    """Index arrays shared by every chunk (picklable for joblib workers)."""
+
+    home: np.ndarray  # team index per remaining game
+    away: np.ndarray
+    margin: np.ndarray  # (games x teams) +1 home, -1 away, float32
+    away_games: np.ndarray  # remaining away games per team
+    base_wins: np.ndarray  # wins banked from completed games, ties as 0.5
+    divisions: Tuple[np.ndarray, ...]  # team indices per division
+    conferences: Tuple[np.ndarray, ...]  # team indices per conference
+    playoff_teams: int
+
+    @property
+    def n_teams(self) -> int:
+        return len(self.base_wins)
+
+
+def _game_stream(seed: int, chunk: int, game: int) -> np.random.Generator:
+    return np.random.Generator(np.random.PCG64(np.random.SeedSequence(seed, spawn_key=(chunk, game))))
+
+
+def _tiebreak_stream(seed: int, chunk: int) -> np.random.Generator:
+    return np.random.Generator(np.random.PCG64(np.random.SeedSequence(seed, spawn_key=(chunk,))))
+
+
+def _game_draws(seed: int, chunk: int, game: int, size: int) -> np.ndarray:
+    return _game_stream(seed, chunk, game).random(size, dtype=np.float32)
+
+
+def simulate_wins(layout: _Layout, probabilities: np.ndarray, seed: int, chunk: int, size: int) -> np.ndarray:
+    """
+    Wins from the remaining games for one chunk of seasons.
+
+    Returns:
+        (size x teams) int8 matrix
+    """
+    draws = np.empty((size, len(probabilities)), dtype=np.float32, order="F")
+    for game in range(len(probabilities)):
+        draws[:, game] = _game_draws(seed, chunk, game, size)
+    home_wins = (draws < probabilities.astype(np.float32)).astype(np.float32)
+    # home win: +1 home, 0 away; home loss: 0 home, +1 away
+    wins = home_wins @ layout.margin + layout.away_games
+    return wins.astype(np.int8)
+
+
+def tally(layout: _Layout, wins: np.ndarray, seed: int, chunk: int) -> Dict[str, np.ndarray]:
+    """
+    Division titles, seeds and win totals summed over one chunk of seasons.
+    """
+    size = len(wins)
+    totals = wins + layout.base_wins
+    # Records differ by at least half a game, so the coin flip only orders ties
+    score = totals + 0.25 * _tiebreak_stream(seed, chunk).random((size, layout.n_teams), dtype=np.float32)
+    rows = np.arange(size)[:, None]
+
+    division_winner = np.column_stack(
+        [members[score[:, members].argmax(axis=1)] for members in layout.divisions]
+    )
+    won_division = np.zeros((size, layout.n_teams), dtype=bool)
+    won_division[rows, division_winner] = True
+
+    seeds = np.zeros((layout.n_teams, layout.playoff_teams), dtype=np.int64)
+    for members in layout.conferences:
+        ranked = members[np.argsort(-score[:, members], axis=1)]
+        # Division winners first, then everyone else, each in record order
+        winners_first = np.argsort(~won_division[rows, ranked], axis=1, kind="stable")
+        seeded = ranked[rows, winners_first[:, :layout.playoff_teams]]
+        slots = seeded * layout.playoff_teams + np.arange(seeded.shape[1])
+        seeds += np.bincount(slots.ravel(), minlength=seeds.size).reshape(seeds.shape)
+
+    return {
+        "seasons": np.array(size),
+        "wins": totals.sum(axis=0, dtype=np.float64),
+        "division": np.bincount(division_winner.ravel(), minlength=layout.n_teams),
+        "seeds": seeds,
+    }
+
+
+def _run_chunk(layout: _Layout, probabilities: np.ndarray, seed: int, chunk: int, size: int):
+    wins = simulate_wins(layout, probabilities, seed, chunk, size)
+    return wins, tally(layout, wins, seed, chunk)
+
+
+class SeasonSimulator:
+    """
+    Simulates the remaining regular season many times over.
+
+    Example:
+        simulator = SeasonSimulator(schedule)
+        predictions = model.predict(features[features["game_id"].isin(simulator.remaining["game_id"])])
+        odds = simulator.run(predictions, n_simulations=1_000_000)
+        odds = simulator.update({"2025_14_KC_DEN": 0.64})
+    """
+
+    def __init__(
+        self,
+        schedule: pd.DataFrame,
+        divisions: Mapping[str, str] = NFL_DIVISIONS,
+        playoff_teams: int = PLAYOFF_TEAMS,
+    ):
+        """
+        Args:
+            schedule: One season's schedule (nfl_current_schedule); games
+                without both scores are the ones simulated. Only game_type
+                'REG' rows are used when that column is present.
+            divisions: Team -> division name; the conference is the first
+                word of the division ("AFC East" -> "AFC")
+            playoff_teams: Playoff seeds per conference, division winners first
+        """
+        if "game_type" in schedule.columns:
+            schedule = schedule[schedule["game_type"] == "REG"]
+        schedule_teams = set(schedule["home_team"]) | set(schedule["away_team"])
+        unknown = sorted(schedule_teams - set(divisions))
+        if unknown:
+            raise ValueError(f"Teams without a division: {unknown}")
+
+        self.teams = sorted(divisions, key=lambda team: (divisions[team], team))
+        self.divisions = dict(divisions)
+        index = {team: i for i, team in enumerate(self.teams)}
+
+        played = schedule["home_score"].notna() & schedule["away_score"].notna()
+        completed = schedule[played]
+        self.remaining = schedule[~played].sort_values("game_id").reset_index(drop=True)
+
+        base_wins = np.zeros(len(self.teams), dtype=np.float32)
+        home_margin = (completed["home_score"] - completed["away_score"]).to_numpy()
+        np.add.at(base_wins, completed["home_team"].map(index).to_numpy(), np.sign(home_margin) * 0.5 + 0.5)
+        np.add.at(base_wins, completed["away_team"].map(index).to_numpy(), 0.5 - np.sign(home_margin) * 0.5)
+
+        home = self.remaining["home_team"].map(index).to_numpy(dtype=np.int64)
+        away = self.remaining["away_team"].map(index).to_numpy(dtype=np.int64)
+        margin = np.zeros((len(self.remaining), len(self.teams)), dtype=np.float32)
+        margin[np.arange(len(home)), home] += 1
+        margin[np.arange(len(away)), away] -= 1
+
+        division_names = sorted(set(divisions[team] for team in self.teams))
+        division_members = tuple(
+            np.array([index[team] for team in self.teams if divisions[team] == name]) for name in division_names
+        )
+        conference_names = sorted(set(name.split()[0] for name in division_names))
+        conferences = []
+        for conference in conference_names:
+            division_ids = [i for i, name in enumerate(division_names) if name.split()[0] == conference]
+            if playoff_teams < len(division_ids):
+                raise ValueError(f"{conference} has {len(division_ids)} divisions but only {playoff_teams} playoff teams")
+            conferences.append(np.concatenate([division_members[i] for i in division_ids]))
+
+        self.layout = _Layout(
+            home=home,
+            away=away,
+            margin=margin,
+            away_games=np.bincount(away, minlength=len(self.teams)).astype(np.float32),
+            base_wins=base_wins,
+            divisions=division_members,
+            conferences=tuple(conferences),
+            playoff_teams=playoff_teams,
+        )
+        self.probabilities: Optional[np.ndarray] = None
+        self._seed = 0
+        self._chunks: List[Tuple[int, int]] = []
+        self._wins: List[np.ndarray] = []
+        self._tallies: List[Dict[str, np.ndarray]] = []
+
+    def _probability_array(self, probabilities: Probabilities, partial: bool = False) -> np.ndarray:
+        """Home win probability per remaining game, in self.remaining order."""
+        if isinstance(probabilities, pd.DataFrame):
+            probabilities = probabilities.set_index("game_id")["home_win_probability"]
+        probabilities = pd.Series(probabilities, dtype="float64")
+        probabilities.index = probabilities.index.astype(str)
+
+        game_ids = self.remaining["game_id"].astype(str)
+        extra = sorted(set(probabilities.index) - set(game_ids))
+        if extra:
+            raise ValueError(f"Not remaining games: {extra[:5]}")
+        values = probabilities.reindex(game_ids).to_numpy()
+        if partial:
+            values = np.where(np.isnan(values), self.probabilities, values)
+        missing = game_ids[np.isnan(values)].tolist()
+        if missing:
+            raise ValueError(f"No probability for {len(missing)} remaining games, e.g. {missing[:5]}")
+        if ((values < 0) | (values > 1)).any():
+            raise ValueError("Probabilities must be between 0 and 1")
+        return values
+
+    def run(
+        self,
+        probabilities: Probabilities,
+        n_simulations: int = 100_000,
+        seed: int = 0,
+        chunk_size: int = CHUNK_SIZE,
+        n_jobs: int = 1,
+    ) -> pd.DataFrame:
+        """
+        Simulate the remaining games n_simulations times.
+
+        Args:
+            probabilities: Home win probability per remaining game, as the
+                frame GameOutcomeModel.predict returns (game_id,
+                home_win_probability) or a game_id -> probability mapping
+            n_simulations: Seasons to simulate
+            seed: Fixes every draw; the same seed gives the same result
+            chunk_size: Seasons per matrix; bounds memory at roughly
+                chunk_size x remaining games x 4 bytes
+            n_jobs: joblib worker processes sharing the chunks (-1 = all cores)
+
+        Returns:
+            One row per team (see summary)
+        """
+        if n_simulations < 1:
+            raise ValueError("n_simulations must be positive")
+        self.probabilities = self._probability_array(probabilities)
+        self._seed = seed
+        self._chunks = [
+            (chunk, min(chunk_size, n_simulations - start))
+            for chunk, start in enumerate(range(0, n_simulations, chunk_size))
+        ]
+        logging.info(
+            f"Simulating {n_simulations} seasons of {len(self.remaining)} remaining games "
+            f"in {len(self._chunks)} chunks on {n_jobs} jobs"
+        )
+        results = Parallel(n_jobs=n_jobs)(
+            delayed(_run_chunk)(self.layout, self.probabilities, seed, chunk, size) for chunk, size in self._chunks
+        )
+        self._wins = [wins for wins, _ in results]
+        self._tallies = [chunk_tally for _, chunk_tally in results]
+        return self.summary()
+
+    def update(self, probabilities: Probabilities) -> pd.DataFrame:
+        """
+        Re-score the last run after some probabilities change.
+
+        The draws of the last run are reused: only games whose probability
+        changed are redrawn from their streams, so the result is identical
+        to a fresh run with the same seed and the new probabilities.
+
+        Args:
+            probabilities: New probabilities for some remaining games
+
+        Returns:
+            One row per team (see summary)
+        """
+        if self.probabilities is None:
+            raise ValueError("Nothing to update; call run() first")
+        updated = self._probability_array(probabilities, partial=True)
+        changed = np.flatnonzero(updated != self.probabilities)
+        logging.info(f"Updating {len(changed)} game probabilities across {len(self._chunks)} chunks")
+        if len(changed) == 0:
+            return self.summary()
+
+        old = self.probabilities.astype(np.float32)
+        new = updated.astype(np.float32)
+        for i, (chunk, size) in enumerate(self._chunks):
+            wins = self._wins[i]
+            for game in changed:
+                draws = _game_draws(self._seed, chunk, game, size)
+                flipped = (draws < new[game]).astype(np.int8) - (draws < old[game]).astype(np.int8)
+                wins[:, self.layout.home[game]] += flipped
+                wins[:, self.layout.away[game]] -= flipped
+            self._tallies[i] = tally(self.layout, wins, self._seed, chunk)
+        self.probabilities = updated
+        return self.summary()
+
+    def summary(self) -> pd.DataFrame:
+        """
+        Per-team probabilities from the last run.
+
+        Returns:
+            team, conference, division, current_wins, expected_wins,
+            division_probability, playoff_probability and seed_1..seed_N
+            probabilities, best playoff odds first within each division
+        """
+        if not self._tallies:
+            raise ValueError("No simulation has been run")
+        seasons = sum(int(chunk_tally["seasons"]) for chunk_tally in self._tallies)
+        seeds = sum(chunk_tally["seeds"] for chunk_tally in self._tallies) / seasons
+
+        summary = pd.DataFrame({
+            "team": self.teams,
+            "conference": [self.divisions[team].split()[0] for team in self.teams],
+            "division": [self.divisions[team] for team in self.teams],
+            "current_wins": self.layout.base_wins.astype("float64"),
+            "expected_wins": sum(chunk_tally["wins"] for chunk_tally in self._tallies) / seasons,
+            "division_probability": sum(chunk_tally["division"] for chunk_tally in self._tallies) / seasons,
+            "playoff_probability": seeds.sum(axis=1),
+        })
+        for seed in range(self.layout.playoff_teams):
+            summary[f"seed_{seed + 1}"] = seeds[:, seed]
+        summary.attrs["n_simulations"] = seasons
+        return summary.sort_values(
+            ["conference", "division", "playoff_probability"], ascending=[True, True, False], ignore_index=True
+        )
@@ -0,0 +1,115 @@
+"""
+Game outcome prediction service.
+
+Loads every models/*.pkl artifact once at startup and serves single-game and
+batch predictions. Concurrent requests for the same model are micro-batched
+into one scoring call.
+
+Run with:
+    uvicorn nfl_analytics.api.app:app --port 8000
+"""
+
+import os
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+
+import numpy as np
+from fastapi import FastAPI, HTTPException
+
+from nfl_analytics.api.batching import MicroBatcher
+from nfl_analytics.api.predictor import LoadedModel, load_models
+from nfl_analytics.api.schemas import BatchRequest, BatchResponse, GameFeatures, ModelInfo, Prediction
+
+MODEL_DIR = os.getenv("NFL_MODEL_DIR", "models")
+DEFAULT_MODEL = os.getenv("NFL_DEFAULT_MODEL", "rf")
+MAX_BATCH_SIZE = int(os.getenv("NFL_API_MAX_BATCH_SIZE", "256"))
+MAX_WAIT_MS = float(os.getenv("NFL_API_MAX_WAIT_MS", "0"))
+
+
+def _predictions(games: List[GameFeatures], probabilities: np.ndarray) -> List[Prediction]:
+    return [
+        Prediction(
+            game_id=game.game_id,
+            home_team=game.home_team,
+            away_team=game.away_team,
+            home_win_probability=float(p),
+            predicted_winner=game.home_team if p > 0.5 else game.away_team,
+        )
+        for game, p in zip(games, probabilities)
+    ]
+
+
+def create_app(
+    model_dir: str = MODEL_DIR,
+    default_model: str = DEFAULT_MODEL,
+    max_batch_size: int = MAX_BATCH_SIZE,
+    max_wait_ms: float = MAX_WAIT_MS,
+) -> FastAPI:
+    """
+    Build the prediction app.
+
+    Args:
+        model_dir: Directory of GameOutcomeModel .pkl artifacts
+        default_model: Model used by /predict routes that don't name one
+        max_batch_size: Most rows scored in one model call
+        max_wait_ms: How long a batch waits for more requests (0 = greedy)
+
+    Returns:
+        FastAPI app
+    """
+    models: Dict[str, LoadedModel] = {}
+    batchers: Dict[str, MicroBatcher] = {}
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        models.update(load_models(model_dir))
+        if not models:
+            raise RuntimeError(f"No model artifacts found in {model_dir}")
+        for name, model in models.items():
+            batchers[name] = MicroBatcher(model.home_win_probability, max_batch_size, max_wait_ms)
+            await batchers[name].start()
+        yield
+        for batcher in batchers.values():
+            await batcher.stop()
+        batchers.clear()
+        models.clear()
+
+    app = FastAPI(title="NFL Analytics Predictions", lifespan=lifespan)
+
+    def _model(name: Optional[str]) -> LoadedModel:
+        name = name or default_model
+        if name not in models:
+            raise HTTPException(status_code=404, detail=f"Unknown model '{name}'; available: {sorted(models)}")
+        return models[name]
+
+    async def _score(name: Optional[str], games: List[GameFeatures]) -> BatchResponse:
+        model = _model(name)
+        X = model.vectorize([game.features for game in games])
+        probabilities = await batchers[model.name].submit(X)
+        return BatchResponse(model=model.name, predictions=_predictions(games, probabilities))
+
+    @app.get("/health")
+    async def health() -> Dict[str, object]:
+        return {"status": "ok", "models": sorted(models)}
+
+    @app.get("/models", response_model=List[ModelInfo])
+    async def list_models() -> List[ModelInfo]:
+        return [
+            ModelInfo(name=m.name, model_type=m.model_type, feature_columns=list(m.feature_columns))
+            for m in models.values()
+        ]
+
+    @app.post("/predict", response_model=Prediction)
+    async def predict(game: GameFeatures, model: Optional[str] = None) -> Prediction:
+        return (await _score(model, [game])).predictions[0]
+
+    @app.post("/predict/batch", response_model=BatchResponse)
+    async def predict_batch(request: BatchRequest, model: Optional[str] = None) -> BatchResponse:
+        if not request.games:
+            return BatchResponse(model=_model(model).name, predictions=[])
+        return await _score(model, request.games)
+
+    return app
+
+
+app = create_app()
@@ -0,0 +1,116 @@
+"""
+Micro-batching for concurrent prediction requests.
+
+Requests that arrive while the model is busy are stacked into one matrix and
+scored in a single call, so the fixed per-call cost of a forest is paid once
+per batch instead of once per request.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent submit() calls into batched predict calls.
+
+    By default the batcher is greedy: it takes whatever is queued the moment
+    the model is free, so an idle service adds no wait and a busy one batches
+    naturally. A positive max_wait_ms holds a batch open a little longer to
+    collect more rows.
+    """
+
+    def __init__(
+        self,
+        predict: Callable[[np.ndarray], np.ndarray],
+        max_batch_size: int = 256,
+        max_wait_ms: float = 0.0,
+    ):
+        """
+        Args:
+            predict: Scores a (rows, features) matrix, returning one value per row
+            max_batch_size: Most rows scored in one call
+            max_wait_ms: How long to hold a batch open for more rows
+        """
+        self.predict = predict
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue: "asyncio.Queue[Tuple[np.ndarray, asyncio.Future]]" = asyncio.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="predict")
+        self._worker: Optional[asyncio.Task] = None
+        self.batches = 0
+
+    async def start(self) -> None:
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        self._executor.shutdown(wait=False)
+
+    async def submit(self, X: np.ndarray) -> np.ndarray:
+        """
+        Score X as part of the next batch.
+
+        Args:
+            X: (rows, features) matrix
+
+        Returns:
+            One prediction per row of X
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((X, future))
+        return await future
+
+    async def _collect(self) -> List[Tuple[np.ndarray, asyncio.Future]]:
+        """Block for the first request, then take more until full or out of time."""
+        pending = [await self._queue.get()]
+        rows = len(pending[0][0])
+        deadline = asyncio.get_running_loop().time() + self.max_wait
+
+        while rows < self.max_batch_size:
+            if not self._queue.empty():
+                item = self._queue.get_nowait()
+            else:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+            pending.append(item)
+            rows += len(item[0])
+        return pending
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = await self._collect()
+            sizes = [len(X) for X, _ in pending]
+            try:
+                X = pending[0][0] if len(pending) == 1 else np.vstack([X for X, _ in pending])
+                predictions = await loop.run_in_executor(self._executor, self.predict, X)
+            except Exception as e:
+                logging.error(f"Batch of {sum(sizes)} rows failed: {e}")
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            self.batches += 1
+            start = 0
+            for size, (_, future) in zip(sizes, pending):
+                if not future.done():
+                    future.set_result(predictions[start : start + size])
+                start += size
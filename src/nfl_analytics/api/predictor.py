@@ -0,0 +1,174 @@
+"""
+In-process scoring for the saved game outcome models.
+
+Reads the artifacts GameOutcomeModel writes once -- .pkl files from
+save_model (a joblib dict of model, scaler, feature_columns, model_type) or
+memory-mapped .model directories from save_artifact -- and scores plain numpy
+matrices without building DataFrames. Inputs are prepared by the model's own
+FeaturePipeline, and pickled random forests and logistic regressions are
+converted to the artifact's array estimators, which skip sklearn's per-call
+validation and joblib dispatch; a converted estimator is checked against the
+model's own predict_proba when it is loaded.
+"""
+
+import hashlib
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Mapping, Optional, Sequence
+
+import joblib
+import numpy as np
+
+from nfl_analytics.ml.artifact import ArrayScaler, as_array_estimator, read_artifact
+from nfl_analytics.ml.feature_pipeline import FeaturePipeline
+
+ARTIFACT_PREFIX = "game_outcome_"
+
+
+def compile_predict_proba(model, n_features: int, seed: int = 0) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Fast predict_proba for a fitted classifier, or the model's own if none applies.
+
+    The array estimator is only used when it reproduces model.predict_proba on
+    a random probe matrix, so an unexpected estimator or sklearn version falls
+    back to the slow path instead of returning different numbers.
+    """
+    compiled = as_array_estimator(model)
+    if compiled is model:
+        return model.predict_proba
+
+    probe = np.random.default_rng(seed).normal(size=(64, n_features))
+    if not np.allclose(compiled.predict_proba(probe), model.predict_proba(probe), atol=1e-9):
+        logging.warning(f"Array form of {type(model).__name__} disagrees with predict_proba; using sklearn path")
+        return model.predict_proba
+    return compiled.predict_proba
+
+
+@dataclass
+class LoadedModel:
+    """
+    A game outcome model ready to score feature matrices.
+    """
+
+    name: str
+    model_type: str
+    features: FeaturePipeline
+    scaler: ArrayScaler
+    predict_proba: Callable[[np.ndarray], np.ndarray]
+    version: str = ""  # content hash of the saved model, changes whenever it is retrained
+
+    @property
+    def feature_columns(self) -> Sequence[str]:
+        return self.features.columns
+
+    def vectorize(self, rows: Sequence[Mapping[str, Optional[float]]]) -> np.ndarray:
+        """
+        Raw feature matrix in feature_columns order, missing values filled.
+
+        Args:
+            rows: One mapping of feature name -> value per game; absent keys
+                and None count as missing
+
+        Returns:
+            float32 array of shape (len(rows), len(feature_columns)), the
+            dtype GameOutcomeModel prepares features in
+        """
+        return self.features.transform(list(rows))
+
+    def vectorize_frame(self, features) -> np.ndarray:
+        """
+        vectorize() for a DataFrame with the feature columns, without a
+        round trip through per-row dicts.
+        """
+        return self.features.transform(features)
+
+    def home_win_probability(self, X: np.ndarray) -> np.ndarray:
+        """Scale and score a matrix from vectorize()."""
+        return self.predict_proba(self.scaler.transform(X))[:, 1]
+
+
+def _content_version(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:12]
+
+
+def load_model(path: str, name: Optional[str] = None) -> LoadedModel:
+    """
+    Load one GameOutcomeModel artifact.
+
+    Args:
+        path: .pkl written by GameOutcomeModel.save_model
+        name: Name to serve it under; defaults to the file stem without
+            the "game_outcome_" prefix (game_outcome_rf.pkl -> "rf")
+
+    Returns:
+        LoadedModel
+    """
+    artifact = joblib.load(path)
+    feature_columns = list(artifact["feature_columns"])
+    scaler = artifact["scaler"]
+
+    if "feature_pipeline" in artifact:
+        features = FeaturePipeline.from_dict(artifact["feature_pipeline"])
+    else:
+        features = FeaturePipeline.from_scaler(feature_columns, scaler)
+
+    if name is None:
+        name = Path(path).stem.removeprefix(ARTIFACT_PREFIX)
+    loaded = LoadedModel(
+        name=name,
+        model_type=artifact["model_type"],
+        features=features,
+        scaler=ArrayScaler(np.asarray(scaler.mean_, dtype="float64"), np.asarray(scaler.scale_, dtype="float64")),
+        predict_proba=compile_predict_proba(artifact["model"], len(feature_columns)),
+        version=_content_version(Path(path)),
+    )
+    logging.info(f"Loaded {loaded.model_type} model '{name}' from {path}")
+    return loaded
+
+
+def load_model_artifact(path: str, name: Optional[str] = None) -> LoadedModel:
+    """
+    Load a .model directory written by GameOutcomeModel.save_artifact.
+
+    Arrays stay memory-mapped, so worker processes serving the same artifact
+    share its pages.
+    """
+    artifact = read_artifact(path)
+    if name is None:
+        name = Path(path).stem.removeprefix(ARTIFACT_PREFIX)
+    loaded = LoadedModel(
+        name=name,
+        model_type=artifact.model_type,
+        features=FeaturePipeline.from_dict(
+            {"columns": artifact.feature_columns, "fill_values": artifact.array("fill_values")}
+        ),
+        scaler=artifact.scaler,
+        predict_proba=artifact.estimator.predict_proba,
+        # The manifest records every array's checksum, so it versions the whole artifact
+        version=_content_version(Path(path) / "manifest.json"),
+    )
+    logging.info(f"Loaded {loaded.model_type} artifact '{name}' from {path}")
+    return loaded
+
+
+def load_models(model_dir: str) -> Dict[str, LoadedModel]:
+    """
+    Load every model in a directory, keyed by serving name.
+
+    A .model artifact directory wins over a .pkl with the same name.
+    """
+    models = {}
+    for path in sorted(Path(model_dir).glob("*.model")):
+        model = load_model_artifact(str(path))
+        models[model.name] = model
+    for path in sorted(Path(model_dir).glob("*.pkl")):
+        if path.stem.removeprefix(ARTIFACT_PREFIX) in models:
+            continue
+        model = load_model(str(path))
+        models[model.name] = model
+    return models
@@ -0,0 +1,40 @@
+"""Request and response bodies for the prediction API."""
+
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class GameFeatures(BaseModel):
+    """One game to score, with the model's feature columns as a mapping."""
+
+    game_id: Optional[str] = None
+    home_team: str
+    away_team: str
+    features: Dict[str, Optional[float]] = Field(
+        default_factory=dict,
+        description="Feature name -> value; missing or null features are filled",
+    )
+
+
+class BatchRequest(BaseModel):
+    games: List[GameFeatures]
+
+
+class Prediction(BaseModel):
+    game_id: Optional[str] = None
+    home_team: str
+    away_team: str
+    home_win_probability: float
+    predicted_winner: str
+
+
+class BatchResponse(BaseModel):
+    model: str
+    predictions: List[Prediction]
+
+
+class ModelInfo(BaseModel):
+    name: str
+    model_type: str
+    feature_columns: List[str]
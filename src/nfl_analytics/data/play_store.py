@@ -0,0 +1,545 @@
+"""
+Column-oriented, indexed play store for situational split queries.
+
+Plays carry the stg_pbp columns and derivations (play_category,
+field_position, down_situation, epa_impact) and are held as one NumPy array
+per column, sorted by (season, week, game_id, play_id). String columns are
+dictionary encoded: small integer codes plus a sorted dictionary.
+
+Every (season, week) is therefore one contiguous run of rows. Each indexed
+column also keeps a posting index: row ids ordered by code, ascending within
+a code, with an offsets array marking where each code starts. The plays for
+a value are one slice of it, and cutting that slice down to a range of weeks
+is two binary searches. A query starts from its most selective posting list
+and checks the other conditions on those rows only, so it touches a few
+thousand rows rather than every play.
+
+A saved store is a directory of .npy files and a manifest. open() maps the
+arrays with mmap_mode="r", like model artifacts, so every process opening the
+same store shares one copy through the OS page cache.
+"""
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from ..analytics.features import raw_cache_files
+
+FORMAT = "nfl-analytics/play-store"
+FORMAT_VERSION = 1
+MANIFEST = "manifest.json"
+
+# Raw play-by-play column -> stg_pbp name
+SOURCE_COLUMNS = {
+    "play_id": "play_id",
+    "game_id": "game_id",
+    "season": "season",
+    "week": "week",
+    "play_type": "play_type",
+    "down": "down",
+    "ydstogo": "yards_to_go",
+    "yardline_100": "yardline_100",
+    "qtr": "quarter",
+    "posteam": "posteam",
+    "defteam": "defteam",
+    "yards_gained": "yards_gained",
+    "touchdown": "touchdown",
+    "first_down": "first_down",
+    "interception": "interception",
+    "fumble": "fumble",
+    "fumble_lost": "fumble_lost",
+    "penalty": "penalty",
+    "epa": "epa",
+    "wpa": "wpa",
+    "success": "success",
+    "passer_player_id": "passer_id",
+    "rusher_player_id": "rusher_id",
+    "receiver_player_id": "receiver_id",
+}
+REQUIRED_COLUMNS = ("game_id", "season", "week", "posteam")
+
+CATEGORICAL_COLUMNS = [
+    "game_id",
+    "play_type",
+    "posteam",
+    "defteam",
+    "play_category",
+    "field_position",
+    "down_situation",
+    "epa_impact",
+    "passer_id",
+    "rusher_id",
+    "receiver_id",
+]
+NUMERIC_COLUMNS = [
+    "down",
+    "yards_to_go",
+    "yardline_100",
+    "quarter",
+    "yards_gained",
+    "touchdown",
+    "first_down",
+    "interception",
+    "fumble",
+    "fumble_lost",
+    "penalty",
+    "epa",
+    "wpa",
+    "success",
+]
+KEY_COLUMNS = ["season", "week", "play_id"]
+INDEXED_COLUMNS = [
+    "posteam",
+    "defteam",
+    "down_situation",
+    "field_position",
+    "play_category",
+    "play_type",
+    "game_id",
+    "passer_id",
+    "rusher_id",
+    "receiver_id",
+]
+# player= matches a player in any of these roles
+PLAYER_COLUMNS = ("passer_id", "rusher_id", "receiver_id")
+
+AGGREGATIONS = ("count", "sum", "mean")
+
+
+class PlayStoreError(ValueError):
+    """The store directory is unreadable or from a newer format."""
+
+
+def derive_play_columns(pbp: pd.DataFrame) -> pd.DataFrame:
+    """
+    stg_pbp over raw play-by-play: renamed columns, the derived situation
+    columns and only plays with a possessing team.
+
+    Source columns pbp lacks are filled with nulls.
+
+    Args:
+        pbp: Play-by-play with at least REQUIRED_COLUMNS
+
+    Returns:
+        One row per play with KEY_COLUMNS, CATEGORICAL_COLUMNS and NUMERIC_COLUMNS
+    """
+    missing = [column for column in REQUIRED_COLUMNS if column not in pbp.columns]
+    if missing:
+        raise ValueError(f"Play-by-play is missing columns: {missing}")
+
+    plays = pbp[pbp["posteam"].notna()]
+    out = pd.DataFrame(index=plays.index)
+    for source, name in SOURCE_COLUMNS.items():
+        if source not in plays.columns:
+            out[name] = np.nan
+        elif name in CATEGORICAL_COLUMNS:
+            out[name] = plays[source].astype(object)
+        else:
+            out[name] = pd.to_numeric(plays[source], errors="coerce").astype("float64")
+
+    play_type = out["play_type"]
+    out["play_category"] = np.select(
+        [
+            play_type.isin(["pass", "run"]),
+            play_type.isin(["punt", "field_goal", "extra_point"]),
+            play_type == "kickoff",
+        ],
+        ["offensive", "special_teams", "kickoff"],
+        "other",
+    )
+    # Null comparisons are false, so nulls fall through to the else branch as in SQL
+    yardline = out["yardline_100"]
+    out["field_position"] = np.select([yardline <= 20, yardline <= 40], ["red_zone", "scoring_territory"], "field")
+    down, to_go = out["down"], out["yards_to_go"]
+    third = down == 3
+    out["down_situation"] = np.select(
+        [third & (to_go <= 3), third & (to_go > 7), third, down == 4],
+        ["short_third_down", "long_third_down", "medium_third_down", "fourth_down"],
+        "early_down",
+    )
+    out["epa_impact"] = np.select([out["epa"] > 0, out["epa"] < 0], ["positive", "negative"], "neutral")
+    return out.sort_values(["season", "week", "game_id", "play_id"], ignore_index=True, kind="stable")
+
+
+def _code_dtype(n_values: int) -> np.dtype:
+    return np.dtype(np.int16) if n_values < np.iinfo(np.int16).max else np.dtype(np.int32)
+
+
+def _as_list(value) -> list:
+    if isinstance(value, (str, bytes)) or not isinstance(value, Iterable):
+        return [value]
+    return list(value)
+
+
+class PlayStore:
+    """
+    Plays as column arrays with posting indexes; see the module docstring.
+    """
+
+    def __init__(
+        self,
+        arrays: Mapping[str, np.ndarray],
+        dictionaries: Mapping[str, Sequence[str]],
+        sources: Sequence[str] = (),
+    ):
+        """
+        Args:
+            arrays: Column arrays, plus 'periods' / 'period_starts' and
+                '<column>.order' / '<column>.offsets' for each indexed column
+            dictionaries: Categorical column -> values its codes point at
+            sources: Cache files the plays were read from
+        """
+        self.arrays = dict(arrays)
+        self.sources = list(sources)
+        self.dictionaries = {column: list(values) for column, values in dictionaries.items()}
+        self._codes = {column: {value: code for code, value in enumerate(values)} for column, values in self.dictionaries.items()}
+        self.periods = self.arrays["periods"]
+        self.period_starts = self.arrays["period_starts"]
+
+    def __len__(self) -> int:
+        return int(self.period_starts[-1])
+
+    @classmethod
+    def from_pbp(cls, pbp: pd.DataFrame, sources: Sequence[str] = ()) -> "PlayStore":
+        """
+        Build a store from raw play-by-play (nflverse column names).
+        """
+        plays = derive_play_columns(pbp)
+        arrays: Dict[str, np.ndarray] = {}
+        dictionaries: Dict[str, List[str]] = {}
+
+        arrays["season"] = plays["season"].to_numpy(dtype=np.int16)
+        arrays["week"] = plays["week"].to_numpy(dtype=np.int8)
+        arrays["play_id"] = plays["play_id"].fillna(-1).to_numpy(dtype=np.int32)
+        for column in NUMERIC_COLUMNS:
+            arrays[column] = plays[column].to_numpy(dtype=np.float32, na_value=np.nan)
+        for column in CATEGORICAL_COLUMNS:
+            codes, values = pd.factorize(plays[column], sort=True)
+            arrays[column] = codes.astype(_code_dtype(len(values)))
+            dictionaries[column] = [str(value) for value in values]
+
+        for column in INDEXED_COLUMNS:
+            codes = arrays[column]
+            order = np.argsort(codes, kind="stable")
+            # Nulls (-1) sort first and are left out of the offsets
+            offsets = np.searchsorted(codes[order], np.arange(len(dictionaries[column]) + 1))
+            arrays[f"{column}.order"] = order.astype(np.int32)
+            arrays[f"{column}.offsets"] = offsets.astype(np.int64)
+
+        period = arrays["season"].astype(np.int32) * 100 + arrays["week"]
+        periods, starts = np.unique(period, return_index=True)
+        arrays["periods"] = periods.astype(np.int32)
+        arrays["period_starts"] = np.append(starts, len(period)).astype(np.int64)
+        return cls(arrays, dictionaries, sources)
+
+    @classmethod
+    def from_cache(
+        cls,
+        root: str,
+        seasons: Optional[Iterable[int]] = None,
+        dataset: str = "pbp_lean",
+    ) -> "PlayStore":
+        """
+        Build a store from the pipeline's raw Parquet cache (newest fetch of each season).
+        """
+        files = raw_cache_files(root, seasons, dataset)
+        frames = []
+        for file in files:
+            available = set(pq.read_schema(file).names)
+            frames.append(pd.read_parquet(file, columns=[column for column in SOURCE_COLUMNS if column in available]))
+        return cls.from_pbp(pd.concat(frames, ignore_index=True), [str(file) for file in files])
+
+    @classmethod
+    def open(cls, path: str) -> "PlayStore":
+        """
+        Open a saved store with every array memory-mapped read-only.
+        """
+        manifest_path = Path(path) / MANIFEST
+        try:
+            manifest = json.loads(manifest_path.read_text())
+        except (OSError, json.JSONDecodeError) as e:
+            raise PlayStoreError(f"Cannot read {manifest_path}: {e}") from e
+        if manifest.get("format") != FORMAT:
+            raise PlayStoreError(f"{path} is not a {FORMAT} directory")
+        if manifest["format_version"] > FORMAT_VERSION:
+            raise PlayStoreError(
+                f"{path} uses format version {manifest['format_version']}; this reader supports up to {FORMAT_VERSION}"
+            )
+        arrays = {name: np.load(Path(path) / file, mmap_mode="r") for name, file in manifest["arrays"].items()}
+        return cls(arrays, manifest["dictionaries"], manifest["sources"])
+
+    def save(self, path: str) -> Path:
+        """
+        Write the store as a directory of .npy files and a manifest.
+
+        The directory is built next to path and renamed into place, so readers
+        never see a half-written store.
+        """
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{target.name}.", dir=target.parent))
+        try:
+            files = {}
+            for name, array in self.arrays.items():
+                files[name] = f"{name}.npy"
+                np.save(staging / files[name], np.ascontiguousarray(array))
+            manifest = {
+                "format": FORMAT,
+                "format_version": FORMAT_VERSION,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "rows": len(self),
+                "sources": list(self.sources),
+                "dictionaries": self.dictionaries,
+                "arrays": files,
+            }
+            (staging / MANIFEST).write_text(json.dumps(manifest))
+            if target.exists():
+                shutil.rmtree(target)
+            os.replace(staging, target)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        logging.info(f"Play store with {len(self)} plays written to {target}")
+        return target
+
+    def _period_ranges(self, season, week, last_weeks: Optional[int]) -> List[Tuple[int, int]]:
+        """Row ranges of the selected (season, week)s, adjacent ones merged."""
+        keep = np.ones(len(self.periods), dtype=bool)
+        if season is not None:
+            keep &= np.isin(self.periods // 100, _as_list(season))
+        if week is not None:
+            keep &= np.isin(self.periods % 100, _as_list(week))
+        selected = np.flatnonzero(keep)
+        if last_weeks is not None:
+            selected = selected[-last_weeks:] if last_weeks > 0 else selected[:0]
+
+        ranges: List[Tuple[int, int]] = []
+        for i in selected:
+            start, stop = int(self.period_starts[i]), int(self.period_starts[i + 1])
+            if ranges and ranges[-1][1] == start:
+                ranges[-1] = (ranges[-1][0], stop)
+            else:
+                ranges.append((start, stop))
+        return ranges
+
+    def _wanted_codes(self, column: str, values) -> np.ndarray:
+        lookup = self._codes[column]
+        return np.array([lookup[value] for value in _as_list(values) if value in lookup], dtype=np.int64)
+
+    def _postings(self, column: str, codes: np.ndarray) -> np.ndarray:
+        """Ascending row ids whose column holds one of codes."""
+        order, offsets = self.arrays[f"{column}.order"], self.arrays[f"{column}.offsets"]
+        slices = [order[offsets[code] : offsets[code + 1]] for code in codes]
+        if len(slices) == 1:
+            return slices[0]
+        return np.sort(np.concatenate(slices)) if slices else np.empty(0, dtype=np.int32)
+
+    def filter(
+        self,
+        season=None,
+        week=None,
+        last_weeks: Optional[int] = None,
+        player=None,
+        **conditions,
+    ) -> "Plays":
+        """
+        Select plays.
+
+        Every condition takes a value or a list of values; conditions are
+        combined with AND.
+
+        Args:
+            season: Season(s)
+            week: Week(s)
+            last_weeks: Only the latest N weeks left after the season/week
+                conditions, across season boundaries
+            player: Player id(s) as passer, rusher or receiver
+            **conditions: Any categorical or numeric column, e.g.
+                posteam='KC', down_situation='short_third_down', quarter=4
+
+        Returns:
+            Plays
+        """
+        unknown = [column for column in conditions if column not in self.dictionaries and column not in NUMERIC_COLUMNS]
+        if unknown:
+            raise ValueError(f"Cannot filter on {unknown}")
+
+        ranges = self._period_ranges(season, week, last_weeks)
+        candidates: List[np.ndarray] = []
+        if player is not None:
+            candidates.append(
+                np.unique(np.concatenate([self._postings(c, self._wanted_codes(c, player)) for c in PLAYER_COLUMNS]))
+            )
+        checks = []
+        for column, values in conditions.items():
+            if column in INDEXED_COLUMNS:
+                candidates.append(self._postings(column, self._wanted_codes(column, values)))
+            elif column in self.dictionaries:
+                checks.append((self.arrays[column], self._wanted_codes(column, values)))
+            else:
+                checks.append((self.arrays[column], np.asarray(_as_list(values), dtype=np.float32)))
+
+        if candidates:
+            # Drive from the shortest posting list; the rest become row checks
+            candidates.sort(key=len)
+            rows = candidates[0]
+            keep = np.zeros(len(rows), dtype=bool)
+            for start, stop in ranges:
+                keep[np.searchsorted(rows, start) : np.searchsorted(rows, stop)] = True
+            rows = rows[keep]
+            for other in candidates[1:]:
+                rows = rows[np.isin(rows, other, assume_unique=True)]
+        else:
+            rows = np.concatenate([np.arange(start, stop) for start, stop in ranges]) if ranges else np.empty(0)
+        rows = rows.astype(np.int64, copy=False)
+
+        for values, wanted in checks:
+            rows = rows[np.isin(values[rows], wanted)]
+        return Plays(self, rows)
+
+    def decode(self, column: str, rows: np.ndarray) -> pd.Series:
+        """Column values at rows; categorical columns come back as pandas Categoricals."""
+        values = self.arrays[column][rows]
+        if column in self.dictionaries:
+            return pd.Series(pd.Categorical.from_codes(values, categories=self.dictionaries[column]), name=column)
+        return pd.Series(values, name=column)
+
+
+# Reported when group_by/agg get no metrics: name -> (column, aggregation)
+DEFAULT_METRICS = {
+    "epa_per_play": ("epa", "mean"),
+    "success_rate": ("success", "mean"),
+    "yards_per_play": ("yards_gained", "mean"),
+}
+
+
+class Plays:
+    """
+    A selection of a PlayStore's plays, as ascending row ids.
+    """
+
+    def __init__(self, store: PlayStore, rows: np.ndarray):
+        self.store = store
+        self.rows = rows
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def to_frame(self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Selected plays as a DataFrame (default every stored column).
+        """
+        columns = columns or KEY_COLUMNS + CATEGORICAL_COLUMNS + NUMERIC_COLUMNS
+        return pd.concat([self.store.decode(column, self.rows) for column in columns], axis=1)
+
+    def agg(self, **metrics: Tuple[str, str]) -> pd.Series:
+        """
+        Aggregate the selection as a whole.
+
+        Args:
+            **metrics: name=(column, 'count' | 'sum' | 'mean'), default DEFAULT_METRICS
+
+        Returns:
+            'plays' and one value per metric (mean of no values is NaN)
+        """
+        group = np.zeros(len(self.rows), dtype=np.intp)
+        return pd.Series({name: values[0] for name, values in self._aggregate(group, 1, self.rows, metrics).items()})
+
+    def group_by(self, *columns: str, **metrics: Tuple[str, str]) -> pd.DataFrame:
+        """
+        Aggregate per distinct combination of columns.
+
+        Plays with a null in any grouping column are left out, as pandas does.
+
+        Args:
+            *columns: Columns to group by, e.g. 'posteam', 'week'
+            **metrics: name=(column, 'count' | 'sum' | 'mean'), default DEFAULT_METRICS
+
+        Returns:
+            One row per group, sorted by the grouping columns, with 'plays' and each metric
+        """
+        arrays, dictionaries = self.store.arrays, self.store.dictionaries
+        unknown = [column for column in columns if column not in dictionaries and column not in KEY_COLUMNS + NUMERIC_COLUMNS]
+        if not columns or unknown:
+            raise ValueError(f"Cannot group by {list(columns) if not unknown else unknown}")
+
+        keys = [arrays[column][self.rows] for column in columns]
+        present = np.ones(len(self.rows), dtype=bool)
+        for column, key in zip(columns, keys):
+            present &= key >= 0 if column in dictionaries else ~np.isnan(key.astype(np.float64))
+        rows = self.rows[present]
+
+        levels, inverses = zip(*(np.unique(key[present], return_inverse=True) for key in keys))
+        shape = tuple(len(level) for level in levels)
+        groups, group = np.unique(np.ravel_multi_index(inverses, shape) if rows.size else np.empty(0, np.intp), return_inverse=True)
+
+        out: Dict[str, np.ndarray] = {}
+        for column, level, position in zip(columns, levels, np.unravel_index(groups, shape)):
+            values = level[position]
+            out[column] = np.asarray(dictionaries[column], dtype=object)[values] if column in dictionaries else values
+        out.update(self._aggregate(group, len(groups), rows, metrics))
+        return pd.DataFrame(out)
+
+    def _aggregate(
+        self, group: np.ndarray, n_groups: int, rows: np.ndarray, metrics: Mapping[str, Tuple[str, str]]
+    ) -> Dict[str, np.ndarray]:
+        """Per-group plays and metrics with bincount; nulls are skipped as in SQL."""
+        out = {"plays": np.bincount(group, minlength=n_groups)}
+        for name, (column, how) in (metrics or DEFAULT_METRICS).items():
+            if column not in NUMERIC_COLUMNS or how not in AGGREGATIONS:
+                raise ValueError(f"Cannot aggregate {column!r} with {how!r}")
+            values = self.store.arrays[column][rows].astype(np.float64)
+            valid = ~np.isnan(values)
+            counts = np.bincount(group[valid], minlength=n_groups)
+            if how == "count":
+                out[name] = counts
+                continue
+            sums = np.bincount(group[valid], weights=values[valid], minlength=n_groups)
+            if how == "sum":
+                out[name] = sums
+            else:
+                out[name] = np.divide(sums, counts, out=np.full(n_groups, np.nan), where=counts > 0)
+        return out
+
+
+def load_play_store(
+    path: str,
+    cache_root: Optional[str] = None,
+    seasons: Optional[Iterable[int]] = None,
+    dataset: str = "pbp_lean",
+) -> PlayStore:
+    """
+    Open the store at path, first rebuilding it from the raw Parquet cache if
+    it is missing or was built from older fetches than the cache now holds.
+
+    Args:
+        path: Store directory
+        cache_root: Raw cache directory (NFL_RAW_CACHE_DIR); None just opens path
+        seasons: Seasons to build from, default every cached season
+        dataset: 'pbp_lean' or 'pbp' for full-mode pulls
+
+    Returns:
+        Memory-mapped PlayStore
+    """
+    if cache_root is None:
+        return PlayStore.open(path)
+
+    current = [str(file) for file in raw_cache_files(cache_root, seasons, dataset)]
+    try:
+        store = PlayStore.open(path)
+        if store.sources == current:
+            return store
+    except PlayStoreError:
+        pass
+    logging.info(f"Building play store at {path} from {len(current)} cached seasons")
+    PlayStore.from_cache(cache_root, seasons, dataset).save(path)
+    return PlayStore.open(path)
@@ -0,0 +1,383 @@
+"""
+Versioned, memory-mappable model artifacts.
+
+An artifact is a directory holding a manifest.json and one .npy file per
+array: scaler parameters, fill values and the estimator itself (a random
+forest's node arrays, or logistic regression coefficients). Arrays are opened
+with mmap_mode="r" on first use, so loading is lazy and zero-copy, and worker
+processes serving the same artifact share its pages through the OS page cache.
+XGBoost boosters, which have no array form here, are kept in their native
+format next to the manifest.
+
+The manifest records the feature columns and a hash of them. read_artifact
+refuses an artifact whose schema differs from the one the caller expects.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from datetime import datetime, timezone
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Sequence
+
+import numpy as np
+
+FORMAT = "nfl-analytics/game-outcome-model"
+FORMAT_VERSION = 1
+MANIFEST = "manifest.json"
+OUTPUT_DTYPE = "float32"
+PARITY_ROWS = 64  # scaled inputs scored at export, re-scored by verify()
+
+
+class ArtifactError(ValueError):
+    """The artifact is unreadable, from a newer format, or fails its integrity check."""
+
+
+class ArtifactSchemaError(ArtifactError):
+    """The artifact was trained on different features than the caller expects."""
+
+
+def schema_hash(feature_columns: Sequence[str], output_dtype: str = OUTPUT_DTYPE) -> str:
+    """Hash of the ordered feature columns and the matrix dtype they are scored as."""
+    payload = json.dumps({"columns": list(feature_columns), "dtype": output_dtype})
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ArrayScaler:
+    """StandardScaler.transform from stored mean and scale."""
+
+    def __init__(self, mean: np.ndarray, scale: np.ndarray):
+        self.mean_ = mean
+        self.scale_ = scale
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        # Same arithmetic as StandardScaler: in place, in the input's float dtype,
+        # so forest splits see bit-identical values
+        X = np.array(X, dtype=np.float32 if np.asarray(X).dtype == np.float32 else np.float64)
+        X -= self.mean_.astype(X.dtype)
+        X /= self.scale_.astype(X.dtype)
+        return X
+
+
+class ArrayForest:
+    """
+    Random forest scored from flattened node arrays.
+
+    All trees are walked together, one level per step, so a batch costs
+    max_depth rounds of array gathers however many trees there are. Leaves
+    point back to themselves, so rows that reach a leaf early just stay put.
+    """
+
+    def __init__(self, arrays: Mapping[str, np.ndarray], max_depth: int):
+        self.roots = arrays["roots"]
+        self.feature = arrays["feature"]
+        self.threshold = arrays["threshold"]
+        self.children = arrays["children"]
+        self.value = arrays["value"]
+        self.feature_importances_ = arrays["feature_importances"]
+        self.max_depth = max_depth
+
+    chunk_rows = 1024  # keeps each level's index arrays cache-sized
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        # Trees split on float32 features, as sklearn does
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        if len(X) > self.chunk_rows:
+            return np.concatenate(
+                [self.predict_proba(X[i : i + self.chunk_rows]) for i in range(0, len(X), self.chunk_rows)]
+            )
+        n_rows, n_features = X.shape
+        row_offsets = (np.arange(n_rows, dtype=np.intp) * n_features)[:, None]
+        flat = X.ravel()
+
+        node = np.repeat(self.roots[None, :].astype(np.intp), n_rows, axis=0)
+        for _ in range(self.max_depth):
+            go_right = flat[row_offsets + self.feature[node]] > self.threshold[node]
+            node = self.children[2 * node + go_right]
+        return np.column_stack([values[node].mean(axis=1) for values in self.value])
+
+
+class ArrayLogistic:
+    """Binary logistic regression from stored coefficients."""
+
+    def __init__(self, coef: np.ndarray, intercept: np.ndarray):
+        self.coef_ = coef
+        self.intercept_ = intercept
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        positive = 1.0 / (1.0 + np.exp(-(np.asarray(X) @ self.coef_[0] + self.intercept_[0])))
+        return np.column_stack([1.0 - positive, positive])
+
+
+def _forest_arrays(model) -> Dict[str, np.ndarray]:
+    """
+    Concatenate every tree's nodes into flat arrays.
+
+    children holds (left, right) pairs indexed by 2 * node + went_right, with
+    child indices offset into the combined arrays. A leaf splits on feature 0
+    at +inf and both its children are itself.
+    """
+    trees = [estimator.tree_ for estimator in model.estimators_]
+    offsets = np.cumsum([0] + [tree.node_count for tree in trees[:-1]])
+    n_classes = int(model.n_classes_)
+
+    features, thresholds, children, values = [], [], [], []
+    for tree, offset in zip(trees, offsets):
+        leaf = tree.children_left < 0
+        own = np.arange(tree.node_count) + offset
+        features.append(np.where(leaf, 0, tree.feature))
+        thresholds.append(np.where(leaf, np.inf, tree.threshold))
+        pairs = np.column_stack([tree.children_left + offset, tree.children_right + offset])
+        pairs[leaf] = own[leaf, None]
+        children.append(pairs.ravel())
+        # tree_.value holds class probabilities from scikit-learn 1.4 and
+        # weighted sample counts before it; normalising covers both
+        value = tree.value[:, 0, :n_classes]
+        values.append(value / value.sum(axis=1, keepdims=True))
+
+    return {
+        "roots": offsets.astype(np.int32),
+        "feature": np.concatenate(features).astype(np.int32),
+        "threshold": np.concatenate(thresholds).astype(np.float64),
+        "children": np.concatenate(children).astype(np.int32),
+        # Class-major so each class's leaf values are contiguous
+        "value": np.ascontiguousarray(np.concatenate(values).T),
+        "feature_importances": np.asarray(model.feature_importances_),
+    }
+
+
+def _forest_max_depth(model) -> int:
+    return int(max(estimator.tree_.max_depth for estimator in model.estimators_))
+
+
+def as_array_estimator(estimator):
+    """
+    The array form an artifact stores for a fitted estimator, or the
+    estimator itself when it has none (XGBoost, multiclass logistic).
+    """
+    kind = type(estimator).__name__
+    if kind == "RandomForestClassifier":
+        return ArrayForest(_forest_arrays(estimator), _forest_max_depth(estimator))
+    if kind == "LogisticRegression" and estimator.coef_.shape[0] == 1:
+        return ArrayLogistic(np.asarray(estimator.coef_, dtype=np.float64), np.asarray(estimator.intercept_, dtype=np.float64))
+    return estimator
+
+
+def write_artifact(
+    path: str,
+    model_type: str,
+    estimator,
+    scaler,
+    feature_columns: Sequence[str],
+    fill_values: Sequence[float],
+    params: Optional[Mapping] = None,
+    training_window: Optional[Mapping] = None,
+    metrics: Optional[Mapping] = None,
+) -> Path:
+    """
+    Write a fitted estimator and its preprocessing as an artifact directory.
+
+    The directory is built next to path and renamed into place, so readers
+    never see a half-written artifact.
+
+    Args:
+        path: Artifact directory to create (replaced if it exists)
+        model_type: GameOutcomeModel model type
+        estimator: Fitted RandomForestClassifier, LogisticRegression or XGBClassifier
+        scaler: Fitted StandardScaler
+        feature_columns: Columns in model order
+        fill_values: Per-column fill value for missing inputs
+        params: Estimator hyperparameters
+        training_window: Seasons / games the model was trained on
+        metrics: Validation metrics
+
+    Returns:
+        Path of the artifact
+    """
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    arrays = {
+        "mean": np.asarray(scaler.mean_, dtype=np.float64),
+        "scale": np.asarray(scaler.scale_, dtype=np.float64),
+        "fill_values": np.asarray(fill_values, dtype=OUTPUT_DTYPE),
+    }
+    estimator_kind = type(estimator).__name__
+    extra = {}
+    if estimator_kind == "RandomForestClassifier":
+        arrays.update(_forest_arrays(estimator))
+        extra["max_depth"] = _forest_max_depth(estimator)
+        extra["n_estimators"] = len(estimator.estimators_)
+    elif estimator_kind == "LogisticRegression":
+        if estimator.coef_.shape[0] != 1:
+            raise ArtifactError("Only binary logistic regression can be stored as arrays")
+        arrays["coef"] = np.asarray(estimator.coef_, dtype=np.float64)
+        arrays["intercept"] = np.asarray(estimator.intercept_, dtype=np.float64)
+    elif estimator_kind != "XGBClassifier":
+        raise ArtifactError(f"No artifact layout for {estimator_kind}")
+    # Scaled features are roughly standard normal
+    parity_inputs = np.random.default_rng(0).standard_normal((PARITY_ROWS, len(feature_columns))).astype(OUTPUT_DTYPE)
+    arrays["parity_inputs"] = parity_inputs
+    arrays["parity_proba"] = np.asarray(estimator.predict_proba(parity_inputs), dtype=np.float64)
+
+    staging = Path(tempfile.mkdtemp(prefix=f".{target.name}.", dir=target.parent))
+    try:
+        entries = {}
+        for name, array in arrays.items():
+            file = staging / f"{name}.npy"
+            np.save(file, np.ascontiguousarray(array))
+            entries[name] = {
+                "file": file.name,
+                "dtype": str(array.dtype),
+                "shape": list(array.shape),
+                "sha256": _file_sha256(file),
+            }
+        if estimator_kind == "XGBClassifier":
+            estimator.save_model(str(staging / "booster.ubj"))
+            extra["booster"] = {"file": "booster.ubj", "sha256": _file_sha256(staging / "booster.ubj")}
+
+        manifest = {
+            "format": FORMAT,
+            "format_version": FORMAT_VERSION,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "model_type": model_type,
+            "estimator": estimator_kind,
+            "params": dict(params or {}),
+            "feature_columns": list(feature_columns),
+            "output_dtype": OUTPUT_DTYPE,
+            "schema_hash": schema_hash(feature_columns),
+            "training_window": dict(training_window or {}),
+            "metrics": {k: float(v) for k, v in (metrics or {}).items()},
+            "arrays": entries,
+            **extra,
+        }
+        (staging / MANIFEST).write_text(json.dumps(manifest, indent=2, default=str))
+
+        if target.exists():
+            shutil.rmtree(target)
+        os.replace(staging, target)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    logging.info(f"Artifact written to {target}")
+    return target
+
+
+class ModelArtifact:
+    """
+    A read-only artifact; arrays and the estimator load on first access.
+    """
+
+    def __init__(self, path: str, manifest: Dict):
+        self.path = Path(path)
+        self.manifest = manifest
+        self._arrays: Dict[str, np.ndarray] = {}
+
+    @property
+    def model_type(self) -> str:
+        return self.manifest["model_type"]
+
+    @property
+    def feature_columns(self) -> list:
+        return list(self.manifest["feature_columns"])
+
+    def array(self, name: str) -> np.ndarray:
+        """Memory-mapped array by manifest name."""
+        if name not in self._arrays:
+            entry = self.manifest["arrays"][name]
+            self._arrays[name] = np.load(self.path / entry["file"], mmap_mode="r")
+        return self._arrays[name]
+
+    def verify(self) -> None:
+        """
+        Check every file against its recorded sha256 (reads the whole artifact),
+        then that the stored estimator reproduces the exported one's
+        predict_proba on the parity inputs.
+        """
+        files = list(self.manifest["arrays"].values())
+        if "booster" in self.manifest:
+            files.append(self.manifest["booster"])
+        for entry in files:
+            if _file_sha256(self.path / entry["file"]) != entry["sha256"]:
+                raise ArtifactError(f"{self.path / entry['file']} does not match its manifest checksum")
+
+        if "parity_inputs" in self.manifest["arrays"]:
+            expected = self.array("parity_proba")
+            actual = self.estimator.predict_proba(self.array("parity_inputs"))
+            if not np.allclose(actual, expected, rtol=0, atol=1e-6):
+                worst = float(np.max(np.abs(actual - expected)))
+                raise ArtifactError(f"{self.path} predict_proba differs from the exported model by up to {worst:.3g}")
+
+    @cached_property
+    def scaler(self) -> ArrayScaler:
+        return ArrayScaler(self.array("mean"), self.array("scale"))
+
+    @cached_property
+    def estimator(self):
+        """Object with predict_proba (and feature_importances_ for tree models)."""
+        kind = self.manifest["estimator"]
+        if kind == "RandomForestClassifier":
+            names = ["roots", "feature", "threshold", "children", "value", "feature_importances"]
+            return ArrayForest({name: self.array(name) for name in names}, self.manifest["max_depth"])
+        if kind == "LogisticRegression":
+            return ArrayLogistic(self.array("coef"), self.array("intercept"))
+
+        from xgboost import XGBClassifier
+
+        model = XGBClassifier()
+        model.load_model(str(self.path / self.manifest["booster"]["file"]))
+        return model
+
+
+def read_artifact(
+    path: str, feature_columns: Optional[Sequence[str]] = None, verify: bool = False
+) -> ModelArtifact:
+    """
+    Open an artifact, reading only its manifest.
+
+    Args:
+        path: Artifact directory
+        feature_columns: Columns the caller will score with; the artifact is
+            refused unless its schema hash matches
+        verify: Also check every file's checksum (reads every array)
+
+    Returns:
+        ModelArtifact
+    """
+    manifest_path = Path(path) / MANIFEST
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except (OSError, json.JSONDecodeError) as e:
+        raise ArtifactError(f"Cannot read {manifest_path}: {e}") from e
+
+    if manifest.get("format") != FORMAT:
+        raise ArtifactError(f"{path} is not a {FORMAT} artifact")
+    if manifest["format_version"] > FORMAT_VERSION:
+        raise ArtifactError(
+            f"{path} uses format version {manifest['format_version']}; this reader supports up to {FORMAT_VERSION}"
+        )
+    if schema_hash(manifest["feature_columns"], manifest["output_dtype"]) != manifest["schema_hash"]:
+        raise ArtifactError(f"{path} feature columns do not match its schema hash")
+    if feature_columns is not None and schema_hash(feature_columns) != manifest["schema_hash"]:
+        missing = sorted(set(feature_columns) - set(manifest["feature_columns"]))
+        extra = sorted(set(manifest["feature_columns"]) - set(feature_columns))
+        raise ArtifactSchemaError(
+            f"{path} was trained on a different feature schema (missing {missing}, extra {extra}, or reordered)"
+        )
+
+    artifact = ModelArtifact(path, manifest)
+    if verify:
+        artifact.verify()
+    return artifact
@@ -0,0 +1,170 @@
+import logging
+from typing import Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+FeatureInput = Union[pd.DataFrame, Mapping[str, object], Sequence[Mapping[str, object]]]
+
+
+def rule_fill_value(column: str) -> Optional[float]:
+    """
+    Fixed fill value for a feature, or None if it is filled from training data.
+
+    Rate features default to a coin flip, turnovers to one per game and EPA
+    to neutral; everything else takes its training median.
+    """
+    name = column.lower()
+    if 'rate' in name:
+        return 0.5
+    if 'turnovers' in name:
+        return 1.0
+    if 'epa' in name:
+        return 0.0
+    return None
+
+
+class FeaturePipeline:
+    """
+    Turns game rows into a contiguous float32 feature matrix.
+
+    Fill values are fitted once on training data and stored with the model,
+    so a single game at inference time is imputed exactly like training was.
+    """
+
+    dtype = np.float32
+
+    def __init__(self, columns: Sequence[str]):
+        """
+        Args:
+            columns: Feature columns, in model order
+        """
+        self.columns = list(columns)
+        self.fill_values: Optional[np.ndarray] = None
+        self.dtypes: Dict[str, str] = {}
+
+    @property
+    def is_fitted(self) -> bool:
+        return self.fill_values is not None
+
+    def fit(self, df: pd.DataFrame) -> 'FeaturePipeline':
+        """
+        Learn fill values and input dtypes from training rows.
+
+        Args:
+            df: Training data containing every feature column
+        """
+        self.dtypes = {column: str(df[column].dtype) for column in self.columns}
+        return self.fit_matrix(self.raw_matrix(df))
+
+    def fit_matrix(self, raw: np.ndarray) -> 'FeaturePipeline':
+        """
+        Learn fill values from an unfilled matrix (see raw_matrix).
+        """
+        # Medians skip the missing values
+        medians = np.nanmedian(raw, axis=0) if len(raw) else np.full(len(self.columns), np.nan)
+
+        fills = np.empty(len(self.columns), dtype=self.dtype)
+        for i, column in enumerate(self.columns):
+            rule = rule_fill_value(column)
+            fills[i] = rule if rule is not None else medians[i]
+        if np.isnan(fills).any():
+            empty = [c for c, v in zip(self.columns, fills) if np.isnan(v)]
+            logging.warning(f"No training values for {empty}; filling with 0")
+            fills = np.nan_to_num(fills)
+        self.fill_values = fills
+        return self
+
+    def raw_matrix(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        float32 feature matrix with missing values left as NaN.
+
+        Lets callers prepare a frame once and fit or impute slices of it.
+        """
+        return self._from_frame(df, fill=False)
+
+    def impute(self, raw: np.ndarray) -> np.ndarray:
+        """
+        Filled copy of a matrix from raw_matrix (or a slice of one).
+        """
+        return self._fill(np.array(raw, dtype=self.dtype, order='C'))
+
+    def transform(self, data: FeatureInput, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Feature matrix for a DataFrame, one record (dict) or a list of records.
+
+        Args:
+            data: Rows to prepare; records may omit features or hold None
+            out: Optional preallocated (rows, features) float32 C-contiguous
+                buffer to write into
+
+        Returns:
+            float32 array of shape (rows, len(columns)) with no missing values
+        """
+        if not self.is_fitted:
+            raise ValueError('FeaturePipeline must be fitted before transform')
+
+        if isinstance(data, pd.DataFrame):
+            return self._from_frame(data, out=out)
+        return self._from_records([data] if isinstance(data, Mapping) else data, out=out)
+
+    def _buffer(self, rows: int, out: Optional[np.ndarray]) -> np.ndarray:
+        shape = (rows, len(self.columns))
+        if out is None:
+            return np.empty(shape, dtype=self.dtype)
+        if out.shape != shape or out.dtype != self.dtype or not out.flags.c_contiguous:
+            raise ValueError(f'out must be a C-contiguous {np.dtype(self.dtype).name} array of shape {shape}')
+        return out
+
+    def _fill(self, X: np.ndarray) -> np.ndarray:
+        np.copyto(X, np.broadcast_to(self.fill_values, X.shape), where=np.isnan(X))
+        return X
+
+    def _from_frame(self, df: pd.DataFrame, out: Optional[np.ndarray] = None, fill: bool = True) -> np.ndarray:
+        X = self._buffer(len(df), out)
+        for i, column in enumerate(self.columns):
+            values = df[column].values
+            if not (isinstance(values, np.ndarray) and values.dtype.kind in 'fiub'):
+                # object / nullable extension columns take the slow coercing path
+                values = pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=self.dtype, na_value=np.nan)
+            X[:, i] = values
+        return self._fill(X) if fill else X
+
+    def _from_records(self, records: Sequence[Mapping[str, object]], out: Optional[np.ndarray] = None) -> np.ndarray:
+        X = self._buffer(len(records), out)
+        nan = float('nan')
+        X[...] = [[record.get(column, nan) for column in self.columns] for record in records]
+        return self._fill(X)
+
+    def to_dict(self) -> Dict[str, object]:
+        """Plain-Python form stored in the model artifact."""
+        return {
+            'columns': list(self.columns),
+            'fill_values': [float(v) for v in self.fill_values],
+            'dtypes': dict(self.dtypes),
+            'output_dtype': np.dtype(self.dtype).name,
+        }
+
+    @classmethod
+    def from_dict(cls, state: Mapping[str, object]) -> 'FeaturePipeline':
+        pipeline = cls(state['columns'])
+        pipeline.fill_values = np.asarray(state['fill_values'], dtype=cls.dtype)
+        pipeline.dtypes = dict(state.get('dtypes', {}))
+        return pipeline
+
+    @classmethod
+    def from_scaler(cls, columns: List[str], scaler) -> 'FeaturePipeline':
+        """
+        Pipeline for an artifact saved before fill values were stored.
+
+        The batch medians those models used aren't recoverable, so the
+        scaler's training mean stands in for them.
+        """
+        pipeline = cls(columns)
+        fills = np.asarray(scaler.mean_, dtype=cls.dtype).copy()
+        for i, column in enumerate(columns):
+            rule = rule_fill_value(column)
+            if rule is not None:
+                fills[i] = rule
+        pipeline.fill_values = fills
+        return pipeline
@@ -0,0 +1,223 @@
+"""Shared fixtures: synthetic play-by-play and training games, the dbt models rendered for the duckdb target and a local nflverse file server."""
+
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+
+import duckdb
+import jinja2
+import numpy as np
+import pandas as pd
+import pytest
+
+from ml.models.game_outcomes import FEATURE_COLUMNS
+
+DBT_MODELS = Path(__file__).resolve().parents[1] / "dbt" / "models"
+DBT_MACROS = DBT_MODELS.parent / "macros"
+TEAMS = ["BAL", "BUF", "DAL", "GB", "KC", "PHI", "SF", "TB"]
+
+
+def _make_pbp(
+    seasons: int = 2,
+    weeks: int = 12,
+    plays_per_game: int = 60,
+    seed: int = 7,
+    byes: Iterable[Tuple[int, int]] = (),
+) -> pd.DataFrame:
+    """Synthetic play-by-play where every team plays once per week, except (season, week) byes for the first pairing."""
+    rng = np.random.default_rng(seed)
+    byes = set(byes)
+    games = []
+    for season in range(2023, 2023 + seasons):
+        for week in range(1, weeks + 1):
+            order = rng.permutation(TEAMS)
+            for i, (home, away) in enumerate(zip(order[::2], order[1::2])):
+                if i == 0 and (season, week) in byes:
+                    continue
+                games.append((f"{season}_{week:02d}_{away}_{home}", season, week, home, away))
+
+    n = len(games) * plays_per_game
+    game = np.repeat(np.arange(len(games)), plays_per_game)
+    game_id, season, week, home, away = (np.array(column)[game] for column in zip(*games))
+    offense_home = rng.random(n) < 0.5
+
+    def with_nulls(values: np.ndarray, p: float = 0.05) -> np.ndarray:
+        values = values.astype("float64")
+        values[rng.random(n) < p] = np.nan
+        return values
+
+    return pd.DataFrame(
+        {
+            "game_id": game_id,
+            "season": season.astype(int),
+            "week": week.astype(int),
+            "game_date": pd.Timestamp("2023-09-07") + pd.to_timedelta((season.astype(int) - 2023) * 364 + (week.astype(int) - 1) * 7, unit="D"),
+            "posteam": np.where(rng.random(n) < 0.03, None, np.where(offense_home, home, away)),
+            "home_team": home,
+            "away_team": away,
+            "play_type": rng.choice(["pass", "run", "punt", "field_goal", "kickoff", None], n, p=[0.45, 0.35, 0.05, 0.04, 0.06, 0.05]),
+            "yards_gained": with_nulls(rng.integers(-5, 30, n)),
+            "touchdown": with_nulls(rng.random(n) < 0.04),
+            "first_down": with_nulls(rng.random(n) < 0.3),
+            "interception": with_nulls(rng.random(n) < 0.02),
+            "fumble_lost": with_nulls(rng.random(n) < 0.01),
+            "penalty": with_nulls(rng.random(n) < 0.07),
+            "epa": with_nulls(rng.normal(0, 1.2, n)),
+            "success": with_nulls(rng.random(n) < 0.45),
+            "down": with_nulls(rng.integers(1, 5, n), p=0.15),
+            "yardline_100": with_nulls(rng.integers(1, 100, n)),
+        }
+    )
+
+
+def _make_games(
+    seasons: Iterable[int] = (2019, 2020, 2021),
+    weeks: int = 6,
+    per_week: int = 8,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """Shuffled game_training_dataset rows where home EPA drives the result, with one tie."""
+    rng = np.random.default_rng(seed)
+    rows = [(s, w, g) for s in seasons for w in range(1, weeks + 1) for g in range(per_week)]
+    df = pd.DataFrame(rows, columns=["season", "week", "slot"])
+    df["game_id"] = [f"{s}_{w:02d}_{g}" for s, w, g in rows]
+    df["home_team"], df["away_team"] = "KC", "BUF"
+    features = pd.DataFrame(rng.normal(size=(len(df), len(FEATURE_COLUMNS))), columns=FEATURE_COLUMNS)
+    df = pd.concat([df, features.mask(rng.random(features.shape) < 0.05)], axis=1)
+    df["home_win"] = (df["home_avg_epa_l3"].fillna(0) + rng.normal(scale=0.5, size=len(df)) > 0).astype(float)
+    df.loc[3, "home_win"] = np.nan
+    return df.sample(frac=1, random_state=seed).reset_index(drop=True)
+
+
+class _DuckDBAdapter:
+    """Resolves adapter.dispatch() to the default__ (DuckDB) implementation of a project macro."""
+
+    def __init__(self) -> None:
+        self.macros = None
+
+    def dispatch(self, name: str, package: str = None) -> Callable[..., str]:
+        return getattr(self.macros, f"default__{name}")
+
+
+def _dialect_macros() -> SimpleNamespace:
+    """The project's dialect macros, rendered as on the duckdb target."""
+    adapter = _DuckDBAdapter()
+    template = jinja2.Template((DBT_MACROS / "dialect.sql").read_text())
+    # In dbt, return() hands back a macro's value; printing it is equivalent for SQL strings
+    adapter.macros = template.make_module({"adapter": adapter, "return": lambda value: value})
+    return SimpleNamespace(**{name: getattr(adapter.macros, name) for name in dir(adapter.macros) if not name.startswith("_")})
+
+
+def _render(model: str) -> str:
+    """Render a dbt model (full-refresh branch) for DuckDB, with ref() pointing at same-named relations."""
+    template = jinja2.Template((DBT_MODELS / model).read_text())
+    return template.render(
+        config=lambda **_: "",
+        ref=lambda name: name,
+        source=lambda source_name, name: name,
+        is_incremental=lambda: False,
+        season_partition=lambda: {},
+        season_incremental_strategy=lambda: "delete+insert",
+        dbt=SimpleNamespace(current_timestamp=lambda: "now()"),
+        **vars(_dialect_macros()),
+    )
+
+
+def _connect() -> duckdb.DuckDBPyConnection:
+    """DuckDB connection with BigQuery's null ordering, as the duckdb target sets it."""
+    con = duckdb.connect()
+    con.execute("SET default_null_order = 'nulls_first_on_asc_last_on_desc'")
+    return con
+
+
+@pytest.fixture
+def make_pbp() -> Callable[..., pd.DataFrame]:
+    """Factory for synthetic play-by-play."""
+    return _make_pbp
+
+
+@pytest.fixture
+def make_games() -> Callable[..., pd.DataFrame]:
+    """Factory for synthetic game_training_dataset rows."""
+    return _make_games
+
+
+@pytest.fixture
+def dbt_duckdb() -> Tuple[duckdb.DuckDBPyConnection, Callable[[str], str]]:
+    """A DuckDB connection and the dbt model renderer for the duckdb target."""
+    return _connect(), _render
+
+
+class _NflverseFiles(ThreadingHTTPServer):
+    """Serves files under root with ETags and 304s, logging (path, status) and failing paths on request."""
+
+    def __init__(self, root: Path) -> None:
+        super().__init__(("127.0.0.1", 0), _NflverseHandler)
+        self.root = root
+        self.requests: List[Tuple[str, int]] = []
+        self.failures: Dict[str, int] = {}  # path -> 503s to answer before serving it
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def put(self, path: str, frame: pd.DataFrame) -> None:
+        target = self.root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if path.endswith(".csv"):
+            frame.to_csv(target, index=False)
+        else:
+            frame.to_parquet(target, index=False)
+
+    def statuses(self, path: str) -> List[int]:
+        return [status for requested, status in self.requests if requested == path]
+
+
+class _NflverseHandler(BaseHTTPRequestHandler):
+    server: _NflverseFiles
+
+    def do_GET(self) -> None:
+        path = self.path.lstrip("/")
+        target = self.server.root / path
+        if self.server.failures.get(path, 0) > 0:
+            self.server.failures[path] -= 1
+            self._respond(path, 503)
+        elif not target.is_file():
+            self._respond(path, 404)
+        else:
+            content = target.read_bytes()
+            etag = f'"{hashlib.sha1(content).hexdigest()}"'
+            if self.headers.get("If-None-Match") == etag:
+                self._respond(path, 304, headers={"ETag": etag})
+            else:
+                self._respond(path, 200, content, {"ETag": etag})
+
+    def _respond(self, path: str, status: int, content: bytes = b"", headers: Dict[str, str] = None) -> None:
+        self.server.requests.append((path, status))
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def nflverse_server(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[_NflverseFiles]:
+    """Local stand-in for the nflverse release and nfldata servers, with retries made instant."""
+    server = _NflverseFiles(tmp_path / "nflverse")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr("pipeline.utils.nflverse.NFLVERSE_BASE_URL", server.url)
+    monkeypatch.setattr("pipeline.utils.nflverse.NFLDATA_BASE_URL", server.url)
+    monkeypatch.setattr("pipeline.utils.nflverse.HTTP_BACKOFF_SECONDS", 0.0)
+    yield server
+    server.shutdown()
+    server.server_close()
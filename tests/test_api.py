@@ -0,0 +1,93 @@
+"""Tests for the prediction service."""
+
+import asyncio
+from pathlib import Path
+from typing import List
+
+import joblib
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+
+from nfl_analytics.api.app import create_app
+from nfl_analytics.api.batching import MicroBatcher
+from nfl_analytics.api.predictor import load_model
+
+FEATURES = ["home_avg_epa_l3", "away_avg_epa_l3", "home_third_down_rate_l3", "home_avg_yards_l3"]
+
+
+def _save_artifact(path: Path, model, model_type: str, seed: int = 0) -> None:
+    """A small fitted model in GameOutcomeModel.save_model's format."""
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(200, len(FEATURES))) + [0.0, 0.0, 0.4, 330.0]
+    y = (X[:, 0] - X[:, 1] + rng.normal(scale=0.5, size=200) > 0).astype(int)
+    scaler = StandardScaler().fit(X)
+    model.fit(scaler.transform(X), y)
+    joblib.dump({"model": model, "scaler": scaler, "feature_columns": FEATURES, "model_type": model_type}, path)
+
+
+@pytest.fixture
+def model_dir(tmp_path: Path) -> Path:
+    _save_artifact(tmp_path / "game_outcome_lr.pkl", LogisticRegression(), "logistic_regression")
+    _save_artifact(
+        tmp_path / "game_outcome_rf.pkl",
+        RandomForestClassifier(n_estimators=10, max_depth=4, random_state=0),
+        "random_forest",
+    )
+    return tmp_path
+
+
+def test_compiled_models_match_sklearn(model_dir: Path) -> None:
+    """The fast scoring path returns the same probabilities as predict_proba."""
+    X = np.random.default_rng(1).normal(size=(50, len(FEATURES))) + [0.0, 0.0, 0.4, 330.0]
+    for name in ("lr", "rf"):
+        loaded = load_model(str(model_dir / f"game_outcome_{name}.pkl"))
+        artifact = joblib.load(model_dir / f"game_outcome_{name}.pkl")
+        expected = artifact["model"].predict_proba(artifact["scaler"].transform(X))[:, 1]
+        np.testing.assert_allclose(loaded.home_win_probability(X), expected)
+
+
+def test_predict_single_and_batch(model_dir: Path) -> None:
+    """Single and batch routes agree, and missing features are filled."""
+    game = {"game_id": "g1", "home_team": "KC", "away_team": "BUF", "features": {"home_avg_epa_l3": 2.0}}
+    with TestClient(create_app(str(model_dir))) as client:
+        assert client.get("/health").json()["models"] == ["lr", "rf"]
+
+        single = client.post("/predict?model=lr", json=game)
+        assert single.status_code == 200
+        body = single.json()
+        assert body["predicted_winner"] == "KC"
+        assert 0.5 < body["home_win_probability"] <= 1.0
+
+        other = dict(game, game_id="g2", features={"away_avg_epa_l3": 2.0})
+        batch = client.post("/predict/batch?model=lr", json={"games": [game, other]}).json()
+        assert [p["game_id"] for p in batch["predictions"]] == ["g1", "g2"]
+        assert batch["predictions"][0]["home_win_probability"] == pytest.approx(body["home_win_probability"])
+        assert batch["predictions"][1]["predicted_winner"] == "BUF"
+
+        assert client.post("/predict?model=xgb", json=game).status_code == 404
+
+
+def test_batcher_coalesces_concurrent_requests() -> None:
+    """Requests queued while the model is busy are scored in one call."""
+    calls: List[int] = []
+
+    def predict(X: np.ndarray) -> np.ndarray:
+        calls.append(len(X))
+        return X[:, 0] * 2
+
+    async def run() -> List[np.ndarray]:
+        batcher = MicroBatcher(predict, max_batch_size=64, max_wait_ms=20)
+        await batcher.start()
+        try:
+            return await asyncio.gather(*(batcher.submit(np.array([[float(i)]])) for i in range(10)))
+        finally:
+            await batcher.stop()
+
+    results = asyncio.run(run())
+    assert [float(r[0]) for r in results] == [2.0 * i for i in range(10)]
+    assert sum(calls) == 10
+    assert len(calls) < 10
@@ -0,0 +1,36 @@
+"""Tests for the walk-forward backtest."""
+
+from typing import Callable
+
+import pandas as pd
+
+from ml.backtesting.walk_forward import WalkForwardBacktest, calibration_table, summarize
+
+
+def test_folds_never_train_on_the_future(make_games: Callable[..., pd.DataFrame]) -> None:
+    """Each week is scored by a model fit only on earlier weeks."""
+    backtest = WalkForwardBacktest(make_games(), test_seasons=[2020, 2021], min_train_games=40)
+    folds = backtest.folds()
+    assert [(f.season, f.week) for f in folds] == [(s, w) for s in (2020, 2021) for w in range(1, 7)]
+
+    keys = backtest.games[["season", "week"]]
+    for fold in folds:
+        train = keys.iloc[:fold.train_end]
+        test = keys.iloc[fold.train_end:fold.test_end]
+        assert (test["season"] == fold.season).all() and (test["week"] == fold.week).all()
+        assert ((train["season"] < fold.season) | (train["week"] < fold.week)).all()
+
+
+def test_parallel_matches_serial(make_games: Callable[..., pd.DataFrame]) -> None:
+    """Fold order and worker count don't change the predictions."""
+    backtest = WalkForwardBacktest(make_games(), test_seasons=[2021], min_train_games=40)
+    serial = backtest.run(["logistic_regression"], n_jobs=1)
+    parallel = backtest.run(["logistic_regression"], n_jobs=2)
+    pd.testing.assert_frame_equal(serial, parallel)
+    assert len(serial) == 6 * 8 and serial["game_id"].str.startswith("2021").all()
+
+    by_week = summarize(serial, by=["model_type", "season", "week"])
+    assert list(by_week["week"]) == list(range(1, 7))
+    assert {"accuracy", "roc_auc", "log_loss", "brier", "calibration_error"} <= set(by_week.columns)
+    assert summarize(serial, by=["model_type"])["accuracy"].iloc[0] > 0.6
+    assert calibration_table(serial)["games"].sum() == len(serial)
@@ -0,0 +1,49 @@
+"""Tests for the benchmark harness and its result history."""
+
+from pathlib import Path
+
+import pytest
+
+from benchmarks.harness import append_history, compare, load_history, run_suite
+from benchmarks.suite import REGISTRY
+
+
+def _context(commit: str) -> dict:
+    return {"commit": commit, "dirty": False, "machine": "ci", "python": "3.11", "timestamp": "2025-01-01T00:00:00+00:00"}
+
+
+def test_suite_records_latency_throughput_and_memory() -> None:
+    """Each (benchmark, size) yields one tagged record with the measured numbers."""
+    records = run_suite(["pbp_load"], sizes=[500, 1_000], repeat=1, min_time=0, context=_context("abc1234"))
+
+    assert [(record["benchmark"], record["size"]) for record in records] == [("pbp_load", 500), ("pbp_load", 1_000)]
+    for record in records:
+        assert record["commit"] == "abc1234"
+        assert record["median_s"] > 0 and record["throughput"] > 0
+        assert record["peak_mb"] > 0
+        assert record["metrics"]["frame_mb"] > 0
+    assert {"ngs_id_mapping", "prepare_features", "train_random_forest", "predict", "model_load_joblib"} <= set(REGISTRY)
+
+
+def test_compare_flags_regressions_between_commits(tmp_path: Path) -> None:
+    """The latest commit is compared with the one run before it on the same machine."""
+    history = tmp_path / "history.jsonl"
+
+    def result(commit: str, benchmark: str, median_s: float, peak_mb: float, machine: str = "ci") -> dict:
+        return {**_context(commit), "machine": machine, "benchmark": benchmark, "size": 100, "median_s": median_s, "peak_mb": peak_mb}
+
+    append_history([result("aaa", "predict", 1.0, 50), result("aaa", "train", 2.0, 10)], str(history))
+    append_history([result("bbb", "predict", 0.5, 50), result("bbb", "train", 2.0, 40, machine="laptop")], str(history))
+    append_history([result("ccc", "predict", 0.8, 50), result("ccc", "train", 2.1, 30)], str(history))
+
+    report = compare(load_history(str(history))).set_index("benchmark")
+
+    assert report.attrs["base"] == "bbb" and report.attrs["head"] == "ccc"
+    assert report.loc["predict", "time_ratio"] == pytest.approx(1.6)
+    assert bool(report.loc["predict", "regression"])
+    # bbb has no "train" result on this machine
+    assert "train" not in report.index
+
+    against_first = compare(load_history(str(history)), base="aaa").set_index("benchmark")
+    assert not bool(against_first.loc["predict", "regression"])
+    assert bool(against_first.loc["train", "regression"])  # 10 MB -> 30 MB
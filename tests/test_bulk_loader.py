@@ -0,0 +1,138 @@
+"""Tests for the bulk loader against the local DuckDB backend."""
+
+from typing import Any, Dict, List
+
+import pandas as pd
+import pytest
+from google.api_core.exceptions import NotFound
+from google.cloud.bigquery import SchemaField
+
+from pipeline.utils.loader import BigQueryBackend, BulkLoader, DuckDBBackend, serialize_to_parquet
+
+
+@pytest.fixture
+def backend() -> DuckDBBackend:
+    """In-memory DuckDB warehouse."""
+    return DuckDBBackend(":memory:")
+
+
+def test_load_many_reports_per_table_stats(backend: DuckDBBackend) -> None:
+    """Every table is loaded and reported with rows, bytes and wall time."""
+    loader = BulkLoader(backend, max_workers=3)
+    frames = {
+        "pbp_2025": pd.DataFrame({"game_id": ["g1", "g1", "g2"], "epa": [0.1, -0.4, 1.2]}),
+        "player_stats_2025": pd.DataFrame({"player_id": ["00-1", "00-2"], "week": [1, 1]}),
+        "rosters_2025": pd.DataFrame({"player_id": ["00-1"], "team": ["KC"]}),
+    }
+
+    results = loader.load_many(frames)
+
+    assert [result.table for result in results] == list(frames)
+    for result, df in zip(results, frames.values()):
+        assert result.rows == len(df)
+        assert result.bytes > 0
+        assert result.wall_seconds >= 0
+        assert len(backend.read_table(result.table)) == len(df)
+
+
+def test_truncate_replaces_table(backend: DuckDBBackend) -> None:
+    """WRITE_TRUNCATE replaces the previous contents."""
+    loader = BulkLoader(backend)
+    loader.load("games", pd.DataFrame({"game_id": ["g1", "g2"]}))
+    loader.load("games", pd.DataFrame({"game_id": ["g3"]}))
+
+    assert backend.read_table("games")["game_id"].tolist() == ["g3"]
+
+
+def test_merge_replaces_only_incoming_keys(backend: DuckDBBackend) -> None:
+    """Merging a game deletes its old plays and leaves other games untouched."""
+    loader = BulkLoader(backend)
+    loader.merge("pbp_data", pd.DataFrame({"game_id": ["g1", "g1", "g2"], "play_id": [1, 2, 1]}), "game_id")
+    loader.merge("pbp_data", pd.DataFrame({"game_id": ["g2", "g2"], "play_id": [1, 2]}), "game_id")
+
+    table = backend.read_table("pbp_data").sort_values(["game_id", "play_id"])
+    assert table["game_id"].tolist() == ["g1", "g1", "g2", "g2"]
+    assert table["play_id"].tolist() == [1, 2, 1, 2]
+
+
+def test_failed_merge_keeps_existing_rows(backend: DuckDBBackend) -> None:
+    """The delete and insert commit together: a merge that fails to insert deletes nothing."""
+    loader = BulkLoader(backend)
+    loader.merge("pbp_data", pd.DataFrame({"game_id": ["g1", "g2"], "play_id": [1, 1]}), "game_id")
+
+    with pytest.raises(Exception, match="Conversion"):
+        loader.merge("pbp_data", pd.DataFrame({"game_id": ["g2"], "play_id": ["not a number"]}), "game_id")
+
+    assert sorted(backend.read_table("pbp_data")["game_id"]) == ["g1", "g2"]
+
+
+class _FakeBigQueryClient:
+    """Records load job configs; tables in `existing` already exist."""
+
+    def __init__(self, existing: List[str]) -> None:
+        self.existing = existing
+        self.configs: Dict[str, Any] = {}
+
+    def get_table(self, table_id: str) -> str:
+        if table_id.rsplit(".", 1)[1] not in self.existing:
+            raise NotFound(table_id)
+        return table_id
+
+    def load_table_from_file(self, _file: Any, table_id: str, job_config: Any) -> Any:
+        self.configs[table_id.rsplit(".", 1)[1]] = job_config
+        return type("Job", (), {"job_id": "job-1", "result": lambda self: None})()
+
+
+def test_bigquery_partitions_new_tables_only() -> None:
+    """Season partitioning is requested when a configured table is created, never on existing ones."""
+    client = _FakeBigQueryClient(existing=["games"])
+    backend = BigQueryBackend(client, partitioned_tables={"pbp_data": ["week", "game_id"], "games": ["week"]})
+    payload = serialize_to_parquet(pd.DataFrame({"season": [2025], "week": [1]}))
+
+    for table in ["pbp_data", "games", "rosters"]:
+        backend.load_parquet(table, payload, "WRITE_APPEND")
+
+    assert client.configs["pbp_data"].range_partitioning.field == "season"
+    assert client.configs["pbp_data"].clustering_fields == ["week", "game_id"]
+    assert client.configs["games"].range_partitioning is None
+    assert client.configs["rosters"].range_partitioning is None
+
+
+class _FakeMergeClient(_FakeBigQueryClient):
+    """Also records queries and table deletions; every table has a one-column schema."""
+
+    def __init__(self, existing: List[str]) -> None:
+        super().__init__(existing)
+        self.queries: List[str] = []
+        self.deleted: List[str] = []
+
+    def get_table(self, table_id: str) -> Any:
+        if table_id.rsplit(".", 1)[1] not in self.existing + list(self.configs):
+            raise NotFound(table_id)
+        return type("Table", (), {"schema": [SchemaField("game_id", "STRING")]})()
+
+    def query(self, sql: str) -> Any:
+        self.queries.append(sql)
+        return type("Job", (), {"job_id": "script-1", "result": lambda self: None})()
+
+    def list_jobs(self, parent_job: str) -> List[Any]:
+        return [type("Job", (), {"statement_type": "DELETE", "num_dml_affected_rows": 3})()]
+
+    def delete_table(self, table_id: str, not_found_ok: bool) -> None:
+        self.deleted.append(table_id.rsplit(".", 1)[1])
+
+
+def test_bigquery_merge_swaps_staged_rows_in_one_transaction() -> None:
+    """Rows are staged, swapped in by one DELETE + INSERT transaction, and the staging table is dropped."""
+    client = _FakeMergeClient(existing=["pbp_data"])
+    loader = BulkLoader(BigQueryBackend(client, partitioned_tables={}))
+
+    result = loader.merge("pbp_data", pd.DataFrame({"game_id": ["g1"]}), "game_id")
+
+    [staging] = [table for table in client.configs if table != "pbp_data"]
+    assert client.configs[staging].write_disposition == "WRITE_TRUNCATE"
+    [script] = client.queries
+    assert script.index("BEGIN TRANSACTION") < script.index("DELETE") < script.index("INSERT") < script.index("COMMIT")
+    assert "ROLLBACK TRANSACTION" in script and staging in script
+    assert client.deleted == [staging]
+    assert result.job_stats["deleted_rows"] == 3
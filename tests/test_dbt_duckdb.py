@@ -0,0 +1,119 @@
+"""End-to-end dbt build on the duckdb target over a synthetic raw Parquet cache."""
+
+import json
+from pathlib import Path
+from typing import Callable
+
+import duckdb
+import numpy as np
+import pandas as pd
+import pytest
+
+from ml.models.game_outcomes import FEATURE_COLUMNS
+from nfl_analytics.analytics.features import build_team_game_performance, compare_to_reference
+from pipeline.utils.cache import RawDataCache
+from pipeline.utils.dbt_runner import run_dbt
+
+DBT_PROJECT = Path(__file__).resolve().parents[1] / "dbt"
+MARTS = "+team_game_performance +player_weekly_performance +game_prediction_features +game_model_inputs +game_training_dataset"
+
+
+def _seed_raw_cache(root: Path, pbp: pd.DataFrame) -> None:
+    """Cache nflverse-shaped pulls the way the pipeline does, one entry per dataset and season."""
+    rng = np.random.default_rng(3)
+    cache = RawDataCache(root=str(root))
+    n = len(pbp)
+    plays = pbp.assign(
+        play_id=np.arange(n), season_type="REG", defteam=np.where(pbp["posteam"] == pbp["home_team"], pbp["away_team"], pbp["home_team"]),
+        ydstogo=rng.integers(1, 15, n), qtr=rng.integers(1, 5, n), time="10:00", fumble=pbp["fumble_lost"], wpa=rng.normal(0, 0.05, n),
+        passer_player_id=None, rusher_player_id=None, receiver_player_id=None,
+    )
+    games = pbp.drop_duplicates("game_id")[["game_id", "season", "week", "home_team", "away_team", "game_date"]]
+    schedules = games.assign(
+        game_type="REG", gameday=games.pop("game_date").dt.strftime("%Y-%m-%d"), gametime="13:00",
+        home_score=rng.integers(0, 45, len(games)), away_score=rng.integers(0, 45, len(games)),
+        stadium="Stadium", surface="grass", roof="outdoors",
+    )
+    # The last week of the last season is still to be played
+    unplayed = (schedules["season"] == schedules["season"].max()) & (schedules["week"] == schedules["week"].max())
+    schedules[["home_score", "away_score"]] = schedules[["home_score", "away_score"]].astype("float64").mask(unplayed)
+
+    players = pd.DataFrame([(f"00-{i:05d}", team) for i, team in enumerate(sorted(set(games["home_team"])))], columns=["player_id", "team"])
+    weekly = players.merge(games[["season", "week"]].drop_duplicates(), how="cross").rename(columns={"team": "recent_team"})
+    stats = ["attempts", "completions", "passing_yards", "passing_tds", "interceptions", "carries", "rushing_yards",
+             "rushing_tds", "targets", "receptions", "receiving_yards", "receiving_tds"]
+    weekly = weekly.assign(position="WR", **{stat: rng.integers(0, 10, len(weekly)) for stat in stats})
+    weekly = weekly.assign(fantasy_points=rng.normal(10, 5, len(weekly)), fantasy_points_ppr=rng.normal(12, 5, len(weekly)))
+    rosters = players.assign(
+        player_name="Player", position="WR", height=72, weight=200, birth_date="1998-01-01", college="State",
+        entry_year=2020, draft_number=40, years_exp=3, status="ACT", jersey_number=11, depth_chart_position="WR",
+    )
+
+    for season in sorted(int(season) for season in pbp["season"].unique()):
+        cache.store("pbp_lean", season, plays[plays["season"] == season].reset_index(drop=True))
+        cache.store("schedules", season, schedules[schedules["season"] == season].reset_index(drop=True))
+        cache.store("weekly", season, weekly[weekly["season"] == season].reset_index(drop=True))
+        cache.store("seasonal_rosters", season, rosters.assign(season=season))
+
+    # An older pull of the same season that the source views must ignore
+    stale = root / "pbp_lean" / "season=2023" / "fetch_date=2000-01-01"
+    stale.mkdir(parents=True)
+    plays[plays["season"] == 2023].head(10).to_parquet(stale / "data.parquet", index=False)
+    (stale / "manifest.json").write_text("{}")
+
+
+def _dbt(args: list, tmp_path: Path) -> list:
+    """Run dbt on the duckdb target, keeping target/ and logs/ out of the repo."""
+    return run_dbt(
+        [*args, "--target-path", str(tmp_path / "target"), "--log-path", str(tmp_path / "logs")],
+        project_dir=str(DBT_PROJECT),
+        profiles_dir=str(DBT_PROJECT),
+        target="duckdb",
+    )
+
+
+@pytest.fixture
+def duckdb_target(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, make_pbp: Callable[..., pd.DataFrame]) -> pd.DataFrame:
+    """Raw cache and DuckDB file for the duckdb target; returns the cached plays."""
+    pbp = make_pbp()
+    _seed_raw_cache(tmp_path / "raw_cache", pbp)
+    monkeypatch.setenv("NFL_RAW_CACHE_DIR", str(tmp_path / "raw_cache"))
+    monkeypatch.setenv("NFL_DBT_DUCKDB_PATH", str(tmp_path / "dbt.duckdb"))
+    return pbp
+
+
+def test_marts_build_and_pass_tests_on_duckdb(tmp_path: Path, duckdb_target: pd.DataFrame) -> None:
+    """The marts and their data tests build offline and match the pandas feature engine."""
+    nodes = _dbt(["build", "--select", MARTS], tmp_path)
+    assert {"team_game_performance", "player_weekly_performance", "game_prediction_features", "game_model_inputs", "game_training_dataset"} <= set(nodes)
+    assert any(node.startswith("valid_nfl_team_team_game_performance") for node in nodes)
+
+    with duckdb.connect(str(tmp_path / "dbt.duckdb")) as con:
+        assert con.execute("select count(*) from main.stg_pbp").fetchone()[0] == duckdb_target["posteam"].notna().sum()
+        reference = con.execute("select * from main.team_game_performance").df()
+        assert con.execute("select count(*) from main.player_weekly_performance").fetchone()[0] > 0
+        assert con.execute("select count(*) from main.game_prediction_features").fetchone()[0] > 0
+        inputs = con.execute("select * from main.game_model_inputs").df()
+        training = con.execute("select * from main.game_training_dataset").df()
+
+    last_week = duckdb_target[(duckdb_target["season"] == 2024) & (duckdb_target["week"] == duckdb_target["week"].max())]
+    assert sorted(inputs["game_id"]) == sorted(last_week["game_id"].unique())
+    assert set(FEATURE_COLUMNS) <= set(inputs.columns) and inputs[FEATURE_COLUMNS].notna().all().all()
+    assert sorted(training["game_id"]) == sorted(set(duckdb_target["game_id"]) - set(last_week["game_id"]))
+    assert set(FEATURE_COLUMNS + ["home_win"]) <= set(training.columns)
+
+    report = compare_to_reference(build_team_game_performance(duckdb_target), reference).set_index("column")
+    # row_number() leaves the order of tied values undefined (see test_features)
+    mismatched = report.drop(["yards_rank_weekly"])
+    assert mismatched["mismatches"].sum() == 0, mismatched[mismatched["mismatches"] > 0].to_string()
+
+
+def test_incremental_run_replaces_whole_seasons(tmp_path: Path, duckdb_target: pd.DataFrame) -> None:
+    """Rebuilding one season on DuckDB leaves the other seasons and the row counts unchanged."""
+    _dbt(["run", "--select", "+team_game_performance"], tmp_path)
+    _dbt(["run", "--select", "+team_game_performance", "--vars", json.dumps({"refresh_seasons": [2024]})], tmp_path)
+
+    with duckdb.connect(str(tmp_path / "dbt.duckdb")) as con:
+        counts = dict(con.execute("select season, count(*) from main.team_game_performance group by 1").fetchall())
+    expected = build_team_game_performance(duckdb_target).groupby("season").size().to_dict()
+    assert counts == expected
@@ -0,0 +1,35 @@
+"""Tests for the ingestion fan-out helper."""
+
+from functools import partial
+from typing import List
+
+from pipeline.utils.fanout import fan_out
+
+
+def _square(value: int) -> int:
+    """Module-level so it pickles for the process executor."""
+    if value < 0:
+        raise ValueError(f"negative: {value}")
+    return value * value
+
+
+def test_fan_out_isolates_failures() -> None:
+    """One failing unit is reported without stopping the others."""
+    units = {value: (_square, (value,)) for value in [1, 2, -3, 4]}
+
+    results = {result.key: result for result in fan_out(units, max_workers=4, executor="thread")}
+
+    assert {key: result.value for key, result in results.items() if result.ok} == {1: 1, 2: 4, 4: 16}
+    assert isinstance(results[-3].error, ValueError)
+    assert results[-3].value is None
+
+
+def test_fan_out_process_executor_matches_inline() -> None:
+    """Process and inline execution produce the same values."""
+    units = {season: (partial(_square), (season,)) for season in [2020, 2021, 2022]}
+
+    def values(max_workers: int, executor: str) -> List[int]:
+        results = fan_out(units, max_workers=max_workers, executor=executor)
+        return sorted(result.value for result in results)
+
+    assert values(3, "process") == values(1, "thread")
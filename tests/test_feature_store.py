@@ -0,0 +1,79 @@
+"""Tests for the point-in-time team feature store."""
+
+from typing import Callable, Tuple
+
+import numpy as np
+import pandas as pd
+
+from nfl_analytics.analytics.feature_store import STORE_FEATURES, FeatureStore, build_feature_store
+from nfl_analytics.analytics.features import build_team_game_performance, compare_to_reference
+
+# The first pairing of 2023 week 5 is dropped, giving both teams a bye
+BYES = [(2023, 5)]
+
+
+def _games(pbp: pd.DataFrame) -> pd.DataFrame:
+    """Schedule implied by the play-by-play."""
+    return pbp[["game_id", "season", "week", "game_date", "home_team", "away_team"]].drop_duplicates("game_id")
+
+
+def _bye_game(games: pd.DataFrame) -> Tuple[pd.Series, str]:
+    """A week 6 game and its team that had a bye in week 5."""
+    week5 = games[(games["season"] == 2023) & (games["week"] == 5)]
+    playing = set(week5["home_team"]) | set(week5["away_team"])
+    week6 = games[(games["season"] == 2023) & (games["week"] == 6)]
+    for _, game in week6.iterrows():
+        for team in (game["home_team"], game["away_team"]):
+            if team not in playing:
+                return game, team
+    raise AssertionError("no bye in the fixture")
+
+
+def test_matches_dbt_team_feature_store(make_pbp: Callable[..., pd.DataFrame], dbt_duckdb: Tuple) -> None:
+    """The local build matches the team_feature_store SQL row for row."""
+    pbp = make_pbp(byes=BYES)
+    games = _games(pbp)
+    performance = build_team_game_performance(pbp)
+
+    con, render = dbt_duckdb
+    con.register("stg_games", games)
+    con.register("team_game_performance", performance)
+    reference = con.execute(render("mart/team_feature_store.sql")).df()
+
+    local = build_feature_store(performance, games)
+    report = compare_to_reference(local, reference, keys=["team", "as_of_game_id"])
+    assert report["mismatches"].sum() == 0, report[report["mismatches"] > 0].to_string()
+
+
+def test_features_survive_bye_week(make_pbp: Callable[..., pd.DataFrame]) -> None:
+    """After a bye the store serves the game two weeks back instead of nothing."""
+    pbp = make_pbp(byes=BYES)
+    games = _games(pbp)
+    performance = build_team_game_performance(pbp)
+    store = build_feature_store(performance, games)
+
+    game, team = _bye_game(games)
+    row = store[(store["as_of_game_id"] == game["game_id"]) & (store["team"] == team)].iloc[0]
+    assert row["source_week"] == 4
+    assert row["weeks_since_source"] == 2
+    assert not np.isnan(row["total_epa_l3"])
+
+
+def test_game_matrix_lookups(make_pbp: Callable[..., pd.DataFrame]) -> None:
+    """game_matrix returns home/away/diff columns in request order, with null rows for unknown games."""
+    pbp = make_pbp(byes=BYES)
+    games = _games(pbp)
+    store = FeatureStore(build_feature_store(build_team_game_performance(pbp), games))
+
+    game, _ = _bye_game(games)
+    matrix = store.game_matrix([game["game_id"], "1999_01_XX_YY"])
+
+    home = store.frame.set_index(["as_of_game_id", "team"]).loc[(game["game_id"], game["home_team"])]
+    away = store.frame.set_index(["as_of_game_id", "team"]).loc[(game["game_id"], game["away_team"])]
+    assert list(matrix.index) == [game["game_id"], "1999_01_XX_YY"]
+    for feature in STORE_FEATURES:
+        assert matrix.iloc[0][f"home_{feature}"] == home[feature]
+        assert matrix.iloc[0][f"diff_{feature}"] == np.nan_to_num(home[feature]) - np.nan_to_num(away[feature])
+    assert matrix.iloc[0]["diff_season_rank"] == home["epa_rank_season"] - away["epa_rank_season"]
+    assert matrix.iloc[1][[f"home_{feature}" for feature in STORE_FEATURES]].isna().all()
+    assert matrix.iloc[1]["form_matchup"] == "mixed_form"
@@ -0,0 +1,54 @@
+"""Parity tests for the local team game feature engine against the dbt models."""
+
+from pathlib import Path
+from typing import Callable, Tuple
+
+import pandas as pd
+
+from nfl_analytics.analytics.features import (
+    build_team_game_performance,
+    compare_to_reference,
+    read_pbp_cache,
+)
+
+
+def _dbt_team_game_performance(pbp: pd.DataFrame, dbt_duckdb: Tuple) -> pd.DataFrame:
+    """Run the real stg_team_stats and team_game_performance SQL on DuckDB."""
+    con, render = dbt_duckdb
+    con.register("pbp", pbp)
+    con.execute("CREATE VIEW stg_pbp AS SELECT * FROM pbp WHERE posteam IS NOT NULL")
+    con.execute("CREATE VIEW stg_games AS SELECT DISTINCT game_id, home_team, away_team FROM pbp")
+    con.execute(f"CREATE VIEW stg_team_stats AS {render('staging/stg_team_stats.sql')}")
+    return con.execute(render("mart/team_game_performance.sql")).df()
+
+
+def test_matches_dbt_team_game_performance(make_pbp: Callable[..., pd.DataFrame], dbt_duckdb: Tuple) -> None:
+    """Every feature column matches the dbt model run over the same plays."""
+    pbp = make_pbp()
+
+    local = build_team_game_performance(pbp)
+    reference = _dbt_team_game_performance(pbp, dbt_duckdb)
+
+    assert list(local.columns) == list(reference.columns)
+    report = compare_to_reference(local, reference).set_index("column")
+    # row_number() leaves the order of tied values undefined, and integer
+    # yardage ties within a week, so that rank is checked by value instead
+    tie_ordered = ["yards_rank_weekly"]
+    mismatched = report.drop(tie_ordered)
+    assert mismatched["mismatches"].sum() == 0, mismatched[mismatched["mismatches"] > 0].to_string()
+
+    for frame in (local, reference):
+        ranked = frame.sort_values(["season", "week", "yards_rank_weekly"])
+        assert (ranked.groupby(["season", "week"])["total_yards"].diff().dropna() <= 0).all()
+
+
+def test_read_pbp_cache_takes_latest_fetch(tmp_path: Path, make_pbp: Callable[..., pd.DataFrame]) -> None:
+    """Only the newest fetch of each cached season is read."""
+    pbp = make_pbp(seasons=1, weeks=2)
+    for fetch_date, frame in [("2024-01-01", pbp.head(10)), ("2024-02-01", pbp)]:
+        entry = tmp_path / "pbp_lean" / "season=2023" / f"fetch_date={fetch_date}"
+        entry.mkdir(parents=True)
+        frame.to_parquet(entry / "data.parquet", index=False)
+        (entry / "manifest.json").write_text("{}")
+
+    assert len(read_pbp_cache(str(tmp_path), seasons=[2023])) == len(pbp)
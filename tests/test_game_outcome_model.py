@@ -0,0 +1,77 @@
+"""Tests for GameOutcomeModel's fitted feature pipeline."""
+
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+
+from ml.models.game_outcomes import FEATURE_COLUMNS, GameOutcomeModel
+from nfl_analytics.ml.feature_pipeline import FeaturePipeline
+
+
+def _training_games(n: int = 300, seed: int = 0) -> pd.DataFrame:
+    """game_training_dataset-shaped rows with some missing features."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(rng.normal(size=(n, len(FEATURE_COLUMNS))) + 100, columns=FEATURE_COLUMNS)
+    df = df.mask(rng.random(df.shape) < 0.1)
+    df["home_team"], df["away_team"] = "KC", "BUF"
+    df["home_win"] = (df["home_avg_yards_l3"].fillna(100) > df["away_avg_yards_l3"].fillna(100)).astype(float)
+    return df
+
+
+def test_single_game_imputed_like_training(tmp_path: Path) -> None:
+    """A lone game gets the training median, not the median of its own batch."""
+    df = _training_games()
+    model = GameOutcomeModel("logistic_regression")
+    model.train(df)
+
+    column = FEATURE_COLUMNS.index("home_avg_yards_l3")
+    median = model.features.fill_values[column]
+    assert 99 < median < 101
+
+    X = model.prepare_features({"home_avg_epa_l3": 0.2})
+    assert X.dtype == np.float32 and X.flags.c_contiguous and X.shape == (1, len(FEATURE_COLUMNS))
+    assert X[0, column] == median
+    assert X[0, FEATURE_COLUMNS.index("home_third_down_rate_l3")] == 0.5
+    assert X[0, FEATURE_COLUMNS.index("home_turnovers_l3")] == 1.0
+
+    path = tmp_path / "model.pkl"
+    model.save_model(str(path))
+    loaded = GameOutcomeModel()
+    loaded.load_model(str(path))
+    np.testing.assert_array_equal(loaded.features.fill_values, model.features.fill_values)
+    np.testing.assert_allclose(loaded.predict_proba(df.head(5)), model.predict_proba(df.head(5)))
+
+
+def test_records_match_dataframe() -> None:
+    """Dicts, records and DataFrames produce the same matrix."""
+    df = _training_games(50)
+    df["home_top_secs_l3"] = df["home_top_secs_l3"].astype(object)  # pd.to_numeric path
+    pipeline = FeaturePipeline(FEATURE_COLUMNS).fit(df)
+
+    records = [{k: (None if pd.isna(v) else v) for k, v in row.items()} for row in df[FEATURE_COLUMNS].to_dict("records")]
+    from_frame = pipeline.transform(df)
+    np.testing.assert_array_equal(pipeline.transform(records), from_frame)
+    np.testing.assert_array_equal(pipeline.transform(records[3]), from_frame[3:4])
+
+    out = np.empty_like(from_frame)
+    assert pipeline.transform(df, out=out) is out
+    with pytest.raises(ValueError):
+        pipeline.transform(df, out=np.empty((1, len(FEATURE_COLUMNS)), dtype=np.float32))
+
+
+def test_loads_artifact_without_fill_values(tmp_path: Path) -> None:
+    """Older artifacts fall back to the scaler's training mean."""
+    df = _training_games()
+    model = GameOutcomeModel("logistic_regression")
+    model.train(df)
+    path = tmp_path / "legacy.pkl"
+    artifact = {k: getattr(model, k) for k in ("model", "scaler", "feature_columns", "model_type")}
+    joblib.dump(artifact, path)
+
+    loaded = GameOutcomeModel()
+    loaded.load_model(str(path))
+    column = FEATURE_COLUMNS.index("home_avg_yards_l3")
+    assert loaded.prepare_features({})[0, column] == np.float32(model.scaler.mean_[column])
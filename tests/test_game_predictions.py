@@ -0,0 +1,123 @@
+"""Tests for incremental batch scoring of upcoming games."""
+
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pytest
+from dagster import materialize
+
+from ml.models.game_outcomes import FEATURE_COLUMNS, GameOutcomeModel
+from pipeline.assets.nfl_predictions import game_predictions
+from pipeline.resources import WarehouseResource
+
+
+def _mart(pbp: pd.DataFrame, dbt_duckdb: Tuple, model: str = "game_model_inputs", played_weeks: Optional[int] = None) -> pd.DataFrame:
+    """Run a real game_model_features mart on DuckDB over plays of the first played_weeks weeks, default all but the last."""
+    con, render = dbt_duckdb
+    played_weeks = int(pbp["week"].max()) - 1 if played_weeks is None else played_weeks
+    # Four 15-minute quarters spread evenly over each game's snaps
+    elapsed = pbp.groupby("game_id").cumcount() * 3600 // pbp.groupby("game_id")["game_id"].transform("size")
+    remaining = 900 - elapsed % 900
+    plays = pbp.assign(
+        play_id=np.arange(len(pbp)),
+        quarter=elapsed // 900 + 1,
+        time_remaining=[f"{seconds // 60:02d}:{seconds % 60:02d}" for seconds in remaining],
+    )
+    games = pbp.drop_duplicates("game_id")
+    con.register("pbp", plays[plays["week"] <= played_weeks])
+    con.register("schedule", games.assign(home_score=20, away_score=np.arange(len(games)) % 3 * 10))
+    con.execute("CREATE OR REPLACE VIEW stg_pbp AS SELECT * FROM pbp WHERE posteam IS NOT NULL")
+    con.execute(
+        f"""CREATE OR REPLACE VIEW stg_games AS
+        SELECT game_id, season, week, game_date, home_team, away_team,
+               CASE WHEN week <= {played_weeks} THEN home_score END AS home_score,
+               CASE WHEN week <= {played_weeks} THEN away_score END AS away_score,
+               CASE WHEN week > {played_weeks} THEN NULL WHEN home_score > away_score THEN 1 WHEN away_score > home_score THEN 0 END AS home_win,
+               CASE WHEN week <= {played_weeks} THEN 'completed' ELSE 'scheduled' END AS game_status,
+               week = {played_weeks} + 1 AS upcoming_week
+        FROM schedule"""
+    )
+    con.execute(f"CREATE OR REPLACE VIEW stg_team_stats AS {render('staging/stg_team_stats.sql')}")
+    con.execute(f"CREATE OR REPLACE VIEW game_model_features AS {render('mart/game_model_features.sql')}")
+    return con.execute(render(f"mart/{model}.sql")).df()
+
+
+def _train(games: pd.DataFrame, seed: int) -> None:
+    model = GameOutcomeModel("random_forest", {"n_estimators": 20, "random_state": seed})
+    model.train(games)
+    model.save_artifact("models/game_outcome_rf.model")
+
+
+@pytest.fixture
+def warehouse(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, make_games: Callable[..., pd.DataFrame]) -> WarehouseResource:
+    """A DuckDB warehouse and the 'rf' serving model trained on synthetic games."""
+    monkeypatch.chdir(tmp_path)
+    _train(make_games(), seed=0)
+    return WarehouseResource(backend="duckdb", duckdb_path=str(tmp_path / "warehouse.duckdb"))
+
+
+def _materialize(warehouse: WarehouseResource, inputs: pd.DataFrame, updated_at: str, **kwargs):
+    warehouse.loader.load("game_model_inputs", inputs.assign(updated_at=pd.Timestamp(updated_at)), write_disposition="WRITE_TRUNCATE")
+    return materialize([game_predictions], resources={"warehouse": warehouse}, **kwargs)
+
+
+def _run(warehouse: WarehouseResource, inputs: pd.DataFrame, updated_at: str) -> pd.DataFrame:
+    return _materialize(warehouse, inputs, updated_at).output_for_node("game_predictions")
+
+
+def test_rescores_only_changed_games_and_models(
+    warehouse: WarehouseResource,
+    make_games: Callable[..., pd.DataFrame],
+    make_pbp: Callable[..., pd.DataFrame],
+    dbt_duckdb: Tuple,
+) -> None:
+    """A dbt rebuild with the same inputs scores nothing; changed features or a retrained model are re-scored."""
+    inputs = _mart(make_pbp(seasons=1, weeks=5), dbt_duckdb)
+    assert set(FEATURE_COLUMNS) <= set(inputs.columns) and inputs["betting_relevant"].all()
+
+    first = _run(warehouse, inputs, "2025-09-01")
+    stored = warehouse.loader.backend.read_table("game_predictions")
+    assert len(first) == len(stored) == len(inputs)
+    assert stored["model_version"].nunique() == 1 and stored["feature_hash"].notna().all()
+    assert stored["home_win_probability"].between(0, 1).all()
+
+    assert _run(warehouse, inputs, "2025-09-02").empty
+
+    moved = inputs.copy()
+    moved.loc[0, "home_avg_epa_l3"] += 3.0
+    assert _run(warehouse, moved, "2025-09-03")["game_id"].tolist() == [inputs.loc[0, "game_id"]]
+
+    _train(make_games(), seed=1)
+    retrained = _run(warehouse, moved, "2025-09-04")
+    stored = warehouse.loader.backend.read_table("game_predictions").set_index("game_id")
+    assert len(retrained) == len(stored) == len(inputs)
+    assert stored["model_version"].nunique() == 1 and stored["model_version"].iloc[0] != first["model_version"].iloc[0]
+    np.testing.assert_array_equal(stored.loc[retrained["game_id"], "scored_at"], retrained["scored_at"])
+
+
+def test_missing_model_inputs_fail_before_scoring(
+    warehouse: WarehouseResource, make_pbp: Callable[..., pd.DataFrame], dbt_duckdb: Tuple
+) -> None:
+    """A feature table without the model's columns fails with the missing ones named and writes nothing."""
+    inputs = _mart(make_pbp(seasons=1, weeks=5), dbt_duckdb).drop(columns=["home_top_secs_l3", "away_rz_first_downs_wm1"])
+
+    result = _materialize(warehouse, inputs, "2025-09-01", raise_on_error=False)
+
+    assert not result.success
+    error = result.get_step_failure_events()[0].step_failure_data.error.cause
+    assert error.cls_name == "ValueError"
+    assert "missing 2 of the 22 inputs of model 'rf': home_top_secs_l3, away_rz_first_downs_wm1" in error.message
+    assert warehouse.read_keys("game_predictions", "game_id", inputs["game_id"].tolist()).empty
+
+
+def test_training_rows_carry_the_inputs_games_were_scored_with(make_pbp: Callable[..., pd.DataFrame], dbt_duckdb: Tuple) -> None:
+    """Once a week is played, game_training_dataset has the same inputs game_model_inputs served for it, plus the result."""
+    pbp = make_pbp(seasons=1, weeks=5)
+    served = _mart(pbp, dbt_duckdb).set_index("game_id")
+    training = _mart(pbp, dbt_duckdb, "game_training_dataset", played_weeks=5).set_index("game_id")
+
+    assert len(training) == pbp["game_id"].nunique()
+    pd.testing.assert_frame_equal(training.loc[served.index, FEATURE_COLUMNS], served[FEATURE_COLUMNS])
+    assert training[["home_score", "away_score"]].notna().all().all() and training["home_win"].isin([0, 1]).any()
@@ -0,0 +1,133 @@
+"""Tests for the sensor-driven in-season pipeline."""
+
+import json
+import uuid
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, List
+
+import pandas as pd
+import pytest
+from dagster import DagsterInstance, DagsterRun, DagsterRunStatus, RunRequest, SkipReason, build_sensor_context, materialize
+
+from pipeline.assets.nfl_live import live_pbp
+from pipeline.resources import WarehouseResource
+from pipeline.sensors import completed_games
+from pipeline.utils.watermarks import WatermarkStore
+
+
+def _schedule(finals: List[int]) -> pd.DataFrame:
+    """Week 1 of 2023 with home scores for the given game indices and nulls elsewhere."""
+    game_ids = ["2023_01_BAL_KC", "2023_01_GB_PHI", "2023_01_DAL_SF", "2023_01_BUF_TB"]
+    return pd.DataFrame(
+        {
+            "game_id": game_ids,
+            "season": 2023,
+            "week": 1,
+            "home_score": [24.0 if i in finals else None for i in range(len(game_ids))],
+            "away_score": [17.0 if i in finals else None for i in range(len(game_ids))],
+        }
+    )
+
+
+def test_sensor_requests_only_new_and_corrected_finals(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The first tick sets a baseline; later ticks request games that went final or changed score."""
+    schedules = iter([_schedule([0]), _schedule([0]), _schedule([0, 1, 2]), _schedule([0, 1, 2])])
+    monkeypatch.setattr(completed_games, "load_current_schedule", lambda: next(schedules))
+    context = build_sensor_context(instance=DagsterInstance.ephemeral())
+
+    assert isinstance(completed_games.completed_games_sensor(context), SkipReason)
+    assert isinstance(completed_games.completed_games_sensor(context), SkipReason)
+
+    request = completed_games.completed_games_sensor(context)
+    assert isinstance(request, RunRequest)
+    assert request.run_config["ops"]["live_pbp"]["config"]["game_ids"] == ["2023_01_DAL_SF", "2023_01_GB_PHI"]
+
+    corrected = _schedule([0, 1, 2])
+    corrected.loc[1, "home_score"] = 27.0
+    monkeypatch.setattr(completed_games, "load_current_schedule", lambda: corrected)
+    request = completed_games.completed_games_sensor(context)
+    assert request.run_config["ops"]["live_pbp"]["config"]["game_ids"] == ["2023_01_GB_PHI"]
+    cursor = json.loads(context.cursor)
+    assert set(cursor["loaded"]) == {"2023_01_BAL_KC"}
+    assert sorted(sorted(finals) for finals in cursor["requested"].values()) == [["2023_01_DAL_SF", "2023_01_GB_PHI"], ["2023_01_GB_PHI"]]
+
+
+def _finish(instance: DagsterInstance, request: RunRequest, status: DagsterRunStatus) -> None:
+    """Record the run Dagster would have launched for a request, ended with status."""
+    instance.add_run(
+        DagsterRun(job_name="live_update_job", run_id=str(uuid.uuid4()), status=status, tags={completed_games.RUN_KEY_TAG: request.run_key})
+    )
+
+
+def test_sensor_marks_finals_loaded_only_after_their_run_succeeds(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Games of a failed run are requested again under a new run key; a successful run retires them."""
+    schedules = iter([_schedule([0]), *[_schedule([0, 1])] * 4])
+    monkeypatch.setattr(completed_games, "load_current_schedule", lambda: next(schedules))
+    instance = DagsterInstance.ephemeral()
+    context = build_sensor_context(instance=instance)
+    completed_games.completed_games_sensor(context)
+
+    first = completed_games.completed_games_sensor(context)
+    assert first.run_config["ops"]["live_pbp"]["config"]["game_ids"] == ["2023_01_GB_PHI"]
+    assert isinstance(completed_games.completed_games_sensor(context), SkipReason)  # still running
+
+    _finish(instance, first, DagsterRunStatus.FAILURE)
+    retry = completed_games.completed_games_sensor(context)
+    assert retry.run_config == first.run_config and retry.run_key != first.run_key
+
+    _finish(instance, retry, DagsterRunStatus.SUCCESS)
+    assert isinstance(completed_games.completed_games_sensor(context), SkipReason)
+    cursor = json.loads(context.cursor)
+    assert set(cursor["loaded"]) == {"2023_01_BAL_KC", "2023_01_GB_PHI"} and cursor["requested"] == {}
+
+
+def test_live_pbp_merges_only_requested_games(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    make_pbp: Callable[..., pd.DataFrame],
+    nflverse_server: ThreadingHTTPServer,
+) -> None:
+    """Only the requested games are written, and the nightly nfl_pbp watermark learns about them."""
+    monkeypatch.chdir(tmp_path)
+    pbp = make_pbp(seasons=1, weeks=2)
+    nflverse_server.put("pbp/play_by_play_2023.parquet", pbp)
+    game_ids = sorted(pbp.loc[pbp["week"] == 2, "game_id"].unique())[:2]
+    warehouse = WarehouseResource(backend="duckdb", duckdb_path=str(tmp_path / "warehouse.duckdb"))
+
+    result = materialize(
+        [live_pbp],
+        resources={"warehouse": warehouse},
+        run_config={"ops": {"live_pbp": {"config": {"game_ids": game_ids}}}},
+    )
+
+    summary = result.output_for_node("live_pbp")
+    assert sorted(summary["game_id"]) == game_ids and (summary["plays"] == 60).all()
+    stored = warehouse.loader.backend.read_table("pbp_data")
+    assert sorted(stored["game_id"].unique()) == game_ids
+    assert sorted(WatermarkStore("nfl_pbp").get("2023|2")) == game_ids
+
+
+def test_live_pbp_retries_until_plays_are_published(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    make_pbp: Callable[..., pd.DataFrame],
+    nflverse_server: ThreadingHTTPServer,
+) -> None:
+    """A final with no plays yet fails the load after the available games are written."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("pipeline.assets.nfl_live.LIVE_PBP_MAX_RETRIES", 0)
+    pbp = make_pbp(seasons=1, weeks=1)
+    nflverse_server.put("pbp/play_by_play_2023.parquet", pbp)
+    published = str(pbp["game_id"].iloc[0])
+    warehouse = WarehouseResource(backend="duckdb", duckdb_path=str(tmp_path / "warehouse.duckdb"))
+
+    result = materialize(
+        [live_pbp],
+        resources={"warehouse": warehouse},
+        run_config={"ops": {"live_pbp": {"config": {"game_ids": [published, "2023_01_NYJ_NE"]}}}},
+        raise_on_error=False,
+    )
+
+    assert not result.success
+    assert list(warehouse.loader.backend.read_table("pbp_data")["game_id"].unique()) == [published]
@@ -0,0 +1,92 @@
+"""Tests for the memory-mapped model artifact format."""
+
+import json
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ml.models.game_outcomes import FEATURE_COLUMNS, GameOutcomeModel
+from nfl_analytics.api.predictor import load_models
+from nfl_analytics.ml.artifact import ArtifactError, ArtifactSchemaError, _file_sha256, _forest_arrays, read_artifact
+
+
+@pytest.mark.parametrize("model_type", ["random_forest", "logistic_regression", "xgboost"])
+def test_artifact_round_trip(tmp_path: Path, make_games: Callable[..., pd.DataFrame], model_type: str) -> None:
+    """A loaded artifact predicts like the trained model and keeps its arrays on disk."""
+    games = make_games()
+    params = {"n_estimators": 20} if model_type != "logistic_regression" else None
+    model = GameOutcomeModel(model_type, params)
+    model.train(games)
+    model.save_artifact(str(tmp_path / "game_outcome.model"))
+
+    loaded = GameOutcomeModel()
+    loaded.load_artifact(str(tmp_path / "game_outcome.model"), verify=True)
+    np.testing.assert_allclose(loaded.predict_proba(games), model.predict_proba(games), atol=1e-6)
+    assert loaded.training_window == {"games": len(games) - 1, "first_season": 2019, "last_season": 2021}
+    assert set(loaded.metrics) >= {"accuracy", "roc_auc"}
+    assert isinstance(loaded.scaler.mean_, np.memmap)
+
+
+def test_refuses_other_schemas_and_versions(tmp_path: Path, make_games: Callable[..., pd.DataFrame]) -> None:
+    """Reordered features, newer formats and corrupted arrays are rejected."""
+    model = GameOutcomeModel("logistic_regression")
+    model.train(make_games())
+    path = tmp_path / "game_outcome_lr.model"
+    model.save_artifact(str(path))
+
+    with pytest.raises(ArtifactSchemaError):
+        read_artifact(str(path), feature_columns=FEATURE_COLUMNS[::-1])
+
+    manifest = json.loads((path / "manifest.json").read_text())
+    (path / "manifest.json").write_text(json.dumps({**manifest, "format_version": 99}))
+    with pytest.raises(ArtifactError, match="format version 99"):
+        read_artifact(str(path))
+    (path / "manifest.json").write_text(json.dumps(manifest))
+
+    np.save(path / "coef.npy", np.zeros((1, len(FEATURE_COLUMNS))))
+    with pytest.raises(ArtifactError, match="checksum"):
+        read_artifact(str(path), verify=True)
+
+
+def test_forest_leaves_holding_counts_export_as_probabilities(make_games: Callable[..., pd.DataFrame]) -> None:
+    """Leaf class counts, as scikit-learn < 1.4 stores them, export as the same probabilities."""
+    model = GameOutcomeModel("random_forest", {"n_estimators": 10})
+    model.train(make_games())
+    probabilities = _forest_arrays(model.model)["value"]
+    for tree in (estimator.tree_ for estimator in model.model.estimators_):
+        tree.value[:] *= tree.weighted_n_node_samples[:, None, None]
+
+    np.testing.assert_allclose(_forest_arrays(model.model)["value"], probabilities)
+
+
+def test_verify_checks_predict_proba_parity(tmp_path: Path, make_games: Callable[..., pd.DataFrame]) -> None:
+    """A forest whose arrays no longer reproduce the exported model fails verify() even with valid checksums."""
+    model = GameOutcomeModel("random_forest", {"n_estimators": 10})
+    model.train(make_games())
+    path = tmp_path / "game_outcome_rf.model"
+    model.save_artifact(str(path))
+    read_artifact(str(path), verify=True)
+
+    np.save(path / "value.npy", np.load(path / "value.npy")[::-1])
+    manifest = json.loads((path / "manifest.json").read_text())
+    manifest["arrays"]["value"]["sha256"] = _file_sha256(path / "value.npy")
+    (path / "manifest.json").write_text(json.dumps(manifest))
+    with pytest.raises(ArtifactError, match="predict_proba differs"):
+        read_artifact(str(path), verify=True)
+
+
+def test_service_prefers_artifact_over_pickle(tmp_path: Path, make_games: Callable[..., pd.DataFrame]) -> None:
+    """The prediction service serves a .model directory in place of the same-named .pkl."""
+    games = make_games()
+    model = GameOutcomeModel("random_forest", {"n_estimators": 10})
+    model.train(games)
+    model.save_model(str(tmp_path / "game_outcome_rf.pkl"))
+    model.save_artifact(str(tmp_path / "game_outcome_rf.model"))
+
+    served = load_models(str(tmp_path))["rf"]
+    X = served.vectorize(games[FEATURE_COLUMNS].astype(object).where(games[FEATURE_COLUMNS].notna(), None).to_dict("records"))
+    assert isinstance(served.scaler.mean_, np.memmap)
+    np.testing.assert_allclose(served.home_win_probability(X), model.predict_proba(games), atol=1e-6)
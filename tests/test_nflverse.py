@@ -0,0 +1,69 @@
+"""Tests for the async nflverse fetch layer against a local file server."""
+
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from pipeline.utils.cache import RawDataCache
+from pipeline.utils.nflverse import RELEASES
+
+
+def _weekly(season: int, rows: int = 20) -> pd.DataFrame:
+    return pd.DataFrame({"player_id": [f"00-{i:07d}" for i in range(rows)], "season": season, "fantasy_points": np.arange(rows) * 1.5})
+
+
+def test_unchanged_files_are_not_downloaded_again(tmp_path: Path, nflverse_server: ThreadingHTTPServer) -> None:
+    """A refresh sends the cached ETag; 304s reuse the cached copy and only the changed season is downloaded."""
+    for season in (2023, 2024):
+        nflverse_server.put(f"player_stats/player_stats_{season}.parquet", _weekly(season))
+    cache = RawDataCache(root=str(tmp_path / "cache"))
+
+    first = {result.key: result.value for result in cache.iter_seasons("weekly", [2023, 2024], RELEASES["weekly"])}
+    assert first[2024].frame["fantasy_points"].dtype == np.float32
+    assert not first[2024].from_cache and first[2024].validators["etag"]
+
+    nflverse_server.put("player_stats/player_stats_2024.parquet", _weekly(2024, rows=25))
+    refreshed = {
+        result.key: result.value
+        for result in cache.iter_seasons("weekly", [2023, 2024], RELEASES["weekly"], force_refresh=True)
+    }
+
+    assert nflverse_server.statuses("player_stats/player_stats_2023.parquet") == [200, 304]
+    assert nflverse_server.statuses("player_stats/player_stats_2024.parquet") == [200, 200]
+    assert refreshed[2023].from_cache and refreshed[2023].content_hash == first[2023].content_hash
+    assert len(refreshed[2024].frame) == 25
+    assert cache.lookup("weekly", 2023).fetch_date == refreshed[2023].fetch_date
+
+
+def test_shared_file_is_downloaded_once_and_split_by_season(
+    tmp_path: Path, nflverse_server: ThreadingHTTPServer
+) -> None:
+    """NGS files cover every season: one request serves every (stat type, season) pull."""
+    nflverse_server.put("nextgen_stats/ngs_passing.parquet", _weekly(2022).assign(season=[2022, 2023] * 10))
+    cache = RawDataCache(root=str(tmp_path / "cache"))
+
+    pulls = {
+        result.key: result.value
+        for result in cache.iter_pulls({("ngs_passing", season): RELEASES["ngs_passing"] for season in (2022, 2023)})
+    }
+
+    assert nflverse_server.statuses("nextgen_stats/ngs_passing.parquet") == [200]
+    assert [len(pull.frame) for pull in pulls.values()] == [10, 10]
+    assert (pulls[("ngs_passing", 2023)].frame["season"] == 2023).all()
+
+
+def test_transient_errors_are_retried_and_missing_files_fail(
+    tmp_path: Path, nflverse_server: ThreadingHTTPServer
+) -> None:
+    """503s are retried with backoff; a 404 fails that pull without affecting the others."""
+    nflverse_server.put("player_stats/player_stats_2023.parquet", _weekly(2023))
+    nflverse_server.failures["player_stats/player_stats_2023.parquet"] = 2
+    cache = RawDataCache(root=str(tmp_path / "cache"))
+
+    results = {result.key: result for result in cache.iter_seasons("weekly", [2023, 2031], RELEASES["weekly"])}
+
+    assert nflverse_server.statuses("player_stats/player_stats_2023.parquet") == [503, 503, 200]
+    assert results[2023].ok and len(results[2023].value.frame) == 20
+    assert not results[2031].ok and results[2031].value is None
@@ -0,0 +1,88 @@
+"""Tests for the indexed, memory-mapped play store."""
+
+from pathlib import Path
+from typing import Callable, Tuple
+
+import numpy as np
+import pandas as pd
+
+from nfl_analytics.data.play_store import PlayStore, load_play_store
+
+
+def _with_stg_columns(pbp: pd.DataFrame) -> pd.DataFrame:
+    """The raw columns stg_pbp reads that the synthetic play-by-play leaves out."""
+    rng = np.random.default_rng(11)
+    n = len(pbp)
+    return pbp.assign(
+        play_id=np.arange(n, dtype="float64"),
+        defteam=np.where(pbp["posteam"] == pbp["home_team"], pbp["away_team"], pbp["home_team"]),
+        ydstogo=rng.integers(1, 15, n).astype("float64"), qtr=rng.integers(1, 5, n).astype("float64"), time="10:00",
+        fumble=pbp["fumble_lost"], wpa=rng.normal(0, 0.05, n),
+        passer_player_id=np.where(rng.random(n) < 0.4, rng.choice(["00-0001", "00-0002"], n), None),
+        rusher_player_id=np.where(rng.random(n) < 0.3, rng.choice(["00-0002", "00-0003"], n), None),
+        receiver_player_id=None,
+    )
+
+
+def test_splits_match_stg_pbp(make_pbp: Callable[..., pd.DataFrame], dbt_duckdb: Tuple) -> None:
+    """Filtered group-bys equal the same aggregation over the real stg_pbp SQL."""
+    pbp = _with_stg_columns(make_pbp(seasons=2, weeks=6))
+    con, render = dbt_duckdb
+    con.register("pbp_data", pbp)
+    con.execute(f"CREATE VIEW stg_pbp AS {render('staging/stg_pbp.sql')}")
+    store = PlayStore.from_pbp(pbp)
+
+    local = store.filter(last_weeks=5, down_situation="short_third_down").group_by(
+        "posteam", epa_per_play=("epa", "mean"), epa=("epa", "sum"), epa_plays=("epa", "count")
+    )
+    # The last 5 weeks present are weeks 2-6 of 2024
+    reference = con.execute(
+        """
+        select posteam, count(*) as plays, avg(epa) as epa_per_play, coalesce(sum(epa), 0) as epa, count(epa) as epa_plays
+        from stg_pbp
+        where down_situation = 'short_third_down' and season * 100 + week >= 202402
+        group by posteam order by posteam
+        """
+    ).df()
+    pd.testing.assert_frame_equal(local, reference, check_dtype=False, rtol=1e-5)
+
+    red_zone = store.filter(posteam="KC", field_position="red_zone", play_category="offensive", quarter=[3, 4])
+    expected = con.execute(
+        "select count(*), avg(success) from stg_pbp where posteam = 'KC' and field_position = 'red_zone'"
+        " and play_category = 'offensive' and quarter in (3, 4)"
+    ).fetchone()
+    summary = red_zone.agg()
+    assert summary["plays"] == expected[0] and np.isclose(summary["success_rate"], expected[1])
+
+    by_player = store.filter(player="00-0002", season=2024).to_frame(["passer_id", "rusher_id"])
+    assert ((by_player["passer_id"] == "00-0002") | (by_player["rusher_id"] == "00-0002")).all()
+    assert len(by_player) == con.execute(
+        "select count(*) from stg_pbp where season = 2024 and '00-0002' in (passer_id, rusher_id)"
+    ).fetchone()[0]
+    assert len(store.filter(posteam="NOPE")) == 0
+
+
+def test_store_is_memory_mapped_and_rebuilt_from_newer_fetches(
+    tmp_path: Path, make_pbp: Callable[..., pd.DataFrame]
+) -> None:
+    """load_play_store reuses the saved store until the raw cache holds a newer fetch."""
+    pbp = _with_stg_columns(make_pbp(seasons=1, weeks=4))
+    cache_root, path = tmp_path / "cache", str(tmp_path / "plays")
+
+    def cache(fetch_date: str, frame: pd.DataFrame) -> None:
+        entry = cache_root / "pbp_lean" / "season=2023" / f"fetch_date={fetch_date}"
+        entry.mkdir(parents=True)
+        frame.to_parquet(entry / "data.parquet", index=False)
+        (entry / "manifest.json").write_text("{}")
+
+    cache("2024-01-01", pbp[pbp["week"] <= 3])
+    first = load_play_store(path, str(cache_root))
+    assert first.periods.tolist() == [202301, 202302, 202303]
+    assert load_play_store(path, str(cache_root)).sources == first.sources
+
+    cache("2024-02-01", pbp)
+    store = load_play_store(path, str(cache_root))
+
+    assert isinstance(store.arrays["epa"], np.memmap) and isinstance(store.arrays["posteam.order"], np.memmap)
+    assert len(store) == pbp["posteam"].notna().sum()
+    assert store.filter(last_weeks=1).group_by("week")["week"].tolist() == [4]
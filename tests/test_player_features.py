@@ -0,0 +1,99 @@
+"""Parity and scoring tests for the local player projection engine."""
+
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from nfl_analytics.analytics.features import compare_to_reference
+from nfl_analytics.analytics.player_features import (
+    DEFAULT_SCORING,
+    PPR_SCORING,
+    SCORING_STATS,
+    PlayerProjectionEngine,
+    scoring_matrix,
+    stg_player_stats,
+)
+
+COUNT_STATS = ["attempts", "completions", "passing_yards", "passing_tds", "interceptions", "carries", "rushing_yards",
+               "rushing_tds", "targets", "receptions", "receiving_yards", "receiving_tds", "rushing_fumbles_lost"]
+
+
+def _weekly(players: int = 40, seasons: Tuple[int, ...] = (2023, 2024), weeks: int = 10, seed: int = 5) -> pd.DataFrame:
+    """Raw nflverse-shaped weekly stats; players miss random weeks and some stats are null."""
+    rng = np.random.default_rng(seed)
+    rows = [(f"00-{p:07d}", s, w) for p in range(players) for s in seasons for w in range(1, weeks + 1)]
+    weekly = pd.DataFrame(rows, columns=["player_id", "season", "week"]).sample(frac=0.8, random_state=seed)
+    n = len(weekly)
+    weekly = weekly.assign(recent_team=rng.choice(["KC", "BUF"], n), position=rng.choice(["QB", "RB", "WR"], n))
+    for stat in COUNT_STATS:
+        values = rng.integers(0, 12, n).astype("float64")
+        values[rng.random(n) < 0.05] = np.nan
+        weekly[stat] = values
+    weekly["fantasy_points"] = rng.normal(10, 6, n)
+    weekly.loc[weekly.index[rng.random(n) < 0.05], "fantasy_points"] = np.nan
+    weekly["fantasy_points_ppr"] = weekly["fantasy_points"] + weekly["receptions"]
+    return weekly.reset_index(drop=True)
+
+
+def _dbt_player_weekly_performance(weekly: pd.DataFrame, dbt_duckdb: Tuple) -> pd.DataFrame:
+    """Run the real stg_player_stats and player_weekly_performance SQL on DuckDB, with empty context joins."""
+    con, render = dbt_duckdb
+    con.register("player_stats", weekly)
+    con.execute(f"CREATE VIEW stg_player_stats AS {render('staging/stg_player_stats.sql')}")
+    con.execute(
+        "CREATE VIEW stg_players AS SELECT DISTINCT player_id, 'Player' AS player_name, 'WR' AS position_group,"
+        " 25 AS age, 3 AS nfl_experience, 'day_two' AS draft_pedigree FROM player_stats"
+    )
+    con.execute(
+        "CREATE VIEW stg_rosters AS SELECT player_id, season, 'starter' AS roster_role,"
+        " 'active' AS roster_status_clean FROM player_stats WHERE false"
+    )
+    con.execute(
+        "CREATE VIEW team_game_performance AS SELECT recent_team AS team, season, week, 'elite' AS season_strength_tier,"
+        " 'hot' AS recent_form, 0.0 AS total_epa, 0 AS points_scored, 60 AS total_plays FROM player_stats WHERE false"
+    )
+    return con.execute(render("mart/player_weekly_performance.sql")).df()
+
+
+def test_matches_dbt_player_weekly_performance(dbt_duckdb: Tuple) -> None:
+    """Every rolling, trend and tier column matches the dbt mart run over the same stats."""
+    weekly = _weekly()
+
+    local = PlayerProjectionEngine(stg_player_stats(weekly)).features()
+    reference = _dbt_player_weekly_performance(weekly, dbt_duckdb)
+
+    report = compare_to_reference(local, reference, keys=("player_id", "season", "week")).set_index("column")
+    assert report.loc["_rows", "mismatches"] == 0
+    assert {"fantasy_points_l5", "catch_rate_l3", "fantasy_volatility", "usage_trend"} <= set(report.index)
+    assert report["mismatches"].sum() == 0, report[report["mismatches"] > 0].to_string()
+
+
+def test_scoring_configs_are_scored_as_one_matrix() -> None:
+    """Every config's points and projections equal scoring each one on its own from the box score."""
+    stats = stg_player_stats(_weekly())
+    engine = PlayerProjectionEngine(stats)
+    configs = [DEFAULT_SCORING, PPR_SCORING, {"receptions": 0.5, "passing_tds": 6}]
+    rng = np.random.default_rng(0)
+    random_configs = rng.normal(size=(200, len(SCORING_STATS)))
+
+    points = engine.score(configs)
+    frame = engine.frame.fillna({stat: 0 for stat in SCORING_STATS})
+    for i, config in enumerate(configs):
+        expected = sum(frame[stat] * points_per for stat, points_per in {**DEFAULT_SCORING, **config}.items())
+        np.testing.assert_allclose(points[:, i], expected)
+    np.testing.assert_allclose(engine.score(random_configs)[:, 7], engine.score(random_configs[7]).ravel())
+    assert scoring_matrix(random_configs).shape == (len(SCORING_STATS), 200)
+
+    # The projection is the blend of the previous 3 and 5 games' scored points
+    ppr = pd.Series(points[:, 1]).groupby([frame["player_id"], frame["season"]])
+    l3 = ppr.transform(lambda s: s.shift(1).rolling(3, min_periods=1).mean())
+    l5 = ppr.transform(lambda s: s.shift(1).rolling(5, min_periods=1).mean())
+    np.testing.assert_allclose(engine.rolling(configs, 3)[:, 1], l3)
+    np.testing.assert_allclose(engine.project(configs)[:, 1], 0.5 * l3 + 0.5 * l5)
+
+    players, upcoming = engine.next_game(configs)
+    assert len(players) == len(stats.drop_duplicates(["player_id", "season"]))
+    by_player = ppr.obj.groupby([frame["player_id"], frame["season"]])
+    expected = 0.5 * by_player.apply(lambda s: s.tail(3).mean()) + 0.5 * by_player.apply(lambda s: s.tail(5).mean())
+    np.testing.assert_allclose(upcoming[:, 1], expected.loc[list(zip(players["player_id"], players["season"]))])
@@ -0,0 +1,128 @@
+"""Tests for the player id resolver."""
+
+import threading
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from dagster import materialize
+
+from pipeline.assets.nfl_rosters import nfl_rosters
+from pipeline.config.settings import SEASONS
+from pipeline.resources import WarehouseResource
+from pipeline.utils.cache import CachedPull
+from pipeline.utils.player_ids import PlayerIdResolver, load_player_id_resolver
+
+
+@pytest.fixture
+def players() -> pd.DataFrame:
+    """Minimal players reference shaped like nfl_data_py.import_players()."""
+    return pd.DataFrame(
+        {
+            "gsis_id": ["00-0033873", "00-0034857", "00-0036389"],
+            "display_name": ["Patrick Mahomes", "Josh Allen", "Josh Allen"],
+            "esb_id": ["MAH373871", "ALL358498", None],
+            "espn_id": [3139477.0, 3918298.0, 4243537.0],
+            "pfr_id": ["MahoPa00", "AlleJo02", "AlleJo03"],
+        }
+    )
+
+
+def test_resolve_column_by_source(players: pd.DataFrame) -> None:
+    """Numeric and string ids resolve to GSIS ids in one lookup."""
+    resolver = PlayerIdResolver.from_players(players)
+
+    resolved = resolver.resolve(pd.Series(["3139477", "4243537", "999"]), "espn_id")
+
+    assert resolved.tolist() == ["00-0033873", "00-0036389", None]
+
+
+def test_source_with_only_ambiguous_keys_resolves_nothing(players: pd.DataFrame) -> None:
+    """A source whose every key is shared by several players leaves the rows unresolved."""
+    resolver = PlayerIdResolver.from_players(players.assign(display_name="Josh Allen"))
+
+    assert resolver.resolve(pd.Series(["Josh Allen", "Patrick Mahomes"]), "name").isna().all()
+
+
+def test_resolve_frame_priority_and_coverage(players: pd.DataFrame) -> None:
+    """GSIS ids win, alternate ids fill gaps and ambiguous names stay unresolved."""
+    resolver = PlayerIdResolver.from_players(players)
+    ngs = pd.DataFrame(
+        {
+            "player_gsis_id": ["00-0033873", None, None, None],
+            "esb_id": [None, "ALL358498", None, None],
+            "player_display_name": ["Patrick Mahomes", "Josh Allen", "Patrick Mahomes II", "Josh Allen"],
+        }
+    )
+
+    resolved, coverage = resolver.resolve_frame(ngs)
+
+    assert resolved.tolist() == ["00-0033873", "00-0034857", "00-0033873", None]
+    assert coverage == {
+        "player_gsis_id->gsis_id": 1,
+        "esb_id->esb_id": 1,
+        "player_display_name->name": 1,
+        "unresolved": 1,
+    }
+
+
+def test_index_is_persisted_between_runs(players: pd.DataFrame, tmp_path: Path) -> None:
+    """A saved index is reloaded when the players reference is unchanged."""
+    pull = CachedPull("players", None, players, "hash-1", "2025-09-07", from_cache=True)
+    built = load_player_id_resolver(pull, state_dir=str(tmp_path))
+    loaded = PlayerIdResolver.load(tmp_path / "player_ids")
+
+    assert loaded.source_hash == built.source_hash == "hash-1"
+    assert sorted(loaded.sources) == sorted(built.sources)
+    assert loaded.resolve(pd.Series(["AlleJo02"]), "pfr_id").tolist() == ["00-0034857"]
+
+
+def test_concurrent_index_builds(players: pd.DataFrame, tmp_path: Path) -> None:
+    """Processes rebuilding the index at once each swap in a complete copy without failing."""
+    errors = []
+    start = threading.Barrier(6)
+
+    def build(builder: int) -> None:
+        start.wait()
+        try:
+            for run in range(5):
+                pull = CachedPull("players", None, players, f"hash-{builder}-{run}", "2025-09-07", from_cache=True)
+                load_player_id_resolver(pull, state_dir=str(tmp_path))
+        except Exception as e:  # noqa: BLE001 - reported by the assert below
+            errors.append(e)
+
+    builders = [threading.Thread(target=build, args=(builder,)) for builder in range(6)]
+    for builder in builders:
+        builder.start()
+    for builder in builders:
+        builder.join()
+
+    assert errors == []
+    assert [path.name for path in tmp_path.iterdir()] == ["player_ids"]
+    assert PlayerIdResolver.load(tmp_path / "player_ids").source_hash.startswith("hash-")
+
+
+def test_rosters_recover_rows_without_gsis_id(
+    players: pd.DataFrame, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, nflverse_server: ThreadingHTTPServer
+) -> None:
+    """A roster row with only an espn id gets its GSIS id; a row no id identifies is dropped."""
+    monkeypatch.chdir(tmp_path)
+    nflverse_server.put("players/players.parquet", players)
+    rosters = pd.DataFrame(
+        {
+            "gsis_id": ["00-0033873", None, None],
+            "espn_id": [3139477.0, 3918298.0, None],
+            "full_name": ["Patrick Mahomes", "Josh Allen", "Practice Squad"],
+            "birth_date": ["1995-09-17", "1996-05-21", "2000-01-01"],
+            "team": ["KC", "BUF", "BUF"],
+            "position": ["QB", "QB", "WR"],
+        }
+    )
+    for season in SEASONS:
+        nflverse_server.put(f"rosters/roster_{season}.parquet", rosters.assign(season=season))
+    warehouse = WarehouseResource(backend="duckdb", duckdb_path=str(tmp_path / "warehouse.duckdb"))
+
+    loaded = materialize([nfl_rosters], resources={"warehouse": warehouse}).output_for_node("nfl_rosters")
+
+    assert loaded.groupby("season")["player_id"].agg(list).tolist() == [["00-0033873", "00-0034857"]] * len(SEASONS)
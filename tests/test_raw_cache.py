@@ -0,0 +1,151 @@
+"""Tests for the local raw-data cache."""
+
+import threading
+from pathlib import Path
+from typing import List
+
+import pandas as pd
+
+from nfl_analytics.analytics.features import raw_cache_files
+from pipeline.utils.cache import RawDataCache
+
+
+def _frame(value: int) -> pd.DataFrame:
+    """Build a small nflverse-shaped frame."""
+    return pd.DataFrame({"game_id": ["2024_01_KC_BAL", "2024_01_GB_PHI"], "home_score": [value, 27]})
+
+
+def test_fetch_reuses_cached_pull(tmp_path: Path) -> None:
+    """A second fetch on the same day is served from disk without downloading."""
+    cache = RawDataCache(root=str(tmp_path))
+    downloads: List[int] = []
+
+    def loader() -> pd.DataFrame:
+        downloads.append(1)
+        return _frame(20)
+
+    first = cache.fetch("schedules", 2025, loader)
+    second = cache.fetch("schedules", 2025, loader)
+
+    assert len(downloads) == 1
+    assert not first.from_cache
+    assert second.from_cache
+    assert second.content_hash == first.content_hash
+    pd.testing.assert_frame_equal(second.frame, first.frame)
+
+
+def test_force_refresh_downloads_again(tmp_path: Path) -> None:
+    """force_refresh bypasses a fresh cache entry."""
+    cache = RawDataCache(root=str(tmp_path))
+    cache.fetch("schedules", 2025, lambda: _frame(20))
+
+    refreshed = cache.fetch("schedules", 2025, lambda: _frame(21), force_refresh=True)
+
+    assert not refreshed.from_cache
+    assert refreshed.frame["home_score"].iloc[0] == 21
+
+
+def test_needs_load_tracks_content_hash(tmp_path: Path) -> None:
+    """Unchanged content skips the warehouse load; changed content does not."""
+    cache = RawDataCache(root=str(tmp_path))
+    pulls = [cache.fetch("schedules", 2025, lambda: _frame(20))]
+
+    assert cache.needs_load("games", pulls)
+    cache.mark_loaded("games", pulls)
+    assert not cache.needs_load("games", pulls)
+
+    changed = [cache.fetch("schedules", 2025, lambda: _frame(24), force_refresh=True)]
+    assert cache.needs_load("games", changed)
+
+
+def test_evict_keeps_latest_entry(tmp_path: Path) -> None:
+    """Eviction removes stale fetch dates but never the newest entry."""
+    cache = RawDataCache(root=str(tmp_path), max_bytes=0)
+    stale = tmp_path / "schedules" / "season=2025" / "fetch_date=2000-01-01"
+    stale.mkdir(parents=True)
+    _frame(1).to_parquet(stale / "data.parquet")
+    (stale / "manifest.json").write_text("{}")
+
+    cache.fetch("schedules", 2025, lambda: _frame(20))
+
+    assert not stale.exists()
+    assert len(list((tmp_path / "schedules" / "season=2025").glob("fetch_date=*"))) == 1
+
+
+def test_concurrent_writers_of_one_pull(tmp_path: Path) -> None:
+    """Processes storing the same pull at once leave one complete entry and no staging directories."""
+    cache = RawDataCache(root=str(tmp_path), max_bytes=0)
+    start, errors = threading.Barrier(8), []
+
+    def write(value: int) -> None:
+        start.wait()
+        try:
+            for _ in range(5):
+                cache.store("schedules", 2025, _frame(value))
+        except Exception as e:  # noqa: BLE001 - reported by the assert below
+            errors.append(e)
+
+    writers = [threading.Thread(target=write, args=(value,)) for value in range(8)]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+
+    season_dir = tmp_path / "schedules" / "season=2025"
+    assert errors == []
+    assert [entry.name for entry in season_dir.iterdir()] == [f"fetch_date={cache.latest('schedules', 2025).fetch_date}"]
+    assert cache.lookup("schedules", 2025).frame["home_score"].iloc[0] in range(8)
+
+
+def test_unfinished_entries_are_not_listed(tmp_path: Path) -> None:
+    """A fetch_date directory without a manifest is neither read nor evicted."""
+    cache = RawDataCache(root=str(tmp_path), max_bytes=0)
+    pull = cache.store("pbp_lean", 2023, _frame(20))
+    unfinished = tmp_path / "pbp_lean" / "season=2023" / "fetch_date=2999-01-01"
+    unfinished.mkdir()
+    _frame(1).to_parquet(unfinished / "data.parquet", index=False)
+
+    cache.evict()
+
+    assert unfinished.exists()
+    assert cache.latest("pbp_lean", 2023).fetch_date == pull.fetch_date
+    assert raw_cache_files(str(tmp_path), [2023]) == [
+        tmp_path / "pbp_lean" / "season=2023" / f"fetch_date={pull.fetch_date}" / "data.parquet"
+    ]
+
+
+def test_iter_seasons_falls_back_to_stale_copy(tmp_path: Path) -> None:
+    """A failed download yields the newest cached copy and keeps the other seasons."""
+    cache = RawDataCache(root=str(tmp_path))
+    stale = tmp_path / "schedules" / "season=2025" / "fetch_date=2000-01-01"
+    stale.mkdir(parents=True)
+    _frame(3).to_parquet(stale / "data.parquet", index=False)
+    (stale / "manifest.json").write_text('{"content_hash": "stale", "fetch_date": "2000-01-01"}')
+
+    def loader(years: List[int]) -> pd.DataFrame:
+        if years == [2025]:
+            raise ConnectionError("nflverse unavailable")
+        return _frame(years[0])
+
+    results = {result.key: result for result in cache.iter_seasons("schedules", [2023, 2024, 2025], loader, max_workers=3)}
+
+    assert results[2023].ok and results[2024].ok
+    assert isinstance(results[2025].error, ConnectionError)
+    assert results[2025].value.fetch_date == "2000-01-01"
+
+
+def test_needs_load_per_season_with_dependencies(tmp_path: Path) -> None:
+    """Seasons load independently, and a changed reference pull reloads every season."""
+    cache = RawDataCache(root=str(tmp_path))
+    season_pulls = cache.fetch_seasons("weekly", [2023, 2024], lambda years: _frame(years[0]))
+    players = cache.fetch("players", None, lambda: _frame(1))
+
+    cache.mark_loaded("player_stats", season_pulls[:1], [players], replace=False)
+    assert not cache.needs_load("player_stats", season_pulls[:1], [players])
+    assert cache.needs_load("player_stats", season_pulls[1:], [players])
+
+    cache.mark_loaded("player_stats", season_pulls[1:], [players], replace=False)
+    assert not cache.needs_load("player_stats", season_pulls, [players])
+
+    new_players = cache.fetch("players", None, lambda: _frame(2), force_refresh=True)
+    assert cache.needs_load("player_stats", season_pulls[:1], [new_players])
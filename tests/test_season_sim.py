@@ -0,0 +1,89 @@
+"""Tests for the Monte Carlo season simulator."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nfl_analytics.analytics.season_sim import NFL_DIVISIONS, SeasonSimulator
+
+
+def _schedule(played_weeks: int = 10, seed: int = 5) -> pd.DataFrame:
+    """A 17-week, 32-team schedule with the first played_weeks weeks final."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for week in range(1, 18):
+        teams = rng.permutation(list(NFL_DIVISIONS))
+        for away, home in zip(teams[::2], teams[1::2]):
+            played = week <= played_weeks
+            rows.append({
+                "game_id": f"2025_{week:02d}_{away}_{home}",
+                "season": 2025,
+                "week": week,
+                "game_type": "REG",
+                "home_team": home,
+                "away_team": away,
+                "home_score": float(rng.integers(0, 40)) if played else np.nan,
+                "away_score": float(rng.integers(0, 40)) if played else np.nan,
+            })
+    return pd.DataFrame(rows)
+
+
+def _probabilities(simulator: SeasonSimulator, seed: int = 1) -> pd.DataFrame:
+    """GameOutcomeModel.predict-shaped probabilities for the remaining games."""
+    rng = np.random.default_rng(seed)
+    return simulator.remaining.assign(home_win_probability=rng.uniform(0.2, 0.8, len(simulator.remaining)))
+
+
+def test_certain_outcomes_give_exact_standings() -> None:
+    """With every home team certain to win, win totals and seeds are fixed."""
+    schedule = _schedule()
+    simulator = SeasonSimulator(schedule)
+    odds = simulator.run(simulator.remaining.assign(home_win_probability=1.0), n_simulations=500, chunk_size=200)
+
+    remaining_home = simulator.remaining["home_team"].value_counts()
+    expected = odds["current_wins"] + odds["team"].map(remaining_home).fillna(0).to_numpy()
+    assert np.allclose(odds["expected_wins"], expected)
+
+    seeds = [f"seed_{seed}" for seed in range(1, 8)]
+    assert odds.groupby("conference")[seeds].sum().eq(1).all().all()
+    assert odds.groupby("division")["division_probability"].sum().round(9).eq(1).all()
+    assert odds["playoff_probability"].sum() == pytest.approx(14)
+    # Seeds 1-4 go to division winners only
+    assert (odds[[f"seed_{seed}" for seed in range(1, 5)]].sum(axis=1) <= odds["division_probability"] + 1e-9).all()
+
+
+def test_update_reuses_draws_and_matches_fresh_run() -> None:
+    """Changing a few probabilities gives the same answer as re-running from scratch."""
+    schedule = _schedule()
+    simulator = SeasonSimulator(schedule)
+    probabilities = _probabilities(simulator)
+    before = simulator.run(probabilities, n_simulations=20_000, seed=3, chunk_size=7_000)
+
+    changed = {game_id: 0.95 for game_id in simulator.remaining["game_id"].head(3)}
+    updated = simulator.update(changed)
+
+    fresh = SeasonSimulator(schedule).run(
+        probabilities.assign(home_win_probability=probabilities["game_id"].map(changed).fillna(probabilities["home_win_probability"])),
+        n_simulations=20_000,
+        seed=3,
+        chunk_size=7_000,
+    )
+    pd.testing.assert_frame_equal(updated, fresh)
+    assert not updated.equals(before)
+
+
+def test_sharded_run_matches_serial_run() -> None:
+    """Splitting the chunks over worker processes does not change the result."""
+    simulator = SeasonSimulator(_schedule(played_weeks=14))
+    probabilities = _probabilities(simulator)
+    serial = simulator.run(probabilities, n_simulations=4_000, chunk_size=1_000)
+    sharded = simulator.run(probabilities, n_simulations=4_000, chunk_size=1_000, n_jobs=2)
+    pd.testing.assert_frame_equal(serial, sharded)
+
+
+def test_missing_probabilities_are_rejected() -> None:
+    """Every remaining game needs a probability."""
+    simulator = SeasonSimulator(_schedule())
+    probabilities = _probabilities(simulator).iloc[1:]
+    with pytest.raises(ValueError, match="No probability"):
+        simulator.run(probabilities, n_simulations=10)
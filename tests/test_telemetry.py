@@ -0,0 +1,90 @@
+"""Tests for per-phase asset telemetry."""
+
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+import pytest
+from dagster import AssetExecutionContext, MaterializeResult, asset, materialize
+
+from pipeline.assets.nfl_pbp import nfl_pbp
+from pipeline.resources import WarehouseResource
+from pipeline.utils.telemetry import Telemetry, instrumented, phase, tagged
+
+
+def _metadata(result, asset_name: str) -> dict:
+    event = next(
+        event for event in result.get_asset_materialization_events()
+        if event.asset_key.to_user_string() == asset_name
+    )
+    return {key: getattr(value, "value", value) for key, value in event.materialization.metadata.items()}
+
+
+def test_pbp_partition_reports_fetch_transform_and_load(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    make_pbp: Callable[..., pd.DataFrame],
+    nflverse_server: ThreadingHTTPServer,
+) -> None:
+    """Each phase of a partition run is timed, sized and tagged with the partition."""
+    monkeypatch.chdir(tmp_path)
+    pbp = make_pbp(seasons=1, weeks=1)
+    nflverse_server.put("pbp/play_by_play_2023.parquet", pbp)
+    warehouse = WarehouseResource(backend="duckdb", duckdb_path=str(tmp_path / "warehouse.duckdb"))
+
+    result = materialize([nfl_pbp], resources={"warehouse": warehouse}, partition_key="2023|1")
+
+    metadata = _metadata(result, "nfl_pbp")
+    assert metadata["fetch_rows"] == metadata["transform_rows"] == metadata["load_rows"] == len(pbp)
+    assert metadata["load_seconds"] > 0 and metadata["load_mb"] > 0
+    assert metadata["peak_rss_mb"] > 0
+    phases = {record["phase"]: record for record in metadata["phases"]}
+    assert set(phases) == {"fetch", "transform", "load"}
+    assert phases["load"]["tags"] == "season=2023 week=1 table=pbp_data"
+    assert phases["load"]["deleted_rows"] == 0
+
+
+def test_materialize_result_keeps_its_metadata(tmp_path: Path) -> None:
+    """Telemetry merges into a returned MaterializeResult; tagged() labels nested phases."""
+    warehouse = WarehouseResource(backend="duckdb", duckdb_path=str(tmp_path / "warehouse.duckdb"))
+
+    @asset
+    @instrumented
+    def season_totals(context: AssetExecutionContext, warehouse: WarehouseResource) -> MaterializeResult:
+        for season in (2022, 2023):
+            with tagged(season=season):
+                with phase("transform") as stats:
+                    frame = pd.DataFrame({"season": [season] * 10, "value": range(10)})
+                    stats.record(rows=len(frame))
+                warehouse.store(context, frame, f"totals_{season}")
+        return MaterializeResult(metadata={"seasons": 2})
+
+    result = materialize([season_totals], resources={"warehouse": warehouse})
+
+    metadata = _metadata(result, "season_totals")
+    assert metadata["seasons"] == 2
+    assert metadata["transform_rows"] == 20 and metadata["load_rows"] == 20
+    assert [record["tags"] for record in metadata["phases"]] == [
+        "season=2022",
+        "season=2022 table=totals_2022",
+        "season=2023",
+        "season=2023 table=totals_2023",
+    ]
+
+
+def test_phases_without_rows_or_bytes_still_summarize() -> None:
+    """Counts no phase recorded come out as missing, not as a dropped column."""
+    telemetry = Telemetry("scoring")
+    with telemetry.phase("fetch") as stats:
+        stats.record(rows=4)
+    with telemetry.phase("transform"):
+        pass
+
+    totals = telemetry.totals()
+    assert list(totals.columns) == ["wall_seconds", "cpu_seconds", "rows", "bytes"]
+    assert totals["bytes"].isna().all() and totals.loc["fetch", "rows"] == 4
+
+    metadata = telemetry.metadata()
+    assert metadata["fetch_rows"].value == 4
+    assert not {"transform_rows", "fetch_mb", "transform_mb"} & set(metadata)
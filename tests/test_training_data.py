@@ -0,0 +1,54 @@
+"""Tests for the cached, projected training data reads."""
+
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, List
+
+import duckdb
+import pandas as pd
+
+from ml.data.training_data import TRAINING_COLUMNS, TRAINING_TABLE, TrainingData
+from ml.models.game_outcomes import GameOutcomeModel
+
+
+class _Warehouse:
+    """game_training_dataset in DuckDB behind the two BigQuery client calls TrainingData makes."""
+
+    def __init__(self, games: pd.DataFrame):
+        self.connection = duckdb.connect()
+        self.connection.register("games", games.assign(extra_column=1.0))
+        self.modified = datetime(2025, 9, 1, tzinfo=timezone.utc)
+        self.queries: List[str] = []
+
+    def get_table(self, table: str) -> SimpleNamespace:
+        return SimpleNamespace(modified=self.modified)
+
+    def query(self, sql: str) -> SimpleNamespace:
+        self.queries.append(sql)
+        result = self.connection.execute(sql.replace(f"`{TRAINING_TABLE}`", "games")).to_arrow_table()
+        return SimpleNamespace(to_arrow=lambda **kwargs: result)
+
+
+def test_projected_rows_are_cached_until_the_table_changes(
+    tmp_path: Path, make_games: Callable[..., pd.DataFrame]
+) -> None:
+    """Repeat loads skip the warehouse; a rebuilt table is downloaded again and replaces the old copy."""
+    warehouse = _Warehouse(make_games(seasons=(2019, 2020, 2021)))
+    data = TrainingData(warehouse, cache_dir=str(tmp_path))
+
+    first = data.load(first_season=2020, last_season=2021)
+    again = data.load(first_season=2020, last_season=2021)
+
+    assert list(first.columns) == TRAINING_COLUMNS
+    assert sorted(first["season"].unique()) == [2020, 2021]
+    pd.testing.assert_frame_equal(first, again)
+    assert len(warehouse.queries) == 1
+    GameOutcomeModel("logistic_regression").train(again)
+
+    warehouse.modified = datetime(2025, 9, 8, tzinfo=timezone.utc)
+    data.load(first_season=2020, last_season=2021)
+    data.load(last_season=2020)
+
+    assert len(warehouse.queries) == 3
+    assert len(list(tmp_path.glob("*.arrow"))) == 2
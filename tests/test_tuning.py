@@ -0,0 +1,50 @@
+"""Tests for the hyperparameter search."""
+
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from ml.tuning.search import FoldCache, rung_folds, sample_configs, successive_halving, tune
+
+
+def test_fold_cache_is_time_aware(tmp_path: Path, make_games: Callable[..., pd.DataFrame]) -> None:
+    """Folds validate on the latest seasons, newest first, training only on earlier ones."""
+    games = make_games(seasons=(2019, 2020, 2021, 2022)).dropna(subset=["home_win"])
+    cache = FoldCache(games, n_folds=2, cache_dir=str(tmp_path))
+    assert [fold.season for fold in cache.folds] == [2022, 2021]
+
+    seasons = cache.games["season"].to_numpy()
+    for i, fold in enumerate(cache.folds):
+        assert (seasons[:fold.train_end] < fold.season).all()
+        assert (seasons[fold.train_end:fold.val_end] == fold.season).all()
+        train_path, val_path = cache.paths(i)
+        X_train = np.load(train_path, mmap_mode="r")
+        assert X_train.shape[0] == fold.train_end and not np.isnan(X_train).any()
+        assert np.allclose(X_train.mean(axis=0), 0, atol=1e-5)
+
+
+def test_successive_halving_races_configs(tmp_path: Path, make_games: Callable[..., pd.DataFrame]) -> None:
+    """Only the best 1/eta of each rung is scored on more folds."""
+    assert rung_folds(4, eta=3) == [1, 3, 4]
+
+    games = make_games(seasons=(2018, 2019, 2020, 2021, 2022)).dropna(subset=["home_win"])
+    cache = FoldCache(games, n_folds=4, cache_dir=str(tmp_path))
+    configs = sample_configs(["logistic_regression", "xgboost"], n_per_type=5)
+    leaderboard = successive_halving(configs, cache, eta=3, n_jobs=1)
+
+    assert len(leaderboard) == 10
+    assert leaderboard["folds"].value_counts().to_dict() == {1: 6, 3: 2, 4: 2}
+    finalists = leaderboard[leaderboard["folds"] == 4]
+    assert list(finalists.index) == [0, 1]
+    assert finalists["log_loss"].is_monotonic_increasing
+
+
+def test_tune_returns_trained_winner(tmp_path: Path, make_games: Callable[..., pd.DataFrame]) -> None:
+    """The best configuration is refit and can be saved like any GameOutcomeModel."""
+    games = make_games(seasons=(2019, 2020, 2021))
+    leaderboard, model = tune(games, model_types=["logistic_regression"], n_per_type=3, n_folds=2, n_jobs=1)
+
+    assert model.is_trained and model.model_type == leaderboard.iloc[0]["model_type"]
+    model.save_model(str(tmp_path / "game_outcome_tuned.pkl"))
@@ -0,0 +1,28 @@
+"""Tests for per-game fingerprints and high-water marks."""
+
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from pipeline.utils.watermarks import WatermarkStore, changed_keys, frame_fingerprints
+
+
+def test_fingerprints_hash_each_game_in_row_order(tmp_path: Path) -> None:
+    """Interleaved games hash like their rows alone, and only edited games change."""
+    plays = pd.DataFrame({"game_id": ["g2", "g1", "g2", "g3", "g1"], "epa": [0.1, -0.4, 0.7, 0.0, 1.2]})
+
+    fingerprints = frame_fingerprints(plays)
+
+    row_hashes = pd.util.hash_pandas_object(plays, index=False).to_numpy()
+    assert fingerprints == {
+        game: hashlib.sha1(row_hashes[(plays["game_id"] == game).to_numpy()].tobytes()).hexdigest()
+        for game in ["g1", "g2", "g3"]
+    }
+    assert frame_fingerprints(plays.iloc[:0]) == {}
+
+    store = WatermarkStore("nfl_pbp", state_dir=str(tmp_path))
+    store.set("2023|1", fingerprints)
+    edited = plays.assign(epa=np.where(plays.index == 2, 0.8, plays["epa"]))
+    assert changed_keys(frame_fingerprints(edited), store.get("2023|1")) == ["g2"]